@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Benchmark `hopla dashboard` against the separate commands it replaces.
+
+Usage (from the repository root):
+    PYTHONPATH=src:developers/benchmarks python developers/benchmarks/dashboard_latency.py
+
+Both scenarios run against the simulated Habitica API (see simulated_habitica.py).
+The separate commands are run in-process, so process startup is not included:
+the real saving is larger than reported here.
+"""
+import time
+
+from click.testing import CliRunner
+
+from hopla.cli.dashboard import dashboard
+from hopla.cli.get_group import get_group
+from hopla.cli.get_user.stats import stats
+from hopla.cli.groupcmds.api import status
+from hopla.hoplalib.tasks.taskcontroller import UserTasksRequest
+from simulated_habitica import SimulatedHabitica, realistic_user
+
+
+def separate_commands():
+    runner = CliRunner()
+    runner.invoke(stats)
+    runner.invoke(get_group)
+    runner.invoke(status)
+    UserTasksRequest(task_type="todos").get_tasks_data_or_exit()
+
+
+def main():
+    api = SimulatedHabitica(user=realistic_user())
+    with api.installed():
+        for name, func in [("dashboard", lambda: CliRunner().invoke(dashboard)),
+                           ("4 separate reads", separate_commands)]:
+            api.calls.clear()
+            start = time.perf_counter()
+            result = func()
+            assert result is None or result.exit_code == 0, result.output
+            print(f"{name:<18} {(time.perf_counter() - start) * 1000:7.1f}ms "
+                  f"requests={len(api.calls)}")
+
+
+if __name__ == "__main__":
+    main()
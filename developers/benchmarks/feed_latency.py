@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Benchmark the end-to-end latency of `hopla feed`.
+
+Usage (from the repository root):
+    PYTHONPATH=src:developers/benchmarks python developers/benchmarks/feed_latency.py
+
+Every scenario runs the real click command against the simulated Habitica API
+(see simulated_habitica.py) and reports the median wall clock time, the
+requests that were made, and the number of /user bytes that were downloaded.
+"""
+import statistics
+import time
+
+from click.testing import CliRunner
+
+from hopla.cli.feed import feed
+from simulated_habitica import SimulatedHabitica, realistic_user
+
+SCENARIOS = {
+    "magic pet, until mount, auto food": ["Wolf-Glow", "--until-mount"],
+    "normal pet, until mount": ["Wolf-Base", "--until-mount"],
+    "normal pet, once": ["Wolf-Base"],
+}
+REPEATS = 5
+
+
+def main():
+    user = realistic_user()
+    user["items"]["pets"].update({"Wolf-Glow": 20, "Wolf-Base": 20})
+    user["items"]["mounts"].pop("Wolf-Glow", None)
+    user["items"]["mounts"].pop("Wolf-Base", None)
+    for name, args in SCENARIOS.items():
+        timings = []
+        api = SimulatedHabitica(user=user)
+        with api.installed():
+            for _ in range(REPEATS):
+                api.calls.clear()
+                start = time.perf_counter()
+                result = CliRunner().invoke(feed, args)
+                timings.append(time.perf_counter() - start)
+                assert result.exit_code == 0, result.output
+        print(f"{name:<36} median={statistics.median(timings) * 1000:7.1f}ms "
+              f"requests={api.calls}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark making the feed-all plan for a fully collected account.
+
+Usage (from the repository root):
+    PYTHONPATH=src python developers/benchmarks/feed_plan.py
+
+The user has every pet that hopla knows about, none of their mounts, and
+plenty of food. Every scenario is repeated and the best run is reported.
+"""
+import timeit
+
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.zoo.fooddata import FoodData
+from hopla.hoplalib.zoo.foodmodels import FoodStockpile, FoodStockpileBuilder
+from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
+from hopla.hoplalib.zoo.petdata import PetData
+from hopla.hoplalib.zoo.petregistry import PetCategory
+from hopla.hoplalib.zoo.zoofeed_algorithms import FeedAlgorithm
+from hopla.hoplalib.zoo.zoomodels import ZooBuilder, ZooHelper
+
+FEED_STATUSES = [5, 10, 15, 20, 25, 30, 35, 40, 45]
+
+
+def maximal_user() -> HabiticaUser:
+    return HabiticaUser(user_dict={"items": {
+        "pets": {name: FEED_STATUSES[i % len(FEED_STATUSES)]
+                 for i, name in enumerate(PetData.pet_names)},
+        "mounts": {},
+        "food": dict.fromkeys(FoodData.drop_food_names, 999),
+    }})
+
+
+def dict_filters(zoo):
+    helper = ZooHelper(ZooHelper(zoo).get_feedable_zoo())
+    for category in [PetCategory.GENERATION1, PetCategory.QUEST, PetCategory.MAGIC_POTION]:
+        list(helper.filter_on_categories(category))
+
+
+def columnar_filters(zoo: ColumnarZoo):
+    feedable = zoo.get_feedable_zoo()
+    for category in [PetCategory.GENERATION1, PetCategory.QUEST, PetCategory.MAGIC_POTION]:
+        list(feedable.filter_on_categories(category))
+
+
+def magic_pet_feeding(stockpile: FoodStockpile):
+    """Feed the most abundant food to a pet, the way the plan feeds magic potion pets."""
+    food_name: str = stockpile.get_most_abundant_food()
+    if stockpile.has_sufficient(food_name, n=3):
+        stockpile.add_food(food_name, n=-3)
+
+
+def main():
+    user = maximal_user()
+    zoo = ZooBuilder(user).build()
+    stockpile: FoodStockpile = FoodStockpileBuilder().user(user).build()
+    columnar = ColumnarZoo.from_zoo(zoo)
+    large_stockpile = FoodStockpile(dict.fromkeys(FoodData.drop_food_names, 10 ** 9))
+    scenarios = {
+        "dict zoo filters": lambda: dict_filters(zoo),
+        "columnar zoo filters": lambda: columnar_filters(columnar),
+        "build columnar zoo": lambda: ColumnarZoo.from_zoo(zoo),
+        "construct algorithm": lambda: FeedAlgorithm(zoo=zoo, stockpile=stockpile),
+        "construct + make plan": lambda: FeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan(),
+        "most abundant food": stockpile.get_most_abundant_food,
+        "magic pet feeding": lambda: magic_pet_feeding(large_stockpile),
+    }
+    plan = FeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan()
+    print(f"{len(zoo)} pets, {len(list(plan))} pets in the plan")
+    for name, func in scenarios.items():
+        best = min(timeit.repeat(func, number=20, repeat=5)) / 20
+        print(f"{name:<22} {best * 1000:9.4f}ms")
+
+
+if __name__ == "__main__":
+    main()
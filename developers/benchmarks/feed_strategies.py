@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark the feed-all strategies over a corpus of accounts.
+
+Usage (from the repository root):
+    PYTHONPATH=src python developers/benchmarks/feed_strategies.py [USER_JSON ...]
+
+The corpus has synthetic accounts: a maximal account (every pet that hopla
+knows, none of their mounts) with little to plenty of food, and random
+accounts with some of the pets and mounts. Every USER_JSON file adds a
+recorded account, e.g. the output of `hopla get-user > user.json`.
+
+For every account and every strategy of FEED_STRATEGIES, the benchmark
+reports the time to make the plan (best of a few runs), the mounts that the
+plan produces, the food that it consumes, and the feed requests that it
+takes. The totals per strategy follow.
+"""
+import json
+import random
+import sys
+import timeit
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
+from hopla.hoplalib.zoo.fooddata import FoodData
+from hopla.hoplalib.zoo.foodmodels import FoodStockpile, FoodStockpileBuilder
+from hopla.hoplalib.zoo.petdata import PetData
+from hopla.hoplalib.zoo.zoofeed_algorithms import FEED_STRATEGIES, FeedPlan
+
+FEED_STATUSES = [5, 10, 15, 20, 25, 30, 35, 40, 45]
+FOOD_PER_KIND = [25, 100, 400, 1600]
+RANDOM_ACCOUNTS = 4
+
+
+class Result(NamedTuple):
+    seconds: float
+    mounts: int
+    food: int
+    requests: int
+
+
+def user_of(pets: Dict[str, int], mounts: Dict[str, bool], food: Dict[str, int]) -> HabiticaUser:
+    return HabiticaUser(user_dict={"items": {"pets": pets, "mounts": mounts, "food": food}})
+
+
+def synthetic_accounts(rng: random.Random) -> Iterator[Tuple[str, HabiticaUser]]:
+    maximal_pets = {name: FEED_STATUSES[i % len(FEED_STATUSES)]
+                    for i, name in enumerate(PetData.pet_names)}
+    for food_per_kind in FOOD_PER_KIND:
+        food = {name: rng.randint(0, 2 * food_per_kind) for name in FoodData.drop_food_names}
+        yield f"maximal, ~{food_per_kind} food/kind", user_of(maximal_pets, {}, food)
+
+    for i in range(RANDOM_ACCOUNTS):
+        pets = {name: rng.choice(FEED_STATUSES) for name in PetData.pet_names
+                if rng.random() < 0.6}
+        mounts = {name: True for name in PetData.pet_names if rng.random() < 0.3}
+        food = {name: rng.randint(0, 150) for name in FoodData.drop_food_names}
+        yield f"random #{i}", user_of(pets, mounts, food)
+
+
+def recorded_accounts(files: List[str]) -> Iterator[Tuple[str, HabiticaUser]]:
+    for file in files:
+        user_dict: dict = json.loads(Path(file).read_text(encoding="utf-8"))
+        yield Path(file).name, HabiticaUser(user_dict=user_dict.get("data", user_dict))
+
+
+def plan_with(strategy: str, zoo: ColumnarZoo, stockpile: FoodStockpile) -> FeedPlan:
+    return FEED_STRATEGIES[strategy](zoo=zoo, stockpile=stockpile).make_plan()
+
+
+def measure(strategy: str, user: HabiticaUser) -> Result:
+    zoo = ColumnarZoo.from_pets_and_mounts(pets=user.get_pets(), mounts=user.get_mounts())
+    stockpile: FoodStockpile = FoodStockpileBuilder().user(user).build()
+    plan: FeedPlan = plan_with(strategy, zoo, stockpile)
+    seconds: float = min(timeit.repeat(partial(plan_with, strategy, zoo, stockpile),
+                                       number=5, repeat=3)) / 5
+    return Result(seconds=seconds,
+                  mounts=len({item.pet_name for item in plan}),
+                  food=sum(item.times for item in plan),
+                  requests=len(plan))
+
+
+def row(name: str, strategy: str, result: Result) -> str:
+    per_food: str = f"{100 * result.mounts / result.food:.2f}" if result.food else "-"
+    return (f"{name:<26} {strategy:<16} {result.seconds * 1000:8.2f}ms {result.mounts:>6} "
+            f"{result.food:>6} {result.requests:>8} {per_food:>9}")
+
+
+def main(files: List[str]):
+    rng = random.Random(2021)
+    accounts = [*synthetic_accounts(rng), *recorded_accounts(files)]
+    totals: Dict[str, Result] = dict.fromkeys(FEED_STRATEGIES, Result(0, 0, 0, 0))
+    print(f"{'account':<26} {'strategy':<16} {'plan':>10} {'mounts':>6} {'food':>6} "
+          f"{'requests':>8} {'mounts/100':>9}")
+    for name, user in accounts:
+        for strategy in FEED_STRATEGIES:
+            result: Result = measure(strategy, user)
+            totals[strategy] = Result(*(total + value
+                                        for total, value in zip(totals[strategy], result)))
+            print(row(name, strategy, result))
+    print()
+    for strategy, total in totals.items():
+        print(row(f"total of {len(accounts)} accounts", strategy, total))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory that the domain models of hopla take for a fully collected account.
+
+Usage (from the repository root):
+    PYTHONPATH=src python developers/benchmarks/model_memory.py
+
+Every scenario builds its models while tracemalloc traces the allocations,
+and reports the memory that the kept models take and the number of memory
+blocks that they are made of.
+"""
+import tracemalloc
+
+from hopla.hoplalib.hatchery.egg_data import EggData
+from hopla.hoplalib.hatchery.eggmodels import EggCollection
+from hopla.hoplalib.hatchery.hatchalgorithms import HatchPlanMaker
+from hopla.hoplalib.hatchery.hatchpotion_data import HatchPotionData
+from hopla.hoplalib.hatchery.hatchpotionmodels import HatchPotionCollection
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.zoo.fooddata import FoodData
+from hopla.hoplalib.zoo.foodmodels import FoodStockpile
+from hopla.hoplalib.zoo.petdata import PetData
+from hopla.hoplalib.zoo.zoofeed_algorithms import FeedAlgorithm
+from hopla.hoplalib.zoo.zoomodels import ZooBuilder
+
+FEED_STATUSES = [5, 10, 15, 20, 25, 30, 35, 40, 45]
+
+
+def full_zoo_user() -> HabiticaUser:
+    pets = {name: FEED_STATUSES[i % len(FEED_STATUSES)]
+            for i, name in enumerate(PetData.pet_names)}
+    return HabiticaUser(user_dict={"items": {
+        "pets": pets,
+        "mounts": dict.fromkeys(PetData.pet_names[::2], True),
+        "eggs": dict.fromkeys(EggData.egg_names, 999),
+        "hatchingPotions": dict.fromkeys(HatchPotionData.hatch_potion_names, 999),
+        "food": dict.fromkeys(FoodData.drop_food_names, 999),
+    }})
+
+
+def traced(func):
+    """Return (the result of func, kept bytes, kept blocks)."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = func()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    return (result,
+            sum(stat.size_diff for stat in stats),
+            sum(stat.count_diff for stat in stats))
+
+
+def main():
+    user = full_zoo_user()
+    zoo = ZooBuilder(user).build()
+    scenarios = {
+        "zoo": lambda: ZooBuilder(user).build(),
+        "hatch plan": lambda: HatchPlanMaker(
+            egg_collection=EggCollection(user.get_eggs()),
+            hatch_potion_collection=HatchPotionCollection(user.get_hatch_potions()),
+            pets=[]
+        ).make_plan(),
+        "feed plan": lambda: FeedAlgorithm(
+            zoo=zoo, stockpile=FoodStockpile(user.get_food())
+        ).make_plan(),
+    }
+    print(f"{len(PetData.pet_names)} pets")
+    for name, func in scenarios.items():
+        _, size, blocks = traced(func)
+        print(f"{name:<12} {size / 1024:9.1f}KiB {blocks:8d} blocks")
+
+
+if __name__ == "__main__":
+    main()
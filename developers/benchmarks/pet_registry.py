@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark the pet lookups of hopla on a fully collected zoo.
+
+Usage (from the repository root):
+    PYTHONPATH=src python developers/benchmarks/pet_registry.py
+
+The user owns every pet and every mount that hopla knows about. Every
+scenario is repeated and the best run is reported.
+"""
+import timeit
+
+from hopla.hoplalib.hatchery.eggmodels import EggCollection
+from hopla.hoplalib.hatchery.egg_data import EggData
+from hopla.hoplalib.hatchery.hatchpotionmodels import HatchPotionCollection
+from hopla.hoplalib.hatchery.hatchpotion_data import HatchPotionData
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.zoo.fooddata import FoodData
+from hopla.hoplalib.zoo.foodpreferences import FoodPreferenceMatrix
+from hopla.hoplalib.zoo.petdata import PetData
+from hopla.hoplalib.zoo.petmodels import Pet
+from hopla.hoplalib.zoo.zoomodels import ZooBuilder, ZooHelper
+
+
+def full_zoo_user() -> HabiticaUser:
+    return HabiticaUser(user_dict={"items": {
+        "pets": dict.fromkeys(PetData.pet_names, 20),
+        "mounts": dict.fromkeys(PetData.pet_names, True),
+        "eggs": dict.fromkeys(EggData.egg_names, 3),
+        "hatchingPotions": dict.fromkeys(HatchPotionData.hatch_potion_names, 3),
+    }})
+
+
+def pet_predicates(pets):
+    for pet in pets:
+        pet.is_feedable()
+        pet.has_just_1_favorite_food()
+        pet.is_quest_pet()
+        pet.is_generation1_pet()
+        pet.is_from_drop_hatch_potions()
+        pet.favorite_food()
+
+
+def required_food_per_pet(pets):
+    for pet in pets:
+        if pet.is_feedable():
+            for food_name in FoodData.drop_food_names:
+                pet.required_food_items_until_mount(food_name)
+
+
+def required_food_matrix(pets):
+    FoodPreferenceMatrix.cached().required_food_items_matrix(
+        {pet.pet_id: int(pet.feed_status) for pet in pets}
+    )
+
+
+def item_predicates(user: HabiticaUser):
+    for egg in EggCollection(user.get_eggs()).values():
+        egg.is_standard_egg()
+        egg.is_quest_egg()
+    for potion in HatchPotionCollection(user.get_hatch_potions()).values():
+        potion.is_standard_hatch_potion()
+        potion.is_magic_hatch_potion()
+
+
+def main():
+    user = full_zoo_user()
+    pets = [Pet(name) for name in PetData.pet_names]
+    scenarios = {
+        "build zoo": lambda: ZooBuilder(user).build(skip_unsupported_pets=True),
+        "build + feedable zoo": lambda: ZooHelper(
+            ZooBuilder(user).build(skip_unsupported_pets=True)
+        ).get_feedable_zoo(),
+        "create all pets": lambda: [Pet(name) for name in PetData.pet_names],
+        "pet predicates": lambda: pet_predicates(pets),
+        "egg/potion predicates": lambda: item_predicates(user),
+        "required food per pet": lambda: required_food_per_pet(pets),
+        "required food matrix": lambda: required_food_matrix(pets),
+    }
+    print(f"{len(PetData.pet_names)} pets")
+    for name, func in scenarios.items():
+        best = min(timeit.repeat(func, number=20, repeat=5)) / 20
+        print(f"{name:<22} {best * 1000:8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+A simulated Habitica API for hopla benchmarks.
+
+The simulation replaces requests.get and requests.post with functions that
+answer from an in-memory user and sleep according to a simple latency model:
+a round trip time per request plus the transfer time of the response body.
+This makes the benchmarks independent of the network and of the real API,
+while still charging realistic costs for large (e.g. full /user) responses.
+"""
+import contextlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+from unittest.mock import patch
+
+from hopla.hoplalib.hatchery.egg_data import EggData
+from hopla.hoplalib.zoo.fooddata import FoodData
+from hopla.hoplalib.zoo.petdata import PetData
+
+
+def realistic_user(*, n_tasks: int = 400) -> dict:
+    """Return a user with every pet, most mounts, food, and a realistic amount of tasks."""
+    pets = {pet: (5 + 5 * (i % 9)) if i % 4 else -1 for i, pet in enumerate(PetData.pet_names)}
+    mounts = {pet: True for i, pet in enumerate(PetData.pet_names) if i % 4 == 0}
+    food = {food_name: 7 + i % 13 for i, food_name in enumerate(FoodData.drop_food_names)}
+    eggs = {egg: 3 for egg in EggData.drop_egg_names}
+    tasks = [{"id": f"task-{i}", "text": "x" * 120, "notes": "y" * 200,
+              "checklist": [{"text": "item", "completed": False}] * 3,
+              "history": [{"date": 1600000000000 + j, "value": 1.5} for j in range(20)]}
+             for i in range(n_tasks)]
+    return {
+        "id": "c0ffee69-dada-feed-abb1-5ca1ab1ed004",
+        "stats": {"gp": 1234.5, "mp": 100, "hp": 50, "lvl": 100, "exp": 10, "class": "wizard"},
+        "party": {"quest": {"key": "rat", "progress": {"up": 3.5}}},
+        "items": {"pets": pets, "mounts": mounts, "food": food, "eggs": eggs,
+                  "hatchingPotions": {"Base": 4, "Golden": 2}},
+        "tasksOrder": {"todos": [task["id"] for task in tasks]},
+        "history": {"exp": [{"date": 1600000000000 + j, "value": j} for j in range(2000)]},
+        "filler": tasks,
+    }
+
+
+def project(user: dict, user_fields: Optional[str]) -> dict:
+    """Return only the requested (dotted) fields of the user, like ?userFields=..."""
+    if not user_fields:
+        return user
+    projected: dict = {"id": user["id"]}
+    for dotted in user_fields.split(","):
+        source, target = user, projected
+        *parents, leaf = dotted.split(".")
+        for parent in parents:
+            source = source[parent]
+            target = target.setdefault(parent, {})
+        target[leaf] = source[leaf]
+    return projected
+
+
+@dataclass
+class LatencyModel:
+    """Round trip time in seconds and bandwidth in bytes per second."""
+    round_trip_time: float = 0.120
+    bandwidth: float = 2_000_000
+
+
+class SimulatedResponse:
+    """The subset of requests.Response that hopla uses."""
+
+    def __init__(self, body: str, status_code: int = 200, headers: Optional[dict] = None):
+        self.text = body
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.text)
+
+
+@dataclass
+class SimulatedHabitica:
+    """The simulated API. Every request is recorded in calls."""
+    user: dict
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    calls: List[str] = field(default_factory=list)
+
+    def _respond(self, method: str, url: str, data, message: str = "") -> SimulatedResponse:
+        body = json.dumps({"success": True, "data": data, "message": message})
+        time.sleep(self.latency.round_trip_time + len(body) / self.latency.bandwidth)
+        self.calls.append(f"{method} {url.split('/api/v3', 1)[-1]}")
+        return SimulatedResponse(body)
+
+    def get(self, url: str, params: Optional[dict] = None, **_kwargs) -> SimulatedResponse:
+        if url.endswith("/api/v3/user"):
+            return self._respond("GET", url, project(self.user, (params or {}).get("userFields")))
+        if url.endswith("/groups/party"):
+            return self._respond("GET", url, {"name": "party", "quest": {"key": "rat",
+                                                                         "active": True}})
+        if url.endswith("/status"):
+            return self._respond("GET", url, {"status": "up"})
+        if url.endswith("/tasks/user"):
+            return self._respond("GET", url, self.user["filler"][:50])
+        return self._respond("GET", url, {})
+
+    def post(self, url: str, **_kwargs) -> SimulatedResponse:
+        if "/user/feed/" in url:
+            return self._respond("POST", url, -1, message="You have tamed the pet!")
+        return self._respond("POST", url, {})
+
+    @contextlib.contextmanager
+    def installed(self) -> Iterator["SimulatedHabitica"]:
+        """Route all the requests of hopla to this simulation (and use fake credentials)."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            auth_file = os.path.join(tmp_dir, "auth.conf")
+            with open(auth_file, mode="w", encoding="utf-8") as file:
+                file.write("[credentials]\n"
+                           "user_id = c0ffee69-dada-feed-abb1-5ca1ab1ed004\n"
+                           "api_token = c0ffee69-dada-feed-abb1-5ca1ab1ed005\n")
+            with patch.dict("os.environ", {"HOPLA_AUTH_FILE": auth_file,
+                                           "HOPLA_CONF_FILE": os.path.join(tmp_dir, "c")}), \
+                    patch("requests.get", self.get), patch("requests.post", self.post):
+                yield self
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark answering zoo questions with ZooHelper scans and with a ZooIndex,
+and making the collection report.
+
+Usage (from the repository root):
+    PYTHONPATH=src python developers/benchmarks/zoo_query.py
+
+The user has every pet that hopla knows about and every other mount. Every
+scenario asks the same three questions: feedable quest pets with a feed
+status above 30, magic potion pets without a mount, and all the Wolf pets.
+The collection report has to stay well under 100ms: it runs in shell prompts.
+"""
+import timeit
+
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.zoo.fooddata import FoodData
+from hopla.hoplalib.zoo.petdata import PetData
+from hopla.hoplalib.zoo.petregistry import PetCategory, get_pet_registry
+from hopla.hoplalib.zoo.zooindex import ZooIndex, ZooQuery
+from hopla.hoplalib.zoo.zoomodels import ZooBuilder, ZooHelper
+from hopla.hoplalib.zoo.zooreport import CollectionReport
+
+FEED_STATUSES = [5, 10, 15, 20, 25, 30, 35, 40, 45]
+QUERIES = [
+    ZooQuery(feedable=True, categories=(PetCategory.QUEST,), min_feed_status=31),
+    ZooQuery(categories=(PetCategory.MAGIC_POTION,), has_pet=True, has_mount=False),
+    ZooQuery(eggs=("Wolf",)),
+]
+
+
+def full_zoo_user() -> HabiticaUser:
+    return HabiticaUser(user_dict={"items": {
+        "pets": {name: FEED_STATUSES[i % len(FEED_STATUSES)]
+                 for i, name in enumerate(PetData.pet_names)},
+        "mounts": dict.fromkeys(PetData.pet_names[::2], True),
+        "food": dict.fromkeys(FoodData.drop_food_names, 999),
+    }})
+
+
+def scans(zoo):
+    helper = ZooHelper(zoo)
+    ZooHelper(helper.get_feedable_zoo()).filter_on_pet(
+        lambda pet: get_pet_registry()[pet.name].category == PetCategory.QUEST
+        and int(pet.feed_status) > 30)
+    helper.filter_on_pet_mount_pairs(
+        lambda pair: pair.pet_available() and not pair.mount_available()
+        and get_pet_registry()[pair.pet.name].category == PetCategory.MAGIC_POTION)
+    helper.filter_on_pet_name(lambda name: name.startswith("Wolf-"))
+
+
+def indexed(index: ZooIndex):
+    for query in QUERIES:
+        index.names(query)
+
+
+def main():
+    user = full_zoo_user()
+    zoo = ZooBuilder(user).build()
+    index = ZooIndex(zoo)
+    scenarios = {
+        "ZooHelper scans": lambda: scans(zoo),
+        "build ZooIndex": lambda: ZooIndex(zoo),
+        "ZooIndex queries": lambda: indexed(index),
+        "collection report": lambda: CollectionReport.from_user(user).to_dict(),
+    }
+    print(f"{len(zoo)} pets")
+    for name, func in scenarios.items():
+        best = min(timeit.repeat(func, number=20, repeat=5)) / 20
+        print(f"{name:<18} {best * 1000:8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+pytest hooks for all the tests, including the doctests of the hopla modules.
+"""
+import os
+import shutil
+import tempfile
+from typing import Optional
+
+import pytest
+
+from hopla.hoplalib.zoo.petregistry import get_pet_registry
+
+_ORIGINAL_XDG_CACHE_HOME: Optional[str] = os.environ.get("XDG_CACHE_HOME")
+
+
+def pytest_configure(config: pytest.Config) -> None:  # pylint: disable=unused-argument
+    """Point the cache directory of hopla at a temporary directory.
+
+    The tests then never write (or delete) the catalogue index, the content
+    tables, or the cached users in the real ~/.cache/hopla. This happens
+    before the collection, because some parametrized tests already create
+    eggs and pets (and therefore load the pet registry) while collecting.
+    """
+    os.environ["XDG_CACHE_HOME"] = tempfile.mkdtemp(prefix="hopla-tests-cache-")
+    get_pet_registry.cache_clear()
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:  # pylint: disable=unused-argument
+    """Remove the temporary cache directory, and restore the real one."""
+    shutil.rmtree(os.environ["XDG_CACHE_HOME"], ignore_errors=True)
+    if _ORIGINAL_XDG_CACHE_HOME is None:
+        del os.environ["XDG_CACHE_HOME"]
+    else:
+        os.environ["XDG_CACHE_HOME"] = _ORIGINAL_XDG_CACHE_HOME
+    get_pet_registry.cache_clear()
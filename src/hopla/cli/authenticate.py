@@ -4,6 +4,7 @@ The module with CLI code that handles the `hopla authenticate` command.
 import logging
 from uuid import UUID
 from dataclasses import dataclass
+from typing import Optional
 
 import click
 
@@ -13,16 +14,30 @@ log = logging.getLogger()
 
 
 @click.command()
-def authenticate():
+@click.option("--profile", metavar="NAME", default=None,
+              help="Store the credentials under this profile name instead of "
+                   "as the default credentials.")
+def authenticate(profile: Optional[str]):
     """Authorize yourself to access the Habitica.com API.
 
     hopla authenticate allows you to interactively provide access credentials.
+
+    \b
+    Examples
+    ---
+    # Store the credentials of your main account.
+    $ hopla authenticate
+
+    \b
+    # Store the credentials of a second account as the 'alice' profile.
+    $ hopla authenticate --profile alice
+    $ hopla --profiles alice get-user stats
     """
-    log.debug("hopla authenticate")
+    log.debug(f"hopla authenticate {profile=}")
 
     hopla_user_credentials: HoplaUserCredentials = request_user_for_credentials()
 
-    AuthorizationHandler().set_hopla_credentials(
+    AuthorizationHandler(profile=profile).set_hopla_credentials(
         user_id=hopla_user_credentials.user_id,
         api_token=hopla_user_credentials.api_token,
         overwrite=True
@@ -10,6 +10,7 @@ import requests
 from hopla.cli.groupcmds.get_user import HabiticaUser
 from hopla.hoplalib.cast.castcontroller import PostCastRequest
 from hopla.hoplalib.cast.spellmodel import Spell, SpellData
+from hopla.hoplalib.hopla_option import LazyChoice
 from hopla.hoplalib.requests_helper import get_data_or_exit
 from hopla.hoplalib.throttling import ApiRequestThrottler
 
@@ -17,7 +18,7 @@ log = logging.getLogger()
 
 
 @click.command()
-@click.argument("spell_name", type=click.Choice(SpellData.single_arg_spells))
+@click.argument("spell_name", type=LazyChoice(lambda: SpellData.single_arg_spells))
 @click.option("--until-out-of-mana", "-u", is_flag=True, default=False,
               help="Keep casting the specified spell until there is insufficient mana left.")
 def cast(spell_name: str, until_out_of_mana: bool) -> None:
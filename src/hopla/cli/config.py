@@ -46,8 +46,14 @@ def print_config_file_content():
             click.echo(line.strip())
 
 
-supported_config_names = click.Choice(["cmd_all.loglevel"])
-"""Values supported: debug,info,warning,error"""
+supported_config_names = click.Choice(["cmd_all.loglevel", "cmd_all.record_history",
+                                       "cmd_all.user_cache_max_age", "cmd_feed_all.strategy"])
+"""
+cmd_all.loglevel: debug,info,warning,error
+cmd_all.record_history: true,false
+cmd_all.user_cache_max_age: seconds, 0 disables the user cache
+cmd_feed_all.strategy: greedy,category-ordered,optimal,fewest-requests
+"""
 
 
 @click.command()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+The module with CLI code that handles the `hopla dashboard` command.
+"""
+import logging
+
+import click
+
+from hopla.hoplalib.dashboard import Dashboard, format_summary
+from hopla.hoplalib.outputformatter import JsonFormatter
+
+log = logging.getLogger()
+
+
+@click.command()
+@click.option("--json/--no-json", "json_flag", default=False, show_default=True,
+              help="Print the summary as JSON instead of text.")
+def dashboard(json_flag: bool) -> dict:
+    """Show an overview of your Habitica account.
+
+    The overview contains your stats, your party quest progress, the number
+    of pets you can feed and hatch, and your due To-Dos. The user, party,
+    API status, and To-Dos are requested concurrently.
+
+    \b
+    Examples
+    ---
+    # Show the overview
+    $ hopla dashboard
+
+    \b
+    # Get the number of feedable pets
+    $ hopla dashboard --json | jq .feedable_pets
+
+    \f
+    :param json_flag: print JSON instead of text
+    :return: the summary as a dict
+    """
+    log.debug(f"hopla dashboard {json_flag=}")
+    summary: dict = Dashboard.fetch().to_dict()
+    if json_flag:
+        click.echo(JsonFormatter(summary).format_with_double_quotes())
+    else:
+        click.echo(format_summary(summary))
+    return summary
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+The module with CLI code that handles the `hopla execute` command.
+"""
+import functools
+import logging
+import sys
+from pathlib import Path
+from typing import List, Union
+
+import click
+
+from hopla.cli.feed_all import (feed_pets_without_confirmation, feed_plan_and_executor,
+                                make_feed_plan)
+from hopla.cli.hatch_all import hatch_eggs_without_confirmation, make_hatch_plan
+from hopla.hoplalib import hopla_option
+from hopla.hoplalib.hatchery.hatchalgorithms import HatchPlan
+from hopla.hoplalib.planfile import FEED_PLAN, InvalidPlanFile, PlanFile
+from hopla.hoplalib.user.usercontroller import HabiticaUserRequest
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.zoo.feedexecutor import Planner
+from hopla.hoplalib.zoo.zoofeed_algorithms import DEFAULT_FEED_STRATEGY, FeedPlan
+
+log = logging.getLogger()
+
+REFUSE = "refuse"
+REBASE = "rebase"
+
+
+def __execute_feed_plan(plan_file: PlanFile, user: HabiticaUser, *,
+                        rebase: bool, no_interactive: bool) -> None:
+    planner: Planner = functools.partial(
+        make_feed_plan,
+        strategy=plan_file.options.get("strategy", DEFAULT_FEED_STRATEGY),
+        partial=plan_file.options.get("partial", False)
+    )
+    plan, executor = feed_plan_and_executor(user, planner,
+                                            None if rebase else plan_file.feed_plan())
+    __exit_if_empty(plan)
+    if no_interactive is False:
+        click.confirm(text=f"{plan.format_plan()}\nDo you want to proceed?", abort=True)
+    feed_pets_without_confirmation(executor)
+
+
+def __execute_hatch_plan(plan_file: PlanFile, user: HabiticaUser, *,
+                         rebase: bool, no_interactive: bool) -> None:
+    plan: HatchPlan = make_hatch_plan(user) if rebase else plan_file.hatch_plan()
+    __exit_if_empty(plan)
+    if no_interactive is False:
+        click.confirm(text=f"{plan.format_plan()}Do you want to proceed?", abort=True)
+    hatch_eggs_without_confirmation(plan)
+
+
+def __exit_if_empty(plan: Union[FeedPlan, HatchPlan]) -> None:
+    if plan.is_empty():
+        click.echo("The plan is empty. There is nothing to execute.")
+        sys.exit(0)
+
+
+@click.command()
+@click.argument("plan_file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--on-drift", type=click.Choice([REFUSE, REBASE]), default=REFUSE,
+              show_default=True,
+              help="What to do when the pets, mounts, food, eggs, or hatching potions "
+                   "changed since the plan was made: refuse to execute the plan, or "
+                   "make the plan again with the same options.")
+@hopla_option.no_interactive_option()
+def execute(plan_file: Path, on_drift: str, no_interactive: bool) -> None:
+    """Execute a plan of `hopla feed-all --plan-out` or `hopla hatch-all --plan-out`.
+
+    The plan file knows the state that the plan was made from. When that
+    state changed in the meantime, the plan may no longer make sense. By
+    default, the plan is then not executed.
+
+    \b
+    Examples
+    ---
+    # make the plan, review it, and execute it later
+    $ hopla feed-all --plan-out plan.json
+    $ cat plan.json
+    $ hopla execute plan.json --yes
+
+    \b
+    # make the plan again when the state changed since plan.json was made
+    $ hopla execute plan.json --on-drift rebase
+
+    \f
+    :param plan_file:
+    :param on_drift:
+    :param no_interactive:
+    """
+    log.debug(f"hopla execute {plan_file=} {on_drift=} {no_interactive=}")
+    try:
+        plan: PlanFile = PlanFile.read(plan_file)
+    except InvalidPlanFile as ex:
+        sys.exit(f"Can't read {plan_file}: {ex}")
+
+    user: HabiticaUser = HabiticaUserRequest().request_user_data_or_exit()
+    drift: List[str] = plan.drift(user)
+    if drift and on_drift == REFUSE:
+        sys.exit(f"The {', '.join(drift)} changed since the plan was made at "
+                 f"{plan.created_at}. Make a new plan, or use --on-drift {REBASE}.")
+    if drift:
+        click.echo(f"The {', '.join(drift)} changed since the plan was made. "
+                   "Made the plan again.")
+
+    execute_plan = __execute_feed_plan if plan.kind == FEED_PLAN else __execute_hatch_plan
+    execute_plan(plan, user, rebase=bool(drift), no_interactive=no_interactive)
@@ -4,23 +4,32 @@ The module with CLI code that handles the `hopla feed` command.
 import logging
 import sys
 from dataclasses import dataclass
-from typing import NoReturn, Optional, Union
+from typing import Any, Dict, List, NoReturn, Optional, TextIO, Tuple, Union
 
 import click
 import requests
 
-from hopla.cli.groupcmds.get_user import HabiticaUser, HabiticaUserRequest
+from hopla.cli.groupcmds.get_user import HabiticaUser
 from hopla.hoplalib.errors import YouFoundABugRewardError
+from hopla.hoplalib.hopla_option import LazyChoice
+from hopla.hoplalib.requests_helper import json_or_failure
+from hopla.hoplalib.throttling import RateLimitingAwareThrottler
+from hopla.hoplalib.user.usercontroller import UserRequestContext
 from hopla.hoplalib.zoo.feed_clickhelper import get_feed_data_or_exit
+from hopla.hoplalib.zoo.feedbatch import FeedBatchPlanner, InvalidFeedBatch, read_pet_names
 from hopla.hoplalib.zoo.fooddata import FoodData
 from hopla.hoplalib.zoo.foodmodels import FoodStockpile, FoodStockpileBuilder
 from hopla.hoplalib.zoo.petcontroller import FeedPostRequester
-from hopla.hoplalib.zoo.petdata import PetData
 from hopla.hoplalib.zoo.petmodels import Pet, PetMountPair
-from hopla.hoplalib.zoo.zoomodels import Zoo, ZooBuilder
+from hopla.hoplalib.zoo.petregistry import get_pet_registry
+from hopla.hoplalib.zoo.zoofeed_algorithms import FeedPlan
+from hopla.hoplalib.zoo.zoomodels import ZooBuilder
 
 log = logging.getLogger()
 
+FEED_USER_FIELDS = ["items.pets", "items.mounts", "items.food"]
+"""The only parts of the user that `hopla feed` needs."""
+
 MIN_FEED_TIMES = 0
 MAX_FEED_TIMES = 23
 valid_feed_amount_range = click.IntRange(min=MIN_FEED_TIMES,
@@ -36,17 +45,20 @@ def print_favorite_food_and_exit(pet_name: str):
     sys.exit()
 
 
-def get_feed_times_until_mount(pet_name: str, food_name: str) -> Union[int, NoReturn]:
+def get_feed_times_until_mount(pet_name: str, food_name: str, *,
+                               user_context: Optional[UserRequestContext] = None
+                               ) -> Union[int, NoReturn]:
     """
     Return how often a pet needs to be fed until it turns into a mount.
 
     :param pet_name: the pet to be fed
     :param food_name: the food to give the pet
+    :param user_context: the user of this invocation, requested if not given
     :return: times to feed, or exit if feeding this pet is not possible.
     """
-    user: HabiticaUser = HabiticaUserRequest().request_user_data_or_exit()
-    zoo: Zoo = ZooBuilder(user).build()
-    pair: PetMountPair = zoo.get(pet_name)
+    user_context = user_context or UserRequestContext(user_fields=FEED_USER_FIELDS)
+    user: HabiticaUser = user_context.user()
+    pair: Optional[PetMountPair] = ZooBuilder(user).build_pair(pet_name)
     if pair is None or pair.pet_available() is False:
         sys.exit(f"Can't feed pet {pet_name}. You don't have this pet.")
     if pair.mount_available():
@@ -60,19 +72,25 @@ def get_feed_times_until_mount(pet_name: str, food_name: str) -> Union[int, NoRe
     return pet.required_food_items_until_mount(food_name)
 
 
-def get_appropriate_food_or_exit(pet_name: str) -> Union[str, NoReturn]:
+def get_appropriate_food_or_exit(pet_name: str, *,
+                                 user_context: Optional[UserRequestContext] = None
+                                 ) -> Union[str, NoReturn]:
     """Return the food that is appropriate for this pet.
 
     For pets hatched with normal hatching potion, return their favorite food.
     For pets hatched with magic hatching potion, return the most abundant food you have.
     Other types of pets should not be received by this function.
+
+    :param pet_name: the pet to be fed
+    :param user_context: the user of this invocation, requested if not given
     """
     pet = Pet(pet_name)
     if pet.has_just_1_favorite_food():
         return pet.favorite_food()
 
     if pet.likes_all_food():
-        user: HabiticaUser = HabiticaUserRequest().request_user_data_or_exit()
+        user_context = user_context or UserRequestContext(user_fields=FEED_USER_FIELDS)
+        user: HabiticaUser = user_context.user()
         stockpile: FoodStockpile = FoodStockpileBuilder().user(user).build()
         return stockpile.get_most_abundant_food()
 
@@ -83,18 +101,108 @@ def get_appropriate_food_or_exit(pet_name: str) -> Union[str, NoReturn]:
     raise YouFoundABugRewardError(msg)
 
 
+def split_pet_and_food_names(names: Tuple[str, ...]) -> Tuple[List[str], Optional[str]]:
+    """Split the PET_NAME... [FOOD_NAME] arguments into the pet names and the food name.
+
+    >>> split_pet_and_food_names(("Wolf-Base", "Fox-Red", "Meat"))
+    (['Wolf-Base', 'Fox-Red'], 'Meat')
+    """
+    food_names: List[str] = [name for name in names if name in FoodData.drop_food_names]
+    if len(food_names) > 1 or (food_names and names[-1] != food_names[0]):
+        raise click.UsageError("Specify at most one FOOD_NAME, after the PET_NAMEs.")
+    food_name: Optional[str] = food_names[0] if food_names else None
+    return [name for name in names if name != food_name], food_name
+
+
+def read_pet_names_or_exit(file: TextIO) -> Union[List[str], NoReturn]:
+    """Return the pet names of the file, one per line. Exit if any pet is unknown."""
+    pet_names: List[str] = read_pet_names(file)
+    feedable_pet_names = set(get_pet_registry().feedable_pet_names())
+    unknown: List[str] = [name for name in pet_names if name not in feedable_pet_names]
+    if unknown:
+        raise click.BadParameter(f"These are not feedable pets: {', '.join(unknown)}",
+                                 param_hint="'--from-file'")
+    return pet_names
+
+
+def feed_pet_or_exit(pet_name: str, *, food_name: Optional[str], times: Optional[int],
+                     until_mount: bool) -> Union[dict, NoReturn]:
+    """Feed a single pet, and return the feed data. Exit if the feed fails.
+
+    Note: this API endpoint expect 'amount' as a query params (?amount=N) instead
+    of a request body (even though it is a HTTP POST).
+    """
+    # Both the food selection and --until-mount need the user: request it once.
+    user_context = UserRequestContext(user_fields=FEED_USER_FIELDS)
+    if food_name is None:
+        food_name = get_appropriate_food_or_exit(pet_name=pet_name, user_context=user_context)
+        log.debug(f"Food is automatically selected to be {food_name=}.")
+
+    if until_mount:
+        times = get_feed_times_until_mount(pet_name=pet_name,
+                                           food_name=food_name,
+                                           user_context=user_context)
+    else:
+        times = times or 1
+
+    pet_feed_request = FeedPostRequester(
+        pet_name=pet_name,
+        food_name=food_name,
+        food_amount=times
+    )
+
+    response: requests.Response = pet_feed_request.post_feed_request()
+    return get_feed_data_or_exit(feed_response=response)
+
+
+def feed_pets_or_exit(pet_names: List[str], *, food_name: Optional[str],
+                      times: Optional[int]) -> Optional[NoReturn]:
+    """Feed several pets with a single user request, and the feed requests throttled.
+
+    :param pet_names: the pets to feed
+    :param food_name: the food of every pet, the appropriate food of every pet when None
+    :param times: how much food every pet gets, until it is a mount when None
+    :return: exit when any pet can't be fed, or when any feed request fails
+    """
+    user: HabiticaUser = UserRequestContext(user_fields=FEED_USER_FIELDS).user()
+    try:
+        plan: FeedPlan = FeedBatchPlanner(user, food_name=food_name,
+                                          times=times).make_plan(pet_names)
+    except InvalidFeedBatch as ex:
+        sys.exit(str(ex))
+    if _feed_plan(plan) is False:
+        sys.exit(1)
+
+
+def _feed_plan(plan: FeedPlan) -> bool:
+    """Feed the pets of the plan, and print the outcomes. Return True if all succeeded."""
+    api_requests = [FeedPostRequester.build_from(item).post_feed_request for item in plan]
+    responses = RateLimitingAwareThrottler(api_requests).perform_and_yield_response()
+    succeeded = True
+    for item, response in zip(plan, responses):
+        response_json: Dict[str, Any] = json_or_failure(response)
+        if response_json["success"] is True:
+            click.echo(response_json["message"])
+        else:
+            succeeded = False
+            click.echo(f"Failed to feed {item.pet_name}\n"
+                       f"{response_json['error']}: {response_json['message']}")
+    return succeeded
+
+
 _TIMES_OPTION = "--times"
 _UNTIL_MOUNT_OPTION = "--until-mount"
 
 
 @click.command()
 @click.argument(
-    "pet_name", type=click.Choice(PetData.feedable_pet_names),
-    metavar="PET_NAME"
+    "names", nargs=-1,
+    type=LazyChoice(lambda: [*get_pet_registry().feedable_pet_names(), *FoodData.drop_food_names]),
+    metavar="PET_NAME... [FOOD_NAME]"
 )
-@click.argument(
-    "food_name", type=click.Choice(FoodData.drop_food_names),
-    metavar="[FOOD_NAME]", required=False
+@click.option(
+    "--from-file", type=click.File(), metavar="FILE",
+    help="Also feed the pets of this file, one PET_NAME per line. Use - for stdin."
 )
 @click.option(
     _TIMES_OPTION, type=valid_feed_amount_range,
@@ -113,15 +221,18 @@ _UNTIL_MOUNT_OPTION = "--until-mount"
     default=False, show_default=True,
     help="Print favorite food for PET_NAME and exit."
 )
-def feed(pet_name: str, food_name: str,
+def feed(names: Tuple[str, ...], from_file: Optional[TextIO],
          times: int, until_mount: bool,
          list_favorite_food: bool):
-    """Feed a single pet.
+    """Feed a pet, or a batch of pets.
 
      \b
      PET_NAME   name of the pet (e.g. Wolf-Golden)
      FOOD_NAME  name of the food (e.g. Honey).
 
+     A batch of pets needs a single user request. It is refused as a
+     whole if any of its pets can't be fed.
+
      \b
      Examples:
      ---
@@ -152,6 +263,15 @@ def feed(pet_name: str, food_name: str,
      # this pet, or not enough potatoes.
      $ hopla feed --times=5 Snail-Desert Potatoe
 
+     \b
+     # Feed several pets their favorite food until they are mounts
+     $ hopla feed --until-mount Wolf-Base Fox-Red Cactus-Golden
+
+     \b
+     # Feed the feedable quest pets that are almost mounts
+     $ hopla zoo query --feedable --category quest --min-feed-status 40 \\
+         | hopla feed --until-mount --from-file -
+
      \b
      # List a pet's favorite food
      $ hopla feed Axolotl-Base --list-favorite-food
@@ -166,38 +286,30 @@ def feed(pet_name: str, food_name: str,
      [API-docs](https://habitica.com/apidoc/#api-User-UserFeed)
     \f
     :return:
-
-    Note: this API endpoint expect 'amount' as a query params (?amount=N) instead
-    of a request body (even though it is a HTTP POST).
     """
-    log.debug(f"hopla feed {pet_name=}, {food_name=}"
+    log.debug(f"hopla feed {names=}, {from_file=}"
               f" {times=} {until_mount=}"
               f" {list_favorite_food=}")
 
     FeedCommandParameterChecker(times=times, until_mount=until_mount) \
         .raise_if_conflicting_feed_time_options()
 
+    pet_names, food_name = split_pet_and_food_names(names)
+    if from_file is not None:
+        pet_names += read_pet_names_or_exit(from_file)
+    if len(pet_names) == 0:
+        raise click.UsageError("Missing argument 'PET_NAME...'.")
     if list_favorite_food:
-        print_favorite_food_and_exit(pet_name=pet_name)
-
-    if food_name is None:
-        food_name = get_appropriate_food_or_exit(pet_name=pet_name)
-        log.debug(f"Food is automatically selected to be {food_name=}.")
-
-    if until_mount:
-        times: int = get_feed_times_until_mount(pet_name=pet_name,
-                                                food_name=food_name)
-    else:
-        times: int = times or 1
+        if len(pet_names) > 1:
+            raise click.UsageError("--list-favorite-food takes a single PET_NAME.")
+        print_favorite_food_and_exit(pet_name=pet_names[0])
 
-    pet_feed_request = FeedPostRequester(
-        pet_name=pet_name,
-        food_name=food_name,
-        food_amount=times
-    )
+    if len(pet_names) > 1 or from_file is not None:
+        return feed_pets_or_exit(pet_names, food_name=food_name,
+                                 times=None if until_mount else times or 1)
 
-    response: requests.Response = pet_feed_request.post_feed_request()
-    return get_feed_data_or_exit(feed_response=response)
+    return feed_pet_or_exit(pet_names[0], food_name=food_name,
+                            times=times, until_mount=until_mount)
 
 
 @dataclass
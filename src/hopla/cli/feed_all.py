@@ -2,32 +2,75 @@
 """
 The module with CLI code that handles the `hopla feed-all` command.
 """
+import functools
 import logging
 import sys
-from typing import Any, Callable, Dict, Iterator, List, NoReturn, Optional, Union
+from pathlib import Path
+from typing import Any, Dict, NoReturn, Optional, Tuple
 
 import click
-from requests import Response
 
 from hopla.hoplalib import hopla_option
 from hopla.cli.groupcmds.get_user import HabiticaUser, HabiticaUserRequest
+from hopla.hoplalib.configuration import ConfigurationFileParser
+from hopla.hoplalib.planfile import PlanFile
 from hopla.hoplalib.throttling import RateLimitingAwareThrottler
+from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
+from hopla.hoplalib.zoo.feedexecutor import AdaptiveFeedExecutor, Planner
 from hopla.hoplalib.zoo.foodmodels import FoodStockpile, FoodStockpileBuilder
-from hopla.hoplalib.zoo.petcontroller import FeedPostRequester
-from hopla.hoplalib.zoo.zoomodels import Zoo, ZooBuilder
-from hopla.hoplalib.zoo.zoofeed_algorithms import FeedAlgorithm, FeedPlan
+from hopla.hoplalib.zoo.zoofeed_algorithms import (DEFAULT_FEED_STRATEGY, FEED_STRATEGIES,
+                                                   FeedPlan, add_partial_feeding)
 
 log = logging.getLogger()
 
 
-def __get_feed_plan_or_exit() -> Union[NoReturn, FeedPlan]:
-    """Get the user and build the feed plan"""
-    user: HabiticaUser = HabiticaUserRequest().request_user_data_or_exit()
-    stockpile: FoodStockpile = FoodStockpileBuilder().user(user).build()
-    zoo: Zoo = ZooBuilder(user).build(skip_unsupported_pets=True)
+FEED_ALL_STRATEGY_CONFIG_NAME = "cmd_feed_all.strategy"
+"""The config name with the strategy of `hopla feed-all` when --strategy is not given."""
+
+
+def configured_strategy() -> str:
+    """Return the configured feed strategy, or the default strategy if it isn't valid."""
+    strategy: str = ConfigurationFileParser().get_full_config_name(
+        FEED_ALL_STRATEGY_CONFIG_NAME, fallback=DEFAULT_FEED_STRATEGY
+    )
+    if strategy not in FEED_STRATEGIES:
+        log.warning(f"{FEED_ALL_STRATEGY_CONFIG_NAME}={strategy} is not one of "
+                    f"{list(FEED_STRATEGIES)}")
+        return DEFAULT_FEED_STRATEGY
+    return strategy
+
+
+def _strategies_help() -> str:
+    return " ".join(f"{name}: {strategy.description}"
+                    for name, strategy in FEED_STRATEGIES.items())
 
-    algorithm = FeedAlgorithm(zoo=zoo, stockpile=stockpile)
-    return algorithm.make_plan()
+
+def make_feed_plan(zoo: ColumnarZoo, stockpile: FoodStockpile, *,
+                   strategy: str, partial: bool) -> FeedPlan:
+    """Make the feed plan with the algorithm of the strategy"""
+    algorithm = FEED_STRATEGIES[strategy](zoo=zoo, stockpile=stockpile)
+    plan: FeedPlan = algorithm.make_plan()
+    if partial:
+        add_partial_feeding(plan, zoo=zoo, stockpile=algorithm.stockpile)
+    return plan
+
+
+def feed_plan_and_executor(user: HabiticaUser, planner: Planner,
+                           plan: Optional[FeedPlan] = None
+                           ) -> Tuple[FeedPlan, AdaptiveFeedExecutor]:
+    """Build the feed plan of the user, and the executor that feeds it
+
+    :param user: the user with the pets, mounts, and food to plan for
+    :param planner: makes the plan, and the rest of the plan after a failure
+    :param plan: the plan to execute instead of a new plan of the planner
+    """
+    pets: Dict[str, int] = user.get_pets()
+    mounts: Dict[str, Optional[bool]] = user.get_mounts()
+    stockpile: FoodStockpile = FoodStockpileBuilder().user(user).build()
+    if plan is None:
+        plan = planner(ColumnarZoo.from_pets_and_mounts(pets=pets, mounts=mounts), stockpile)
+    return plan, AdaptiveFeedExecutor(plan, pets=pets, mounts=mounts,
+                                      stockpile=stockpile, planner=planner)
 
 
 def __confirm_with_user_or_abort(plan: FeedPlan) -> Optional[NoReturn]:
@@ -41,36 +84,47 @@ def __confirm_with_user_or_abort(plan: FeedPlan) -> Optional[NoReturn]:
     click.confirm(text=prompt_msg, abort=True)
 
 
-def __feed_pets_without_confirmation(plan: FeedPlan):
+def feed_pets_without_confirmation(executor: AdaptiveFeedExecutor):
     """Feed all the pets in the plan. Print the result to the terminal.
 
+    When feeding a pet fails, the rest of the plan is made again.
+
     Warning: this function does ask for confirmation.
     """
-    # Feel free to refactor this such that we don't iterate over
-    # the plan twice.
-    feed_requests: List[Callable[[], Response]] = [
-        FeedPostRequester.build_from(item).post_feed_request
-        for item in plan
-    ]
-    throttler = RateLimitingAwareThrottler(feed_requests)
-    feed_response_iter: Iterator[Response] = throttler.perform_and_yield_response()
-    for item in plan:
-        feed_response: Response = next(feed_response_iter)
-        response_json: Dict[str, Any] = feed_response.json()
-        if response_json["success"] is True:
+    for outcome in executor.execute(RateLimitingAwareThrottler()):
+        response_json: Dict[str, Any] = outcome.response_json
+        if outcome.success:
             click.echo(response_json["message"])
         else:
-            click.echo(f"Failed to feed {item.pet_name}\n"
+            click.echo(f"Failed to feed {outcome.item.pet_name}\n"
                        f"{response_json['error']}: {response_json['message']}")
+        if outcome.replanned:
+            click.echo(f"Replanned the rest: {len(executor.remaining_items)} feed items left.")
 
 
 @click.command()
+@click.option("--strategy", type=click.Choice(list(FEED_STRATEGIES)),
+              help=f"{_strategies_help()} Defaults to the {FEED_ALL_STRATEGY_CONFIG_NAME} "
+                   f"config, or {DEFAULT_FEED_STRATEGY}.")
+@click.option("--partial", is_flag=True, default=False,
+              help="Also feed the food that is left to the pets that are closest to "
+                   "becoming a mount.")
+@click.option("--plan-out", type=click.Path(dir_okay=False, writable=True, path_type=Path),
+              help="Write the feed plan to this file instead of feeding the pets. "
+                   "Feed the pets later with `hopla execute`.")
 @hopla_option.no_interactive_option()
-def feed_all(no_interactive: bool) -> None:
+def feed_all(strategy: Optional[str], partial: bool, plan_out: Optional[Path],
+             no_interactive: bool) -> None:
     """Feed all your pets.
 
     This command will first feed normal pets, then your quest pets, and
     finally all your pets that were hatched with magic hatching potions.
+    With `--strategy optimal`, the pets that need the fewest food items
+    go first instead, so the same food turns more pets into mounts.
+
+    The plan only feeds pets that it can turn into mounts. With `--partial`,
+    the food that is left goes to the pets that need the fewest food items,
+    so those pets become mounts with the next food that drops.
 
     Not this command will first show you the feed plan, and for safety,
     ask for your confirmation. Pets will only if you confirm this prompt.
@@ -91,11 +145,34 @@ def feed_all(no_interactive: bool) -> None:
     $ hopla feed-all --yes
     $ hopla feed-all --force
 
+    \b
+    # get the most mounts out of your food
+    $ hopla feed-all --strategy optimal
+
+    \b
+    # always use the optimal strategy
+    $ hopla config cmd_feed_all.strategy optimal
+
+    \b
+    # don't let any food sit idle
+    $ hopla feed-all --partial
+
+    \b
+    # plan now, review the plan, and feed the pets later
+    $ hopla feed-all --plan-out plan.json
+    $ hopla execute plan.json
+
     \f
+    :param strategy:
+    :param partial:
+    :param plan_out:
     :param no_interactive:
     """
-    log.debug(f"hopla feed-all {no_interactive=}")
-    plan: FeedPlan = __get_feed_plan_or_exit()
+    log.debug(f"hopla feed-all {strategy=} {partial=} {plan_out=} {no_interactive=}")
+    strategy = strategy or configured_strategy()
+    planner: Planner = functools.partial(make_feed_plan, strategy=strategy, partial=partial)
+    user: HabiticaUser = HabiticaUserRequest().request_user_data_or_exit()
+    plan, executor = feed_plan_and_executor(user, planner)
     if plan.is_empty():
         click.echo(
             "The feed plan is empty. Reasons for this could be:\n"
@@ -105,7 +182,12 @@ def feed_all(no_interactive: bool) -> None:
         )
         sys.exit(0)
 
+    if plan_out is not None:
+        PlanFile.of_feed_plan(plan, user=user, strategy=strategy, partial=partial).write(plan_out)
+        click.echo(f"Wrote the feed plan of {len(plan)} items to {plan_out}.")
+        return
+
     if no_interactive is False:
         __confirm_with_user_or_abort(plan)
 
-    __feed_pets_without_confirmation(plan)
+    feed_pets_without_confirmation(executor)
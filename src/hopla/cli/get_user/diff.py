@@ -0,0 +1,85 @@
+"""
+The module with CLI code that handles the `hopla get-user diff` command.
+"""
+import logging
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import click
+
+from hopla.hoplalib.authorization import AuthorizationHandler
+from hopla.hoplalib.outputformatter import JsonFormatter
+from hopla.hoplalib.user.userhistory import (RECORD_HISTORY_CONFIG_NAME, UserHistoryStore,
+                                             UserSnapshot, UserSnapshotDiff)
+
+log = logging.getLogger()
+
+
+class DurationParamType(click.ParamType):
+    """A click parameter type for durations such as 30m, 12h, 1d, and 2w."""
+    name = "duration"
+
+    UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+    def convert(self, value, param: Optional[click.Parameter],
+                ctx: Optional[click.Context]) -> timedelta:
+        """Turn a duration string into a timedelta.
+
+        >>> DurationParamType().convert("36h", None, None)
+        datetime.timedelta(days=1, seconds=43200)
+        >>> DurationParamType().convert("2w", None, None)
+        datetime.timedelta(days=14)
+        """
+        if isinstance(value, timedelta):
+            return value
+        match = re.fullmatch(r"\s*(\d+)\s*([smhdw])\s*", str(value))
+        if match is None:
+            self.fail(f"{value!r} is not a duration such as 30m, 12h, 1d, or 2w.", param, ctx)
+        amount, unit = match.groups()
+        return timedelta(**{DurationParamType.UNITS[unit]: int(amount)})
+
+
+@click.command()
+@click.option("--since", "since", type=DurationParamType(), default="1d", show_default=True,
+              help="How far back to compare the user with, e.g. 30m, 12h, 1d, or 2w.")
+def diff(since: timedelta) -> dict:
+    """Show what changed about the user according to the recorded history.
+
+    This compares the most recent recorded snapshot of the user with the
+    snapshot of the specified time ago. It makes no API requests. Enable
+    the recording of snapshots with:
+    `hopla config cmd_all.record_history true`
+
+    \b
+    Examples
+    ---
+    # show the pets gained, food consumed, and gold spent in the last day
+    $ hopla get-user diff
+
+    \b
+    # show what changed in the last 2 weeks
+    $ hopla get-user diff --since 2w
+
+    \f
+    :param since: how far back to look
+    :return: the diff as a dict
+    """
+    log.debug(f"hopla get-user diff {since=}")
+    store = UserHistoryStore()
+    user_id: str = AuthorizationHandler().user_id
+    latest: Optional[UserSnapshot] = store.latest(user_id)
+    if latest is None:
+        sys.exit("No user snapshots have been recorded yet. Enable the user history with:\n"
+                 f"  hopla config {RECORD_HISTORY_CONFIG_NAME} true")
+
+    baseline: UserSnapshot = store.baseline(user_id, since=datetime.now(timezone.utc) - since)
+    user_diff = UserSnapshotDiff(old=store.load_user(baseline), new=store.load_user(latest))
+    result: dict = {
+        "from": baseline.taken_at.isoformat(),
+        "to": latest.taken_at.isoformat(),
+        **user_diff.to_dict()
+    }
+    click.echo(JsonFormatter(result).format_with_double_quotes())
+    return result
@@ -6,7 +6,8 @@ import logging
 import click
 import requests
 
-from hopla.hoplalib.requests_helper import get_data_or_exit
+from hopla.hoplalib.contenttables import ContentTablesCache
+from hopla.hoplalib.requests_helper import get_data_from_json_or_exit, get_data_or_exit
 from hopla.hoplalib.http import HabiticaRequest, UrlBuilder
 from hopla.hoplalib.common import GlobalConstants
 from hopla.hoplalib.outputformatter import JsonFormatter
@@ -33,9 +34,16 @@ class ApiContentRequest:
         """
         Function that requests the habitica API content.
         If the request was successful return the content, else exits.
+
+        The tables that hopla needs from the content are cached, such that
+        hopla knows about the pets, eggs, potions, and spells of new releases.
         """
         api_response: requests.Response = self.request_api_content()
-        return get_data_or_exit(api_response)
+        response_json: dict = api_response.json()
+        content_data: dict = get_data_from_json_or_exit(response_json,
+                                                        status_code=api_response.status_code)
+        ContentTablesCache().refresh(content_data, app_version=response_json.get("appVersion"))
+        return content_data
 
 
 @api.command()
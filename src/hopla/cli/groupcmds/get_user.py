@@ -2,6 +2,8 @@
 The module with CLI code that handles the `hopla get` group command.
 """
 import logging
+from functools import update_wrapper
+from typing import Callable
 
 import click
 
@@ -10,16 +12,29 @@ from hopla.hoplalib.user.usermodels import HabiticaUser
 
 log = logging.getLogger()
 
-pass_user = click.make_pass_decorator(HabiticaUser)
+
+def pass_user(func: Callable) -> Callable:
+    """
+    Decorator that passes the HabiticaUser as the first argument of a command.
+
+    The user is only requested from the Habitica API when a command needs it,
+    so commands such as `hopla get-user diff` don't make any API requests.
+    """
+
+    @click.pass_context
+    def new_func(ctx: click.Context, *args, **kwargs):
+        user = ctx.find_object(HabiticaUser)
+        if user is None:
+            user = HabiticaUserRequest(allow_cached=True).request_user_data_or_exit()
+            ctx.obj = user
+        return ctx.invoke(func, user, *args, **kwargs)
+
+    return update_wrapper(new_func, func)
 
 
 @click.group()
-@click.pass_context
-def get_user(ctx: click.Context) -> HabiticaUser:
+def get_user() -> None:
     """
     GROUP for getting user information from Habitica.
     """
     log.debug("hopla get-user")
-    user: HabiticaUser = HabiticaUserRequest().request_user_data_or_exit()
-    ctx.obj = user
-    return user
@@ -4,9 +4,8 @@ The module with CLI code that handles the `hopla set` group command.
 import logging
 
 import click
-import requests
 
-from hopla.hoplalib.http import RequestHeaders, UrlBuilder
+from hopla.hoplalib.http import UrlBuilder
 from hopla.hoplalib.outputformatter import JsonFormatter
 from hopla.hoplalib.http import HabiticaRequest
 
@@ -53,16 +52,10 @@ def day_start(day_start_hour, json_flag: bool):
     """
     log.debug(f"hopla set day-start {day_start_hour}")
 
-    headers = RequestHeaders().get_default_request_headers()
     body = {"dayStart": day_start_hour}
     url = UrlBuilder(path_extension="/user/custom-day-start").url
 
-    response = requests.post(
-        url=url,
-        headers=headers,
-        json=body,
-        timeout=HabiticaRequest.TIMEOUT
-    )
+    response = HabiticaRequest().post_user_change(url, json=body)
 
     json = response.json()
     json_data = json["data"]
@@ -0,0 +1,136 @@
+"""
+The module with CLI code that handles the `hopla webhook` group command.
+"""
+import logging
+import secrets
+import sys
+from typing import FrozenSet, List, Optional
+
+import click
+import requests
+
+from hopla.hoplalib.authorization import AuthorizationHandler
+from hopla.hoplalib.http import HabiticaRequest
+from hopla.hoplalib.outputformatter import JsonFormatter
+from hopla.hoplalib.user.usercache import USER_CACHE_MAX_AGE_CONFIG_NAME, UserSnapshotCache
+from hopla.hoplalib.webhooks import (WebhookAuthorization, WebhookEvent, WebhookEventHandler,
+                                     WebhookEventTypes, WebhookServer, sample_event)
+
+log = logging.getLogger()
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+sample_event_types: List[str] = sorted(
+    event_type for event_types in WebhookEventTypes.EVENT_TYPES.values()
+    for event_type in event_types if event_type is not None
+)
+
+
+def configured_user_ids() -> FrozenSet[str]:
+    """Return the user ids of all the profiles with valid credentials."""
+    user_ids = []
+    for profile in AuthorizationHandler().profile_names():
+        handler = AuthorizationHandler(profile=profile)
+        if handler.auth_file_is_valid():
+            user_ids.append(handler.user_id)
+    return frozenset(user_ids)
+
+
+@click.group()
+def webhook():
+    """GROUP for receiving Habitica webhooks."""
+
+
+@webhook.command()
+@click.option("--host", default=DEFAULT_HOST, show_default=True,
+              help="The address to listen on.")
+@click.option("--port", type=click.IntRange(min=0, max=65535), default=DEFAULT_PORT,
+              show_default=True, help="The port to listen on.")
+@click.option("--secret", metavar="SECRET",
+              help="The secret that requests must have in the path of the URL, or "
+                   f"in the {WebhookAuthorization.SECRET_HEADER_NAME} header. "
+                   "A random secret when not specified.")
+def serve(host: str, port: int, secret: Optional[str]) -> None:
+    """Receive Habitica webhooks to keep the cached user fresh.
+
+    Every received event is applied to the cached user, or invalidates it.
+    This only helps when the user cache is enabled, for example with:
+    `hopla config cmd_all.user_cache_max_age 3600`
+
+    Register the printed URL of this receiver as a webhook on habitica.com
+    (or make it reachable through a tunnel). The URL has the secret of the
+    receiver in its path. Only events of the users of your profiles are
+    accepted. Stop the receiver with CTRL-C.
+
+    \b
+    Examples
+    ---
+    # receive webhooks on http://127.0.0.1:8080/SECRET
+    $ hopla webhook serve --secret SECRET
+
+    \b
+    # listen on all interfaces
+    $ hopla webhook serve --host 0.0.0.0 --port 9000
+
+    [API-docs](https://habitica.com/apidoc/#api-Webhook)
+    """
+    log.debug(f"hopla webhook serve {host=} {port=}")
+    if UserSnapshotCache.max_age() == 0:
+        click.echo(f"Warning: the user cache is disabled ({USER_CACHE_MAX_AGE_CONFIG_NAME}=0).",
+                   err=True)
+    user_ids: FrozenSet[str] = configured_user_ids()
+    if not user_ids:
+        sys.exit("No credentials found. Please run: hopla authenticate")
+    authorization = WebhookAuthorization(secret or secrets.token_urlsafe(16), user_ids=user_ids)
+
+    def echo_event(event: WebhookEvent, outcome: str) -> None:
+        click.echo(f"{event.webhook_type}/{event.event_type} for {event.user_id}: {outcome}")
+
+    server = WebhookServer((host, port), authorization=authorization,
+                           event_handler=WebhookEventHandler(), on_event=echo_event)
+    click.echo(f"Receiving webhooks on "
+               f"http://{host}:{server.server_address[1]}/{authorization.secret}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        click.echo("Stopped receiving webhooks.")
+    finally:
+        server.server_close()
+
+
+@webhook.command(name="send-test")
+@click.argument("event_type", type=click.Choice(sample_event_types))
+@click.option("--url", default=f"http://{DEFAULT_HOST}:{DEFAULT_PORT}/", show_default=True,
+              help="The webhook receiver to send the event to.")
+@click.option("--pet", default="Wolf-Base", show_default=True,
+              help="The pet of petHatched and mountRaised events.")
+@click.option("--secret", metavar="SECRET",
+              help="The secret of the receiver. Not needed when the URL has the secret.")
+def send_test(event_type: str, url: str, pet: str, secret: Optional[str]) -> dict:
+    """Send a sample webhook event to a receiver, like Habitica would.
+
+    This lets you test `hopla webhook serve` offline. The event is
+    sent on behalf of the authenticated user.
+
+    \b
+    Examples
+    ---
+    # pretend that a Wolf-Base just hatched
+    $ hopla webhook send-test petHatched --secret SECRET
+
+    \b
+    # pretend that a task was scored
+    $ hopla webhook send-test scored --url http://127.0.0.1:9000/SECRET
+
+    \f
+    :return: the response of the receiver
+    """
+    log.debug(f"hopla webhook send-test {event_type=} {url=} {pet=}")
+    event: dict = sample_event(event_type, user_id=AuthorizationHandler().user_id, pet=pet)
+    headers = {} if secret is None else {WebhookAuthorization.SECRET_HEADER_NAME: secret}
+    response = requests.post(url=url, json=event, headers=headers,
+                             timeout=HabiticaRequest.TIMEOUT)
+    response_json: dict = response.json()
+    click.echo(JsonFormatter(response_json).format_with_double_quotes())
+    return response_json
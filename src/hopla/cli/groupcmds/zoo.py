@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+The module with CLI code that handles the `hopla zoo` GROUP command.
+"""
+import logging
+
+import click
+
+log = logging.getLogger()
+
+
+@click.group()
+def zoo() -> None:
+    """GROUP for questions about your pets and mounts."""
+    log.debug("hopla zoo")
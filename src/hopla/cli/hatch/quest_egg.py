@@ -9,6 +9,7 @@ import click
 from hopla.cli.groupcmds.hatch import hatch_egg
 from hopla.hoplalib.hatchery.egg_data import EggData
 from hopla.hoplalib.hatchery.hatchpotion_data import HatchPotionData
+from hopla.hoplalib.hopla_option import LazyChoice
 
 log = logging.getLogger()
 
@@ -16,11 +17,11 @@ log = logging.getLogger()
 @click.command()
 @click.argument(
     "egg_name", metavar="QUEST_EGG_NAME",
-    type=click.Choice(EggData.quest_egg_names)
+    type=LazyChoice(lambda: EggData.quest_egg_names)
 )
 @click.argument(
     "potion_name",
-    type=click.Choice(HatchPotionData.drop_hatch_potion_names)
+    type=LazyChoice(lambda: HatchPotionData.drop_hatch_potion_names)
 )
 def quest_egg(egg_name: str, potion_name: str):
     """hatch a quest egg.
@@ -10,6 +10,7 @@ import click
 from hopla.cli.groupcmds.hatch import hatch_egg
 from hopla.hoplalib.hatchery.egg_data import EggData
 from hopla.hoplalib.hatchery.hatchpotion_data import HatchPotionData
+from hopla.hoplalib.hopla_option import LazyChoice
 
 log = logging.getLogger()
 
@@ -17,11 +18,11 @@ log = logging.getLogger()
 @click.command()
 @click.argument(
     "egg_name", metavar="STANDARD_EGG_NAME",
-    type=click.Choice(EggData.drop_egg_names)
+    type=LazyChoice(lambda: EggData.drop_egg_names)
 )
 @click.argument(
     "potion_name", metavar="POTION_NAME",
-    type=click.Choice(sorted(HatchPotionData.hatch_potion_names))
+    type=LazyChoice(lambda: sorted(HatchPotionData.hatch_potion_names))
 )
 def standard_egg(egg_name: str, potion_name: str) -> NoReturn:
     """Hatch a standard egg.
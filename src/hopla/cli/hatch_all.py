@@ -4,7 +4,8 @@ The module with CLI code that handles the `hopla hatch-all` command.
 """
 import logging
 import sys
-from typing import Any, Callable, Dict, Iterator, List
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 import click
 from requests import Response
@@ -14,6 +15,7 @@ from hopla.hoplalib.hatchery.eggmodels import EggCollection
 from hopla.hoplalib.hatchery.hatchalgorithms import HatchPlan, HatchPlanMaker
 from hopla.hoplalib.hatchery.hatchcontroller import HatchRequester
 from hopla.hoplalib.hatchery.hatchpotionmodels import HatchPotionCollection
+from hopla.hoplalib.planfile import PlanFile
 from hopla.hoplalib.throttling import RateLimitingAwareThrottler
 from hopla.hoplalib.user.usercontroller import HabiticaUserRequest
 from hopla.hoplalib.user.usermodels import HabiticaUser
@@ -24,8 +26,11 @@ log = logging.getLogger()
 
 
 @click.command()
+@click.option("--plan-out", type=click.Path(dir_okay=False, writable=True, path_type=Path),
+              help="Write the hatch plan to this file instead of hatching the eggs. "
+                   "Hatch the eggs later with `hopla execute`.")
 @hopla_option.no_interactive_option()
-def hatch_all(no_interactive: bool) -> None:
+def hatch_all(plan_out: Optional[Path], no_interactive: bool) -> None:
     """Hatch all the available eggs.
 
     \b
@@ -50,17 +55,15 @@ def hatch_all(no_interactive: bool) -> None:
     Successfully hatched a Treeling-Zombie.
     Successfully hatched a Robot-Desert.
 
+    \b
+    # Plan now, review the plan, and hatch the eggs later.
+    $ hopla hatch-all --plan-out plan.json
+    $ hopla execute plan.json
+
     """
-    log.debug(f"hopla hatch-all {no_interactive=}")
+    log.debug(f"hopla hatch-all {plan_out=} {no_interactive=}")
     user: HabiticaUser = HabiticaUserRequest().request_user_data_or_exit()
-    eggs = EggCollection(user.get_eggs())
-    potions = HatchPotionCollection(user.get_hatch_potions())
-    pets: List[Pet] = to_pet_list(user.get_pets())
-
-    plan_maker = HatchPlanMaker(
-        egg_collection=eggs, hatch_potion_collection=potions, pets=pets
-    )
-    plan: HatchPlan = plan_maker.make_plan()
+    plan: HatchPlan = make_hatch_plan(user)
 
     if plan.is_empty():
         click.echo(
@@ -69,22 +72,37 @@ def hatch_all(no_interactive: bool) -> None:
         )
         sys.exit(1)
 
+    if plan_out is not None:
+        PlanFile.of_hatch_plan(plan, user=user).write(plan_out)
+        click.echo(f"Wrote the hatch plan of {len(plan)} items to {plan_out}.")
+        return
+
     if no_interactive is True:
-        _hatch_eggs_without_confirmation(plan)
+        hatch_eggs_without_confirmation(plan)
     else:
         _ask_for_confirmation_and_maybe_hatch(plan)
 
 
+def make_hatch_plan(user: HabiticaUser) -> HatchPlan:
+    """Make the plan to hatch the eggs of the user with the hatching potions of the user."""
+    plan_maker = HatchPlanMaker(
+        egg_collection=EggCollection(user.get_eggs()),
+        hatch_potion_collection=HatchPotionCollection(user.get_hatch_potions()),
+        pets=to_pet_list(user.get_pets())
+    )
+    return plan_maker.make_plan()
+
+
 def _ask_for_confirmation_and_maybe_hatch(plan: HatchPlan) -> None:
     plan_text: str = plan.format_plan()
     user_confirmed: bool = click.confirm(text=plan_text + "Do you wish to proceed?")
     if user_confirmed is True:
-        _hatch_eggs_without_confirmation(plan)
+        hatch_eggs_without_confirmation(plan)
     else:
         click.echo("No eggs were hatched.")
 
 
-def _hatch_eggs_without_confirmation(plan: HatchPlan) -> None:
+def hatch_eggs_without_confirmation(plan: HatchPlan) -> None:
     """Hatch all the eggs. Print the result to the terminal.
     Warning: this function does not ask for confirmation.
     """
@@ -0,0 +1,122 @@
+"""
+The module with CLI code that handles the `hopla zoo query` command.
+"""
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import click
+
+from hopla.cli.groupcmds.get_user import HabiticaUser, pass_user
+from hopla.hoplalib.hopla_option import LazyChoice
+from hopla.hoplalib.zoo.foodmodels import FeedStatus
+from hopla.hoplalib.zoo.petmodels import PetMountPair
+from hopla.hoplalib.zoo.petregistry import PetCategory, PetRecord, get_pet_registry
+from hopla.hoplalib.zoo.zooindex import ZooIndex, ZooQuery, egg_and_potion
+from hopla.hoplalib.zoo.zoomodels import Zoo, ZooBuilder
+
+log = logging.getLogger()
+
+OUTPUT_FORMATS = ("names", "ndjson", "json")
+
+valid_feed_status = click.IntRange(FeedStatus.PET_GREW_UP_TO_MOUNT, FeedStatus.MAX_FED_STATE)
+
+
+def _egg_names() -> List[str]:
+    return sorted({egg_and_potion(pet_name)[0] for pet_name in get_pet_registry()})
+
+
+def _potion_names() -> List[str]:
+    return sorted({egg_and_potion(pet_name)[1] for pet_name in get_pet_registry()})
+
+
+def pair_as_json(name: str, pair: PetMountPair) -> Dict[str, Any]:
+    """Return the JSON object of a single row of the query output."""
+    record: Optional[PetRecord] = get_pet_registry().get(name)
+    egg, potion = egg_and_potion(name)
+    return {
+        "name": name,
+        "category": None if record is None else record.category,
+        "egg": egg,
+        "potion": potion,
+        "feed_status": None if pair.pet is None else int(pair.pet.feed_status),
+        "pet": pair.pet_available(),
+        "mount": pair.mount_available()
+    }
+
+
+@click.command()
+@click.option("--category", "categories", multiple=True, type=click.Choice(PetCategory.ALL),
+              help="Only pets of this category. Repeat to allow more categories.")
+@click.option("--egg", "eggs", multiple=True, type=LazyChoice(_egg_names),
+              help="Only pets of this egg (e.g. Wolf). Repeat to allow more eggs.")
+@click.option("--potion", "potions", multiple=True, type=LazyChoice(_potion_names),
+              help="Only pets of this hatching potion (e.g. Base). Repeat to allow more potions.")
+@click.option("--min-feed-status", type=valid_feed_status,
+              help="Only pets with at least this feed status.")
+@click.option("--max-feed-status", type=valid_feed_status,
+              help="Only pets with at most this feed status.")
+@click.option("--pet/--no-pet", "has_pet", default=None,
+              help="Only pets that you have (--pet), or don't have (--no-pet), right now.")
+@click.option("--mount/--no-mount", "has_mount", default=None,
+              help="Only pets whose mount you have (--mount), or don't have (--no-mount).")
+@click.option("--feedable", is_flag=True, default=False,
+              help="Only pets that you can feed right now.")
+@click.option("--format", "output_format", type=click.Choice(OUTPUT_FORMATS),
+              default=OUTPUT_FORMATS[0], show_default=True,
+              help="names: one name per line. ndjson: one JSON object per line. "
+                   "json: a single JSON list.")
+@pass_user
+def query(user: HabiticaUser,
+          categories: Tuple[str, ...], eggs: Tuple[str, ...], potions: Tuple[str, ...],
+          min_feed_status: Optional[int], max_feed_status: Optional[int],
+          has_pet: Optional[bool], has_mount: Optional[bool],
+          feedable: bool, output_format: str) -> List[str]:
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    """Find the pets and mounts that meet all the specified criteria.
+
+    The zoo is indexed once, by category, egg, hatching potion, and
+    feed status, so every question is answered without scanning all
+    your pets.
+
+    \b
+    Examples
+    ---
+    # feedable quest pets with a feed status above 30
+    $ hopla zoo query --feedable --category quest --min-feed-status 31
+
+    \b
+    # magic potion pets that you have, but whose mount you don't have
+    $ hopla zoo query --category magic_potion --pet --no-mount
+
+    \b
+    # all your Wolf pets and mounts, as JSON lines for jq
+    $ hopla zoo query --egg Wolf --format ndjson | jq -r .potion
+
+    \f
+    :return: the names of the pets and mounts that meet the criteria
+    """
+    zoo_query = ZooQuery(
+        categories=categories or None, eggs=eggs or None, potions=potions or None,
+        min_feed_status=min_feed_status, max_feed_status=max_feed_status,
+        has_pet=has_pet, has_mount=has_mount, feedable=feedable
+    )
+    log.debug(f"hopla zoo query {zoo_query=} {output_format=}")
+    zoo: Zoo = ZooBuilder(user).build(skip_unsupported_pets=True,
+                                      categories=zoo_query.categories)
+    index = ZooIndex(zoo)
+
+    if output_format == "names":
+        names: List[str] = index.names(zoo_query)
+        for name in names:
+            click.echo(name)
+        return names
+
+    rows: List[Dict[str, Any]] = [pair_as_json(name, pair)
+                                  for name, pair in index.pairs(zoo_query)]
+    if output_format == "ndjson":
+        for row in rows:
+            click.echo(json.dumps(row))
+    else:
+        click.echo(json.dumps(rows, indent=2))
+    return [row["name"] for row in rows]
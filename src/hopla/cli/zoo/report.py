@@ -0,0 +1,50 @@
+"""
+The module with CLI code that handles the `hopla zoo report` command.
+"""
+import logging
+from typing import Any, Dict
+
+import click
+
+from hopla.cli.groupcmds.get_user import HabiticaUser, pass_user
+from hopla.hoplalib.outputformatter import JsonFormatter
+from hopla.hoplalib.zoo.zooreport import CollectionReport, format_report
+
+log = logging.getLogger()
+
+
+@click.command()
+@click.option("--json/--no-json", "json_flag", default=False, show_default=True,
+              help="Print the report as JSON, including the names of the missing "
+                   "pets and mounts.")
+@pass_user
+def report(user: HabiticaUser, json_flag: bool) -> Dict[str, Any]:
+    """Show how complete your pet and mount collection is.
+
+    For every category (generation1, magic_potion, quest, wacky, and rare)
+    this shows the pets that you have, the mounts that you have, and the
+    number of pets that `hopla feed-all` can turn into mounts with the food
+    that you have right now.
+
+    \b
+    Examples
+    ---
+    # Show the report
+    $ hopla zoo report
+
+    \b
+    # List the quest mounts that you don't have yet
+    $ hopla zoo report --json | jq -r '.quest.missing_mounts[]'
+
+    \f
+    :param user:
+    :param json_flag: print JSON instead of text
+    :return: the report as a dict
+    """
+    log.debug(f"hopla zoo report {json_flag=}")
+    result: Dict[str, Any] = CollectionReport.from_user(user).to_dict()
+    if json_flag:
+        click.echo(JsonFormatter(result).format_with_double_quotes())
+    else:
+        click.echo(format_report(result))
+    return result
@@ -3,11 +3,14 @@ Library code to handle Hopla's authorization, authentication and
 identification.
 """
 
+import threading
 import uuid
 import logging
 import sys
 from configparser import ConfigParser
 from pathlib import Path
+from typing import Any, Callable, List, Optional
+
 from hopla.hoplalib.common import get_configuration_dirpath, EnvironmentVariables
 
 log = logging.getLogger()
@@ -17,7 +20,13 @@ class AuthorizationFileConstants:
     """Class with authorization and authentication related constants"""
 
     CONFIG_SECTION_CREDENTIALS = "credentials"
-    """only section of the authorization file"""
+    """section of the authorization file with the default credentials"""
+
+    DEFAULT_PROFILE_NAME = "default"
+    """profile name that refers to the [credentials] section"""
+
+    CONFIG_SECTION_PROFILE_PREFIX = f"{CONFIG_SECTION_CREDENTIALS}."
+    """named profiles live in sections such as [credentials.alice]"""
 
     CONFIG_KEY_USER_ID = "user_id"
     """user id field in the hopla authorization file """
@@ -31,7 +40,7 @@ class HoplaAuthFile:
     api token separate from other hopla configuration.
     """
     def __init__(self):
-        self.global_env_var_hopla_auth_file = EnvironmentVariables.HOPLA_AUTH_FILE
+        self.global_env_var_hopla_auth_file = EnvironmentVariables.get_hopla_auth_file()
 
     @property
     def file_path(self) -> Path:
@@ -52,32 +61,115 @@ class HoplaAuthFile:
         Path.mkdir(self.file_path.parent, parents=True, exist_ok=True)
 
 
+class ActiveProfile:
+    """
+    The credential profile that the current thread uses for its API requests.
+
+    When hopla runs a command for multiple profiles at once, every profile gets
+    its own thread. Storing the profile per thread lets all the existing
+    request code (which creates an AuthorizationHandler on the fly) pick up
+    the right credentials without having to pass the profile around.
+    """
+    _local = threading.local()
+
+    @classmethod
+    def get(cls) -> Optional[str]:
+        """Return the active profile name, or None for the default credentials."""
+        return getattr(cls._local, "profile", None)
+
+    @classmethod
+    def set(cls, profile: Optional[str]) -> None:
+        """Make the specified profile active for the current thread."""
+        cls._local.profile = profile
+
+    @classmethod
+    def bind(cls, func: Callable[[], Any]) -> Callable[[], Any]:
+        """Return func such that it runs with the profile of the calling thread.
+
+        Use this when handing work to another thread (e.g. a thread pool).
+        """
+        profile: Optional[str] = cls.get()
+
+        def run_with_profile() -> Any:
+            cls.set(profile)
+            return func()
+
+        return run_with_profile
+
+
+def profile_to_section_name(profile: Optional[str]) -> str:
+    """Return the auth file section that holds the credentials of a profile.
+
+    >>> profile_to_section_name(None)
+    'credentials'
+    >>> profile_to_section_name("default")
+    'credentials'
+    >>> profile_to_section_name("alice")
+    'credentials.alice'
+    """
+    if profile is None or profile == AuthorizationFileConstants.DEFAULT_PROFILE_NAME:
+        return AuthorizationFileConstants.CONFIG_SECTION_CREDENTIALS
+    return f"{AuthorizationFileConstants.CONFIG_SECTION_PROFILE_PREFIX}{profile}"
+
+
+def section_name_to_profile(section_name: str) -> Optional[str]:
+    """Return the profile name of an auth file section, None if it is no profile.
+
+    >>> section_name_to_profile("credentials")
+    'default'
+    >>> section_name_to_profile("credentials.alice")
+    'alice'
+    >>> section_name_to_profile("something-else") is None
+    True
+    """
+    if section_name == AuthorizationFileConstants.CONFIG_SECTION_CREDENTIALS:
+        return AuthorizationFileConstants.DEFAULT_PROFILE_NAME
+    prefix = AuthorizationFileConstants.CONFIG_SECTION_PROFILE_PREFIX
+    if section_name.startswith(prefix) and len(section_name) > len(prefix):
+        return section_name[len(prefix):]
+    return None
+
+
 class AuthorizationHandler:
     """
     This class *should* only get and set values in the hopla authorization file.
     """
 
-    def __init__(self, *, auth_file: HoplaAuthFile = None):
+    def __init__(self, *, auth_file: HoplaAuthFile = None,
+                 profile: Optional[str] = None):
         self.config_parser = ConfigParser()
         if auth_file is None:
             self.auth_file = HoplaAuthFile()
         else:
             self.auth_file = auth_file
+        self.profile: Optional[str] = profile or ActiveProfile.get()
+
+    @property
+    def credentials_section(self) -> str:
+        """Return the section of the auth file that this handler uses."""
+        return profile_to_section_name(self.profile)
 
     @property
     def user_id(self):
         """Return the user id to be used in habitica API requests"""
         self._parse()
-        return self.config_parser[AuthorizationFileConstants.CONFIG_SECTION_CREDENTIALS] \
+        return self.config_parser[self.credentials_section] \
             .get(AuthorizationFileConstants.CONFIG_KEY_USER_ID)
 
     @property
     def api_token(self):
         """Return the api token to be used in habitica API requests"""
         self._parse()
-        return self.config_parser[AuthorizationFileConstants.CONFIG_SECTION_CREDENTIALS] \
+        return self.config_parser[self.credentials_section] \
             .get(AuthorizationFileConstants.CONFIG_KEY_API_TOKEN)
 
+    def profile_names(self) -> List[str]:
+        """Return the names of all the credential profiles in the auth file."""
+        if self.auth_file.exists():
+            self.config_parser.read(self.auth_file.file_path)
+        profiles = [section_name_to_profile(section) for section in self.config_parser.sections()]
+        return [profile for profile in profiles if profile is not None]
+
     def set_hopla_credentials(self, *,
                               user_id: uuid.UUID,
                               api_token: uuid.UUID,
@@ -90,21 +182,25 @@ class AuthorizationHandler:
         :return:
         """
         log.debug(f"set_hopla_credentials overwrite={overwrite}")
-        if self.auth_file.exists() and overwrite is False:
-            log.info(f"Auth file {self.auth_file} not recreated because it already exists")
+        if self.auth_file_is_valid() and overwrite is False:
+            log.info(f"{self.credentials_section} in auth file {self.auth_file} not "
+                     "recreated because it already exists")
             return
 
         self.auth_file.create_auth_dir()
+        if self.auth_file.exists():
+            # keep the credentials of the other profiles intact
+            self.config_parser.read(self.auth_file.file_path)
         with open(self.auth_file.file_path, mode="w", encoding="utf-8") as new_auth_file:
-            self.config_parser.add_section(
-                AuthorizationFileConstants.CONFIG_SECTION_CREDENTIALS)
+            if self.config_parser.has_section(self.credentials_section) is False:
+                self.config_parser.add_section(self.credentials_section)
             self.config_parser.set(
-                section=AuthorizationFileConstants.CONFIG_SECTION_CREDENTIALS,
+                section=self.credentials_section,
                 option=AuthorizationFileConstants.CONFIG_KEY_USER_ID,
                 value=str(user_id)
             )
             self.config_parser.set(
-                section=AuthorizationFileConstants.CONFIG_SECTION_CREDENTIALS,
+                section=self.credentials_section,
                 option=AuthorizationFileConstants.CONFIG_KEY_API_TOKEN,
                 value=str(api_token)
             )
@@ -114,18 +210,16 @@ class AuthorizationHandler:
 
     def auth_file_is_valid(self) -> bool:
         """
-        Return True when the authenticate file exists, has a [credentials] section with
-        a user id and api token field in it.
+        Return True when the authenticate file exists, has a [credentials] section
+        (or the section of the profile) with a user id and api token field in it.
         """
         if self.auth_file.exists() is False:
             log.debug(f"{self.auth_file} does not exist")
             return False
 
         self.config_parser.read(self.auth_file.file_path)
-        if self.config_parser.has_section(
-                AuthorizationFileConstants.CONFIG_SECTION_CREDENTIALS) is False:
-            log.debug(f"{self.auth_file} has no "
-                      f"{AuthorizationFileConstants.CONFIG_SECTION_CREDENTIALS} section")
+        if self.config_parser.has_section(self.credentials_section) is False:
+            log.debug(f"{self.auth_file} has no {self.credentials_section} section")
             return False
 
         if self._auth_file_has_user_id() is False:
@@ -144,7 +238,7 @@ class AuthorizationHandler:
         inside the [credentials] section.
         """
         return self.config_parser.has_option(
-            section=AuthorizationFileConstants.CONFIG_SECTION_CREDENTIALS,
+            section=self.credentials_section,
             option=AuthorizationFileConstants.CONFIG_KEY_API_TOKEN)
 
     def _auth_file_has_user_id(self) -> bool:
@@ -153,7 +247,7 @@ class AuthorizationHandler:
         value inside the [credentials] section.
         """
         return self.config_parser.has_option(
-            section=AuthorizationFileConstants.CONFIG_SECTION_CREDENTIALS,
+            section=self.credentials_section,
             option=AuthorizationFileConstants.CONFIG_KEY_USER_ID)
 
     def _parse(self):
@@ -162,5 +256,8 @@ class AuthorizationHandler:
         if self._auth_file_has_api_token() is False or self._auth_file_has_user_id() is False:
             print("no credentials found")
             print("Please run:")
-            print("    hopla authenticate")
+            if self.credentials_section == AuthorizationFileConstants.CONFIG_SECTION_CREDENTIALS:
+                print("    hopla authenticate")
+            else:
+                print(f"    hopla authenticate --profile {self.profile}")
             sys.exit(1)
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 from uuid import UUID
 
+from hopla.hoplalib.contenttables import ContentTables
 from hopla.hoplalib.errors import YouFoundABugRewardError
 
 
@@ -24,21 +25,33 @@ class SpellData:
         "defensiveStance": 25, "valorousPresence": 20, "intimidate": 15
     }
     """@see: hopla api content | jq .spells.warrior"""
+    warrior_spells_single_arg = ContentTables.cached().extend_spell_book(
+        warrior_spells_single_arg, "warrior"
+    )
 
     mage_spells_single_arg: ClassSpellBook = {
         "mpheal": 30, "earth": 35
     }
     """@see: hopla api content | jq .spells.wizard"""
+    mage_spells_single_arg = ContentTables.cached().extend_spell_book(
+        mage_spells_single_arg, "wizard"
+    )
 
     rogue_spells_single_arg: ClassSpellBook = {
         "toolsOfTrade": 25, "stealth": 45
     }
     """@see: hopla api content | jq .spells.rogue"""
+    rogue_spells_single_arg = ContentTables.cached().extend_spell_book(
+        rogue_spells_single_arg, "rogue"
+    )
 
     healer_spells_single_arg: ClassSpellBook = {
         "heal": 15, "brightness": 15, "protectAura": 30, "healAll": 25
     }
     """@see: hopla api content | jq .spells.healer"""
+    healer_spells_single_arg = ContentTables.cached().extend_spell_book(
+        healer_spells_single_arg, "healer"
+    )
 
     spell_book_single_arg: SpellBook = {
         "warrior": warrior_spells_single_arg,
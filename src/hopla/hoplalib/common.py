@@ -1,11 +1,14 @@
 """
 Module with some Hopla common logic and data
 """
-from typing import Final
+from typing import Any, Dict, Final, Optional, Type, TypeVar
 from pathlib import Path
+import dataclasses
 import os
 import click
 
+_T = TypeVar("_T")
+
 
 class GlobalConstants:
     """Class of global variables to be used by the entire application.
@@ -46,17 +49,91 @@ class EnvironmentVariables:
     """ environment variable that a user can set to overwrite the
         default authenticate file """
 
-    HOPLA_AUTH_FILE = os.environ.get(GLOBAL_ENV_VAR_HOPLA_AUTH_FILE)
-
     GLOBAL_ENV_VAR_HOPLA_CONF_FILE = "HOPLA_CONF_FILE"
     """ environment variable that a user can set to overwrite the
         default config file """
 
     HOPLA_CONF_FILE = os.environ.get(GLOBAL_ENV_VAR_HOPLA_CONF_FILE)
 
+    GLOBAL_ENV_VAR_HOPLA_HISTORY_FILE: Final[str] = "HOPLA_HISTORY_FILE"
+    """ environment variable that a user can set to overwrite the
+        default user history database """
+
+    @staticmethod
+    def get_hopla_auth_file() -> Optional[str]:
+        """Return the value of ${HOPLA_AUTH_FILE}.
+
+        The environment is read on every call (instead of once at import time)
+        such that every invocation sees the auth file that is currently set.
+        """
+        return os.environ.get(EnvironmentVariables.GLOBAL_ENV_VAR_HOPLA_AUTH_FILE)
+
+    @staticmethod
+    def get_hopla_history_file() -> Optional[str]:
+        """Return the value of ${HOPLA_HISTORY_FILE}."""
+        return os.environ.get(EnvironmentVariables.GLOBAL_ENV_VAR_HOPLA_HISTORY_FILE)
+
 
 def get_configuration_dirpath() -> Path:
     """
     Get the most appropriate location for configuration (this is different per OS/environment)
     """
     return Path(click.get_app_dir(GlobalConstants.APPLICATION_NAME)).resolve()
+
+
+def get_data_dirpath() -> Path:
+    """
+    Get the most appropriate location for data that hopla collects over time.
+
+    This follows the XDG base directory specification: ${XDG_DATA_HOME}/hopla,
+    which defaults to ~/.local/share/hopla.
+    """
+    xdg_data_home: Optional[str] = os.environ.get("XDG_DATA_HOME")
+    data_home = Path(xdg_data_home) if xdg_data_home else Path.home() / ".local" / "share"
+    return (data_home / GlobalConstants.APPLICATION_NAME).resolve()
+
+
+def get_cache_dirpath() -> Path:
+    """
+    Get the most appropriate location for data that hopla can always recreate.
+
+    This follows the XDG base directory specification: ${XDG_CACHE_HOME}/hopla,
+    which defaults to ~/.cache/hopla.
+    """
+    xdg_cache_home: Optional[str] = os.environ.get("XDG_CACHE_HOME")
+    cache_home = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return (cache_home / GlobalConstants.APPLICATION_NAME).resolve()
+
+
+def with_slots(cls: Type[_T]) -> Type[_T]:
+    """Class decorator that recreates a dataclass with __slots__ for its fields.
+
+    This is dataclass(slots=True) for the Pythons before 3.10. Apply it on top
+    of @dataclass. Frozen dataclasses remain copyable and picklable.
+
+    >>> @with_slots
+    ... @dataclasses.dataclass(frozen=True)
+    ... class Point:
+    ...     x: int
+    ...     y: int = 0
+    >>> point = Point(1)
+    >>> point, hasattr(point, "__dict__")
+    (Point(x=1, y=0), False)
+    """
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    cls_dict: Dict[str, Any] = {name: value for name, value in cls.__dict__.items()
+                                if name not in field_names + ("__dict__", "__weakref__")}
+    cls_dict["__slots__"] = field_names
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in field_names}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)  # also for frozen dataclasses
+
+    cls_dict.setdefault("__getstate__", __getstate__)
+    cls_dict.setdefault("__setstate__", __setstate__)
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
@@ -77,6 +77,9 @@ class ConfigurationFileParser:
         self.config_parser.read(self._conf_file.file_path)
         configuration_setting = FullConfigurationNameStr(full_config_name_str=full_config_name)
 
+        if not self.config_parser.has_section(configuration_setting.section):
+            # e.g. a section that was added after the config file was created
+            self.config_parser.add_section(configuration_setting.section)
         self.config_parser.set(
             section=configuration_setting.section,
             option=configuration_setting.short_config_name,
@@ -159,6 +162,15 @@ class HoplaDefaultConfiguration:
         # warning: something worth of creating an issue on github, but nothing broke
         # error: user experienced something breaking down
         default_config.set(all_commands_section, "loglevel", "warning")
+        # true: record every fetched user in the local user history (`hopla get-user diff`)
+        default_config.set(all_commands_section, "record_history", "false")
+        # seconds that read-only commands may use a cached user (0: never)
+        default_config.set(all_commands_section, "user_cache_max_age", "0")
+
+        feed_all_section = "cmd_feed_all"
+        default_config.add_section(feed_all_section)
+        # the strategy of `hopla feed-all` without --strategy: greedy, optimal, ...
+        default_config.set(feed_all_section, "strategy", "greedy")
         return default_config
 
     def supported_sections(self):
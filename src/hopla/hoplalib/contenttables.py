@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Library code for the data tables that hopla extracts from the API content.
+
+PetData, EggData, HatchPotionData, FoodData and SpellData are hardcoded,
+so hopla doesn't know about the items that Habitica released after the
+release of hopla. Every `hopla api content` therefore extracts the few
+tables that hopla needs from the (large) content into a small local cache
+that is keyed by the appVersion of the API.
+
+The data modules extend their hardcoded tables with the cached tables when
+they're imported. This only reads a small local file: it never requests the
+API. Without a cache, the hardcoded tables are used as they are.
+"""
+import json
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from hopla.hoplalib.common import get_cache_dirpath
+
+log = logging.getLogger()
+
+HABITICA_CLASSES = ["warrior", "wizard", "healer", "rogue"]
+
+_SINGLE_ARG_SPELL_TARGETS = ["self", "party"]
+"""Spells with these targets can be cast without specifying a task or user."""
+
+
+def extract_content_tables(content: dict) -> dict:
+    """Extract the tables that hopla needs from the API content.
+
+    >>> content = {"petInfo": {"Wolf-Base": {"type": "drop"}, "Orca-Base": {"type": "special"}},
+    ...            "dropEggs": {"Wolf": {}}, "food": {"Meat": {"target": "Base", "canDrop": True}},
+    ...            "spells": {"healer": {"heal": {"mana": 15, "target": "self"},
+    ...                                  "smash": {"mana": 10, "target": "task"}}}}
+    >>> tables = extract_content_tables(content)
+    >>> tables["pets"]["special"], tables["eggs"]["drop"], tables["food"]
+    (['Orca-Base'], ['Wolf'], {'Meat': 'Base'})
+    >>> tables["spells"]["healer"]
+    {'heal': 15}
+    """
+    pet_info: dict = content.get("petInfo", {})
+    spells: dict = content.get("spells", {})
+    return {
+        "pets": {
+            pet_type: sorted(pet for pet, info in pet_info.items() if info.get("type") == pet_type)
+            for pet_type in ["drop", "premium", "quest", "wacky", "special"]
+        },
+        "eggs": {
+            "drop": sorted(content.get("dropEggs", {})),
+            "quest": sorted(content.get("questEggs", {}))
+        },
+        "hatchingPotions": {
+            "drop": sorted(content.get("dropHatchingPotions", {})),
+            "premium": sorted(content.get("premiumHatchingPotions", {})),
+            "wacky": sorted(content.get("wackyHatchingPotions", {}))
+        },
+        "food": {food: info.get("target") for food, info in content.get("food", {}).items()
+                 if info.get("canDrop") is True},
+        "spells": {
+            habitica_class: {spell: info["mana"]
+                             for spell, info in spells.get(habitica_class, {}).items()
+                             if info.get("target") in _SINGLE_ARG_SPELL_TARGETS}
+            for habitica_class in HABITICA_CLASSES
+        }
+    }
+
+
+class ContentTables:
+    """The tables that were extracted from the API content (empty if there is no cache)."""
+
+    def __init__(self, tables: Optional[dict] = None, *, app_version: Optional[str] = None):
+        self.tables: dict = tables or {}
+        self.app_version = app_version
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(app_version={self.app_version})"
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def cached() -> "ContentTables":
+        """Return the cached tables. The cache file is read at most once per process."""
+        return ContentTablesCache().load()
+
+    def extend(self, names: List[str], table: str, kind: str, *,
+               known: Optional[List[str]] = None) -> List[str]:
+        """Return names followed by the cached names of the table that hopla doesn't know.
+
+        >>> tables = ContentTables({"eggs": {"drop": ["Fox", "Wolf", "Yeti"]}})
+        >>> tables.extend(["Wolf"], "eggs", "drop")
+        ['Wolf', 'Fox', 'Yeti']
+
+        :param names: the hardcoded names
+        :param known: other names that must not be added (e.g. names of another list)
+        """
+        skip = set(names + (known or []))
+        return names + [name for name in self.tables.get(table, {}).get(kind, [])
+                        if name not in skip]
+
+    def extend_spell_book(self, spells: Dict[str, int], habitica_class: str) -> Dict[str, int]:
+        """Return the spells of the class with the mana of the cached content."""
+        return {**spells, **self.tables.get("spells", {}).get(habitica_class, {})}
+
+    def extend_favorite_food(self, favorite_food: Dict[str, str]) -> Dict[str, str]:
+        """Return the potion to favorite food mapping with the foods of unmapped potions.
+
+        >>> ContentTables({"food": {"Cake_Base": "Base", "Cheese": "Gold"}}).extend_favorite_food(
+        ...     {"Base": "Meat"})
+        {'Base': 'Meat', 'Gold': 'Cheese'}
+        """
+        extended = dict(favorite_food)
+        for food, potion in self.tables.get("food", {}).items():
+            if potion is not None and potion not in extended:
+                extended[potion] = food
+        return extended
+
+
+class ContentTablesCache:
+    """The local file with the tables of the most recently fetched API content."""
+    TABLES_FORMAT = 1
+    """Increase this when extract_content_tables changes, to ignore older caches."""
+
+    def __init__(self, *, cache_file: Optional[Path] = None):
+        self.cache_file: Path = cache_file or get_cache_dirpath() / "content-tables.json"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(cache_file={self.cache_file})"
+
+    def _read(self) -> Optional[dict]:
+        try:
+            with open(self.cache_file, mode="r", encoding="utf-8") as file:
+                entry = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as ex:
+            log.debug(f"ignored the broken content cache {self.cache_file}: {ex!r}")
+            return None
+        if entry.get("format") != ContentTablesCache.TABLES_FORMAT:
+            return None
+        return entry
+
+    def cached_app_version(self) -> Optional[str]:
+        """Return the appVersion of the cached tables, None if nothing is cached."""
+        entry: Optional[dict] = self._read()
+        return None if entry is None else entry["appVersion"]
+
+    def load(self) -> ContentTables:
+        """Return the cached tables. Return empty tables if nothing is cached."""
+        entry: Optional[dict] = self._read()
+        if entry is None:
+            return ContentTables()
+        return ContentTables(entry["tables"], app_version=entry["appVersion"])
+
+    def refresh(self, content: dict, *, app_version: Optional[str]) -> bool:
+        """Cache the tables of the content unless they're cached for this appVersion already.
+
+        Caching is a side effect of requesting the content, so a failure to
+        write the cache is logged instead of stopping the command.
+
+        :return: True if the cache was (re)written
+        """
+        if app_version is not None and app_version == self.cached_app_version():
+            return False
+        entry = {"format": ContentTablesCache.TABLES_FORMAT, "appVersion": app_version,
+                 "tables": extract_content_tables(content)}
+        try:
+            Path.mkdir(self.cache_file.parent, parents=True, exist_ok=True)
+            tmp_file: Path = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, mode="w", encoding="utf-8") as file:
+                json.dump(entry, file)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as ex:
+            log.warning(f"Failed to cache the content tables: {ex}")
+            return False
+        log.debug(f"cached the content tables of {app_version=}")
+        return True
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Library code for `hopla dashboard`: a combined overview of a Habitica account.
+
+All the data of the dashboard comes from independent API requests. These
+requests are performed concurrently, so the dashboard costs roughly a single
+round trip instead of one round trip per request.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+from hopla.cli.get_group import HabiticaGroupRequest
+from hopla.hoplalib.authorization import ActiveProfile
+from hopla.hoplalib.hatchery.eggmodels import EggCollection
+from hopla.hoplalib.hatchery.hatchalgorithms import HatchPlanMaker
+from hopla.hoplalib.hatchery.hatchpotionmodels import HatchPotionCollection
+from hopla.hoplalib.http import HabiticaRequest, UrlBuilder
+from hopla.hoplalib.requests_helper import get_data_or_exit
+from hopla.hoplalib.tasks.taskcontroller import UserTasksRequest
+from hopla.hoplalib.user.usercontroller import HabiticaUserRequest
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.zoo.foodmodels import FeedStatus
+from hopla.hoplalib.zoo.petmodels import Pet
+from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
+from hopla.hoplalib.zoo.petregistry import get_pet_registry
+
+log = logging.getLogger()
+
+DASHBOARD_USER_FIELDS = ["stats", "party.quest", "items.pets", "items.mounts",
+                         "items.eggs", "items.hatchingPotions"]
+"""The only parts of the user that the dashboard needs."""
+
+
+def request_api_status_or_exit() -> dict:
+    """Get the Habitica API status (e.g. {"status": "up"})."""
+    response = requests.get(url=UrlBuilder(path_extension="/status").url,
+                            timeout=HabiticaRequest.TIMEOUT)
+    return get_data_or_exit(response)
+
+
+def request_party_or_none() -> Optional[dict]:
+    """Get the party of the user, or None if the user is not in a party."""
+    response_json: dict = HabiticaGroupRequest("party").get_group_request().json()
+    if response_json["success"] is True:
+        return response_json["data"]
+    log.debug(f"no party: {response_json.get('message')}")
+    return None
+
+
+def fetch_concurrently(fetchers: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """Call all the fetchers concurrently and return their results by name.
+
+    The fetchers run with the credential profile of the calling thread.
+    """
+    with ThreadPoolExecutor(max_workers=max(len(fetchers), 1),
+                            thread_name_prefix="hopla-fetch") as pool:
+        futures = {name: pool.submit(ActiveProfile.bind(fetcher))
+                   for name, fetcher in fetchers.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+@dataclass(frozen=True)
+class Dashboard:
+    """The combined data of the user, the party, the API, and the To-Dos."""
+    user: HabiticaUser
+    party: Optional[dict]
+    api_status: dict
+    todos: List[dict]
+
+    @classmethod
+    def fetch(cls) -> "Dashboard":
+        """Request all the dashboard data concurrently."""
+        results: Dict[str, Any] = fetch_concurrently({
+            "user": HabiticaUserRequest(
+                user_fields=DASHBOARD_USER_FIELDS, allow_cached=True
+            ).request_user_data_or_exit,
+            "party": request_party_or_none,
+            "api_status": request_api_status_or_exit,
+            "todos": UserTasksRequest(task_type="todos").get_tasks_data_or_exit
+        })
+        return cls(**results)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the most relevant stats of the user."""
+        stats: dict = self.user.get_stats()
+        return {name: stats.get(name) for name in ["class", "lvl", "hp", "mp", "exp", "gp"]}
+
+    def quest(self) -> Optional[Dict[str, Any]]:
+        """Return the quest of the party, None if there is no party quest."""
+        quest: dict = (self.party or {}).get("quest") or {}
+        if quest.get("key") is None:
+            return None
+        user_quest: dict = self.user.user_dict.get("party", {}).get("quest", {})
+        return {
+            "key": quest["key"],
+            "active": quest.get("active", False),
+            "progress": quest.get("progress", {}),
+            "pending_damage": user_quest.get("progress", {}).get("up", 0)
+        }
+
+    def feedable_pet_count(self) -> int:
+        """Return the number of pets that can still be fed."""
+        zoo = ColumnarZoo.from_pets_and_mounts(pets=self.user.get_pets(),
+                                               mounts=self.user.get_mounts())
+        return len(zoo.get_feedable_zoo())
+
+    def hatchable_pet_count(self) -> int:
+        """Return the number of pets that hatch-all would hatch."""
+        pets: List[Pet] = [Pet(name, feed_status=FeedStatus(status))
+                           for name, status in self.user.get_pets().items()
+                           if name in get_pet_registry()]
+        plan = HatchPlanMaker(
+            egg_collection=EggCollection(self.user.get_eggs()),
+            hatch_potion_collection=HatchPotionCollection(self.user.get_hatch_potions()),
+            pets=pets
+        ).make_plan()
+        return len(plan)
+
+    def due_todos(self, now: datetime) -> List[str]:
+        """Return the texts of the To-Dos that are due today or overdue."""
+        today = now.astimezone().date()
+        return [todo["text"] for todo in self.todos
+                if todo.get("date") and todo.get("completed") is not True
+                and _parse_api_date(todo["date"]).astimezone().date() <= today]
+
+    def to_dict(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Return the summary of the dashboard as a dict."""
+        now = now or datetime.now(timezone.utc)
+        return {
+            "api_status": self.api_status.get("status"),
+            "stats": self.stats(),
+            "party": None if self.party is None else self.party.get("name"),
+            "quest": self.quest(),
+            "feedable_pets": self.feedable_pet_count(),
+            "hatchable_pets": self.hatchable_pet_count(),
+            "due_todos": self.due_todos(now)
+        }
+
+
+def _parse_api_date(date: str) -> datetime:
+    """Parse a date of the Habitica API.
+
+    >>> _parse_api_date("2021-06-01T22:00:00.000Z")
+    datetime.datetime(2021, 6, 1, 22, 0, tzinfo=datetime.timezone.utc)
+    """
+    return datetime.fromisoformat(date.replace("Z", "+00:00"))
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    """Turn the dict of Dashboard.to_dict into human-readable text."""
+    stats: dict = summary["stats"]
+    lines: List[str] = [
+        f"API status: {summary['api_status']}",
+        f"Level {stats['lvl']} {stats['class']}: "
+        f"hp={stats['hp']:.0f} mp={stats['mp']:.0f} exp={stats['exp']:.0f} gp={stats['gp']:.2f}",
+        f"Party: {summary['party'] or '-'}"
+    ]
+    quest: Optional[dict] = summary["quest"]
+    if quest is not None:
+        state = "active" if quest["active"] else "waiting to start"
+        lines.append(f"Quest: {quest['key']} ({state}), progress={quest['progress']}, "
+                     f"pending damage={quest['pending_damage']:.1f}")
+    lines.append(f"Feedable pets: {summary['feedable_pets']}")
+    lines.append(f"Hatchable pets: {summary['hatchable_pets']}")
+    lines.append(f"Due To-Dos: {len(summary['due_todos'])}")
+    lines.extend(f"  - {todo}" for todo in summary["due_todos"])
+    return "\n".join(lines)
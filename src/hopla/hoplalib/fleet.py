@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Library code to run a hopla command for multiple Habitica accounts at once.
+
+Every account is identified by a credential profile in the hopla auth
+file. A fleet run invokes the same command once per profile, concurrently.
+Each profile runs in its own thread and therefore gets its own credentials,
+its own API requests, and its own rate-limiting state. The prompts of the
+profiles (e.g. the confirmation of a feed plan) are asked one at a time, so
+an answer can't end up with the plan of another profile.
+"""
+import functools
+import io
+import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+import click
+
+from hopla.hoplalib.authorization import ActiveProfile, AuthorizationHandler
+
+log = logging.getLogger()
+
+PROFILES_OPTION = "--profiles"
+ALL_PROFILES_OPTION = "--all-profiles"
+
+
+class ProfileTaggedStream(io.TextIOBase):
+    """
+    A text stream that prefixes every line with the active profile of the
+    thread that writes it (e.g. "[alice] 12 mana left.").
+
+    Lines of different profiles are never interleaved halfway: a line is
+    only passed to the underlying stream when it is complete or flushed.
+    """
+
+    def __init__(self, stream: TextIO):
+        super().__init__()
+        self.__stream = stream
+        self.__lock = threading.Lock()
+        self.__buffers: Dict[int, str] = {}
+        self.__mid_line: Dict[int, bool] = {}
+
+    @property
+    def encoding(self) -> str:
+        """The encoding of the underlying stream. Click inspects this."""
+        return getattr(self.__stream, "encoding", "utf-8")
+
+    @property
+    def errors(self) -> Optional[str]:
+        """The error handling of the underlying stream. Click inspects this."""
+        return getattr(self.__stream, "errors", None)
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self.__stream.isatty()
+
+    def write(self, text: str) -> int:
+        if isinstance(text, str) is False:
+            raise TypeError(f"{self.__class__.__name__} only accepts str, got {type(text)}")
+        thread_id: int = threading.get_ident()
+        with self.__lock:
+            buffered: str = self.__buffers.get(thread_id, "") + text
+            *lines, remainder = buffered.split("\n")
+            self.__buffers[thread_id] = remainder
+            for line in lines:
+                self.__emit(thread_id, f"{line}\n")
+        return len(text)
+
+    def flush(self) -> None:
+        thread_id: int = threading.get_ident()
+        with self.__lock:
+            remainder: str = self.__buffers.pop(thread_id, "")
+            if remainder:
+                self.__emit(thread_id, remainder)
+            self.__stream.flush()
+
+    def __emit(self, thread_id: int, text: str) -> None:
+        """Write text to the underlying stream. The caller must hold the lock."""
+        tag = "" if self.__mid_line.get(thread_id) else self.__tag()
+        self.__mid_line[thread_id] = not text.endswith("\n")
+        self.__stream.write(f"{tag}{text}")
+
+    @staticmethod
+    def __tag() -> str:
+        profile: Optional[str] = ActiveProfile.get()
+        return f"[{profile}] " if profile is not None else ""
+
+
+class SerializedPrompts:
+    """
+    A context manager that lets a single thread at a time use click.confirm
+    and click.prompt.
+
+    All the threads read the same stdin. Without this, the answer that the
+    user typed after the prompt of one profile could be read by the prompt
+    of another profile. The text of a prompt is written through the
+    ProfileTaggedStream, so it shows which profile is asking.
+    """
+    PROMPT_FUNCTIONS = ("confirm", "prompt")
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__originals: Dict[str, Callable] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self.__originals)})"
+
+    def __enter__(self) -> "SerializedPrompts":
+        for name in SerializedPrompts.PROMPT_FUNCTIONS:
+            self.__originals[name] = getattr(click, name)
+            setattr(click, name, self.__serialized(self.__originals[name]))
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        for name, original in self.__originals.items():
+            setattr(click, name, original)
+        self.__originals.clear()
+
+    def __serialized(self, prompt_func: Callable) -> Callable:
+        @functools.wraps(prompt_func)
+        def serialized(*args, **kwargs):
+            with self.__lock:
+                try:
+                    return prompt_func(*args, **kwargs)
+                finally:
+                    sys.stdout.flush()
+        return serialized
+
+
+@dataclass(frozen=True)
+class ProfileRunResult:
+    """The outcome of running a command for a single profile."""
+    profile: str
+    exit_code: int
+    return_value: Any = None
+
+
+class FleetRunner:
+    """Run a callable once for every profile, concurrently."""
+
+    def __init__(self, profiles: List[str]):
+        self.profiles = profiles
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(profiles={self.profiles})"
+
+    def run(self, func: Callable[[], Any]) -> List[ProfileRunResult]:
+        """Call func for all the profiles and return the results in profile order.
+
+        The output of every profile is tagged with the name of the profile, and
+        the profiles prompt the user one at a time.
+        """
+        original_stdout, original_stderr = sys.stdout, sys.stderr
+        sys.stdout = ProfileTaggedStream(original_stdout)
+        sys.stderr = ProfileTaggedStream(original_stderr)
+        try:
+            with SerializedPrompts(), \
+                    ThreadPoolExecutor(max_workers=max(len(self.profiles), 1),
+                                       thread_name_prefix="hopla-profile") as pool:
+                futures = [pool.submit(self._run_as, profile, func)
+                           for profile in self.profiles]
+                return [future.result() for future in futures]
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            sys.stdout, sys.stderr = original_stdout, original_stderr
+
+    @staticmethod
+    def _run_as(profile: str, func: Callable[[], Any]) -> ProfileRunResult:
+        """Call func with the specified profile active and capture how it exits."""
+        ActiveProfile.set(profile)
+        try:
+            return ProfileRunResult(profile=profile, exit_code=0, return_value=func())
+        except click.exceptions.Exit as ex:
+            return ProfileRunResult(profile=profile, exit_code=ex.exit_code)
+        except click.ClickException as ex:
+            ex.show()
+            return ProfileRunResult(profile=profile, exit_code=ex.exit_code)
+        except click.Abort:
+            click.echo("Aborted!", err=True)
+            return ProfileRunResult(profile=profile, exit_code=1)
+        except SystemExit as ex:
+            return ProfileRunResult(profile=profile, exit_code=FleetRunner._exit_code(ex))
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            ActiveProfile.set(None)
+
+    @staticmethod
+    def _exit_code(ex: SystemExit) -> int:
+        """Translate a SystemExit like the python interpreter would do."""
+        if ex.code is None:
+            return 0
+        if isinstance(ex.code, int):
+            return ex.code
+        click.echo(ex.code, err=True)
+        return 1
+
+
+def parse_profiles(_ctx: click.Context, _param: click.Parameter,
+                   value: Optional[str]) -> List[str]:
+    """Click callback that turns 'alice, bob' into ['alice', 'bob']."""
+    if value is None:
+        return []
+    return [profile.strip() for profile in value.split(",") if profile.strip()]
+
+
+class FleetGroup(click.Group):
+    """
+    A click group that runs its subcommand for multiple credential profiles when
+    the --profiles or --all-profiles option is given.
+    """
+
+    def invoke(self, ctx: click.Context) -> Any:
+        profiles: List[str] = self.selected_profiles(ctx)
+        if len(profiles) == 0 or len(ctx.protected_args) == 0:
+            return super().invoke(ctx)
+
+        with ctx:
+            cmd_name, cmd, cmd_args = self.resolve_command(ctx, [*ctx.protected_args, *ctx.args])
+            ctx.protected_args, ctx.args = [], []
+            ctx.invoked_subcommand = cmd_name
+            click.Command.invoke(self, ctx)
+
+            log.debug(f"run {cmd_name} for {profiles=}")
+            results: List[ProfileRunResult] = FleetRunner(profiles).run(
+                lambda: self._invoke_subcommand(ctx, cmd, cmd_name, cmd_args)
+            )
+
+        exit_code: int = max(result.exit_code for result in results)
+        if exit_code != 0:
+            ctx.exit(exit_code)
+        return [result.return_value for result in results]
+
+    @staticmethod
+    def _invoke_subcommand(ctx: click.Context, cmd: click.Command,
+                           cmd_name: str, cmd_args: List[str]) -> Any:
+        """Parse the arguments of the subcommand and invoke it."""
+        # The parser consumes the args, so every profile gets its own copy.
+        with cmd.make_context(cmd_name, list(cmd_args), parent=ctx) as sub_ctx:
+            return sub_ctx.command.invoke(sub_ctx)
+
+    @staticmethod
+    def selected_profiles(ctx: click.Context) -> List[str]:
+        """Return the profiles selected by the --profiles and --all-profiles options."""
+        if ctx.params.get("all_profiles") is True:
+            profiles: List[str] = AuthorizationHandler().profile_names()
+            if len(profiles) == 0:
+                raise click.UsageError(f"{ALL_PROFILES_OPTION} was given, "
+                                       "but the auth file has no credential profiles.")
+            return profiles
+        return ctx.params.get("profiles") or []
+
+
+def profiles_option() -> Callable:
+    """A decorator that adds --profiles to a FleetGroup."""
+    return click.option(
+        PROFILES_OPTION, "profiles", metavar="NAME[,NAME...]",
+        callback=parse_profiles, expose_value=True,
+        help="Run the command once for every specified credential profile, concurrently. "
+             "The output of every profile is prefixed with the profile name."
+    )
+
+
+def all_profiles_option() -> Callable:
+    """A decorator that adds --all-profiles to a FleetGroup."""
+    return click.option(
+        ALL_PROFILES_OPTION, "all_profiles", is_flag=True, default=False,
+        help="Run the command for all the credential profiles in the auth file, concurrently."
+    )
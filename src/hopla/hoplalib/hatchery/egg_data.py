@@ -4,6 +4,8 @@ Module with egg and hatch potion data.
 """
 from typing import List
 
+from hopla.hoplalib.contenttables import ContentTables
+
 
 class EggData:
     """Class with data about eggs."""
@@ -16,6 +18,7 @@ class EggData:
     Drop eggs. This is list was retrieved using:
     hopla api content | jq .dropEggs | jq. keys
     """
+    drop_egg_names = ContentTables.cached().extend(drop_egg_names, "eggs", "drop")
 
     quest_egg_names: List[str] = [
         "Alligator", "Armadillo", "Axolotl",
@@ -37,6 +40,7 @@ class EggData:
     Quest Eggs. This is list was retrieved using:
     hopla api content | jq .questEggs | jq keys
     """
+    quest_egg_names = ContentTables.cached().extend(quest_egg_names, "eggs", "quest")
 
     egg_names: List[str] = drop_egg_names + quest_egg_names
     """All eggs in habitica."""
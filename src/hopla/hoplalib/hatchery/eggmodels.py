@@ -7,8 +7,9 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, Iterator
 
 from hopla.hoplalib.errors import YouFoundABugRewardError
-from hopla.hoplalib.hatchery.egg_data import EggData
 from hopla.hoplalib.hatchery.hatchpotionmodels import HatchPotion
+from hopla.hoplalib.snapshots import QuantitiesSnapshot
+from hopla.hoplalib.zoo.petregistry import get_pet_registry
 
 
 class EggException(YouFoundABugRewardError):
@@ -18,9 +19,10 @@ class EggException(YouFoundABugRewardError):
 @dataclass
 class Egg:
     """An Habitica egg."""
+    __slots__ = ("name", "quantity")
 
     def __init__(self, name: str, *, quantity: int = 1):
-        if name not in EggData.egg_names:
+        if get_pet_registry().egg_kind(name) is None:
             raise EggException(f"{name} is not a valid egg name.")
         if quantity < 0:
             raise EggException(f"{quantity} is below 0.")
@@ -39,11 +41,11 @@ class Egg:
 
     def is_standard_egg(self) -> bool:
         """Return True if this is a drop egg. Else False"""
-        return self.name in EggData.drop_egg_names
+        return get_pet_registry().egg_kind(self.name) == "drop"
 
     def is_quest_egg(self) -> bool:
         """Return True if this is a quest egg. Else False"""
-        return self.name in EggData.quest_egg_names
+        return get_pet_registry().egg_kind(self.name) == "quest"
 
     def can_be_hatched_by(self, potion: HatchPotion) -> bool:
         """Return true if the specified potion can hatch this egg."""
@@ -65,7 +67,7 @@ class EggCollection:
         """Use the given eggs to create __eggs."""
         self.__eggs: Dict[str, Egg] = {}
         for name, n in self.eggs.items():
-            if name in EggData.egg_names:
+            if get_pet_registry().egg_kind(name) is not None:
                 self.__eggs[name] = Egg(name, quantity=n)
             else:
                 logging.error(f"{name} is not yet a supported egg name")
@@ -86,6 +88,12 @@ class EggCollection:
         """Like dict.values() but for an EggCollection."""
         yield from self.__eggs.values()
 
+    def snapshot(self) -> QuantitiesSnapshot:
+        """Return a frozen snapshot of the eggs, e.g. to use as a cache key."""
+        return QuantitiesSnapshot.of("eggs", {
+            name: egg.quantity for name, egg in self.__eggs.items()
+        })
+
     def remove_egg(self, egg: Egg) -> "EggCollection":
         """Remove a single eggs from the EggCollection.
 
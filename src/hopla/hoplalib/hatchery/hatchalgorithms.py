@@ -5,12 +5,14 @@ Module with algorithms for hatching many eggs.
 from dataclasses import dataclass, field
 from typing import Any, List
 
+from hopla.hoplalib.common import with_slots
 from hopla.hoplalib.hatchery.eggmodels import Egg, EggCollection, EggException
 from hopla.hoplalib.hatchery.hatchpotionmodels import HatchPotion, \
     HatchPotionCollection
 from hopla.hoplalib.zoo.petmodels import Pet
 
 
+@with_slots
 @dataclass(frozen=True)
 class HatchPlanItem:
     """Plan to hatch a specific egg with a specified potion."""
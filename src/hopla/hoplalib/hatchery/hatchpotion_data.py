@@ -4,6 +4,8 @@ Module with hatching potion data.
 """
 from typing import List
 
+from hopla.hoplalib.contenttables import ContentTables
+
 
 class HatchPotionData:
     """Class with data about hatching potions."""
@@ -16,6 +18,8 @@ class HatchPotionData:
     This list was retrieved by using:
         hopla api content | jq .dropHatchingPotions | jq keys
     """
+    drop_hatch_potion_names = ContentTables.cached().extend(drop_hatch_potion_names,
+                                                            "hatchingPotions", "drop")
 
     magic_hatch_potion_names = [
         "Amber", "Aquatic", "Aurora", "AutumnLeaf",
@@ -35,12 +39,16 @@ class HatchPotionData:
     Magic hatching potions. This list was retrieved by using:
         hopla api content | jq .premiumHatchingPotions | jq keys
     """
+    magic_hatch_potion_names = ContentTables.cached().extend(magic_hatch_potion_names,
+                                                             "hatchingPotions", "premium")
 
     wacky_hatch_potion_names = ["Dessert", "Fungi", "TeaShop", "Veggie", "VirtualPet"]
     """
     Wacky hatching potions. This list was retrieved by using:
         hopla api content | jq '.wackyHatchingPotions|keys'
     """
+    wacky_hatch_potion_names = ContentTables.cached().extend(wacky_hatch_potion_names,
+                                                             "hatchingPotions", "wacky")
 
     non_drop_hatch_potion_names: List[str] = (
             magic_hatch_potion_names
@@ -5,14 +5,17 @@ Module with models for hatching potions.
 from dataclasses import dataclass, field
 from typing import Dict, Iterator
 
+from hopla.hoplalib.common import with_slots
 from hopla.hoplalib.errors import YouFoundABugRewardError
-from hopla.hoplalib.hatchery.hatchpotion_data import HatchPotionData
+from hopla.hoplalib.snapshots import QuantitiesSnapshot
+from hopla.hoplalib.zoo.petregistry import get_pet_registry
 
 
 class HatchPotionException(YouFoundABugRewardError):
     """Exception raised when there is an error with an hatching potion."""
 
 
+@with_slots
 @dataclass
 class HatchPotion:
     """A habitica hatching potion."""
@@ -20,7 +23,7 @@ class HatchPotion:
     quantity: int = 1
 
     def __post_init__(self):
-        if self.name not in HatchPotionData.hatch_potion_names:
+        if get_pet_registry().hatch_potion_kind(self.name) is None:
             raise HatchPotionException(f"{self.name} is not a valid hatching potion name.")
         if self.quantity < 0:
             raise HatchPotionException(f"{self.quantity} is below 0.")
@@ -30,15 +33,15 @@ class HatchPotion:
 
     def is_standard_hatch_potion(self) -> bool:
         """Return true if this is a standard hatching potion."""
-        return self.name in HatchPotionData.drop_hatch_potion_names
+        return get_pet_registry().hatch_potion_kind(self.name) == "drop"
 
     def is_magic_hatch_potion(self) -> bool:
         """Return true if this is a magic hatching potion."""
-        return self.name in HatchPotionData.magic_hatch_potion_names
+        return get_pet_registry().hatch_potion_kind(self.name) == "magic"
 
     def is_wacky_hatch_potion(self) -> bool:
         """Return true if this is a wacky hatching potion."""
-        return self.name in HatchPotionData.wacky_hatch_potion_names
+        return get_pet_registry().hatch_potion_kind(self.name) == "wacky"
 
 
 @dataclass
@@ -71,6 +74,12 @@ class HatchPotionCollection:
         """Like dict.values() but for an HatchPotionCollection."""
         yield from self.__potions.values()
 
+    def snapshot(self) -> QuantitiesSnapshot:
+        """Return a frozen snapshot of the hatching potions, e.g. to use as a cache key."""
+        return QuantitiesSnapshot.of("hatching_potions", {
+            name: potion.quantity for name, potion in self.__potions.items()
+        })
+
     def remove_hatch_potion(self, potion: HatchPotion) -> "HatchPotionCollection":
         """Remove a single hatching potion from this collection.
 
@@ -2,12 +2,18 @@
 """
 Module with common click options and arguments.
 """
-from typing import Final, List
+from typing import Any, Callable, Final, List, Optional, Sequence
 
 import click
+from click.shell_completion import CompletionItem
+
+from hopla.hoplalib.nameindex import NameIndex
 
 NO_INTERACTION_OPTION_NAMES: Final[List[str]] = ["--force", "--yes", "-f"]
 
+_MAX_LISTED_CHOICES = 20
+"""Choices that are longer than this are not listed in an error message."""
+
 
 def no_interactive_option() -> click.option:
     """A decorator to handle --force consistently throughout hopla."""
@@ -16,3 +22,78 @@ def no_interactive_option() -> click.option:
         is_flag=True, default=False, show_default=True,
         help="Don't ask for confirmation before executing this command."
     )
+
+
+class LazyChoice(click.Choice):
+    """A click.Choice that only computes its choices when click needs them.
+
+    Click needs the choices to validate or complete a value. Commands that are
+    not invoked (and `--help`) therefore don't pay for computing long choice lists.
+
+    The choices are validated and completed through a NameIndex, so neither
+    scans all the choices. An invalid value fails with "did you mean" suggestions
+    instead of a list of all the choices.
+
+    >>> choice = LazyChoice(lambda: ["Wolf-Base", "Fox-Base"])
+    >>> choice.convert("Fox-Base", None, None)
+    'Fox-Base'
+    >>> [item.value for item in choice.shell_complete(None, None, "Wo")]
+    ['Wolf-Base']
+    """
+
+    def __init__(self, get_choices: Callable[[], Sequence[str]], case_sensitive: bool = True):
+        self.__get_choices = get_choices
+        self.__choices: Optional[Sequence[str]] = None
+        self.__index: Optional[NameIndex] = None
+        super().__init__(choices=(), case_sensitive=case_sensitive)
+
+    @property
+    def choices(self) -> Sequence[str]:
+        """The choices, computed on first access."""
+        if self.__choices is None:
+            self.__choices = self.__get_choices()
+        return self.__choices
+
+    @choices.setter
+    def choices(self, choices: Sequence[str]) -> None:
+        self.__choices = choices or None
+        self.__index = None
+
+    @property
+    def index(self) -> NameIndex:
+        """The index of the choices, built on first access."""
+        if self.__index is None:
+            self.__index = NameIndex(self.choices)
+        return self.__index
+
+    def convert(self, value: Any, param: Optional[click.Parameter],
+                ctx: Optional[click.Context]) -> Any:
+        if ctx is not None and ctx.token_normalize_func is not None:
+            return super().convert(value, param, ctx)  # pragma: no cover
+        if value in self.index:
+            return value
+        if not self.case_sensitive:
+            match: Optional[str] = self.index.casefolded(value)
+            if match is not None:
+                return match
+
+        suggestions: List[str] = self.index.suggestions(value)
+        if suggestions:
+            self.fail(f"{value!r} is not a valid choice. "
+                      f"Did you mean {' or '.join(map(repr, suggestions))}?", param, ctx)
+        if len(self.index) > _MAX_LISTED_CHOICES:
+            self.fail(f"{value!r} is not a valid choice. "
+                      "Press TAB to complete the choices.", param, ctx)
+        return super().convert(value, param, ctx)  # fails with a list of the choices
+
+    def shell_complete(self, ctx: click.Context, param: click.Parameter,
+                       incomplete: str) -> List[CompletionItem]:
+        """Complete the choices that start with incomplete.
+
+        If no choice starts with incomplete, ignore the case of incomplete.
+        """
+        matched: List[str] = self.index.with_prefix(incomplete,
+                                                    case_sensitive=self.case_sensitive)
+        if not matched and self.case_sensitive:
+            matched = self.index.with_prefix(incomplete, case_sensitive=False)
+        return [CompletionItem(choice) for choice in matched]
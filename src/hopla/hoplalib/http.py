@@ -4,8 +4,11 @@ Library code to help with Habitica API HTTPS-requests
 from dataclasses import dataclass
 from typing import Final
 
+import requests
+
 from hopla.hoplalib.authorization import AuthorizationHandler
 from hopla.hoplalib.common import GlobalConstants
+from hopla.hoplalib.user.usercache import UserSnapshotCache
 
 
 class RequestHeaders:
@@ -78,3 +81,18 @@ class HabiticaRequest:
         Return the default headers with the user's credentials and the x-client header.
         """
         return RequestHeaders().get_default_request_headers()
+
+    def post_user_change(self, url: str, **kwargs) -> requests.Response:
+        """POST a request that changes the user, using the default headers.
+
+        The cached user (if any) is invalidated, because it no longer
+        matches the user on the Habitica server.
+        """
+        response = requests.post(
+            url=url,
+            headers=self.default_headers,
+            timeout=HabiticaRequest.TIMEOUT,
+            **kwargs
+        )
+        UserSnapshotCache().invalidate(self.default_headers[RequestHeaders.X_API_USER_HEADER_NAME])
+        return response
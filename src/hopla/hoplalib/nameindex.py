@@ -0,0 +1,79 @@
+"""
+A module with a sorted index of names for prefix lookups and suggestions.
+
+Shell completion asks for every name that starts with what the user typed so
+far. The index answers that with a binary search (bisect) in the sorted names
+instead of a scan of all the names.
+"""
+import difflib
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_MAX_CHAR = chr(0x10FFFF)
+"""Sorts after every character that can follow a prefix in a name."""
+
+
+class NameIndex:
+    """An immutable index of names.
+
+    >>> index = NameIndex(["Wolf-Base", "Wolf-Red", "Fox-Base"])
+    >>> index.with_prefix("Wolf-")
+    ['Wolf-Base', 'Wolf-Red']
+    >>> index.with_prefix("wolf-b", case_sensitive=False)
+    ['Wolf-Base']
+    >>> index.suggestions("wolf-red"), index.suggestions("Wolf-Rde")
+    (['Wolf-Red'], ['Wolf-Red', 'Wolf-Base'])
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.__names: Tuple[str, ...] = tuple(sorted(set(names)))
+        self.__name_set = frozenset(self.__names)
+        folded: List[Tuple[str, str]] = sorted((name.casefold(), name) for name in self.__names)
+        self.__folded_names: Tuple[str, ...] = tuple(fold for fold, _ in folded)
+        self.__folded_originals: Tuple[str, ...] = tuple(name for _, name in folded)
+        self.__by_folded: Dict[str, str] = dict(folded)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} names)"
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.__name_set
+
+    def __iter__(self):
+        return iter(self.__names)
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+    def casefolded(self, name: str) -> Optional[str]:
+        """Return the name that equals name when the case is ignored, or None.
+
+        >>> NameIndex(["Wolf-Base"]).casefolded("WOLF-base")
+        'Wolf-Base'
+        """
+        return self.__by_folded.get(name.casefold())
+
+    def with_prefix(self, prefix: str, *, case_sensitive: bool = True) -> List[str]:
+        """Return the names that start with the prefix, in sorted order."""
+        if case_sensitive:
+            return list(_prefix_range(self.__names, prefix, self.__names))
+        return list(_prefix_range(self.__folded_names, prefix.casefold(),
+                                  self.__folded_originals))
+
+    def suggestions(self, name: str, *, n: int = 3) -> List[str]:
+        """Return at most n names that the user probably meant with name."""
+        match: Optional[str] = self.casefolded(name)
+        if match is not None:
+            return [match]
+        folded: str = name.casefold()
+        close: List[str] = difflib.get_close_matches(folded, self.__folded_names, n=n, cutoff=0.6)
+        if close:
+            return [self.__by_folded[fold] for fold in close]
+        return self.with_prefix(name, case_sensitive=False)[:n]
+
+
+def _prefix_range(keys: Tuple[str, ...], prefix: str, values: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return the values of the sorted keys that start with prefix."""
+    start: int = bisect_left(keys, prefix)
+    end: int = bisect_left(keys, prefix + _MAX_CHAR, lo=start)
+    return values[start:end]
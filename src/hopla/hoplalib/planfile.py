@@ -0,0 +1,164 @@
+"""
+A module that stores feed and hatch plans in JSON files.
+
+A plan file makes it possible to make a plan on one machine, review it,
+and execute it later, e.g. from a cron job on another machine. Between
+making the plan and executing it, the user may have fed, hatched, or
+gained items. The plan file therefore has the fingerprints of the state it
+was made from (see snapshots.py). The executor compares them with the
+fingerprints of the state at that moment, and only trusts the plan when
+none of them drifted.
+"""
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from hopla.hoplalib.errors import PrintableException
+from hopla.hoplalib.hatchery.eggmodels import Egg, EggCollection, EggException
+from hopla.hoplalib.hatchery.hatchalgorithms import HatchPlan
+from hopla.hoplalib.hatchery.hatchpotionmodels import (HatchPotion, HatchPotionCollection,
+                                                       HatchPotionException)
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
+from hopla.hoplalib.zoo.foodmodels import FoodStockpileBuilder
+from hopla.hoplalib.zoo.zoofeed_algorithms import FeedPlan
+from hopla.hoplalib.zoo.zoomodels import ZooSnapshot
+
+PLAN_FILE_VERSION = 1
+"""The version of the format of the plan files. Bump it on incompatible changes."""
+FEED_PLAN = "feed"
+HATCH_PLAN = "hatch"
+
+
+class InvalidPlanFile(PrintableException):
+    """Exception raised when a plan file can't be read."""
+
+
+def _zoo_fingerprint(user: HabiticaUser) -> str:
+    zoo = ColumnarZoo.from_pets_and_mounts(pets=user.get_pets(), mounts=user.get_mounts())
+    return ZooSnapshot.from_zoo(zoo).fingerprint
+
+
+def feed_state(user: HabiticaUser) -> Dict[str, str]:
+    """Return the fingerprints of the state of the user that a feed plan depends on."""
+    return {
+        "zoo": _zoo_fingerprint(user),
+        "food": FoodStockpileBuilder().user(user).build().snapshot().fingerprint,
+    }
+
+
+def hatch_state(user: HabiticaUser) -> Dict[str, str]:
+    """Return the fingerprints of the state of the user that a hatch plan depends on."""
+    return {
+        "zoo": _zoo_fingerprint(user),
+        "eggs": EggCollection(user.get_eggs()).snapshot().fingerprint,
+        "hatching_potions":
+            HatchPotionCollection(user.get_hatch_potions()).snapshot().fingerprint,
+    }
+
+
+STATE_OF_KIND = {FEED_PLAN: feed_state, HATCH_PLAN: hatch_state}
+"""The function that fingerprints the state of the user, for every kind of plan."""
+
+
+@dataclass(frozen=True)
+class PlanFile:
+    """A feed or hatch plan, with the fingerprints of the state it was made from.
+
+    >>> plan = FeedPlan()
+    >>> plan.add_to_feed_plan(pet_name="Wolf-Base", food_name="Meat", times=9)
+    >>> plan_file = PlanFile(FEED_PLAN, items=[{"pet_name": "Wolf-Base",
+    ...                                         "food_name": "Meat", "times": 9}])
+    >>> PlanFile.from_json(plan_file.to_json()).feed_plan().feed_plan == plan.feed_plan
+    True
+    """
+    kind: str
+    """FEED_PLAN or HATCH_PLAN."""
+    items: List[Dict[str, Any]]
+    state: Dict[str, str] = field(default_factory=dict)
+    """The fingerprints of the state that the plan was made from. See STATE_OF_KIND."""
+    options: Dict[str, Any] = field(default_factory=dict)
+    """The options that the plan was made with, to make it again after a drift."""
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    def __post_init__(self):
+        try:
+            if self.kind == FEED_PLAN:
+                self.feed_plan()
+            else:
+                self.hatch_plan()
+        except (KeyError, TypeError, EggException, HatchPotionException) as ex:
+            raise InvalidPlanFile(f"The plan file has an invalid item: {ex}") from ex
+
+    @classmethod
+    def of_feed_plan(cls, plan: FeedPlan, *, user: HabiticaUser,
+                     **options: Any) -> "PlanFile":
+        """Create the plan file of a feed plan that was made for the user."""
+        items = [{"pet_name": item.pet_name, "food_name": item.food_name, "times": item.times}
+                 for item in plan]
+        return cls(FEED_PLAN, items=items, state=feed_state(user), options=options)
+
+    @classmethod
+    def of_hatch_plan(cls, plan: HatchPlan, *, user: HabiticaUser) -> "PlanFile":
+        """Create the plan file of a hatch plan that was made for the user."""
+        items = [{"egg": item.egg.name, "potion": item.potion.name} for item in plan]
+        return cls(HATCH_PLAN, items=items, state=hatch_state(user))
+
+    def feed_plan(self) -> FeedPlan:
+        """Return the items as a FeedPlan."""
+        plan = FeedPlan()
+        for item in self.items:
+            plan.add_to_feed_plan(pet_name=item["pet_name"], food_name=item["food_name"],
+                                  times=item["times"])
+        return plan
+
+    def hatch_plan(self) -> HatchPlan:
+        """Return the items as a HatchPlan."""
+        plan = HatchPlan()
+        for item in self.items:
+            plan.add(egg=Egg(item["egg"]), potion=HatchPotion(item["potion"]))
+        return plan
+
+    def drift(self, user: HabiticaUser) -> List[str]:
+        """Return the parts of the state (e.g. "food") that changed since the plan was made."""
+        current: Dict[str, str] = STATE_OF_KIND[self.kind](user)
+        return [part for part, value in current.items() if self.state.get(part) != value]
+
+    def to_json(self) -> str:
+        """Return the plan file as a JSON document."""
+        return json.dumps({
+            "version": PLAN_FILE_VERSION,
+            "kind": self.kind,
+            "created_at": self.created_at,
+            "state": self.state,
+            "options": self.options,
+            "items": self.items,
+        }, indent=2)
+
+    @classmethod
+    def from_json(cls, text: str) -> "PlanFile":
+        """Parse and validate a JSON document of to_json()."""
+        try:
+            body = json.loads(text)
+        except ValueError as ex:
+            raise InvalidPlanFile(f"The plan file is not valid JSON: {ex}") from ex
+        if not isinstance(body, dict):
+            raise InvalidPlanFile("The plan file is not a JSON object.")
+        if body.get("version") != PLAN_FILE_VERSION:
+            raise InvalidPlanFile(f"Unsupported plan file version: {body.get('version')!r}")
+        if body.get("kind") not in STATE_OF_KIND:
+            raise InvalidPlanFile(f"Unknown kind of plan: {body.get('kind')!r}")
+        return cls(body["kind"], items=body.get("items", []),
+                   state=body.get("state", {}), options=body.get("options", {}),
+                   created_at=body.get("created_at", ""))
+
+    def write(self, path: Path) -> None:
+        """Write the plan file to the path."""
+        path.write_text(self.to_json() + "\n", encoding="utf-8")
+
+    @classmethod
+    def read(cls, path: Path) -> "PlanFile":
+        """Read the plan file of the path."""
+        return cls.from_json(path.read_text(encoding="utf-8"))
@@ -4,7 +4,7 @@ A module with helper functions for the requests package.
 """
 import logging
 import sys
-from typing import Any, NoReturn, Union
+from typing import Any, Dict, NoReturn, Union
 
 import requests
 import click
@@ -28,6 +28,40 @@ def get_data_or_exit(api_response: requests.Response) -> Union[NoReturn, Any]:
                                  status_code=api_response.status_code)
 
 
+def get_data_from_json_or_exit(response_json: Dict[str, Any], *,
+                               status_code: int) -> Union[NoReturn, Any]:
+    """Returns the "data" of a parsed response if successful, else print error message and exit
+
+    Use this instead of get_data_or_exit when the rest of the JSON is needed too.
+
+    :param response_json: the parsed JSON of the response
+    :param status_code: the status code of the response
+    :return:
+    """
+    if response_json["success"]:
+        return response_json["data"]
+
+    __failed_to_get_data_so_exit(response_json=response_json,
+                                 status_code=status_code)
+
+
+def json_or_failure(api_response: requests.Response) -> Dict[str, Any]:
+    """Return the JSON of a response, or a failure like Habitica's if it isn't JSON.
+
+    A proxy in front of Habitica answers a 502 or 503 with an HTML page, and a
+    429 may have an empty body.
+
+    :param api_response:
+    :return: the JSON, or {"success": False, "error": ..., "message": ...}
+    """
+    try:
+        return api_response.json()
+    except ValueError:
+        log.debug(f"received a response without JSON: {api_response.status_code=}")
+        return {"success": False, "error": f"HTTP {api_response.status_code}",
+                "message": "Habitica did not answer with JSON."}
+
+
 def __failed_to_get_data_so_exit(response_json,
                                  status_code: int) -> NoReturn:
     log.debug(f"received: {response_json=}")
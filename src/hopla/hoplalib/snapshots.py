@@ -0,0 +1,62 @@
+"""
+A module with immutable snapshots of the state of a user.
+
+A snapshot is frozen and hashable, so it can be a cache key or a member of
+a set. It also has a fingerprint: a blake2b digest of a canonical encoding of
+its content. Equal content gives equal fingerprints, in every process and on
+every machine, so a stored fingerprint tells whether anything changed since
+the last run without comparing the state itself.
+"""
+import hashlib
+import json
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, Mapping, Tuple
+
+FINGERPRINT_SIZE = 16
+"""The size of a fingerprint in bytes. It has twice as many hex digits."""
+
+
+def fingerprint(kind: str, content: Any) -> str:
+    """Return the fingerprint of JSON serializable content of the specified kind.
+
+    The kind is part of the fingerprint, so a stockpile and an egg collection
+    with the same quantities have different fingerprints.
+
+    >>> fingerprint("food", [["Meat", 3]]) == fingerprint("food", [["Meat", 3]])
+    True
+    >>> len(fingerprint("food", []))
+    32
+    """
+    body: str = json.dumps([kind, content], separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(body.encode("utf-8"), digest_size=FINGERPRINT_SIZE).hexdigest()
+
+
+@dataclass(frozen=True)
+class QuantitiesSnapshot:
+    """A frozen snapshot of the quantities of named items, such as food or eggs.
+
+    >>> first = QuantitiesSnapshot.of("food", {"Meat": 3, "Milk": 0})
+    >>> first == QuantitiesSnapshot.of("food", {"Milk": 0, "Meat": 3})
+    True
+    >>> first.as_dict()
+    {'Meat': 3, 'Milk': 0}
+    """
+    kind: str
+    """What the items are, e.g. food, eggs, or hatching_potions."""
+    items: Tuple[Tuple[str, int], ...]
+    """The (name, quantity) of every item, sorted on the name."""
+
+    @classmethod
+    def of(cls, kind: str, quantities: Mapping[str, int]) -> "QuantitiesSnapshot":
+        """Create the snapshot of the quantities. The order of the quantities doesn't matter."""
+        return cls(kind, tuple(sorted((name, int(n)) for name, n in quantities.items())))
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """The fingerprint of the kind and the items."""
+        return fingerprint(self.kind, self.items)
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the quantities as a new dict."""
+        return dict(self.items)
@@ -2,6 +2,8 @@
 """
 The module with controllers for habitica tasks.
 """
+from typing import List, Optional
+
 import requests
 
 from hopla.hoplalib.http import HabiticaRequest, UrlBuilder
@@ -18,10 +20,33 @@ class AddTodoRequest(HabiticaRequest):
 
     def post_add_todo_request(self):
         """Perform the add To-Do request and return the data in case of success"""
-        response = requests.post(
+        response = self.post_user_change(self.url, json=self.habitica_todo.to_json_dict())
+        return get_data_or_exit(response)
+
+
+class UserTasksRequest(HabiticaRequest):
+    """An object that can get the tasks of the user.
+
+    [apidoc](https://habitica.com/apidoc/#api-Task-GetUserTasks)
+    """
+
+    def __init__(self, task_type: Optional[str] = None):
+        """
+        :param task_type: habits, dailys, todos, rewards, or completedTodos.
+                          None gets all the tasks except for completed To-Dos.
+        """
+        self.url: str = UrlBuilder(path_extension="/tasks/user").url
+        self.task_type = task_type
+
+    def get_tasks_request(self) -> requests.Response:
+        """Perform the get tasks request and return the response."""
+        return requests.get(
             url=self.url,
             headers=self.default_headers,
-            json=self.habitica_todo.to_json_dict(),
+            params={"type": self.task_type} if self.task_type else None,
             timeout=HabiticaRequest.TIMEOUT
         )
-        return get_data_or_exit(response)
+
+    def get_tasks_data_or_exit(self) -> List[dict]:
+        """Get the tasks or exit if the API request failed."""
+        return get_data_or_exit(self.get_tasks_request())
@@ -118,21 +118,45 @@ class RateLimitingAwareThrottler:
         :return:
         """
         for api_request in self.api_requests:
-            log.debug(self)
-            if self._is_rate_initialized is True and self._throttling_required():
-                self._throttle()
+            yield self.__perform(api_request)
 
-            response: Response = api_request()
-            self.__update_rate_info(response)
+    def perform(self, api_request: Callable[[], Response], *,
+                requests_remaining: int) -> Response:
+        """
+        Execute a single request that is not in the queue, e.g. because the
+        requests that follow it are only known after its response.
+
+        :param api_request: the request to execute
+        :param requests_remaining: the number of requests that still have to
+        be executed, including this one
+        :return: the response of the request
+        """
+        self._api_requests_remaining = requests_remaining
+        return self.__perform(api_request)
 
-            yield response
+    def __perform(self, api_request: Callable[[], Response]) -> Response:
+        log.debug(self)
+        if self._is_rate_initialized is True and self._throttling_required():
+            self._throttle()
+
+        response: Response = api_request()
+        self.__update_rate_info(response)
+        return response
 
     def __update_rate_info(self, response: Response):
-        """Use the response to update rate limiting information"""
-        self._set_xrate_limit_remaining(response.headers)
-        self._set_xrate_limit_reset(response.headers)
+        """Use the response to update rate limiting information.
+
+        A response without rate limiting headers (e.g. the HTML page of a
+        gateway error) keeps the rate limiting information that we had.
+        """
         # Consider dequeueing from a queue instead calculating remaining requests.
         self._api_requests_remaining -= 1
+        if (ResponseHeaders.XRATE_LIMIT_REMAINING_HEADER_NAME not in response.headers
+                or ResponseHeaders.XRATE_LIMIT_RESET_HEADER_NAME not in response.headers):
+            log.debug(f"no rate limiting headers in the response: {response.status_code}")
+            return
+        self._set_xrate_limit_remaining(response.headers)
+        self._set_xrate_limit_reset(response.headers)
         self._is_rate_initialized = True
 
     def _throttling_required(self) -> bool:
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Library code for the local cache of the users that hopla fetched.
+
+Read-only commands can use a cached user instead of requesting /user again.
+A cached user is used until it is older than the configured maximum age, or
+until it is invalidated. `hopla webhook serve` keeps the cache fresh by
+applying the events that Habitica pushes, and hopla invalidates the cached
+user itself after every request that changes the user.
+"""
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from hopla.hoplalib.common import get_cache_dirpath
+from hopla.hoplalib.configuration import ConfigurationFileParser
+from hopla.hoplalib.user.usermodels import HabiticaUser
+
+log = logging.getLogger()
+
+USER_CACHE_MAX_AGE_CONFIG_NAME = "cmd_all.user_cache_max_age"
+"""The config name with the maximum age of a cached user in seconds. 0 disables the cache."""
+
+
+class UserSnapshotCache:
+    """A directory with one JSON file per cached user."""
+
+    def __init__(self, *, cache_dir: Optional[Path] = None):
+        self.cache_dir: Path = cache_dir or get_cache_dirpath() / "users"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(cache_dir={self.cache_dir})"
+
+    @staticmethod
+    def max_age() -> int:
+        """Return the configured maximum age of a cached user in seconds (0 if disabled)."""
+        value = ConfigurationFileParser().get_full_config_name(USER_CACHE_MAX_AGE_CONFIG_NAME,
+                                                               fallback="0")
+        try:
+            return max(int(value), 0)
+        except ValueError:
+            log.warning(f"{USER_CACHE_MAX_AGE_CONFIG_NAME}={value} is not a number of seconds")
+            return 0
+
+    def _file(self, user_id: str) -> Path:
+        return self.cache_dir / f"{user_id}.json"
+
+    def get(self, user_id: str, *, max_age: int) -> Optional[HabiticaUser]:
+        """Return the cached user if it is younger than max_age seconds, else None."""
+        entry: Optional[dict] = self._read(user_id)
+        if entry is None or time.time() - entry["cached_at"] > max_age:
+            return None
+        return HabiticaUser(user_dict=entry["user"])
+
+    def put(self, user_id: str, user: HabiticaUser, *,
+            cached_at: Optional[float] = None) -> None:
+        """Cache the user."""
+        entry = {"cached_at": time.time() if cached_at is None else cached_at,
+                 "user": user.user_dict}
+        Path.mkdir(self.cache_dir, parents=True, exist_ok=True)
+        # write and rename, such that readers never see a partially written file
+        tmp_file: Path = self._file(user_id).with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, mode="w", encoding="utf-8") as file:
+            json.dump(entry, file)
+        os.replace(tmp_file, self._file(user_id))
+
+    def update(self, user_id: str, user: HabiticaUser) -> bool:
+        """Replace the cached user, but keep its age. Return False if nothing was cached."""
+        entry: Optional[dict] = self._read(user_id)
+        if entry is None:
+            return False
+        self.put(user_id, user, cached_at=entry["cached_at"])
+        return True
+
+    def get_regardless_of_age(self, user_id: str) -> Optional[HabiticaUser]:
+        """Return the cached user no matter how old it is."""
+        entry: Optional[dict] = self._read(user_id)
+        return None if entry is None else HabiticaUser(user_dict=entry["user"])
+
+    def invalidate(self, user_id: str) -> None:
+        """Forget the cached user."""
+        try:
+            self._file(user_id).unlink()
+            log.debug(f"invalidated the cached user {user_id}")
+        except FileNotFoundError:
+            pass
+
+    def _read(self, user_id: str) -> Optional[dict]:
+        try:
+            with open(self._file(user_id), mode="r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as ex:
+            log.warning(f"ignoring the unreadable cached user {user_id}: {ex}")
+            return None
@@ -2,24 +2,43 @@
 """
 Module that talks to the Habitica API to manage a Habitica user object.
 """
+from typing import List, Optional, Sequence
+
 import requests
 
 from hopla.hoplalib.requests_helper import get_data_or_exit
-from hopla.hoplalib.http import HabiticaRequest, UrlBuilder
+from hopla.hoplalib.http import HabiticaRequest, RequestHeaders, UrlBuilder
+from hopla.hoplalib.user.usercache import UserSnapshotCache
+from hopla.hoplalib.user.userhistory import record_user_if_enabled
 from hopla.hoplalib.user.usermodels import HabiticaUser
 
 
 class HabiticaUserRequest(HabiticaRequest):
     """Class that requests a user model from the Habitica API"""
 
-    def __init__(self):
+    def __init__(self, *, user_fields: Optional[Sequence[str]] = None,
+                 allow_cached: bool = False):
+        """
+        :param user_fields: if specified, only request these fields of the user
+                            (e.g. ["items.pets", "stats.gp"]) instead of the full user.
+        :param allow_cached: if True, a cached user may be returned instead of
+                             requesting the user. Only use this for read-only commands.
+        """
         self.url = UrlBuilder(path_extension="/user").url
+        self.user_fields: Optional[List[str]] = list(user_fields) if user_fields else None
+        self.allow_cached = allow_cached
+
+    @property
+    def _authenticated_user_id(self) -> str:
+        return self.default_headers[RequestHeaders.X_API_USER_HEADER_NAME]
 
     def request_user(self) -> requests.Response:
         """Perform the user get request and return the response"""
+        params = {"userFields": ",".join(self.user_fields)} if self.user_fields else None
         return requests.get(
             url=self.url,
             headers=self.default_headers,
+            params=params,
             timeout=HabiticaRequest.TIMEOUT
         )
 
@@ -27,7 +46,47 @@ class HabiticaUserRequest(HabiticaRequest):
         """
         Function that request the user from habitica and returns
         a HabiticaUser if the request was successful. Else exits.
+
+        When the user history is enabled, a full user is also recorded as a snapshot.
+        When the user cache is enabled, a full user is also cached.
         """
+        max_cache_age: int = UserSnapshotCache.max_age()
+        if self.allow_cached and max_cache_age > 0:
+            cached_user = UserSnapshotCache().get(self._authenticated_user_id,
+                                                  max_age=max_cache_age)
+            if cached_user is not None:
+                return cached_user
+
         user_response: requests.Response = self.request_user()
         user_data: dict = get_data_or_exit(user_response)
-        return HabiticaUser(user_dict=user_data)
+        user = HabiticaUser(user_dict=user_data)
+        if self.user_fields is None:
+            user_id: str = user_data.get("id") or self._authenticated_user_id
+            record_user_if_enabled(user, user_id=user_id)
+            if max_cache_age > 0:
+                UserSnapshotCache().put(user_id, user)
+        return user
+
+
+class UserRequestContext:
+    """
+    The user of a single hopla invocation.
+
+    The user is requested at most once: the first call to user() performs
+    the request and every later call returns the same HabiticaUser.
+    """
+
+    def __init__(self, *, user_fields: Optional[Sequence[str]] = None):
+        self.user_fields = user_fields
+        self.__user: Optional[HabiticaUser] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(user_fields={self.user_fields})"
+
+    def user(self) -> HabiticaUser:
+        """Return the user, request it if that didn't happen yet."""
+        if self.__user is None:
+            self.__user = HabiticaUserRequest(
+                user_fields=self.user_fields
+            ).request_user_data_or_exit()
+        return self.__user
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Library code to keep a local history of the users that hopla fetched.
+
+The history is a content-addressed SQLite database. Every JSON object and
+array of a user is stored once as a node that is identified by the hash of
+its content. A node refers to its children by their hashes, so snapshots
+that share subtrees (e.g. an unchanged inventory) also share the nodes of
+those subtrees. Recording a snapshot therefore only costs the nodes on the
+paths that changed since earlier snapshots.
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from hopla.hoplalib.common import EnvironmentVariables, get_data_dirpath
+from hopla.hoplalib.configuration import ConfigurationFileParser
+from hopla.hoplalib.user.usermodels import HabiticaUser
+
+log = logging.getLogger()
+
+RECORD_HISTORY_CONFIG_NAME = "cmd_all.record_history"
+"""The config name that enables the recording of user snapshots."""
+
+_HASH_REF = "h"
+_VALUE_REF = "v"
+
+
+def _to_canonical_json(value: Any) -> str:
+    """Serialize value such that equal values always give equal strings.
+
+    >>> _to_canonical_json({"b": [1, 2], "a": None})
+    '{"a":null,"b":[1,2]}'
+    """
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _hash_node(body: str) -> str:
+    return hashlib.blake2b(body.encode("utf-8"), digest_size=20).hexdigest()
+
+
+def _utc_timestamp(moment: datetime) -> str:
+    """Return an ISO timestamp in UTC, such that timestamps sort chronologically.
+
+    >>> _utc_timestamp(datetime(2021, 6, 1, 12, 30, tzinfo=timezone.utc))
+    '2021-06-01T12:30:00+00:00'
+    """
+    return moment.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """A recorded user at a single point in time."""
+    snapshot_id: int
+    user_id: str
+    taken_at: datetime
+    root_hash: str
+
+
+class UserHistoryStore:
+    """The local SQLite database with the user snapshots."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS nodes (
+            hash TEXT PRIMARY KEY,
+            body TEXT NOT NULL
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS snapshots (
+            snapshot_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            taken_at TEXT NOT NULL,
+            root_hash TEXT NOT NULL REFERENCES nodes (hash)
+        );
+        CREATE INDEX IF NOT EXISTS snapshots_by_user_and_time
+            ON snapshots (user_id, taken_at);
+    """
+
+    def __init__(self, *, db_file: Optional[Path] = None):
+        self.db_file: Path = db_file or UserHistoryStore.default_db_file()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(db_file={self.db_file})"
+
+    @staticmethod
+    def default_db_file() -> Path:
+        """Return ${HOPLA_HISTORY_FILE} if set, else the history file in the data dir."""
+        env_history_file: Optional[str] = EnvironmentVariables.get_hopla_history_file()
+        if env_history_file is not None:
+            return Path(env_history_file).resolve()
+        return get_data_dirpath() / "history.sqlite3"
+
+    @staticmethod
+    def recording_enabled() -> bool:
+        """Return True if the user configured hopla to record user snapshots."""
+        value: str = ConfigurationFileParser().get_full_config_name(
+            RECORD_HISTORY_CONFIG_NAME, fallback="false"
+        )
+        return str(value).strip().lower() in ["true", "yes", "on", "1"]
+
+    def _connect(self) -> sqlite3.Connection:
+        Path.mkdir(self.db_file.parent, parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.db_file, timeout=30)
+        connection.executescript(UserHistoryStore.SCHEMA)
+        return connection
+
+    def record(self, user: HabiticaUser, *, user_id: str,
+               taken_at: Optional[datetime] = None) -> UserSnapshot:
+        """Store the user as a new snapshot and return that snapshot."""
+        taken_at = datetime.fromisoformat(_utc_timestamp(taken_at or datetime.now(timezone.utc)))
+        new_nodes: Dict[str, str] = {}
+        _, root_hash = self._to_ref(user.user_dict, new_nodes)
+
+        with closing(self._connect()) as connection:
+            with connection:
+                connection.executemany("INSERT OR IGNORE INTO nodes (hash, body) VALUES (?, ?)",
+                                       new_nodes.items())
+                snapshot_id: int = connection.execute(
+                    "INSERT INTO snapshots (user_id, taken_at, root_hash) VALUES (?, ?, ?)",
+                    (user_id, taken_at.isoformat(), root_hash)
+                ).lastrowid
+        log.debug(f"recorded snapshot {snapshot_id} with {len(new_nodes)} nodes")
+        return UserSnapshot(snapshot_id=snapshot_id, user_id=user_id,
+                            taken_at=taken_at, root_hash=root_hash)
+
+    def _to_ref(self, value: Any, new_nodes: Dict[str, str]) -> list:
+        """Return a reference to value: the hash of a node or the (scalar) value itself."""
+        if isinstance(value, dict):
+            return [_HASH_REF, self._put(["d", {key: self._to_ref(child, new_nodes)
+                                                for key, child in value.items()}], new_nodes)]
+        if isinstance(value, list):
+            return [_HASH_REF, self._put(["l", [self._to_ref(child, new_nodes)
+                                                for child in value]], new_nodes)]
+        return [_VALUE_REF, value]
+
+    @staticmethod
+    def _put(node: list, new_nodes: Dict[str, str]) -> str:
+        body: str = _to_canonical_json(node)
+        node_hash: str = _hash_node(body)
+        new_nodes[node_hash] = body
+        return node_hash
+
+    def snapshots(self, user_id: str) -> List[UserSnapshot]:
+        """Return the snapshots of a user from old to new."""
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT snapshot_id, user_id, taken_at, root_hash FROM snapshots "
+                "WHERE user_id = ? ORDER BY taken_at, snapshot_id",
+                (user_id,)
+            ).fetchall()
+        return [UserHistoryStore._to_snapshot(row) for row in rows]
+
+    def latest(self, user_id: str) -> Optional[UserSnapshot]:
+        """Return the most recent snapshot of the user, or None if there are none."""
+        snapshots: List[UserSnapshot] = self.snapshots(user_id)
+        return snapshots[-1] if snapshots else None
+
+    def baseline(self, user_id: str, *, since: datetime) -> Optional[UserSnapshot]:
+        """Return the snapshot that best describes the user at the moment since.
+
+        This is the last snapshot taken at or before since. When no such
+        snapshot exists, this is the oldest snapshot that is available.
+        """
+        snapshots: List[UserSnapshot] = self.snapshots(user_id)
+        before_since = [snap for snap in snapshots if snap.taken_at <= since]
+        if before_since:
+            return before_since[-1]
+        return snapshots[0] if snapshots else None
+
+    def node_count(self) -> int:
+        """Return the number of distinct nodes in the store."""
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+
+    def load_user(self, snapshot: UserSnapshot) -> HabiticaUser:
+        """Rebuild the user of the specified snapshot."""
+        with closing(self._connect()) as connection:
+            bodies: Dict[str, list] = UserHistoryStore._fetch_tree(connection,
+                                                                   snapshot.root_hash)
+        return HabiticaUser(user_dict=UserHistoryStore._from_ref([_HASH_REF, snapshot.root_hash],
+                                                                 bodies))
+
+    @staticmethod
+    def _fetch_tree(connection: sqlite3.Connection, root_hash: str) -> Dict[str, list]:
+        """Fetch all the nodes below root_hash, one query per level of the tree."""
+        bodies: Dict[str, list] = {}
+        to_fetch: List[str] = [root_hash]
+        while to_fetch:
+            rows = connection.execute(
+                f"SELECT hash, body FROM nodes WHERE hash IN ({','.join('?' * len(to_fetch))})",
+                to_fetch
+            ).fetchall()
+            next_level: Dict[str, None] = {}
+            for node_hash, body in rows:
+                bodies[node_hash] = json.loads(body)
+                next_level.update(dict.fromkeys(UserHistoryStore._child_hashes(bodies[node_hash])))
+            to_fetch = [node_hash for node_hash in next_level if node_hash not in bodies]
+        return bodies
+
+    @staticmethod
+    def _child_hashes(node: list) -> List[str]:
+        kind, children = node
+        refs = children.values() if kind == "d" else children
+        return [ref[1] for ref in refs if ref[0] == _HASH_REF]
+
+    @staticmethod
+    def _from_ref(ref: list, bodies: Dict[str, list]) -> Any:
+        if ref[0] == _VALUE_REF:
+            return ref[1]
+        kind, children = bodies[ref[1]]
+        if kind == "d":
+            return {key: UserHistoryStore._from_ref(child, bodies)
+                    for key, child in children.items()}
+        return [UserHistoryStore._from_ref(child, bodies) for child in children]
+
+    @staticmethod
+    def _to_snapshot(row: tuple) -> UserSnapshot:
+        snapshot_id, user_id, taken_at, root_hash = row
+        return UserSnapshot(snapshot_id=snapshot_id, user_id=user_id,
+                            taken_at=datetime.fromisoformat(taken_at), root_hash=root_hash)
+
+
+@dataclass(frozen=True)
+class UserSnapshotDiff:
+    """The changes between an older and a newer version of the same user."""
+    old: HabiticaUser
+    new: HabiticaUser
+
+    @staticmethod
+    def _items(user: HabiticaUser, name: str) -> dict:
+        return user.user_dict.get("items", {}).get(name) or {}
+
+    def pets_gained(self) -> List[str]:
+        """Return the pets that the new user has, but the old user didn't have."""
+        old_pets: dict = UserSnapshotDiff._items(self.old, "pets")
+        new_pets: dict = UserSnapshotDiff._items(self.new, "pets")
+        return sorted(pet for pet, feed_status in new_pets.items()
+                      if (feed_status or 0) > 0 >= (old_pets.get(pet) or 0))
+
+    def mounts_gained(self) -> List[str]:
+        """Return the mounts that the new user has, but the old user didn't have."""
+        old_mounts: dict = UserSnapshotDiff._items(self.old, "mounts")
+        new_mounts: dict = UserSnapshotDiff._items(self.new, "mounts")
+        return sorted(mount for mount, available in new_mounts.items()
+                      if available is True and old_mounts.get(mount) is not True)
+
+    def food_consumed(self) -> Dict[str, int]:
+        """Return how much of every food type the user has less than before."""
+        new_food: dict = UserSnapshotDiff._items(self.new, "food")
+        consumed = {food: amount - new_food.get(food, 0)
+                    for food, amount in UserSnapshotDiff._items(self.old, "food").items()}
+        return {food: amount for food, amount in sorted(consumed.items()) if amount > 0}
+
+    def gold_spent(self) -> float:
+        """Return how much gold the user has less than before (0 if gold increased)."""
+        old_gp: float = self.old.user_dict.get("stats", {}).get("gp", 0)
+        new_gp: float = self.new.user_dict.get("stats", {}).get("gp", 0)
+        return round(max(old_gp - new_gp, 0), 2)
+
+    def to_dict(self) -> dict:
+        """Return the diff as a dict."""
+        return {
+            "pets_gained": self.pets_gained(),
+            "mounts_gained": self.mounts_gained(),
+            "food_consumed": self.food_consumed(),
+            "gold_spent": self.gold_spent()
+        }
+
+
+def record_user_if_enabled(user: HabiticaUser, *, user_id: str) -> Optional[UserSnapshot]:
+    """Record a snapshot of the user when the user history is enabled.
+
+    Recording is a side effect of fetching a user, so a broken history
+    database is logged instead of stopping the command.
+    """
+    try:
+        if UserHistoryStore.recording_enabled() is False:
+            return None
+        return UserHistoryStore().record(user, user_id=user_id)
+    except (sqlite3.Error, OSError) as ex:
+        log.warning(f"Failed to record the user history: {ex}")
+        return None
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Library code to receive Habitica webhooks and keep the user cache fresh.
+
+Habitica can push events about task activity, user activity (e.g. a hatched
+pet) and quest activity to a URL. Every valid event is either applied to the
+cached user, or it invalidates the cached user when its effect on the user
+can't be derived from the event.
+
+The receiver only accepts requests that know its secret, either as the path
+of the URL (Habitica webhooks can't send custom headers) or in the
+X-Hopla-Webhook-Secret header. It also only accepts events of the users of
+the configured profiles, so nobody else can fill the cache with their user.
+
+[webhook docs](https://habitica.com/apidoc/#api-Webhook)
+"""
+import hmac
+import json
+import logging
+import threading
+from copy import deepcopy
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from hopla.hoplalib.errors import PrintableException
+from hopla.hoplalib.user.usercache import UserSnapshotCache
+from hopla.hoplalib.user.usermodels import HabiticaUser
+
+log = logging.getLogger()
+
+
+class InvalidWebhookEvent(PrintableException):
+    """Exception raised when a webhook event is invalid."""
+
+
+class WebhookEventTypes:
+    """The webhook types and event types that hopla knows about."""
+    TASK_ACTIVITY = "taskActivity"
+    USER_ACTIVITY = "userActivity"
+    QUEST_ACTIVITY = "questActivity"
+    GROUP_CHAT_RECEIVED = "groupChatReceived"
+
+    EVENT_TYPES: Dict[str, frozenset] = {
+        TASK_ACTIVITY: frozenset(["created", "updated", "deleted", "scored", "checklistScored"]),
+        USER_ACTIVITY: frozenset(["petHatched", "mountRaised", "leveledUp"]),
+        QUEST_ACTIVITY: frozenset(["questStarted", "questFinished", "questInvited"]),
+        GROUP_CHAT_RECEIVED: frozenset([None]),
+    }
+
+
+@dataclass(frozen=True)
+class WebhookEvent:
+    """A validated webhook event."""
+    webhook_type: str
+    event_type: Optional[str]
+    user_id: str
+    body: dict
+
+    @classmethod
+    def from_json(cls, raw_body: bytes) -> "WebhookEvent":
+        """Parse and validate the body of a webhook request."""
+        try:
+            body = json.loads(raw_body)
+        except ValueError as ex:
+            raise InvalidWebhookEvent(f"The body is not valid JSON: {ex}") from ex
+        if not isinstance(body, dict):
+            raise InvalidWebhookEvent("The body is not a JSON object.")
+
+        webhook_type = body.get("webhookType")
+        if webhook_type not in WebhookEventTypes.EVENT_TYPES:
+            raise InvalidWebhookEvent(f"Unknown webhookType: {webhook_type!r}")
+        event_type = body.get("type")
+        if event_type not in WebhookEventTypes.EVENT_TYPES[webhook_type]:
+            raise InvalidWebhookEvent(f"Unknown type for {webhook_type}: {event_type!r}")
+        user_id = (body.get("user") or {}).get("_id")
+        if not isinstance(user_id, str) or user_id == "":
+            raise InvalidWebhookEvent("The event has no user._id.")
+        if event_type == "petHatched" and not isinstance(body.get("pet"), str):
+            raise InvalidWebhookEvent("A petHatched event must specify the pet.")
+        return cls(webhook_type=webhook_type, event_type=event_type,
+                   user_id=user_id, body=body)
+
+
+def _apply_pet_hatched(user_dict: dict, event: WebhookEvent) -> bool:
+    pet_name: str = event.body["pet"]
+    items: dict = user_dict["items"]
+    egg_name, _, potion_name = pet_name.partition("-")
+    items["pets"][pet_name] = 5
+    for inventory, item_name in [("eggs", egg_name), ("hatchingPotions", potion_name)]:
+        if items[inventory].get(item_name, 0) <= 0:
+            return False  # the cache didn't know about this item: it was already stale
+        items[inventory][item_name] -= 1
+    return True
+
+
+def _apply_task_scored(user_dict: dict, event: WebhookEvent) -> bool:
+    user: dict = event.body["user"]
+    if "stats" not in user or (user.get("_tmp") or {}).get("drop"):
+        return False  # a drop changes the items in a way that the event doesn't describe
+    user_dict["stats"].update(user["stats"])
+    return True
+
+
+EVENT_APPLIERS: Dict[str, Callable[[dict, WebhookEvent], bool]] = {
+    "petHatched": _apply_pet_hatched,
+    "scored": _apply_task_scored,
+}
+"""
+Functions that apply an event to a cached user dict. They return False if
+the event can't be applied. All the other events invalidate the cached user.
+"""
+
+
+class WebhookEventHandler:
+    """Apply webhook events to the user cache."""
+    APPLIED = "applied"
+    INVALIDATED = "invalidated"
+    IGNORED = "ignored"
+
+    def __init__(self, cache: Optional[UserSnapshotCache] = None):
+        self.cache: UserSnapshotCache = cache or UserSnapshotCache()
+        self.__lock = threading.Lock()  # events may arrive concurrently
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(cache={self.cache})"
+
+    def handle(self, event: WebhookEvent) -> str:
+        """Apply the event to the cached user, or invalidate it. Return what happened."""
+        if event.webhook_type == WebhookEventTypes.GROUP_CHAT_RECEIVED:
+            return WebhookEventHandler.IGNORED
+        with self.__lock:
+            return self._apply_or_invalidate(event)
+
+    def _apply_or_invalidate(self, event: WebhookEvent) -> str:
+        cached_user: Optional[HabiticaUser] = self.cache.get_regardless_of_age(event.user_id)
+        applier = EVENT_APPLIERS.get(event.event_type)
+        if cached_user is not None and applier is not None:
+            user_dict: dict = deepcopy(cached_user.user_dict)
+            try:
+                applied: bool = applier(user_dict, event)
+            except (KeyError, TypeError, AttributeError) as ex:
+                log.debug(f"cannot apply {event.event_type}: {ex!r}")
+                applied = False
+            if applied and self.cache.update(event.user_id, HabiticaUser(user_dict=user_dict)):
+                return WebhookEventHandler.APPLIED
+
+        self.cache.invalidate(event.user_id)
+        return WebhookEventHandler.INVALIDATED
+
+
+@dataclass(frozen=True)
+class WebhookAuthorization:
+    """The secret and the users that a webhook receiver accepts.
+
+    >>> authorization = WebhookAuthorization("s3cr3t", user_ids=frozenset(["u"]))
+    >>> authorization.authorizes_request("/s3cr3t", headers={})
+    True
+    >>> authorization.authorizes_request("/", headers={"X-Hopla-Webhook-Secret": "s3cr3t"})
+    True
+    >>> authorization.authorizes_request("/guess", headers={})
+    False
+    """
+    secret: str
+    user_ids: FrozenSet[str]
+    """The user ids of the configured profiles."""
+
+    SECRET_HEADER_NAME = "X-Hopla-Webhook-Secret"
+
+    def __post_init__(self):
+        if self.secret == "":
+            raise ValueError("The secret of a webhook receiver can't be empty.")
+
+    def authorizes_request(self, path: str, *, headers: Mapping[str, str]) -> bool:
+        """Return True if the path of the URL, or the secret header, has the secret."""
+        path_secret: str = urlsplit(path).path.strip("/")
+        header_secret: str = headers.get(WebhookAuthorization.SECRET_HEADER_NAME) or ""
+        return any(hmac.compare_digest(candidate.encode("utf-8"), self.secret.encode("utf-8"))
+                   for candidate in [path_secret, header_secret])
+
+    def authorizes_event(self, event: WebhookEvent) -> bool:
+        """Return True if the event is about the user of a configured profile."""
+        return event.user_id in self.user_ids
+
+
+class WebhookRequestHandler(BaseHTTPRequestHandler):
+    """HTTP request handler that accepts authorized webhook events."""
+    server: "WebhookServer"
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Handle a webhook event (the method name is prescribed by http.server)."""
+        authorization: WebhookAuthorization = self.server.authorization
+        if not authorization.authorizes_request(self.path, headers=self.headers):
+            self._respond(HTTPStatus.FORBIDDEN,
+                          {"success": False, "message": "Missing or wrong webhook secret."})
+            return
+        try:
+            content_length = int(self.headers.get("Content-Length") or 0)
+            if content_length < 0:
+                raise ValueError(content_length)
+        except ValueError:
+            self._respond(HTTPStatus.BAD_REQUEST,
+                          {"success": False, "message": "Invalid Content-Length header."})
+            return
+        try:
+            event = WebhookEvent.from_json(self.rfile.read(content_length))
+        except InvalidWebhookEvent as ex:
+            self._respond(HTTPStatus.BAD_REQUEST, {"success": False, "message": str(ex)})
+            return
+        if not authorization.authorizes_event(event):
+            self._respond(HTTPStatus.FORBIDDEN,
+                          {"success": False, "message": f"Unknown user: {event.user_id}"})
+            return
+        outcome: str = self.server.event_handler.handle(event)
+        self.server.on_event(event, outcome)
+        self._respond(HTTPStatus.OK, {"success": True, "outcome": outcome})
+
+    def _respond(self, status: HTTPStatus, body: dict) -> None:
+        encoded: bytes = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format, *args):
+        log.debug(f"webhook receiver: {format % args}")
+
+
+class WebhookServer(ThreadingHTTPServer):
+    """An HTTP server that receives webhook events. Start it with serve_forever()."""
+
+    def __init__(self, server_address: Tuple[str, int], *,
+                 authorization: WebhookAuthorization,
+                 event_handler: WebhookEventHandler,
+                 on_event: Callable[[WebhookEvent, str], Any]):
+        """
+        :param server_address: the host and port to listen on
+        :param authorization: the secret and the users that the server accepts
+        :param event_handler: applies the received events to the user cache
+        :param on_event: called with every event and its outcome (e.g. to print it)
+        """
+        super().__init__(server_address, WebhookRequestHandler)
+        self.authorization = authorization
+        self.event_handler = event_handler
+        self.on_event = on_event
+
+
+def sample_event(event_type: str, *, user_id: str, pet: str = "Wolf-Base") -> dict:
+    """Return an event like Habitica would send it, for testing a receiver.
+
+    >>> sample_event("leveledUp", user_id="u")["webhookType"]
+    'userActivity'
+    """
+    webhook_type = next(webhook_type for webhook_type, event_types
+                        in WebhookEventTypes.EVENT_TYPES.items() if event_type in event_types)
+    event: Dict[str, Any] = {"webhookType": webhook_type, "type": event_type,
+                             "user": {"_id": user_id}}
+    if event_type in ["petHatched", "mountRaised"]:
+        event["pet"] = pet
+        event["message"] = f"{event_type}: {pet}"
+    elif event_type == "leveledUp":
+        event.update({"initialLvl": 1, "finalLvl": 2})
+    elif event_type == "scored":
+        event.update({"task": {"id": "sample-task", "type": "habit", "text": "hopla test"},
+                      "direction": "up", "delta": 1.0})
+        event["user"]["stats"] = {"hp": 50, "mp": 30, "exp": 10, "gp": 25.5, "lvl": 2}
+    elif webhook_type == WebhookEventTypes.QUEST_ACTIVITY:
+        event.update({"group": {"id": "party", "name": "party"}, "quest": {"key": "rat"}})
+    return event
@@ -0,0 +1,261 @@
+"""
+A module with a compiled, memory-mapped index of the pet catalogue.
+
+The pet catalogue (the names, eggs, potions, categories, and favorite food
+of all the pets) is compiled once into a compact binary file in the cache
+directory. Every later hopla invocation memory-maps that file and queries it
+directly, instead of building the catalogue out of Python lists.
+
+The layout of an index (all integers are little-endian):
+
+    header          see _HEADER
+    string offsets  (n_strings + 1) x u32, into the string blob
+    string blob     the interned UTF-8 strings; pet i is string i
+    pet records     n_pets x _RECORD (name, egg, potion, food, category, flags)
+    hash table      table_size x u32: pet id + 1 (0 is empty), linear probing
+    bitsets         n_categories x ceil(n_pets / 8) bytes: bit i is pet i
+"""
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import zlib
+from itertools import accumulate
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+log = logging.getLogger()
+
+_MAGIC = b"HPCI"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHHIII")
+"""magic, format version, n_categories, n_strings, n_pets, table_size"""
+_U32 = struct.Struct("<I")
+_RECORD = struct.Struct("<IIIIBB")
+"""name, egg, potion, and favorite food string ids, category id, flags"""
+_NO_STRING = 0xFFFFFFFF
+_FEEDABLE_FLAG = 1
+_RARE_FLAG = 2
+
+
+class CataloguePet(NamedTuple):
+    """A pet such as it is compiled into the index."""
+    name: str
+    egg: Optional[str]
+    potion: Optional[str]
+    category: int
+    """The position of the category of this pet in the categories of the index."""
+    feedable: bool
+    favorite_food: Optional[str]
+    rare: bool
+
+
+def _stable_hash(data: bytes) -> int:
+    """A hash that, unlike hash(), is the same in every process."""
+    return zlib.crc32(data)
+
+
+def _pack_records(pets: List[CataloguePet]) -> Tuple[List[bytes], List[bytes]]:
+    """Intern the strings of the pets and return (encoded strings, packed records)."""
+    strings: List[str] = [pet.name for pet in pets]
+    string_ids: Dict[str, int] = {name: pet_id for pet_id, name in enumerate(strings)}
+
+    def intern(string: Optional[str]) -> int:
+        if string is None:
+            return _NO_STRING
+        if string not in string_ids:
+            string_ids[string] = len(strings)
+            strings.append(string)
+        return string_ids[string]
+
+    records: List[bytes] = [
+        _RECORD.pack(pet_id, intern(pet.egg), intern(pet.potion), intern(pet.favorite_food),
+                     pet.category,
+                     (_FEEDABLE_FLAG if pet.feedable else 0) | (_RARE_FLAG if pet.rare else 0))
+        for pet_id, pet in enumerate(pets)
+    ]
+    return [string.encode("utf-8") for string in strings], records
+
+
+def _pack_hash_table(encoded_names: List[bytes]) -> bytes:
+    """Return the open-addressing hash table of the names, at most half full."""
+    table_size = 1 << max(len(encoded_names) * 2 - 1, 1).bit_length()
+    table: List[int] = [0] * table_size
+    for pet_id, encoded_name in enumerate(encoded_names):
+        slot = _stable_hash(encoded_name) & (table_size - 1)
+        while table[slot] != 0:
+            slot = (slot + 1) & (table_size - 1)
+        table[slot] = pet_id + 1
+    return struct.pack(f"<{table_size}I", *table)
+
+
+def compile_index(pets: List[CataloguePet], *, n_categories: int) -> bytes:
+    """Compile the pets into an index. The pet ids are the positions in pets.
+
+    >>> index = CatalogueIndex(compile_index(
+    ...     [CataloguePet("Wolf-Base", "Wolf", "Base", 0, True, "Meat", False)], n_categories=1))
+    >>> index.pet_id("Wolf-Base"), index.pet_id("Wolf-Nope"), index.pet(0).favorite_food
+    (0, None, 'Meat')
+    """
+    encoded, records = _pack_records(pets)
+    hash_table: bytes = _pack_hash_table(encoded[:len(pets)])
+    bitsets: List[int] = [0] * n_categories
+    for pet_id, pet in enumerate(pets):
+        bitsets[pet.category] |= 1 << pet_id
+
+    return b"".join([
+        _HEADER.pack(_MAGIC, _FORMAT_VERSION, n_categories, len(encoded), len(pets),
+                     len(hash_table) // _U32.size),
+        struct.pack(f"<{len(encoded) + 1}I", 0, *accumulate(len(string) for string in encoded)),
+        *encoded,
+        *records,
+        hash_table,
+        *(bitset.to_bytes((len(pets) + 7) // 8, "little") for bitset in bitsets)
+    ])
+
+
+class _Sections:
+    """The start positions of the sections of an index."""
+    __slots__ = ("offsets", "strings", "records", "table", "bitsets")
+
+    def __init__(self, *, offsets: int, strings: int, records: int, table: int, bitsets: int):
+        self.offsets = offsets
+        self.strings = strings
+        self.records = records
+        self.table = table
+        self.bitsets = bitsets
+
+
+class CatalogueIndex:
+    """Read-only queries on a compiled index, without unpacking the entire index."""
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        magic, version, self.n_categories, n_strings, self.n_pets, self.__table_size = \
+            _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError(f"not a catalogue index of format {_FORMAT_VERSION}")
+        self.__buffer = buffer
+        self.__decoded: Dict[int, str] = {}  # eggs, potions, and food are shared by many pets
+        strings_start: int = _HEADER.size + (n_strings + 1) * _U32.size
+        records_start: int = strings_start + _U32.unpack_from(
+            buffer, _HEADER.size + n_strings * _U32.size
+        )[0]
+        table_start: int = records_start + self.n_pets * _RECORD.size
+        self.__sections = _Sections(offsets=_HEADER.size, strings=strings_start,
+                                    records=records_start, table=table_start,
+                                    bitsets=table_start + self.__table_size * _U32.size)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.n_pets} pets)"
+
+    def __len__(self) -> int:
+        return self.n_pets
+
+    def _encoded_string(self, string_id: int) -> bytes:
+        start, end = struct.unpack_from("<II", self.__buffer,
+                                        self.__sections.offsets + string_id * _U32.size)
+        return self.__buffer[self.__sections.strings + start:self.__sections.strings + end]
+
+    def _string(self, string_id: int) -> Optional[str]:
+        if string_id == _NO_STRING:
+            return None
+        string: Optional[str] = self.__decoded.get(string_id)
+        if string is None:
+            string = self._encoded_string(string_id).decode("utf-8")
+            self.__decoded[string_id] = string
+        return string
+
+    def pet_name(self, pet_id: int) -> str:
+        """Return the name of the pet with this id."""
+        return self._string(pet_id)
+
+    def pet_id(self, pet_name: str) -> Optional[int]:
+        """Return the id of the pet, or None if the pet is not in the index."""
+        encoded: bytes = pet_name.encode("utf-8")
+        mask: int = self.__table_size - 1
+        slot: int = _stable_hash(encoded) & mask
+        while True:
+            entry: int = _U32.unpack_from(self.__buffer,
+                                          self.__sections.table + slot * _U32.size)[0]
+            if entry == 0:
+                return None
+            if self._encoded_string(entry - 1) == encoded:
+                return entry - 1
+            slot = (slot + 1) & mask
+
+    def pet(self, pet_id: int) -> CataloguePet:
+        """Return the pet with this id."""
+        name_id, egg_id, potion_id, food_id, category, flags = _RECORD.unpack_from(
+            self.__buffer, self.__sections.records + pet_id * _RECORD.size
+        )
+        return CataloguePet(self._string(name_id), self._string(egg_id),
+                            self._string(potion_id), category, bool(flags & _FEEDABLE_FLAG),
+                            self._string(food_id), bool(flags & _RARE_FLAG))
+
+    def category_bitset(self, category: int) -> int:
+        """Return the ids of the pets of the category as a bitset (bit i is pet i)."""
+        bitset_length: int = (self.n_pets + 7) // 8
+        start: int = self.__sections.bitsets + category * bitset_length
+        return int.from_bytes(self.__buffer[start:start + bitset_length], "little")
+
+
+def _install_key(source_files: Iterable[Path]) -> str:
+    """Return a key of the locations of the source files, i.e. of this hopla install.
+
+    Several installs (e.g. in different virtual environments) share the
+    cache directory. Every install only replaces its own outdated indexes.
+    """
+    paths: str = "\n".join(str(source_file) for source_file in source_files)
+    return hashlib.blake2b(paths.encode("utf-8"), digest_size=4).hexdigest()
+
+
+def _cache_key(source_files: Iterable[Path]) -> str:
+    """Return a key that changes whenever one of the source files changes."""
+    stats: List[str] = [str(_FORMAT_VERSION)]
+    for source_file in source_files:
+        try:
+            stat = source_file.stat()
+            stats.append(f"{source_file}:{stat.st_mtime_ns}:{stat.st_size}")
+        except OSError:
+            stats.append(f"{source_file}:missing")
+    return hashlib.blake2b("\n".join(stats).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _write_index(index_file: Path, compiled: bytes, *, install_key: str) -> None:
+    """Replace the outdated indexes of this install by the compiled index.
+    A failure is not fatal."""
+    try:
+        Path.mkdir(index_file.parent, parents=True, exist_ok=True)
+        for outdated_file in index_file.parent.glob(f"catalogue-{install_key}-*.idx"):
+            try:
+                outdated_file.unlink()
+            except OSError:  # e.g. another process still maps it on Windows
+                pass
+        tmp_file: Path = index_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(compiled)
+        os.replace(tmp_file, index_file)
+    except OSError as ex:
+        log.debug(f"failed to cache the catalogue index: {ex!r}")
+
+
+def load_catalogue_index(compile_pets: Callable[[], List[CataloguePet]], *,
+                         n_categories: int, source_files: List[Path],
+                         cache_dir: Path) -> CatalogueIndex:
+    """Memory-map the compiled index, and compile it first if it is missing or outdated.
+
+    :param compile_pets: returns the pets of the catalogue (only called to compile)
+    :param source_files: the files that the catalogue is made from
+    :param cache_dir: the directory of the compiled index
+    """
+    install_key: str = _install_key(source_files)
+    index_file: Path = cache_dir / f"catalogue-{install_key}-{_cache_key(source_files)}.idx"
+    try:
+        with open(index_file, mode="rb") as file:
+            return CatalogueIndex(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+    except (OSError, ValueError):
+        log.debug(f"compile the catalogue index {index_file}")
+
+    compiled: bytes = compile_index(compile_pets(), n_categories=n_categories)
+    _write_index(index_file, compiled, install_key=install_key)
+    return CatalogueIndex(compiled)
@@ -0,0 +1,232 @@
+"""
+A module with a columnar representation of a Zoo.
+
+A Zoo is a dict of PetMountPairs. The ColumnarZoo keeps the same pets and
+mounts in parallel columns instead: the name, the catalogue pet id, the feed
+status, the mount status, and the category of every row. The ZooHelper
+filters become masks (one byte per row, 1 for a selected row) that are
+computed with bytes.translate and combined with integer &, so filtering
+neither runs a Python predicate per pet nor copies the columns.
+
+A ColumnarZoo is a read-only Mapping[str, PetMountPair], so it can be used
+wherever a Zoo is read. The pairs are created when they are accessed.
+"""
+from array import array
+from itertools import compress
+from typing import (Callable, Dict, Iterable, Iterator, Mapping, NamedTuple, Optional,
+                    Tuple)
+
+from hopla.hoplalib.zoo.foodmodels import FeedStatus
+from hopla.hoplalib.zoo.petmodels import Mount, Pet, PetMountPair
+from hopla.hoplalib.zoo.petregistry import PetCategory, PetRecord, get_pet_registry
+
+_NO_PET = 0
+"""The feed code of a row without a pet. Other feed codes are feed status + 2."""
+_FEED_CODE_OFFSET = 2
+_MOUNT_CODES: Dict[Optional[bool], int] = {None: 1, False: 2, True: 3}
+"""The mount codes of the availability statuses. 0 is a row without a mount."""
+_MOUNT_STATUSES: Dict[int, Optional[bool]] = {code: status
+                                              for status, code in _MOUNT_CODES.items()}
+_UNKNOWN_CATEGORY = 255
+
+
+def _mask_table(codes: Iterable[int]) -> bytes:
+    """Return the translation table that turns the codes into 1, and other bytes into 0."""
+    table = bytearray(256)
+    for code in codes:
+        table[code] = 1
+    return bytes(table)
+
+
+_PET_AVAILABLE = _mask_table(range(_FEED_CODE_OFFSET + FeedStatus.START_FEED_STATE, 256))
+_MOUNT_AVAILABLE = _mask_table([_MOUNT_CODES[True]])
+
+
+def _mount_code(availability_status: Optional[bool]) -> int:
+    return _MOUNT_CODES.get(availability_status, _MOUNT_CODES[None])
+
+
+def _and(mask: bytes, *masks: bytes) -> bytes:
+    """Return the mask of the rows that are selected by all the masks."""
+    selected: int = int.from_bytes(mask, "little")
+    for other in masks:
+        selected &= int.from_bytes(other, "little")
+    return selected.to_bytes(len(mask), "little")
+
+
+def _not(mask: bytes) -> bytes:
+    """Return the mask of the rows that are not selected by mask."""
+    return mask.translate(_mask_table([0]))
+
+
+class _Columns(NamedTuple):
+    """The columns of a zoo, shared by all the filtered views of the zoo."""
+    names: Tuple[str, ...]
+    pet_ids: array
+    """The catalogue pet id of every row, -1 if hopla doesn't know the pet."""
+    feed_codes: bytes
+    mount_codes: bytes
+    categories: bytes
+    """The position of the category in PetCategory.ALL, or _UNKNOWN_CATEGORY."""
+    rows: Dict[str, int]
+
+
+class ColumnarZoo(Mapping[str, PetMountPair]):
+    """A read-only zoo in columns, or a filtered view of one.
+
+    >>> zoo = ColumnarZoo.from_pets_and_mounts(
+    ...     pets={"Wolf-Base": 10, "Fox-Base": 5, "Phoenix-Base": 5}, mounts={"Fox-Base": True})
+    >>> list(zoo.get_feedable_zoo())
+    ['Wolf-Base']
+    >>> list(zoo.filter_on_categories(PetCategory.RARE))
+    ['Phoenix-Base']
+    """
+    # pylint: disable=too-many-public-methods
+    # The masks and the filters mirror ZooHelper: splitting them up would hide that.
+
+    def __init__(self, columns: _Columns, mask: Optional[bytes] = None):
+        self.__columns = columns
+        self.__mask: bytes = b"\x01" * len(columns.names) if mask is None else mask
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} of {len(self.__columns.names)} rows)"
+
+    def __len__(self) -> int:
+        return self.__mask.count(1)
+
+    def __iter__(self) -> Iterator[str]:
+        return compress(self.__columns.names, self.__mask)
+
+    def __contains__(self, name: object) -> bool:
+        row: Optional[int] = self.__columns.rows.get(name)  # type: ignore
+        return row is not None and self.__mask[row] == 1
+
+    def __getitem__(self, name: str) -> PetMountPair:
+        if name not in self:
+            raise KeyError(name)
+        return self.__pair(self.__columns.rows[name])
+
+    def __pair(self, row: int) -> PetMountPair:
+        name: str = self.__columns.names[row]
+        feed_code: int = self.__columns.feed_codes[row]
+        mount_code: int = self.__columns.mount_codes[row]
+        pet = None
+        if feed_code != _NO_PET:
+            pet = Pet(name, feed_status=FeedStatus(feed_code - _FEED_CODE_OFFSET))
+        mount = None
+        if mount_code != 0:
+            mount = Mount(name, availability_status=_MOUNT_STATUSES[mount_code])
+        return PetMountPair(pet=pet, mount=mount)
+
+    @classmethod
+    def from_pets_and_mounts(cls, *, pets: Dict[str, int],
+                             mounts: Dict[str, Optional[bool]]) -> "ColumnarZoo":
+        """Create the zoo of the feed statuses of pets and the mounts of a user.
+
+        Like ZooBuilder.build(skip_unsupported_pets=True), the rows are the pets that
+        hopla knows, followed by the mounts without a pet.
+        """
+        pets = {name: int(FeedStatus(status)) for name, status in pets.items()
+                if name in get_pet_registry()}
+        names: Tuple[str, ...] = (*pets, *(name for name in mounts if name not in pets))
+        return cls._from_columns(
+            names,
+            feed_codes=bytes(_NO_PET if name not in pets else pets[name] + _FEED_CODE_OFFSET
+                             for name in names),
+            mount_codes=bytes(_mount_code(mounts[name]) if name in mounts else 0
+                              for name in names)
+        )
+
+    @classmethod
+    def from_zoo(cls, zoo: Mapping[str, PetMountPair]) -> "ColumnarZoo":
+        """Create the columnar zoo of a Zoo."""
+        if isinstance(zoo, ColumnarZoo):
+            return zoo
+        return cls._from_columns(
+            tuple(zoo),
+            feed_codes=bytes(_NO_PET if pair.pet is None
+                             else int(pair.pet.feed_status) + _FEED_CODE_OFFSET
+                             for pair in zoo.values()),
+            mount_codes=bytes(0 if pair.mount is None
+                              else _mount_code(pair.mount.availability_status)
+                              for pair in zoo.values())
+        )
+
+    @classmethod
+    def _from_columns(cls, names: Tuple[str, ...], *,
+                      feed_codes: bytes, mount_codes: bytes) -> "ColumnarZoo":
+        registry = get_pet_registry()
+        records: Tuple[Optional[PetRecord], ...] = tuple(registry.get(name) for name in names)
+        return cls(_Columns(
+            names=names,
+            pet_ids=array("i", (-1 if record is None else record.pet_id for record in records)),
+            feed_codes=feed_codes,
+            mount_codes=mount_codes,
+            categories=bytes(_UNKNOWN_CATEGORY if record is None
+                             else PetCategory.ALL.index(record.category) for record in records),
+            rows={name: row for row, name in enumerate(names)}
+        ))
+
+    @property
+    def mask(self) -> bytes:
+        """The rows of this view: one byte per row of the zoo, 1 if the row is selected."""
+        return self.__mask
+
+    def filter_on_mask(self, mask: bytes) -> "ColumnarZoo":
+        """Return the view of the rows that are selected by both this view and mask."""
+        return ColumnarZoo(self.__columns, _and(self.__mask, mask))
+
+    def pets_available_mask(self) -> bytes:
+        """Return the mask of the rows whose pet the user has right now."""
+        return self.__columns.feed_codes.translate(_PET_AVAILABLE)
+
+    def mounts_available_mask(self) -> bytes:
+        """Return the mask of the rows whose mount the user has right now."""
+        return self.__columns.mount_codes.translate(_MOUNT_AVAILABLE)
+
+    def categories_mask(self, *categories: str) -> bytes:
+        """Return the mask of the rows whose pet is of one of the categories."""
+        codes = [PetCategory.ALL.index(category) for category in categories]
+        return self.__columns.categories.translate(_mask_table(codes))
+
+    def feedable_mask(self) -> bytes:
+        """Return the mask of the rows whose pet can be fed. See PetMountPair.can_feed_pet().
+
+        This is the definition of a feedable pet that ZooHelper and ZooIndex use as well.
+        """
+        return _and(self.pets_available_mask(),
+                    self.categories_mask(*PetCategory.FEEDABLE),
+                    _not(self.mounts_available_mask()))
+
+    def get_feedable_zoo(self) -> "ColumnarZoo":
+        """Return the view of the pets that can be fed."""
+        return self.filter_on_mask(self.feedable_mask())
+
+    def filter_on_categories(self, *categories: str) -> "ColumnarZoo":
+        """Return the view of the pets of the categories."""
+        return self.filter_on_mask(self.categories_mask(*categories))
+
+    def filter_on_pet_mount_pairs(self,
+                                  predicate: Callable[[PetMountPair], bool]) -> "ColumnarZoo":
+        """Return the view of the pairs for which the predicate is True.
+
+        Unlike the other filters, this creates the pairs of the view.
+        """
+        return self.filter_on_mask(bytes(
+            selected and bool(predicate(self.__pair(row)))
+            for row, selected in enumerate(self.__mask)
+        ))
+
+    def filter_on_pet_name(self, predicate: Callable[[str], bool]) -> "ColumnarZoo":
+        """Return the view of the rows whose pet name the predicate is True for."""
+        return self.filter_on_mask(bytes(
+            bool(predicate(name)) for name in self.__columns.names
+        ))
+
+    def feed_rows(self) -> Iterator[Tuple[str, int, int]]:
+        """Yield (pet name, pet id, feed status) of the rows of this view that have a pet."""
+        for row in compress(range(len(self.__mask)), self.__mask):
+            feed_code: int = self.__columns.feed_codes[row]
+            if feed_code != _NO_PET:
+                yield (self.__columns.names[row], self.__columns.pet_ids[row],
+                       feed_code - _FEED_CODE_OFFSET)
@@ -0,0 +1,112 @@
+"""
+A module that plans the feeding of a list of specific pets.
+
+`hopla feed` with several pets checks every pet against a single /user
+request, and turns them into a single FeedPlan. The food is taken from a
+fork of the stockpile while planning, so two pets can't be planned with the
+same food items. A batch with any pet that can't be fed is refused as a
+whole, with the reason for every such pet.
+"""
+from typing import Iterable, List, Optional, Union
+
+from hopla.hoplalib.errors import PrintableException
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.zoo.foodmodels import FoodStockpile, FoodStockpileBuilder
+from hopla.hoplalib.zoo.petmodels import Pet, PetMountPair
+from hopla.hoplalib.zoo.zoofeed_algorithms import FeedPlan, FeedPlanItem
+from hopla.hoplalib.zoo.zoomodels import ZooBuilder
+
+
+class InvalidFeedBatch(PrintableException):
+    """Exception raised when some pets of a batch can't be fed. The msg has every reason."""
+
+
+def read_pet_names(lines: Iterable[str]) -> List[str]:
+    """Return the pet name of every line. Blank lines and # comments are skipped.
+
+    >>> read_pet_names(["Wolf-Base\\n", "\\n", "# magic pets\\n", "Fox-Rainbow  # later"])
+    ['Wolf-Base', 'Fox-Rainbow']
+    """
+    names: List[str] = []
+    for line in lines:
+        name: str = line.split("#", 1)[0].strip()
+        if name:
+            names.append(name)
+    return names
+
+
+class FeedBatchPlanner:
+    """Plan to feed the specified pets of a user.
+
+    >>> user = HabiticaUser({"items": {"pets": {"Wolf-Base": 35, "Fox-Red": 40},
+    ...                                "mounts": {}, "food": {"Meat": 3, "Strawberry": 2}}})
+    >>> plan = FeedBatchPlanner(user).make_plan(["Wolf-Base", "Fox-Red"])
+    >>> [item.format_item() for item in plan]
+    ['Pet Wolf-Base will get 3 Meat.', 'Pet Fox-Red will get 2 Strawberry.']
+    """
+
+    def __init__(self, user: HabiticaUser, *, food_name: Optional[str] = None,
+                 times: Optional[int] = None):
+        """
+        :param user: the user with the pets, mounts, and food
+        :param food_name: the food of every pet. The favorite food of a pet when
+                          None, or the most abundant food for a pet that likes all food.
+        :param times: how much food every pet gets. Until the pet is a mount when None.
+        """
+        self.__zoo_builder = ZooBuilder(user)
+        self.__stockpile: FoodStockpile = FoodStockpileBuilder().user(user).build()
+        self.food_name = food_name
+        self.times = times
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(food_name={self.food_name}, "
+                f"times={self.times})")
+
+    def make_plan(self, pet_names: Iterable[str]) -> FeedPlan:
+        """Make the plan to feed every pet once. A pet that occurs twice is fed once.
+
+        :param pet_names: the pets to feed
+        :raise InvalidFeedBatch: when any of the pets can't be fed
+        """
+        stockpile: FoodStockpile = self.__stockpile.fork()
+        plan = FeedPlan()
+        errors: List[str] = []
+        for pet_name in dict.fromkeys(pet_names):
+            item: Union[FeedPlanItem, str] = self.__plan_item(stockpile, pet_name)
+            if isinstance(item, str):
+                errors.append(item)
+            else:
+                plan.add_to_feed_plan(pet_name=item.pet_name, food_name=item.food_name,
+                                      times=item.times)
+
+        if errors:
+            raise InvalidFeedBatch("\n".join(errors))
+        return plan
+
+    def __plan_item(self, stockpile: FoodStockpile, pet_name: str) -> Union[FeedPlanItem, str]:
+        """Return the item of the pet, and take its food from the stockpile. Or the reason
+        why the pet can't be fed."""
+        reason: Optional[str] = self.__cannot_feed_reason(pet_name)
+        if reason is not None:
+            return reason
+
+        pet: Pet = self.__zoo_builder.build_pair(pet_name).pet
+        food: str = self.food_name or (stockpile.get_most_abundant_food()
+                                       if pet.likes_all_food() else pet.favorite_food())
+        times: int = pet.required_food_items_until_mount(food) if self.times is None \
+            else self.times
+        if not stockpile.has_sufficient(food, n=times):
+            return (f"Can't feed pet {pet_name}. It needs {times} {food}, "
+                    f"but only {stockpile.as_dict().get(food, 0)} are left.")
+        stockpile.add_food(food, n=-times)
+        return FeedPlanItem(pet_name=pet_name, food_name=food, times=times)
+
+    def __cannot_feed_reason(self, pet_name: str) -> Optional[str]:
+        pair: Optional[PetMountPair] = self.__zoo_builder.build_pair(pet_name)
+        if pair is None or pair.pet_available() is False:
+            return f"Can't feed pet {pet_name}. You don't have this pet."
+        if pair.mount_available():
+            return f"Can't feed pet {pet_name}. You have the mount."
+        if pair.can_feed_pet() is False:
+            return f"Can't feed pet {pet_name}. {pair.pet.feed_status_explanation()}"
+        return None
@@ -0,0 +1,166 @@
+"""
+A module that executes a feed plan, and replans when a feed request fails.
+
+A plan is made from the zoo and the food of the user at the start of
+feed-all. When a feed request fails, e.g. because the food was spent on
+another device, the rest of the plan rests on stale assumptions. The
+AdaptiveFeedExecutor therefore keeps a live model of the feed statuses, the
+mounts, and the food: every response updates it. After a failure, it makes
+the rest of the plan again from that model. This needs no new /user request.
+"""
+import logging
+from collections import deque
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Iterator, List, NamedTuple, Optional
+
+from requests import Response
+from requests.status_codes import codes
+
+from hopla.hoplalib.requests_helper import json_or_failure
+from hopla.hoplalib.throttling import RateLimitingAwareThrottler
+from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
+from hopla.hoplalib.zoo.foodmodels import FeedStatus, FoodStockpile
+from hopla.hoplalib.zoo.foodpreferences import FoodPreferenceMatrix
+from hopla.hoplalib.zoo.petcontroller import FeedPostRequester
+from hopla.hoplalib.zoo.petregistry import get_pet_registry
+from hopla.hoplalib.zoo.zoofeed_algorithms import FeedPlan, FeedPlanItem
+
+log = logging.getLogger()
+
+Planner = Callable[[ColumnarZoo, FoodStockpile], FeedPlan]
+"""A function that makes a feed plan for a zoo from the food of a stockpile."""
+
+FOOD_FAILURE_STATUS_CODES = (codes.unauthorized, codes.not_found)
+"""The HTTP status codes of failed feeds that may mean that the food ran out."""
+FOOD_FAILURE_ERRORS = ("NotAuthorized", "NotFound")
+"""The errors of failed feeds that may mean that the food ran out."""
+
+
+def _the_food_may_have_run_out(status_code: Any, error: Any) -> bool:
+    """Return True if a failed feed with this status code and error may mean that the food ran out.
+
+    The message of Habitica is translated, so it is no use here. Habitica
+    answers both a missing pet and missing food with NotFound, and both a
+    mount that the user already has and too little food with NotAuthorized.
+    Those failures are therefore blamed on the pet and on the food. Any
+    other failure, such as a bad request or a Habitica outage, says nothing
+    about the food.
+
+    >>> _the_food_may_have_run_out(401, "NotAuthorized")
+    True
+    >>> _the_food_may_have_run_out(400, "BadRequest"), _the_food_may_have_run_out(502, "HTTP 502")
+    (False, False)
+    """
+    return status_code in FOOD_FAILURE_STATUS_CODES or error in FOOD_FAILURE_ERRORS
+
+
+def post_feed_request(item: FeedPlanItem) -> Response:
+    """Feed the pet of the item, and return the response of Habitica."""
+    return FeedPostRequester.build_from(item).post_feed_request()
+
+
+class FeedOutcome(NamedTuple):
+    """The result of executing a single item of the plan."""
+    item: FeedPlanItem
+    response_json: Dict[str, Any]
+    replanned: bool
+    """True if the item failed, and the rest of the plan was made again."""
+
+    @property
+    def success(self) -> bool:
+        """Return True if Habitica fed the pet."""
+        return self.response_json.get("success") is True
+
+
+class AdaptiveFeedExecutor:
+    """Execute a feed plan, and make the rest of the plan again when a feed fails.
+
+    A failure always takes the pet out of the model. When the failure may
+    mean that the food ran out (see _the_food_may_have_run_out), the food of
+    the item is removed from the model too. E.g. the food may have been spent
+    on another device. Any other failure, such as a Habitica outage, keeps
+    the food for the other pets.
+    """
+
+    def __init__(self, plan: FeedPlan, *, pets: Dict[str, int],
+                 mounts: Dict[str, Optional[bool]], stockpile: FoodStockpile,
+                 planner: Planner,
+                 feed: Callable[[FeedPlanItem], Response] = post_feed_request):
+        # pylint: disable=too-many-arguments
+        """
+        :param plan: the plan to execute
+        :param pets: the feed statuses of the pets of the user, before the plan
+        :param mounts: the mounts of the user, before the plan
+        :param stockpile: the food of the user, before the plan
+        :param planner: makes the rest of the plan after a failure
+        :param feed: performs the feed request of an item
+        """
+        self.__queue: Deque[FeedPlanItem] = deque(plan)
+        self.__pets: Dict[str, int] = dict(pets)
+        self.__mounts: Dict[str, Optional[bool]] = dict(mounts)
+        self.__stockpile: FoodStockpile = stockpile.fork()
+        self.__planner = planner
+        self.__feed = feed
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.__queue)} items queued)"
+
+    @property
+    def stockpile(self) -> FoodStockpile:
+        """The food that the user has according to the responses so far."""
+        return self.__stockpile
+
+    @property
+    def remaining_items(self) -> List[FeedPlanItem]:
+        """The items that haven't been executed yet."""
+        return list(self.__queue)
+
+    def execute(self, throttler: Optional[RateLimitingAwareThrottler] = None
+                ) -> Iterator[FeedOutcome]:
+        """Execute the items one by one, and yield the outcome of every item.
+
+        :param throttler: the throttler to perform the requests with
+        """
+        throttler = throttler or RateLimitingAwareThrottler()
+        while self.__queue:
+            item: FeedPlanItem = self.__queue.popleft()
+            response: Response = throttler.perform(partial(self.__feed, item),
+                                                   requests_remaining=len(self.__queue) + 1)
+            response_json: Dict[str, Any] = json_or_failure(response)
+            if response_json.get("success") is True:
+                self.__on_success(item, response_json.get("data"))
+                yield FeedOutcome(item, response_json, replanned=False)
+            else:
+                self.__on_failure(item, response.status_code, response_json)
+                self.__replan()
+                yield FeedOutcome(item, response_json, replanned=True)
+
+    def __on_success(self, item: FeedPlanItem, feed_status: Any) -> None:
+        self.__stockpile.add_food(item.food_name, n=-item.times)
+        if not isinstance(feed_status, int):  # estimate it when Habitica doesn't return it
+            matrix = FoodPreferenceMatrix.cached()
+            pet_id: int = get_pet_registry().pet_id(item.pet_name)
+            feed_status = (self.__pets[item.pet_name]
+                           + item.times * matrix.increment(pet_id, item.food_name))
+        if feed_status == FeedStatus.PET_GREW_UP_TO_MOUNT or \
+                feed_status >= FeedStatus.FULLY_FED_STATE:
+            self.__pets[item.pet_name] = FeedStatus.PET_GREW_UP_TO_MOUNT
+            self.__mounts[item.pet_name] = True
+        else:
+            self.__pets[item.pet_name] = feed_status
+
+    def __on_failure(self, item: FeedPlanItem, status_code: Any,
+                     response_json: Dict[str, Any]) -> None:
+        log.debug(f"Failed to feed {item}: {status_code} {response_json}")
+        self.__pets.pop(item.pet_name, None)
+        if _the_food_may_have_run_out(status_code, response_json.get("error")):
+            left: int = self.__stockpile.as_dict().get(item.food_name, 0)
+            self.__stockpile.add_food(item.food_name, n=-left)
+
+    def __replan(self) -> None:
+        """Replace the queued items by a new plan for the model."""
+        # the pets of the queue haven't been fed yet, or only partly: the model knows how far
+        zoo = ColumnarZoo.from_pets_and_mounts(pets=self.__pets, mounts=self.__mounts)
+        plan: FeedPlan = self.__planner(zoo, self.__stockpile.fork())
+        log.debug(f"Replanned {len(self.__queue)} items into {len(plan)} items")
+        self.__queue = deque(plan)
@@ -1,6 +1,7 @@
 """
 Module with data about Habitica food information.
 """
+from hopla.hoplalib.contenttables import ContentTables
 
 
 class FoodData:
@@ -37,6 +38,9 @@ class FoodData:
     * hopla api content | jq .premiumHatchingPotions
     * hopla api content | jq. wackyHatchingPotions
     """
+    hatch_potion_favorite_food_mapping = ContentTables.cached().extend_favorite_food(
+        hatch_potion_favorite_food_mapping
+    )
 
     drop_food_names = list(hatch_potion_favorite_food_mapping.values())
     """A list of food items that can be dropped by doing tasks.
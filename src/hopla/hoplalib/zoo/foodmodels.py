@@ -1,14 +1,18 @@
 """
 A helper module for feeding logic.
 """
-import copy
+import heapq
 import math
+from array import array
 from dataclasses import dataclass
-from typing import Dict, Final, Optional
+from typing import Dict, Final, Iterable, List, Optional, Tuple
 
 from hopla.cli.groupcmds.get_user import HabiticaUser
+from hopla.hoplalib.common import with_slots
 from hopla.hoplalib.errors import PrintableException
+from hopla.hoplalib.snapshots import QuantitiesSnapshot
 from hopla.hoplalib.zoo.fooddata import FoodData
+from hopla.hoplalib.zoo.petregistry import get_pet_registry
 
 
 class InvalidFeedStatus(PrintableException):
@@ -26,7 +30,15 @@ class FeedStatus:
     50 would turn the pet into a mount, so 50 is impossible to reach.
     The feed status of 0 means that you had the pet before, but
     you released it.
+
+    A feed status is immutable, and there is only one instance per value:
+
+    >>> FeedStatus(27) is FeedStatus(27)
+    True
     """
+    __slots__ = ("__feed_status",)
+    __instances: Dict[int, "FeedStatus"] = {}
+
     PET_GREW_UP_TO_MOUNT: Final[int] = -1
     PET_RELEASED: Final[int] = 0
 
@@ -37,14 +49,22 @@ class FeedStatus:
     FAVORITE_INCREMENT: Final[int] = 5
     NON_FAVORITE_INCREMENT: Final[int] = 2
 
-    def __init__(self, feed_status: int = START_FEED_STATE):
-        invalid_status = (feed_status < FeedStatus.PET_GREW_UP_TO_MOUNT
-                          or feed_status in [1, 2, 3, 4]
-                          or feed_status > FeedStatus.MAX_FED_STATE)
-        if invalid_status:
-            raise InvalidFeedStatus(f"{feed_status=} is invalid")
+    def __new__(cls, feed_status: int = START_FEED_STATE) -> "FeedStatus":
+        instance: Optional[FeedStatus] = cls.__instances.get(feed_status)
+        if instance is None:
+            invalid_status = (feed_status < FeedStatus.PET_GREW_UP_TO_MOUNT
+                              or feed_status in [1, 2, 3, 4]
+                              or feed_status > FeedStatus.MAX_FED_STATE)
+            if invalid_status:
+                raise InvalidFeedStatus(f"{feed_status=} is invalid")
+
+            instance = super().__new__(cls)
+            instance.__feed_status = feed_status
+            cls.__instances[feed_status] = instance
+        return instance
 
-        self.__feed_status = feed_status
+    def __reduce__(self):
+        return FeedStatus, (self.__feed_status,)  # copies are the same flyweight
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.__feed_status})"
@@ -92,6 +112,7 @@ class FoodException(PrintableException):
         self.food = food
 
 
+@with_slots
 @dataclass(frozen=True)
 class Food:
     """A stockpile food item."""
@@ -105,25 +126,117 @@ class Food:
         Return False if the food_item item is a drop food.
         Otherwise, return True.
         """
-        return self.name not in FoodData.drop_food_names
+        return self.name not in get_pet_registry().drop_food_names
+
+
+class _FoodHeap:
+    """A max-heap of the food ids of a stockpile, on the quantities of the food.
+
+    The entries are (-quantity, food id), so equal quantities are ordered on
+    the food id: the top is the first of the most abundant food, like max().
+    A change of a quantity pushes a new entry (O(log F), in C through heapq);
+    the outdated entries are dropped when they reach the top.
+    """
+    __slots__ = ("quantities", "entries")
+
+    MAX_ENTRIES_PER_FOOD = 4
+    """Rebuild the heap when the outdated entries make it this many times too large."""
+
+    def __init__(self, quantities: array, entries: List[Tuple[int, int]]):
+        self.quantities = quantities
+        """The quantity of every food id."""
+        self.entries = entries
+
+    @classmethod
+    def from_quantities(cls, quantities: Iterable[int]) -> "_FoodHeap":
+        """Create the heap of the food ids 0, 1, ... with the specified quantities."""
+        quantities = array("q", quantities)
+        return cls(quantities, cls.__entries(quantities))
+
+    @staticmethod
+    def __entries(quantities: array) -> List[Tuple[int, int]]:
+        # a list that is sorted from low to high is a valid heap
+        return sorted((-quantity, food_id) for food_id, quantity in enumerate(quantities))
+
+    def copy(self) -> "_FoodHeap":
+        """Return an independent copy of the heap."""
+        return _FoodHeap(array("q", self.quantities), list(self.entries))
+
+    def top(self) -> int:
+        """Return the food id with the highest quantity."""
+        entries, quantities = self.entries, self.quantities
+        while entries and -entries[0][0] != quantities[entries[0][1]]:
+            heapq.heappop(entries)  # outdated: the quantity changed after the push
+        if not entries:
+            raise ValueError("the stockpile has no food")
+        return entries[0][1]
+
+    def add(self, food_id: int, n: int) -> None:
+        """Add n (which may be negative) to the quantity of the food id."""
+        self.quantities[food_id] += n
+        if len(self.entries) > _FoodHeap.MAX_ENTRIES_PER_FOOD * len(self.quantities):
+            self.entries = _FoodHeap.__entries(self.quantities)
+        else:
+            heapq.heappush(self.entries, (-self.quantities[food_id], food_id))
 
 
 @dataclass
 class FoodStockpile:
-    """The food of a user."""
+    """The food of a user.
+
+    The quantities are kept in an array that is indexed by food id (the
+    position of the food in the dict that the stockpile was created with),
+    together with a max-heap of the food ids. Changing a quantity is
+    O(log F), and the most abundant food is known in amortized O(1).
+
+    The stockpile is copy-on-write: it copies the quantities and the heap
+    when it changes for the first time. fork() is therefore cheap.
+    """
 
     def __init__(self, __stockpile: Dict[str, int]):
-        self.__stockpile = __stockpile
+        self.__food_names: Tuple[str, ...] = tuple(__stockpile)
+        self.__food_ids: Dict[str, int] = {name: food_id
+                                           for food_id, name in enumerate(self.__food_names)}
+        self.__drop_food_ids: Dict[str, int] = {
+            name: food_id for name, food_id in self.__food_ids.items()
+            if name in get_pet_registry().drop_food_names
+        }
+        self.__heap = _FoodHeap.from_quantities(__stockpile.values())
+        self.__owns_heap = True  # False while __heap is shared with a fork
 
     def __eq__(self, other):
-        # pylint: disable=protected-access
-        return isinstance(other, FoodStockpile) and self.__stockpile == other.__stockpile
+        return isinstance(other, FoodStockpile) and self.as_dict() == other.as_dict()
 
-    def __hash__(self):
-        return hash(self.__stockpile)
+    __hash__ = None  # a stockpile changes: use snapshot() as a dict key or set member
 
     def __repr__(self) -> str:
-        return self.__class__.__name__ + f"({self.__stockpile})"
+        return self.__class__.__name__ + f"({self.as_dict()})"
+
+    def __copy__(self) -> "FoodStockpile":
+        return self.fork()
+
+    def __deepcopy__(self, memo: dict) -> "FoodStockpile":
+        return self.fork()  # the quantities are ints: sharing them is a deep copy
+
+    def fork(self) -> "FoodStockpile":
+        """Return an independent stockpile with the same food.
+
+        The food is shared until one of the stockpiles changes.
+
+        >>> stockpile = FoodStockpileBuilder.empty_stockpile()
+        >>> fork = stockpile.fork().add_food("Meat", n=3)
+        >>> fork.as_dict()["Meat"], stockpile.as_dict()["Meat"]
+        (3, 0)
+        """
+        # pylint: disable=protected-access,unused-private-member
+        self.__owns_heap = False
+        fork: FoodStockpile = FoodStockpile.__new__(FoodStockpile)
+        fork.__food_names = self.__food_names  # the names and ids never change
+        fork.__food_ids = self.__food_ids
+        fork.__drop_food_ids = self.__drop_food_ids
+        fork.__heap = self.__heap
+        fork.__owns_heap = False
+        return fork
 
     def add_food(self, food_name: str, *, n: int) -> "FoodStockpile":
         """
@@ -134,19 +247,23 @@ class FoodStockpile:
                   When negative, subtract n from this food from the stockpile.
         :return: The modified FoodStockPile
         """
-        food = Food(food_name)
-        if food.is_rare_food_item():
+        food_id: Optional[int] = self.__drop_food_ids.get(food_name)
+        if food_id is None:
+            if food_name in get_pet_registry().drop_food_names:
+                raise KeyError(food_name)  # a drop food that this stockpile doesn't have
             raise FoodException(msg=f"Not Supported: {food_name=} is not supported.",
-                                food=food)
-
-        cur_quantity = self.__stockpile[food_name]
+                                food=Food(food_name))
 
+        cur_quantity: int = self.__heap.quantities[food_id]
         if cur_quantity + n < 0:
             msg = (f"Insufficient food: Cannot remove {n=} of food from the stockpile\n"
                    f"The current quantity of {food_name} is {cur_quantity}.")
             raise FoodException(msg, food=Food(food_name))
 
-        self.__stockpile[food_name] += n
+        if not self.__owns_heap:
+            self.__heap = self.__heap.copy()
+            self.__owns_heap = True
+        self.__heap.add(food_id, n)
 
         return self
 
@@ -171,11 +288,11 @@ class FoodStockpile:
         occur equally most frequent, return one of them. This function makes
         no guarantee which is returned in that case.
         """
-        return max(self.__stockpile, key=self.__stockpile.get)
+        return self.__food_names[self.__heap.top()]
 
     def has_sufficient(self, food_name: str, *, n: int) -> bool:
         """Return True if the stockpile has >=n of the specified food item."""
-        return self.__stockpile[food_name] >= n
+        return self.__heap.quantities[self.__food_ids[food_name]] >= n
 
     def has_sufficient_abundant_food(self, *, n: int):
         """Return True if the stockpile has >=n of the most abundant food item."""
@@ -183,8 +300,18 @@ class FoodStockpile:
         return self.has_sufficient(food_name, n=n)
 
     def as_dict(self) -> Dict[str, int]:
-        """Return a deep copy of the underlying data."""
-        return copy.deepcopy(self.__stockpile)
+        """Return a copy of the underlying data."""
+        return dict(zip(self.__food_names, self.__heap.quantities))
+
+    def snapshot(self) -> QuantitiesSnapshot:
+        """Return a frozen snapshot of the food, e.g. to use as a cache key.
+
+        >>> stockpile = FoodStockpile({"Meat": 3})
+        >>> snapshot = stockpile.snapshot()
+        >>> stockpile.add_food("Meat", n=-1).snapshot().fingerprint != snapshot.fingerprint
+        True
+        """
+        return QuantitiesSnapshot.of("food", self.as_dict())
 
 
 class FoodStockpileBuilder:
@@ -0,0 +1,112 @@
+"""
+A module with a precomputed pets x food matrix of food preferences.
+
+Every cell of the matrix holds the increment of the feed status of a pet when
+it eats one item of a food: FAVORITE_INCREMENT for favorite food,
+NON_FAVORITE_INCREMENT for other food, and 0 for pets that can't be fed.
+
+Only a handful of distinct rows exist (one per favorite food, one for the
+pets that like all food, and one for unfeedable pets), so pets share their
+row. The number of food items that a pet needs to become a mount is then a
+single bytes.translate of its row, through the table of its feed status.
+"""
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from hopla.hoplalib.zoo.fooddata import FoodData
+from hopla.hoplalib.zoo.foodmodels import FeedStatus
+from hopla.hoplalib.zoo.petregistry import PetRecord, get_pet_registry
+
+NOT_FEEDABLE = 0
+"""The increment, and the required food items, of pets that can't be fed."""
+
+
+@lru_cache(maxsize=None)
+def _required_food_table(feed_status: int) -> bytes:
+    """Return the translation table from increments to required food items of a feed status.
+
+    >>> table = _required_food_table(45)
+    >>> table[FeedStatus.FAVORITE_INCREMENT], table[FeedStatus.NON_FAVORITE_INCREMENT]
+    (1, 3)
+    """
+    table = bytearray(256)
+    target: int = FeedStatus.FULLY_FED_STATE - feed_status
+    for increment in (FeedStatus.FAVORITE_INCREMENT, FeedStatus.NON_FAVORITE_INCREMENT):
+        table[increment] = -(-target // increment)  # ceil without floats
+    return bytes(table)
+
+
+class FoodPreferenceMatrix:
+    """The increments of all the pets for all the drop food.
+
+    >>> matrix = FoodPreferenceMatrix.cached()
+    >>> wolf_base: int = get_pet_registry().pet_id("Wolf-Base")
+    >>> matrix.increment(wolf_base, "Meat"), matrix.increment(wolf_base, "Milk")
+    (5, 2)
+    >>> matrix.required_food_items(wolf_base, "Meat", feed_status=5)
+    9
+    """
+
+    def __init__(self, food_names: List[str]):
+        self.food_names: Tuple[str, ...] = tuple(food_names)
+        """The food of the columns, in order. The last column is for any other food."""
+        self.__columns: Dict[str, int] = {name: column for column, name in enumerate(food_names)}
+
+        n_columns: int = len(food_names) + 1
+        non_favorite: bytes = bytes([FeedStatus.NON_FAVORITE_INCREMENT]) * n_columns
+        self.__non_favorite_row: bytes = non_favorite
+        self.__favorite_rows: Dict[str, bytes] = {}
+        for column, food_name in enumerate(food_names):
+            row = bytearray(non_favorite)
+            row[column] = FeedStatus.FAVORITE_INCREMENT
+            self.__favorite_rows[food_name] = bytes(row)
+        self.__likes_all_food_row: bytes = bytes([FeedStatus.FAVORITE_INCREMENT]) * n_columns
+        self.__unfeedable_row: bytes = bytes([NOT_FEEDABLE]) * n_columns
+        self.__rows: Dict[int, bytes] = {}  # the row of every pet id looked up so far
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(get_pet_registry())} pets x {self.food_names})"
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def cached() -> "FoodPreferenceMatrix":
+        """Return the matrix of the drop food. It is created at most once per process."""
+        return FoodPreferenceMatrix(FoodData.drop_food_names)
+
+    def row(self, pet_id: int) -> bytes:
+        """Return the increments of the pet, for every column of food_names (and other food)."""
+        row: Optional[bytes] = self.__rows.get(pet_id)
+        if row is None:
+            record: PetRecord = get_pet_registry()[get_pet_registry().pet_name(pet_id)]
+            if not record.feedable:
+                row = self.__unfeedable_row
+            elif record.likes_all_food:
+                row = self.__likes_all_food_row
+            else:
+                row = self.__favorite_rows.get(record.favorite_food, self.__non_favorite_row)
+            self.__rows[pet_id] = row
+        return row
+
+    def increment(self, pet_id: int, food_name: str) -> int:
+        """Return the increment of the feed status of the pet for one item of the food."""
+        return self.row(pet_id)[self.__columns.get(food_name, len(self.food_names))]
+
+    def required_food_items(self, pet_id: int, food_name: str, *, feed_status: int) -> int:
+        """Return the number of food items that the pet needs to become a mount.
+
+        Return NOT_FEEDABLE (0) if the pet can't be fed.
+        """
+        return _required_food_table(feed_status)[self.increment(pet_id, food_name)]
+
+    def required_food_items_row(self, pet_id: int, *, feed_status: int) -> bytes:
+        """Return the required food items of the pet for every column of food_names."""
+        return self.row(pet_id)[:-1].translate(_required_food_table(feed_status))
+
+    def required_food_items_matrix(self, feed_statuses: Mapping[int, int]) -> Dict[int, bytes]:
+        """Return the required food items for every pet of the feed status vector.
+
+        :param feed_statuses: the feed status of every pet id
+        :return: the required food items of every pet id, for every column of food_names
+        """
+        return {pet_id: self.required_food_items_row(pet_id, feed_status=feed_status)
+                for pet_id, feed_status in feed_statuses.items()}
@@ -9,6 +9,7 @@ is overkill for now.
 """
 from typing import List
 
+from hopla.hoplalib.contenttables import ContentTables
 from hopla.hoplalib.hatchery.egg_data import EggData
 from hopla.hoplalib.hatchery.hatchpotion_data import HatchPotionData
 
@@ -79,6 +80,10 @@ class PetData:
         "Jackalope-RoyalPurple", "BearCub-Polar", "Dragon-Hydra", "Wolf-Cerberus",
         "Gryphatrice-Jubilant", "Gryphon-Gryphatrice", "Aether-Invisible"
     ]
+    other_pet_names = ContentTables.cached().extend(
+        other_pet_names, "pets", "special",
+        known=world_boss_reward_pet_names + event_sequence_pet_names
+    )
 
     rare_pet_names = world_boss_reward_pet_names + event_sequence_pet_names + other_pet_names
     """Rare pet names are pets that cannot be hatched.
@@ -6,10 +6,9 @@ from typing import Optional
 
 from hopla.hoplalib.common import GlobalConstants
 from hopla.hoplalib.errors import PrintableException, YouFoundABugRewardError
-from hopla.hoplalib.hatchery.hatchpotion_data import HatchPotionData
-from hopla.hoplalib.zoo.fooddata import FoodData
 from hopla.hoplalib.zoo.foodmodels import FeedStatus
-from hopla.hoplalib.zoo.petdata import PetData
+from hopla.hoplalib.zoo.foodpreferences import FoodPreferenceMatrix
+from hopla.hoplalib.zoo.petregistry import PetCategory, PetRecord, get_pet_registry
 
 
 class InvalidPet(PrintableException):
@@ -33,10 +32,12 @@ class Pet:
     # However, that is really overkill for now and not urgent enough.
     # Therefore, too-many-public-methods is disabled for this class.
     #################################################################
+    __slots__ = ("name", "feed_status", "_record")
 
     def __init__(self, pet_name: str, *,
                  feed_status: FeedStatus = FeedStatus(5)):
-        if pet_name not in PetData.pet_names:
+        record: Optional[PetRecord] = get_pet_registry().get(pet_name)
+        if record is None:
             raise InvalidPet(f"{pet_name=} is not recognized by hopla.\n"
                              "Potential causes: \n"
                              "* did you spell it correctly?\n"
@@ -45,20 +46,20 @@ class Pet:
 
         self.name = pet_name
         self.feed_status = feed_status
+        self._record: PetRecord = record
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.name}: {self.feed_status})"
 
+    @property
+    def pet_id(self) -> int:
+        """The id of this pet in the pet catalogue."""
+        return self._record.pet_id
+
     @property
     def hatch_potion_name(self) -> Optional[str]:
         """The hatching potion used to hatch the egg this pet came from."""
-        if self.name in PetData.rare_pet_names:
-            return None
-
-        # This logic might break, but seems to be solid for past few years due to
-        # stabling naming convention by the Habitica API developers.
-        _, potion = self.name.split("-")
-        return potion
+        return self._record.potion
 
     def is_available(self) -> bool:
         """Return True if the feed status says that the pet is available."""
@@ -66,15 +67,15 @@ class Pet:
 
     def is_feedable(self) -> bool:
         """Return True if a pet cannot be fed at all."""
-        return self.name not in PetData.unfeedable_pet_names
+        return self._record.feedable
 
     def has_just_1_favorite_food(self) -> bool:
         """Return True if this pet likes only 1 type of food."""
-        return self.name in PetData.only_1favorite_food_pet_names
+        return self._record.favorite_food is not None
 
     def likes_all_food(self) -> bool:
         """Return True if this pet prefers all food."""
-        return self.name in PetData.magic_potion_pet_names
+        return self._record.likes_all_food
 
     def feed_status_explanation(self) -> str:
         """Explain the feed status of a pet."""
@@ -110,27 +111,19 @@ class Pet:
         if self.is_feedable() is False:
             return default_value_for_unfeedable
 
-        if self.name in PetData.magic_potion_pet_names:
+        if self.likes_all_food():
             return default_value_for_all_favorite_food
 
         if self.has_just_1_favorite_food():
-            return (FoodData.hatch_potion_favorite_food_mapping
-                    .get(self.hatch_potion_name))
+            return self._record.favorite_food
 
         raise InvalidPet(f"Could not find the feed habits of this {self.name=}",
                          pet=self)  # pragma: no cover
 
     def is_favorite_food(self, food_name: str) -> bool:
         """Return true if 'food_name' is this Pets favorite food."""
-        if self.is_feedable() is False:
-            return False
-        if self.likes_all_food():
-            return True
-        if self.has_just_1_favorite_food():
-            return self.favorite_food() == food_name
-
-        raise InvalidPet(f"Unable to determine if {food_name=} is {self.name=}'s favorite.",
-                         pet=self)  # pragma: no cover
+        increment: int = FoodPreferenceMatrix.cached().increment(self.pet_id, food_name)
+        return increment == FeedStatus.FAVORITE_INCREMENT
 
     def required_food_items_until_mount(self, food_name: str) -> int:
         """
@@ -142,30 +135,31 @@ class Pet:
 
     def is_generation1_pet(self) -> bool:
         """Return True if this pet is from the generation 1 pet"""
-        return self.name in PetData.generation1_pet_names
+        return self._record.category == PetCategory.GENERATION1
 
     def is_quest_pet(self) -> bool:
         """
         Return True if this pet is a quest pet. This doesn't include
         special pets such as world event related pets.
         """
-        return self.name in PetData.quest_pet_names
+        return self._record.category == PetCategory.QUEST
 
     def is_magic_hatch_pet(self) -> bool:
         """Return True if this pet is hatched from a magic potion."""
-        return self.name in PetData.magic_potion_pet_names
+        return self._record.category == PetCategory.MAGIC_POTION
 
     def is_from_drop_hatch_potions(self) -> bool:
         """
         Return True if the pet was hatched from one of the 'ordinary'
         potions. (Such as: Base, Desert, ...).
         """
-        return self.hatch_potion_name in HatchPotionData.drop_hatch_potion_names
+        return get_pet_registry().hatch_potion_kind(self.hatch_potion_name) == "drop"
 
 
 @dataclass
 class Mount:
     """ The model class for mounts."""
+    __slots__ = ("name", "_availability_status")
 
     def __init__(self, mount_name: str, *,
                  availability_status: Optional[bool]):
@@ -185,6 +179,11 @@ class Mount:
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.name}: {self._availability_status})"
 
+    @property
+    def availability_status(self) -> Optional[bool]:
+        """The status of the mount such as the API returns it."""
+        return self._availability_status
+
     def is_available(self) -> bool:
         """Return true if the user has the mount right now."""
         return self._availability_status is True
@@ -197,6 +196,7 @@ class InvalidPetMountPair(YouFoundABugRewardError):
 @dataclass
 class PetMountPair:
     """A pair of a pet and its mount."""
+    __slots__ = ("pet", "mount")
 
     def __init__(self, *, pet: Optional[Pet],
                  mount: Optional[Mount]):
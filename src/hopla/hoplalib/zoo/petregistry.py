@@ -0,0 +1,234 @@
+"""
+A module with a registry of everything hopla knows about pets, eggs,
+hatching potions, and food.
+
+The data modules (PetData, EggData, HatchPotionData, FoodData) keep the
+names in lists. Asking those lists whether a name is in there costs a
+scan of the list. The registry answers from the compiled catalogue index
+instead (see catalogueindex.py), and keeps the records that it decoded, so
+that every later lookup of the same pet is a single dict access.
+"""
+import functools
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional
+
+from hopla.hoplalib.common import get_cache_dirpath
+from hopla.hoplalib.contenttables import ContentTablesCache
+from hopla.hoplalib.hatchery.egg_data import EggData
+from hopla.hoplalib.hatchery.hatchpotion_data import HatchPotionData
+from hopla.hoplalib.zoo.catalogueindex import (CatalogueIndex, CataloguePet,
+                                               load_catalogue_index)
+from hopla.hoplalib.zoo.fooddata import FoodData
+
+
+class PetCategory:
+    """The categories of pets, such as they are used by the PetRegistry."""
+    GENERATION1 = "generation1"
+    MAGIC_POTION = "magic_potion"
+    QUEST = "quest"
+    WACKY = "wacky"
+    RARE = "rare"
+
+    ALL = (GENERATION1, MAGIC_POTION, QUEST, WACKY, RARE)
+    """All the categories, in the order of the pet ids."""
+    FEEDABLE = (GENERATION1, MAGIC_POTION, QUEST)
+    """The categories of the pets that can be fed."""
+    HATCHABLE = (GENERATION1, MAGIC_POTION, QUEST, WACKY)
+    """The categories of the pets that hatch from an egg and a hatching potion."""
+
+
+class PetRecord(NamedTuple):
+    """The immutable facts about a single pet.
+
+    >>> record = get_pet_registry()["Wolf-Base"]
+    >>> record.egg, record.potion, record.category, record.favorite_food
+    ('Wolf', 'Base', 'generation1', 'Meat')
+    """
+    name: str
+    egg: Optional[str]
+    """The egg that the pet hatched from, None for rare pets."""
+    potion: Optional[str]
+    """The hatching potion that hatched the pet, None for rare pets."""
+    category: str
+    feedable: bool
+    favorite_food: Optional[str]
+    """The single favorite food. None if the pet likes all food or can't be fed."""
+    rare: bool
+    pet_id: int
+    """The position of the pet in the catalogue index."""
+
+    @property
+    def likes_all_food(self) -> bool:
+        """Return True if the pet prefers all food."""
+        return self.category == PetCategory.MAGIC_POTION
+
+
+_CATALOGUE_SOURCE_FILES: List[Path] = [
+    Path(__file__),
+    Path(__file__).parent / "petdata.py",
+    Path(__file__).parent / "fooddata.py",
+    Path(__file__).parents[1] / "hatchery" / "egg_data.py",
+    Path(__file__).parents[1] / "hatchery" / "hatchpotion_data.py",
+]
+"""The files that the pet catalogue is made from (besides the cached content tables)."""
+
+
+def _catalogue_pets() -> List[CataloguePet]:
+    """Compute the pets of the catalogue from the hopla data modules."""
+    # PetData builds its lists when it's imported: only do so when compiling the catalogue.
+    from hopla.hoplalib.zoo.petdata import PetData  # pylint: disable=import-outside-toplevel
+
+    pets: List[CataloguePet] = []
+    for category, pet_names in [(PetCategory.GENERATION1, PetData.generation1_pet_names),
+                                (PetCategory.MAGIC_POTION, PetData.magic_potion_pet_names),
+                                (PetCategory.QUEST, PetData.quest_pet_names),
+                                (PetCategory.WACKY, PetData.wacky_pet_names)]:
+        for pet_name in pet_names:
+            egg, potion = pet_name.split("-")
+            pets.append(CataloguePet(
+                name=pet_name, egg=egg, potion=potion,
+                category=PetCategory.ALL.index(category),
+                feedable=category != PetCategory.WACKY,
+                favorite_food=FoodData.hatch_potion_favorite_food_mapping.get(potion)
+                if category in [PetCategory.GENERATION1, PetCategory.QUEST] else None,
+                rare=False
+            ))
+    pets.extend(CataloguePet(name=pet_name, egg=None, potion=None,
+                             category=PetCategory.ALL.index(PetCategory.RARE),
+                             feedable=False, favorite_food=None, rare=True)
+                for pet_name in PetData.rare_pet_names)
+    return pets
+
+
+class PetRegistry:
+    """A read-only mapping of pet names to PetRecords, plus the item name sets."""
+
+    def __init__(self, index: CatalogueIndex, *,
+                 egg_kinds: Dict[str, str],
+                 hatch_potion_kinds: Dict[str, str],
+                 drop_food_names: FrozenSet[str]):
+        self.__index = index
+        self.__records: Dict[str, PetRecord] = {}  # the records decoded so far
+        self.__egg_kinds = egg_kinds
+        self.__hatch_potion_kinds = hatch_potion_kinds
+        self.drop_food_names: FrozenSet[str] = drop_food_names
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} pets)"
+
+    def __contains__(self, pet_name: object) -> bool:
+        return isinstance(pet_name, str) and self.get(pet_name) is not None
+
+    def __getitem__(self, pet_name: str) -> PetRecord:
+        record: Optional[PetRecord] = self.get(pet_name)
+        if record is None:
+            raise KeyError(pet_name)
+        return record
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.__index.pet_name(pet_id) for pet_id in range(len(self.__index)))
+
+    def __len__(self) -> int:
+        return len(self.__index)
+
+    def get(self, pet_name: str) -> Optional[PetRecord]:
+        """Return the record of the pet, or None if hopla doesn't know the pet."""
+        record: Optional[PetRecord] = self.__records.get(pet_name)
+        if record is None:
+            pet_id: Optional[int] = self.__index.pet_id(pet_name)
+            if pet_id is None:
+                return None
+            record = self._decode(pet_id)
+            self.__records[pet_name] = record
+        return record
+
+    def _decode(self, pet_id: int) -> PetRecord:
+        pet: CataloguePet = self.__index.pet(pet_id)
+        return PetRecord(pet.name, pet.egg, pet.potion, PetCategory.ALL[pet.category],
+                         pet.feedable, pet.favorite_food, pet.rare, pet_id)
+
+    def pet_id(self, pet_name: str) -> Optional[int]:
+        """Return the id of the pet, or None if hopla doesn't know the pet."""
+        record: Optional[PetRecord] = self.get(pet_name)
+        return None if record is None else record.pet_id
+
+    def pet_name(self, pet_id: int) -> str:
+        """Return the name of the pet with this id."""
+        return self.__index.pet_name(pet_id)
+
+    def bitset(self, *categories: str) -> int:
+        """Return the ids of the pets of the categories as a bitset (bit i is pet i).
+
+        >>> wolf_base: int = 1 << get_pet_registry().pet_id("Wolf-Base")
+        >>> bool(get_pet_registry().bitset(PetCategory.GENERATION1) & wolf_base)
+        True
+        """
+        bitset = 0
+        for category in categories:
+            bitset |= self.__index.category_bitset(PetCategory.ALL.index(category))
+        return bitset
+
+    def names_of(self, bitset: int) -> List[str]:
+        """Return the names of the pets in the bitset, in the order of the pet ids."""
+        bits: str = format(bitset, "b")[::-1]  # bits[i] is the bit of pet i
+        return [self.__index.pet_name(pet_id) for pet_id, bit in enumerate(bits) if bit == "1"]
+
+    def pet_names(self, *categories: str) -> List[str]:
+        """Return the names of the pets of the categories, in the order of the pet ids.
+
+        >>> get_pet_registry().pet_names(PetCategory.WACKY)[:2]
+        ['BearCub-Dessert', 'BearCub-Fungi']
+        """
+        return self.names_of(self.bitset(*categories))
+
+    def feedable_pet_names(self) -> List[str]:
+        """Return the names of the pets that can be fed."""
+        return self.pet_names(*PetCategory.FEEDABLE)
+
+    def egg_kind(self, egg_name: str) -> Optional[str]:
+        """Return "drop" or "quest" for a known egg, else None.
+
+        >>> get_pet_registry().egg_kind("Wolf"), get_pet_registry().egg_kind("Gryphon")
+        ('drop', 'quest')
+        """
+        return self.__egg_kinds.get(egg_name)
+
+    def hatch_potion_kind(self, potion_name: str) -> Optional[str]:
+        """Return "drop", "magic", or "wacky" for a known hatching potion, else None.
+
+        >>> registry = get_pet_registry()
+        >>> registry.hatch_potion_kind("Base"), registry.hatch_potion_kind("Veggie")
+        ('drop', 'wacky')
+        """
+        return self.__hatch_potion_kinds.get(potion_name)
+
+    @classmethod
+    def load(cls, *, cache_dir: Optional[Path] = None) -> "PetRegistry":
+        """Load the registry from the compiled catalogue index.
+
+        The index is compiled (from the hopla data modules) when it's missing,
+        or when the data modules or the cached content tables changed.
+        """
+        index: CatalogueIndex = load_catalogue_index(
+            _catalogue_pets, n_categories=len(PetCategory.ALL),
+            source_files=_CATALOGUE_SOURCE_FILES + [ContentTablesCache().cache_file],
+            cache_dir=cache_dir or get_cache_dirpath()
+        )
+        egg_kinds = {**dict.fromkeys(EggData.drop_egg_names, "drop"),
+                     **dict.fromkeys(EggData.quest_egg_names, "quest")}
+        hatch_potion_kinds = {
+            **dict.fromkeys(HatchPotionData.drop_hatch_potion_names, "drop"),
+            **dict.fromkeys(HatchPotionData.magic_hatch_potion_names, "magic"),
+            **dict.fromkeys(HatchPotionData.wacky_hatch_potion_names, "wacky")
+        }
+        return cls(index, egg_kinds=egg_kinds, hatch_potion_kinds=hatch_potion_kinds,
+                   drop_food_names=frozenset(FoodData.drop_food_names))
+
+
+@functools.lru_cache(maxsize=None)
+def get_pet_registry() -> PetRegistry:
+    """Return the registry of all the pets, eggs, hatching potions, and food that hopla knows.
+
+    The registry is loaded on first use, so importing hopla doesn't touch the cache directory.
+    """
+    return PetRegistry.load()
@@ -0,0 +1,94 @@
+"""
+A module with a bitset representation of the pets and mounts of a user.
+
+Every pet that hopla knows has an id in the pet catalogue (see petregistry.py).
+A set of pets is then a single int in which bit i is set when pet i is in the
+set. Questions about a zoo become bitwise operations on those ints, and the
+bitsets of many accounts can be combined with | and &.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.zoo.foodmodels import FeedStatus
+from hopla.hoplalib.zoo.petmodels import PetMountPair
+from hopla.hoplalib.zoo.petregistry import PetCategory, get_pet_registry
+
+_UNAVAILABLE_PET_STATUSES = (FeedStatus.PET_GREW_UP_TO_MOUNT, FeedStatus.PET_RELEASED)
+
+
+def count(bitset: int) -> int:
+    """Return the number of pets in the bitset.
+
+    >>> count(0b1011)
+    3
+    """
+    return bin(bitset).count("1")
+
+
+def bitset_of(pet_names: Iterable[str]) -> int:
+    """Return the bitset of the pets, leaving out the pets that hopla doesn't know."""
+    bitset = 0
+    for pet_name in pet_names:
+        pet_id: Optional[int] = get_pet_registry().pet_id(pet_name)
+        if pet_id is not None:
+            bitset |= 1 << pet_id
+    return bitset
+
+
+@dataclass(frozen=True)
+class ZooBitsets:
+    """The pets and the mounts that a user has right now, as bitsets over the pet ids.
+
+    Pets and mounts that hopla doesn't know are left out.
+
+    >>> zoo = ZooBitsets.from_pets_and_mounts(pets={"Wolf-Base": 5, "Fox-Base": -1},
+    ...                                       mounts={"Fox-Base": True})
+    >>> zoo.names(zoo.owned_without_mount())
+    ['Wolf-Base']
+    """
+    pets: int = 0
+    mounts: int = 0
+
+    def __or__(self, other: "ZooBitsets") -> "ZooBitsets":
+        """Return the pets and the mounts that at least one of the zoos has."""
+        return ZooBitsets(pets=self.pets | other.pets, mounts=self.mounts | other.mounts)
+
+    def __and__(self, other: "ZooBitsets") -> "ZooBitsets":
+        """Return the pets and the mounts that both zoos have."""
+        return ZooBitsets(pets=self.pets & other.pets, mounts=self.mounts & other.mounts)
+
+    @classmethod
+    def from_pets_and_mounts(cls, *, pets: Dict[str, int],
+                             mounts: Dict[str, Optional[bool]]) -> "ZooBitsets":
+        """Create the bitsets from the feed statuses of pets and the mounts of a user."""
+        return cls(
+            pets=bitset_of(name for name, feed_status in pets.items()
+                           if feed_status not in _UNAVAILABLE_PET_STATUSES),
+            mounts=bitset_of(name for name, availability_status in mounts.items()
+                             if availability_status is True)
+        )
+
+    @classmethod
+    def from_user(cls, user: HabiticaUser) -> "ZooBitsets":
+        """Create the bitsets of the pets and mounts of the user."""
+        return cls.from_pets_and_mounts(pets=user.get_pets(), mounts=user.get_mounts())
+
+    @classmethod
+    def from_zoo(cls, zoo: Dict[str, PetMountPair]) -> "ZooBitsets":
+        """Create the bitsets of the pets and mounts that are available in the zoo."""
+        return cls(pets=bitset_of(name for name, pair in zoo.items() if pair.pet_available()),
+                   mounts=bitset_of(name for name, pair in zoo.items() if pair.mount_available()))
+
+    def owned_without_mount(self) -> int:
+        """Return the pets that the user has, but whose mount the user doesn't have."""
+        return self.pets & ~self.mounts
+
+    def hatchable_not_owned(self) -> int:
+        """Return the pets that hatch from an egg and a potion, and that the user doesn't have."""
+        return get_pet_registry().bitset(*PetCategory.HATCHABLE) & ~self.pets
+
+    @staticmethod
+    def names(bitset: int) -> List[str]:
+        """Return the names of the pets in the bitset, in the order of the pet ids."""
+        return get_pet_registry().names_of(bitset)
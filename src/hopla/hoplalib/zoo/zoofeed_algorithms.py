@@ -1,15 +1,24 @@
 """
 A modules with algorithms for feeding multiple pets at once.
 """
+import abc
 from dataclasses import dataclass
-from typing import Iterator, List
-from copy import deepcopy
+from typing import (Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Set, Tuple,
+                    Type)
 
+from hopla.hoplalib.common import with_slots
+from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
 from hopla.hoplalib.zoo.foodmodels import FoodStockpile
-from hopla.hoplalib.zoo.petmodels import Pet
-from hopla.hoplalib.zoo.zoomodels import Zoo, ZooHelper
+from hopla.hoplalib.zoo.foodpreferences import FoodPreferenceMatrix
+from hopla.hoplalib.zoo.petmodels import PetMountPair
+from hopla.hoplalib.zoo.petregistry import PetCategory, get_pet_registry
 
+FEED_ORDER: Tuple[str, ...] = (PetCategory.GENERATION1, PetCategory.QUEST,
+                               PetCategory.MAGIC_POTION)
+"""The order in which the categories of pets are fed."""
 
+
+@with_slots
 @dataclass(frozen=True)
 class FeedPlanItem:
     """An item of a feed plan.
@@ -78,30 +87,55 @@ class FeedPlan:
         return "\n".join([item.format_item() for item in self.__feed_plan])
 
 
-@dataclass
-class FeedAlgorithm:
+FEED_STRATEGIES: Dict[str, Type["FeedStrategy"]] = {}
+"""The registered FeedStrategy classes, by the name of their strategy."""
+
+DEFAULT_FEED_STRATEGY = "greedy"
+
+
+def feed_strategy(name: str) -> Callable[[Type["FeedStrategy"]], Type["FeedStrategy"]]:
+    """Return a class decorator that registers a FeedStrategy in FEED_STRATEGIES.
+
+    :param name: the name of the strategy, e.g. for `hopla feed-all --strategy`
     """
-    This class contains an algorithm that makes a plan to distribute food
-    from a food stockpile over all pets.
+    def register(strategy: Type[FeedStrategy]) -> Type[FeedStrategy]:
+        if name in FEED_STRATEGIES:
+            raise ValueError(f"A feed strategy named {name} is already registered.")
+        FEED_STRATEGIES[name] = strategy
+        return strategy
+
+    return register
+
+
+class FeedStrategy(abc.ABC):
+    """
+    A strategy that makes a plan to distribute food from a food stockpile
+    over the feedable pets of a zoo.
+
+    Register a strategy with the feed_strategy decorator to make it
+    available to `hopla feed-all --strategy`.
     """
+    description: str = ""
+    """A single sentence about what the plans of the strategy are good at."""
 
-    def __init__(self, *, zoo: Zoo, stockpile: FoodStockpile):
-        self.__zoo: Zoo = ZooHelper(deepcopy(zoo)).get_feedable_zoo()
-        self.__stockpile = deepcopy(stockpile)
+    def __init__(self, *, zoo: Mapping[str, PetMountPair], stockpile: FoodStockpile):
+        self._zoo: ColumnarZoo = ColumnarZoo.from_zoo(zoo).get_feedable_zoo()
+        self._stockpile = stockpile.fork()
+        self._preferences = FoodPreferenceMatrix.cached()
 
-        self.__feed_plan = FeedPlan()
+        self._feed_plan = FeedPlan()
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}(\n"
-            f"  __feed_plan={self.__feed_plan.format_plan()}\n"
+            f"  __feed_plan={self._feed_plan.format_plan()}\n"
             f")"
         )
 
     @property
     def stockpile(self) -> FoodStockpile:
         """Return the stockpile."""
-        return self.__stockpile
+        return self._stockpile
 
     @property
     def feed_plan(self) -> FeedPlan:
@@ -109,45 +143,269 @@ class FeedAlgorithm:
 
         This plan will be empty before calling make_plan.
         """
-        return self.__feed_plan
+        return self._feed_plan
 
+    @abc.abstractmethod
     def make_plan(self) -> FeedPlan:
         """Make the plan.
 
         This function removes food from the stockpile and adds feed items
         to the feed plan.
         """
-        helper = ZooHelper(self.__zoo)
-        gen1_zoo: Zoo = helper.filter_on_pet(Pet.is_generation1_pet)
-        quest_zoo: Zoo = helper.filter_on_pet(Pet.is_quest_pet)
-        magic_zoo: Zoo = helper.filter_on_pet(Pet.is_magic_hatch_pet)
 
-        self.__make_plan(gen1_zoo)
-        self.__make_plan(quest_zoo)
-        self.__make_plan(magic_zoo)
 
-        return self.__feed_plan
+@feed_strategy(DEFAULT_FEED_STRATEGY)
+class FeedAlgorithm(FeedStrategy):
+    """
+    This class contains an algorithm that makes a plan to distribute food
+    from a food stockpile over all pets.
+
+    The pets are fed in FEED_ORDER, and in the order of the zoo. A pet that
+    likes all food gets the most abundant food.
+    """
+    description = "feed the pets category by category, in the order of your zoo."
+
+    def make_plan(self) -> FeedPlan:
+        for category in FEED_ORDER:
+            self.__make_plan(self._zoo.filter_on_categories(category))
 
-    def __make_plan(self, zoo: Zoo):
+        return self._feed_plan
+
+    def __make_plan(self, zoo: ColumnarZoo):
         """Make plan for the specified zoo.
 
         This function assumes that only feedable pets are passed.
         """
-        for pet_name, pair in zoo.items():
-            pet: Pet = pair.pet
-
-            if pet.has_just_1_favorite_food():
-                food_name: str = pet.favorite_food()
-            else:
-                food_name: str = self.__stockpile.get_most_abundant_food()
-
-            times: int = pet.required_food_items_until_mount(food_name)
-            if self.__stockpile.has_sufficient(food_name, n=times):
+        for pet_name, pet_id, feed_status in zoo.feed_rows():
+            food_name: Optional[str] = get_pet_registry()[pet_name].favorite_food
+            if food_name is None:
+                food_name = self._stockpile.get_most_abundant_food()
+
+            times: int = self._preferences.required_food_items(
+                pet_id, food_name, feed_status=feed_status
+            )
+            if self._stockpile.has_sufficient(food_name, n=times):
                 subtract_times: int = -times
-                self.__stockpile.add_food(food_name,
-                                          n=subtract_times)
-                self.__feed_plan.add_to_feed_plan(
+                self._stockpile.add_food(food_name,
+                                         n=subtract_times)
+                self._feed_plan.add_to_feed_plan(
                     pet_name=pet_name,
                     food_name=food_name,
                     times=times
                 )
+
+
+class _Candidate(NamedTuple):
+    """A pet that a strategy may feed. Candidates sort on times, then row."""
+    times: int
+    """The food items that the pet needs to become a mount."""
+    row: int
+    """The position of the pet in the candidates, to make the plan deterministic."""
+    pet_name: str
+    food_name: Optional[str]
+    """The favorite food of the pet, None if the pet likes all food."""
+
+
+def _candidates(zoo: ColumnarZoo, preferences: FoodPreferenceMatrix,
+                categories: Tuple[str, ...] = FEED_ORDER) -> List[_Candidate]:
+    """Return the candidates of the feedable zoo, in the order of the categories."""
+    candidates: List[_Candidate] = []
+    for category in categories:
+        for pet_name, pet_id, feed_status in zoo.filter_on_categories(category).feed_rows():
+            candidates.append(_Candidate(
+                # the fewest items of any food are the items of the food that the pet likes
+                min(preferences.required_food_items_row(pet_id, feed_status=feed_status)),
+                len(candidates), pet_name, get_pet_registry()[pet_name].favorite_food
+            ))
+    return candidates
+
+
+def _feed(plan: FeedPlan, stockpile: FoodStockpile, candidate: _Candidate, times: int) -> int:
+    """Plan to feed the candidate at most times items of food that it likes.
+
+    A pet that likes all food gets the most abundant food, and the next most
+    abundant food when that runs out.
+
+    :return: the number of food items that the plan feeds the candidate
+    """
+    fed = 0
+    while fed < times:
+        food_name: str = candidate.food_name or stockpile.get_most_abundant_food()
+        n: int = min(times - fed, stockpile.as_dict().get(food_name, 0))
+        if n == 0:
+            break
+        stockpile.add_food(food_name, n=-n)
+        plan.add_to_feed_plan(pet_name=candidate.pet_name, food_name=food_name, times=n)
+        fed += n
+    return fed
+
+
+class _FoodBudget:
+    """The food that is left for the candidates that haven't been selected yet.
+
+    The favorite food of the selected pets counts against that food. The
+    food of the pets that like all food only counts against the total, so
+    they can get any food that the other pets leave.
+    """
+
+    def __init__(self, stockpile: FoodStockpile):
+        self.food_left: Dict[str, int] = stockpile.as_dict()
+        self.total_food_left: int = sum(self.food_left.values())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.total_food_left} food left)"
+
+    def select(self, candidates: List[_Candidate]) -> List[_Candidate]:
+        """Return the candidates that the food suffices for, fewest food items first."""
+        selected: List[_Candidate] = []
+        for candidate in sorted(candidates):
+            if candidate.times > self.total_food_left:
+                break  # the candidates after this one need at least as much food
+            if candidate.food_name is not None:
+                if candidate.times > self.food_left.get(candidate.food_name, 0):
+                    continue
+                self.food_left[candidate.food_name] -= candidate.times
+            self.total_food_left -= candidate.times
+            selected.append(candidate)
+        return selected
+
+
+def _favorite_food_first(candidate: _Candidate) -> Tuple[bool, int]:
+    """The order to feed selected candidates: the pets that like all food get what's left."""
+    return candidate.food_name is None, candidate.row
+
+
+@feed_strategy("category-ordered")
+class CategoryOrderedFeedAlgorithm(FeedStrategy):
+    """
+    This class contains an algorithm that feeds the categories of pets in
+    FEED_ORDER, like the FeedAlgorithm, but feeds the pets of a category
+    that need the fewest food items first. It turns as many pets of the
+    first category into mounts as possible, then of the next category,
+    and so on.
+    """
+    description = "feed the pets category by category, the pets that need the least food first."
+
+    def make_plan(self) -> FeedPlan:
+        budget = _FoodBudget(self._stockpile)
+        for category in FEED_ORDER:
+            selected: List[_Candidate] = budget.select(
+                _candidates(self._zoo, self._preferences, (category,))
+            )
+            for candidate in sorted(selected, key=_favorite_food_first):
+                _feed(self._feed_plan, self._stockpile, candidate, candidate.times)
+
+        return self._feed_plan
+
+
+@feed_strategy("optimal")
+class OptimalFeedAlgorithm(FeedStrategy):
+    """
+    This class contains an algorithm that makes a plan that turns as many
+    pets as possible into mounts, and then spends as little food as possible.
+
+    Like the FeedAlgorithm, pets only get food that they like: their favorite
+    food, or any food for the pets that like all food (magic potion pets). A
+    pet that likes all food may get more than one kind of food, because
+    every item counts the same.
+
+    The pets are taken in order of the food items that they need, fewest
+    first. A pet is taken if its food still fits: its favorite food, and the
+    food of the stockpile as a whole (the pets that like all food share what
+    the other pets leave). A pet that doesn't fit is passed over, but the
+    pets after it are still tried. Because these capacities are nested, any
+    other plan can swap one of its pets for the first pet (in this order)
+    that it lacks, without needing more food. So no plan turns more pets
+    into mounts, or as many with less food.
+
+    >>> from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
+    >>> zoo = ColumnarZoo.from_pets_and_mounts(
+    ...     pets={"Wolf-Base": 5, "BearCub-Amber": 45, "Fox-Amber": 45}, mounts={})
+    >>> stockpile = FoodStockpile({"Meat": 9})
+    >>> OptimalFeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan().format_plan()
+    'Pet BearCub-Amber will get 1 Meat.\\nPet Fox-Amber will get 1 Meat.'
+    """
+
+    description = "turn as many pets as possible into mounts, with as little food as possible."
+
+    def make_plan(self) -> FeedPlan:
+        """Make the plan.
+
+        This function removes food from the stockpile and adds feed items
+        to the feed plan. The pets with a favorite food are fed first, so the
+        pets that like all food get the food that is left.
+        """
+        selected: List[_Candidate] = _FoodBudget(self._stockpile).select(
+            _candidates(self._zoo, self._preferences)
+        )
+        for candidate in sorted(selected, key=_favorite_food_first):
+            _feed(self._feed_plan, self._stockpile, candidate, candidate.times)
+
+        return self._feed_plan
+
+
+@feed_strategy("fewest-requests")
+class FewestRequestsFeedAlgorithm(FeedStrategy):
+    """
+    This class contains an algorithm that makes a plan with a single feed
+    request per pet, so the plan never takes more requests than mounts.
+
+    It selects the pets like the OptimalFeedAlgorithm. The pets that like
+    all food then get a single kind of food: the pets that need the most
+    food first, each the food that fits it the tightest, so the large
+    leftovers remain for the pets after it. A pet that no single food can
+    feed is left out, even if a mix of food could.
+    """
+    description = "feed every pet with a single request, for the most mounts per request."
+
+    def make_plan(self) -> FeedPlan:
+        selected: List[_Candidate] = _FoodBudget(self._stockpile).select(
+            _candidates(self._zoo, self._preferences)
+        )
+        likes_all_food: List[_Candidate] = []
+        for candidate in sorted(selected, key=_favorite_food_first):
+            if candidate.food_name is None:
+                likes_all_food.append(candidate)
+            else:
+                _feed(self._feed_plan, self._stockpile, candidate, candidate.times)
+
+        food_left: Dict[str, int] = self._stockpile.as_dict()
+        for candidate in sorted(likes_all_food, key=lambda c: (-c.times, c.row)):
+            fitting: List[Tuple[int, str]] = [(n, name) for name, n in food_left.items()
+                                              if n >= candidate.times]
+            if fitting:
+                _, food_name = min(fitting)
+                food_left[food_name] -= candidate.times
+                _feed(self._feed_plan, self._stockpile,
+                      candidate._replace(food_name=food_name), candidate.times)
+
+        return self._feed_plan
+
+
+def add_partial_feeding(plan: FeedPlan, *, zoo: Mapping[str, PetMountPair],
+                        stockpile: FoodStockpile) -> FeedPlan:
+    """Add the food that the plan leaves to the plan, for the pets that won't become a mount.
+
+    The pets that need the fewest food items go first, and each pet gets as
+    much of the food that it likes as is left. The food is thus spent on as
+    few pets as possible, which are then as close as possible to becoming a
+    mount when more food drops. A partially fed pet takes a single feed
+    request per kind of food.
+
+    :param plan: a plan that was made for the zoo, e.g. by a FEED_STRATEGIES strategy
+    :param zoo: the zoo of the plan
+    :param stockpile: the food that is left after the plan. This food is removed from it.
+    :return: the same plan, with the partial feeding at the end
+
+    >>> from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
+    >>> zoo = ColumnarZoo.from_pets_and_mounts(pets={"Wolf-Base": 5, "Wolf-Red": 30},
+    ...                                        mounts={})
+    >>> add_partial_feeding(FeedPlan(), zoo=zoo, stockpile=FoodStockpile({"Meat": 3}))
+    FeedPlan(__feed_plan=[FeedPlanItem(pet_name='Wolf-Base', food_name='Meat', times=3)])
+    """
+    planned: Set[str] = {item.pet_name for item in plan}
+    feedable_zoo: ColumnarZoo = ColumnarZoo.from_zoo(zoo).get_feedable_zoo()
+    for candidate in sorted(_candidates(feedable_zoo, FoodPreferenceMatrix.cached())):
+        if candidate.pet_name not in planned:
+            _feed(plan, stockpile, candidate, candidate.times)
+    return plan
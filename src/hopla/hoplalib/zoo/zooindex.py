@@ -0,0 +1,185 @@
+"""
+A module with secondary indexes over the rows of a Zoo.
+
+Questions such as "feedable quest pets with a feed status above 30" or "all
+the Wolf pets" would otherwise scan the whole zoo with a predicate per
+question. The ZooIndex visits the zoo once and keeps, for every category,
+egg, hatching potion, and feed status bucket, the bitset of the rows (the
+positions of the pairs in the zoo) that have it. A query is then the bitwise
+& of a few of those bitsets.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
+from hopla.hoplalib.zoo.petmodels import PetMountPair
+from hopla.hoplalib.zoo.petregistry import PetRecord, get_pet_registry
+
+FEED_STATUS_BUCKET_SIZE = 10
+"""The width of the feed status ranges that the rows are indexed by."""
+
+
+def egg_and_potion(pet_name: str) -> Tuple[str, str]:
+    """Return the egg and the hatching potion part of the name of a pet (or mount).
+
+    Unlike PetRecord.egg and PetRecord.potion, this also works for rare pets
+    and for the pets that hopla doesn't know.
+
+    >>> egg_and_potion("Wolf-Veteran")
+    ('Wolf', 'Veteran')
+    """
+    egg, _, potion = pet_name.partition("-")
+    return egg, potion
+
+
+def _union(index: Dict[str, int], keys: Iterable[str]) -> int:
+    rows = 0
+    for key in keys:
+        rows |= index.get(key, 0)
+    return rows
+
+
+def _add(index: Dict[Any, int], key: Any, bit: int) -> None:
+    index[key] = index.get(key, 0) | bit
+
+
+def _row_numbers(rows: int) -> Iterator[int]:
+    """Yield the row numbers in the bitset of rows, in increasing order."""
+    while rows:
+        lowest_bit: int = rows & -rows
+        yield lowest_bit.bit_length() - 1
+        rows ^= lowest_bit
+
+
+@dataclass(frozen=True)
+class ZooQuery:
+    """The criteria of a ZooIndex query. A pair must meet all the criteria that are set.
+
+    The tuples accept a pair that matches any of their items. None accepts any pair.
+    """
+    # pylint: disable=too-many-instance-attributes
+    categories: Optional[Tuple[str, ...]] = None
+    eggs: Optional[Tuple[str, ...]] = None
+    potions: Optional[Tuple[str, ...]] = None
+    min_feed_status: Optional[int] = None
+    """Only accept pairs with a pet whose feed status is at least this. Inclusive."""
+    max_feed_status: Optional[int] = None
+    """Only accept pairs with a pet whose feed status is at most this. Inclusive."""
+    has_pet: Optional[bool] = None
+    """True to accept the pairs whose pet the user has right now, False for the others."""
+    has_mount: Optional[bool] = None
+    """True to accept the pairs whose mount the user has right now, False for the others."""
+    feedable: bool = False
+    """True to only accept the pets that can be fed. See PetMountPair.can_feed_pet()."""
+
+
+class ZooIndex:
+    """Secondary indexes over a zoo, built in a single pass over the zoo.
+
+    >>> from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
+    >>> index = ZooIndex(ColumnarZoo.from_pets_and_mounts(
+    ...     pets={"Wolf-Base": 35, "Wolf-Veteran": 5, "Fox-Base": 40}, mounts={"Fox-Base": True}
+    ... ))
+    >>> index.names(ZooQuery(eggs=("Wolf",)))
+    ['Wolf-Base', 'Wolf-Veteran']
+    >>> index.names(ZooQuery(feedable=True, min_feed_status=31))
+    ['Wolf-Base']
+    """
+    # pylint: disable=too-many-instance-attributes
+    # Every index is an attribute: bundling them would only hide what a query uses.
+
+    def __init__(self, zoo: Mapping[str, PetMountPair]):
+        self.__zoo = zoo
+        self.__names: Tuple[str, ...] = tuple(zoo)
+        self.__feed_statuses: List[Optional[int]] = []
+        self.__by_category: Dict[str, int] = {}
+        self.__by_egg: Dict[str, int] = {}
+        self.__by_potion: Dict[str, int] = {}
+        self.__by_bucket: Dict[int, int] = {}
+        self.__pets_available = 0
+        self.__mounts_available = 0
+        self.__feedable = 0
+        feedable_zoo: ColumnarZoo = ColumnarZoo.from_zoo(zoo).get_feedable_zoo()
+        for row, (name, pair) in enumerate(zoo.items()):
+            self.__index_row(1 << row, name, pair)
+            if name in feedable_zoo:
+                self.__feedable |= 1 << row
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.__names)} rows)"
+
+    def __index_row(self, bit: int, name: str, pair: PetMountPair) -> None:
+        egg, potion = egg_and_potion(name)
+        _add(self.__by_egg, egg, bit)
+        _add(self.__by_potion, potion, bit)
+        record: Optional[PetRecord] = get_pet_registry().get(name)
+        if record is not None:
+            _add(self.__by_category, record.category, bit)
+
+        feed_status: Optional[int] = None if pair.pet is None else int(pair.pet.feed_status)
+        self.__feed_statuses.append(feed_status)
+        if feed_status is not None:
+            _add(self.__by_bucket, feed_status // FEED_STATUS_BUCKET_SIZE, bit)
+        if pair.pet_available():
+            self.__pets_available |= bit
+        if pair.mount_available():
+            self.__mounts_available |= bit
+
+    @property
+    def all_rows(self) -> int:
+        """The bitset of all the rows of the zoo."""
+        return (1 << len(self.__names)) - 1
+
+    def select(self, query: ZooQuery) -> int:
+        """Return the bitset of the rows that meet all the criteria of the query."""
+        rows: int = self.all_rows
+        if query.categories is not None:
+            rows &= _union(self.__by_category, query.categories)
+        if query.eggs is not None:
+            rows &= _union(self.__by_egg, query.eggs)
+        if query.potions is not None:
+            rows &= _union(self.__by_potion, query.potions)
+        if query.min_feed_status is not None or query.max_feed_status is not None:
+            rows &= self.__feed_status_rows(query.min_feed_status, query.max_feed_status)
+        if query.has_pet is not None:
+            rows &= self.__pets_available if query.has_pet else ~self.__pets_available
+        if query.has_mount is not None:
+            rows &= self.__mounts_available if query.has_mount else ~self.__mounts_available
+        if query.feedable:
+            rows &= self.__feedable
+        return rows
+
+    def __feed_status_rows(self, low: Optional[int], high: Optional[int]) -> int:
+        """Return the rows with a pet whose feed status is in [low, high].
+
+        The buckets that are entirely in the range are taken as a whole. Only the
+        rows of the (at most two) buckets that straddle a bound are checked one by one.
+        """
+        low = -(2 ** 31) if low is None else low
+        high = 2 ** 31 if high is None else high
+        rows = 0
+        for bucket, bucket_rows in self.__by_bucket.items():
+            first: int = bucket * FEED_STATUS_BUCKET_SIZE
+            last: int = first + FEED_STATUS_BUCKET_SIZE - 1
+            if low <= first and last <= high:
+                rows |= bucket_rows
+            elif first <= high and low <= last:
+                rows |= self.__rows_in_range(bucket_rows, low, high)
+        return rows
+
+    def __rows_in_range(self, rows: int, low: int, high: int) -> int:
+        """Return the rows of rows with a pet whose feed status is in [low, high]."""
+        selected = 0
+        for row in _row_numbers(rows):
+            if low <= self.__feed_statuses[row] <= high:  # type: ignore
+                selected |= 1 << row
+        return selected
+
+    def names(self, query: ZooQuery) -> List[str]:
+        """Return the names of the pairs that meet the query, in the order of the zoo."""
+        return [self.__names[row] for row in _row_numbers(self.select(query))]
+
+    def pairs(self, query: ZooQuery) -> Iterator[Tuple[str, PetMountPair]]:
+        """Yield the (name, pair) of the pairs that meet the query, in the order of the zoo."""
+        for name in self.names(query):
+            yield name, self.__zoo[name]
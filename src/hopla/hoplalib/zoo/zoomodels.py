@@ -3,13 +3,16 @@
 Module with models for collections of pets and mounts.
 """
 import logging
-from typing import Callable, Dict
+from functools import cached_property
+from typing import Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple
 from dataclasses import dataclass
 
 from hopla.cli.groupcmds.get_user import HabiticaUser
+from hopla.hoplalib.snapshots import fingerprint
+from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
 from hopla.hoplalib.zoo.foodmodels import FeedStatus
-from hopla.hoplalib.zoo.petdata import PetData
 from hopla.hoplalib.zoo.petmodels import Mount, Pet, PetMountPair
+from hopla.hoplalib.zoo.petregistry import get_pet_registry
 
 Zoo = Dict[str, PetMountPair]
 """
@@ -18,11 +21,65 @@ PetMountPair.
 """
 
 
+@dataclass(frozen=True)
+class ZooSnapshot:
+    """A frozen snapshot of a zoo, e.g. to use as a cache key.
+
+    >>> zoo = {"Wolf-Base": PetMountPair(pet=Pet("Wolf-Base", feed_status=FeedStatus(5)),
+    ...                                  mount=None)}
+    >>> ZooSnapshot.from_zoo(zoo).pairs
+    (('Wolf-Base', 5, None),)
+    """
+    pairs: Tuple[Tuple[str, Optional[int], Optional[bool]], ...]
+    """The (name, feed status, mount availability) of every pair, sorted on the name.
+
+    The feed status is None without a pet. The availability is None without
+    a mount (or for a mount without an availability status).
+    """
+
+    @classmethod
+    def from_zoo(cls, zoo: Mapping[str, PetMountPair]) -> "ZooSnapshot":
+        """Create the snapshot of the zoo. The order of the zoo doesn't matter."""
+        return cls(tuple(sorted(
+            (name,
+             None if pair.pet is None else int(pair.pet.feed_status),
+             None if pair.mount is None else pair.mount.availability_status)
+            for name, pair in zoo.items()
+        )))
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """The fingerprint of the pairs. See snapshots.fingerprint()."""
+        return fingerprint("zoo", self.pairs)
+
+
 @dataclass(frozen=True)
 class ZooHelper:
     """Class with helper functions for a Zoo."""
     zoo: Zoo
 
+    def filter_on_bitset(self, bitset: int) -> Zoo:
+        """Filter the zoo on the pet ids in the bitset. This does not change the underlying zoo.
+
+        :param bitset: Include the PetMountPair if bit i is set for pet id i, else
+                       omit the pair. Pairs of pets unknown to hopla are omitted.
+        :return: A filtered zoo.
+        """
+        filtered: Zoo = {}
+        for pet_name, pair in self.zoo.items():
+            pet_id: Optional[int] = get_pet_registry().pet_id(pet_name)
+            if pet_id is not None and bitset >> pet_id & 1:
+                filtered[pet_name] = pair
+        return filtered
+
+    def filter_on_categories(self, *categories: str) -> Zoo:
+        """Filter the zoo on the PetCategory of the pets. This does not change the underlying zoo.
+
+        :param categories: Include the PetMountPair if the pet is of one of these categories.
+        :return: A filtered zoo.
+        """
+        return self.filter_on_bitset(get_pet_registry().bitset(*categories))
+
     def filter_on_pet_mount_pairs(self, predicate: Callable[[PetMountPair], bool]) -> Zoo:
         """Filter the zoo on the pair. This does not change the underlying zoo.
 
@@ -35,8 +92,12 @@ class ZooHelper:
         }
 
     def get_feedable_zoo(self) -> Zoo:
-        """Helper function to get only the pets that can be fed in this Zoo."""
-        return self.filter_on_pet_mount_pairs(PetMountPair.can_feed_pet)
+        """Helper function to get only the pets that can be fed in this Zoo.
+
+        The pets are selected by ColumnarZoo.get_feedable_zoo().
+        """
+        feedable: ColumnarZoo = ColumnarZoo.from_zoo(self.zoo).get_feedable_zoo()
+        return self.filter_on_pet_name(lambda pet_name: pet_name in feedable)
 
     def filter_on_pet_name(self, predicate: Callable[[str], bool]) -> Zoo:
         """Filter the zoo on the pet name. This does not change the underlying zoo.
@@ -61,6 +122,19 @@ class ZooHelper:
         }
 
 
+def _category_selector(categories: Optional[Iterable[str]]) -> Callable[[str], bool]:
+    """Return the predicate that selects the pets of the categories, or all pets if None."""
+    if categories is None:
+        return lambda pet_name: True
+    selected: int = get_pet_registry().bitset(*categories)
+
+    def is_selected(pet_name: str) -> bool:
+        pet_id: Optional[int] = get_pet_registry().pet_id(pet_name)
+        return pet_id is not None and selected >> pet_id & 1 == 1
+
+    return is_selected
+
+
 class ZooBuilder:
     """
     Class that creates a Zoo from a HabiticaUser using the
@@ -68,42 +142,88 @@ class ZooBuilder:
     """
 
     def __init__(self, user: HabiticaUser):
-        self.pets: dict = user.get_pets()
-        self.mounts: dict = user.get_mounts()
-        self.__zoo: Zoo = {}  # empty until build() is called
+        # read-only references: the builder never changes the inventory of the user
+        self.pets: Mapping[str, int] = user.get_pets()
+        self.mounts: Mapping[str, Optional[bool]] = user.get_mounts()
 
     def __repr__(self):
         return self.__class__.__name__ + f"({self.__dict__})"
 
-    def build(self, skip_unsupported_pets: bool = False) -> Zoo:
-        """ Build the Zoo.
+    def build_pair(self, pet_name: str) -> Optional[PetMountPair]:
+        """Build only the PetMountPair of the specified pet.
 
-        :param skip_unsupported_pets: if True, skip unsupported pets (excludes mounts)
-        :return: the Zoo in case of success
+        Unlike build(), this does not visit the other pets and mounts of the user.
+
+        :param pet_name: name of the pet (and mount)
+        :return: the pair, or None if the user has neither the pet nor the mount
         """
+        feed_status: Optional[int] = self.pets.get(pet_name)
+        availability_status: Optional[bool] = self.mounts.get(pet_name)
+        if feed_status is None and availability_status is None:
+            return None
+
+        pet = None
+        if feed_status is not None:
+            pet = Pet(pet_name, feed_status=FeedStatus(feed_status))
+        return PetMountPair(pet=pet, mount=self.__build_mount(pet_name))
+
+    def __build_mount(self, mount_name: str) -> Optional[Mount]:
+        availability_status: Optional[bool] = self.mounts.get(mount_name)
+        if availability_status is None:
+            return None
+        return Mount(mount_name, availability_status=availability_status)
+
+    def build_subset(self, pet_names: Iterable[str]) -> Zoo:
+        """Build the Zoo of only the specified pets (and mounts).
+
+        :param pet_names: the names of the pets to build the pairs of
+        :return: the zoo of the pets that the user has the pet or the mount of
+        """
+        zoo: Zoo = {}
+        for pet_name in pet_names:
+            pair: Optional[PetMountPair] = self.build_pair(pet_name)
+            if pair is not None:
+                zoo[pet_name] = pair
+        return zoo
+
+    def iter_pairs(self, skip_unsupported_pets: bool = False, *,
+                   categories: Optional[Iterable[str]] = None
+                   ) -> Iterator[Tuple[str, PetMountPair]]:
+        """Yield the (pet name, PetMountPair) of the Zoo, one pair at a time.
 
-        # loop through the pets
+        The pets come first, followed by the mounts without a pet. This does
+        not change the pets and mounts of the builder (nor those of the user).
+
+        :param skip_unsupported_pets: if True, skip unsupported pets (excludes mounts)
+        :param categories: if given, only yield the pairs of the pets of these
+                           PetCategory categories
+        """
+        is_selected: Callable[[str], bool] = _category_selector(categories)
         for pet_name, feed_status in self.pets.items():
-            if skip_unsupported_pets and (pet_name not in PetData.pet_names):
-                logging.error(f"{pet_name=} not supported yet: skipped {pet_name}")
+            if skip_unsupported_pets and (pet_name not in get_pet_registry()):
+                logging.error(f"{pet_name=} not supported yet: skipped {pet_name}. "
+                              "Run `hopla api content` to update the pets that hopla knows.")
                 continue
-
-            pet = Pet(pet_name, feed_status=FeedStatus(feed_status))
-            if self.mounts.get(pet_name) is not None:
-                mount = Mount(
-                    mount_name=pet_name,
-                    availability_status=self.mounts[pet_name]
+            if is_selected(pet_name):
+                yield pet_name, PetMountPair(
+                    pet=Pet(pet_name, feed_status=FeedStatus(feed_status)),
+                    mount=self.__build_mount(pet_name)
                 )
-                del self.mounts[pet_name]  # no need to handle the mount twice
-            else:
-                mount = None
-            self.__zoo[pet_name] = PetMountPair(pet=pet, mount=mount)
 
-        # loop through the remaining mounts
         for mount_name, availability_status in self.mounts.items():
-            if mount_name not in self.pets:
+            if mount_name not in self.pets and is_selected(mount_name):
                 # We found a mount without a pet. This is possible for rares.
-                mount = Mount(mount_name, availability_status=availability_status)
-                self.__zoo[mount_name] = PetMountPair(pet=None, mount=mount)
+                yield mount_name, PetMountPair(
+                    pet=None, mount=Mount(mount_name, availability_status=availability_status)
+                )
+
+    def build(self, skip_unsupported_pets: bool = False, *,
+              categories: Optional[Iterable[str]] = None) -> Zoo:
+        """ Build the Zoo. Calling build() again builds the same Zoo.
 
-        return self.__zoo
+        :param skip_unsupported_pets: if True, skip unsupported pets (excludes mounts)
+        :param categories: if given, only build the pairs of the pets of these
+                           PetCategory categories
+        :return: the Zoo in case of success
+        """
+        return dict(self.iter_pairs(skip_unsupported_pets, categories=categories))
@@ -0,0 +1,112 @@
+"""
+A module with the collection completion report of a user.
+
+Every number of the report is the size of a bitset over the catalogue pet ids
+(see zoobitsets.py): the catalogue of a category, the pets and mounts that
+the user has, and the pets that the current food stockpile turns into
+mounts. A category is then a handful of & operations, not a Python predicate
+per pet.
+"""
+from typing import Any, Dict, List, NamedTuple
+
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
+from hopla.hoplalib.zoo.foodmodels import FoodStockpile, FoodStockpileBuilder
+from hopla.hoplalib.zoo.petregistry import PetCategory, get_pet_registry
+from hopla.hoplalib.zoo.zoobitsets import ZooBitsets, bitset_of, count
+from hopla.hoplalib.zoo.zoofeed_algorithms import FeedAlgorithm, FeedPlan
+
+
+class CategoryReport(NamedTuple):
+    """The completion of a single PetCategory. All the fields but category are bitsets."""
+    category: str
+    catalogue: int
+    """The pets of the category that hopla knows."""
+    pets: int
+    """The pets of the category that the user has right now."""
+    mounts: int
+    """The mounts of the category that the user has."""
+    mountable: int
+    """The pets of the category that the current stockpile turns into mounts."""
+
+    @property
+    def missing_pets(self) -> int:
+        """The pets of the category that the user doesn't have right now."""
+        return self.catalogue & ~self.pets
+
+    @property
+    def missing_mounts(self) -> int:
+        """The mounts of the category that the user doesn't have."""
+        return self.catalogue & ~self.mounts
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the counts, and the names of the missing pets and mounts."""
+        return {
+            "category": self.category,
+            "total": count(self.catalogue),
+            "pets": count(self.pets),
+            "mounts": count(self.mounts),
+            "feedable_to_mount": count(self.mountable),
+            "missing_pets": get_pet_registry().names_of(self.missing_pets),
+            "missing_mounts": get_pet_registry().names_of(self.missing_mounts),
+        }
+
+
+class CollectionReport:
+    """The completion of the collection of a user, per PetCategory.
+
+    >>> report = CollectionReport(ZooBitsets.from_pets_and_mounts(
+    ...     pets={"Wolf-Base": 45, "Fox-Base": 5}, mounts={"Fox-Base": True}
+    ... ), mountable=bitset_of(["Wolf-Base"]))
+    >>> generation1 = report.categories()[0]
+    >>> count(generation1.pets), count(generation1.mounts), count(generation1.mountable)
+    (2, 1, 1)
+    """
+
+    def __init__(self, bitsets: ZooBitsets, *, mountable: int):
+        self.bitsets = bitsets
+        self.mountable = mountable
+        """The pets that the current food stockpile turns into mounts."""
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.bitsets}, mountable={self.mountable})"
+
+    @classmethod
+    def from_user(cls, user: HabiticaUser) -> "CollectionReport":
+        """Create the report of the zoo and the food of the user."""
+        pets: Dict[str, int] = user.get_pets()
+        mounts: Dict[str, bool] = user.get_mounts()
+        stockpile: FoodStockpile = FoodStockpileBuilder().user(user).build()
+        zoo = ColumnarZoo.from_pets_and_mounts(pets=pets, mounts=mounts)
+        plan: FeedPlan = FeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan()
+        return cls(ZooBitsets.from_pets_and_mounts(pets=pets, mounts=mounts),
+                   mountable=bitset_of(item.pet_name for item in plan))
+
+    def categories(self) -> List[CategoryReport]:
+        """Return the report of every category, in the order of PetCategory.ALL."""
+        reports: List[CategoryReport] = []
+        for category in PetCategory.ALL:
+            catalogue: int = get_pet_registry().bitset(category)
+            reports.append(CategoryReport(
+                category=category,
+                catalogue=catalogue,
+                pets=self.bitsets.pets & catalogue,
+                mounts=self.bitsets.mounts & catalogue,
+                mountable=self.mountable & catalogue
+            ))
+        return reports
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the report as a dict with the report of every category."""
+        return {report.category: report.to_dict() for report in self.categories()}
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Turn the dict of CollectionReport.to_dict into a human-readable table."""
+    lines: List[str] = [f"{'category':<13}{'pets':>10}{'mounts':>10}{'feedable':>10}"]
+    for category, row in report.items():
+        lines.append(f"{category:<13}"
+                     f"{row['pets']:>5}/{row['total']:<4}"
+                     f"{row['mounts']:>5}/{row['total']:<4}"
+                     f"{row['feedable_to_mount']:>10}")
+    return "\n".join(lines)
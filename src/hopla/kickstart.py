@@ -5,6 +5,7 @@ and sets up logging.
 """
 import logging
 import sys
+from typing import List
 
 import click
 
@@ -14,10 +15,13 @@ from hopla.cli.buy.enchanted_armoire import enchanted_armoire
 from hopla.cli.cast import cast
 from hopla.cli.complete import complete
 from hopla.cli.config import config
+from hopla.cli.dashboard import dashboard
+from hopla.cli.execute import execute
 from hopla.cli.feed import feed
 from hopla.cli.feed_all import feed_all
 from hopla.cli.get_group import get_group
 from hopla.cli.get_user.auth import auth
+from hopla.cli.get_user.diff import diff
 from hopla.cli.get_user.info import info
 from hopla.cli.get_user.inventory import inventory
 from hopla.cli.get_user.stats import stats
@@ -27,14 +31,19 @@ from hopla.cli.groupcmds.buy import buy
 from hopla.cli.groupcmds.get_user import get_user
 from hopla.cli.groupcmds.hatch import hatch
 from hopla.cli.groupcmds.set import set  # pylint: disable=redefined-builtin
+from hopla.cli.groupcmds.webhook import webhook
+from hopla.cli.groupcmds.zoo import zoo
 from hopla.cli.hatch.quest_egg import quest_egg
 from hopla.cli.hatch.standard_egg import standard_egg
 from hopla.cli.hatch_all import hatch_all
 from hopla.cli.request import request
 from hopla.cli.support_development import support_development
 from hopla.cli.version import version
+from hopla.cli.zoo.query import query
+from hopla.cli.zoo.report import report
 from hopla.hoplalib.common import GlobalConstants
 from hopla.hoplalib.configuration import ConfigInitializer, ConfigurationFileParser
+from hopla.hoplalib.fleet import FleetGroup, all_profiles_option, profiles_option
 from hopla.hoplalib.hoplaversion import HoplaVersion
 
 
@@ -72,10 +81,26 @@ HOPLA_CONTEXT_SETTINGS = {
 }
 
 
-@click.group(context_settings=HOPLA_CONTEXT_SETTINGS)
+@click.group(cls=FleetGroup, context_settings=HOPLA_CONTEXT_SETTINGS)
 @click.version_option(version=HoplaVersion().semantic_version())
-def hopla():
-    """hopla - a command line interface (CLI) to interact with habitica.com"""
+@profiles_option()
+@all_profiles_option()
+def hopla(profiles: List[str], all_profiles: bool):
+    """hopla - a command line interface (CLI) to interact with habitica.com
+
+    \b
+    Multiple accounts
+    ---
+    # Feed the pets of the alice and bob profiles at the same time.
+    $ hopla --profiles alice,bob feed-all --yes
+
+    \b
+    # Get the gold of every account in the auth file.
+    $ hopla --all-profiles get-user stats gp
+    [default] 117.5
+    [alice] 21.2
+    """
+    log.debug(f"hopla {profiles=} {all_profiles=}")
 
 
 def organize_cli() -> None:
@@ -105,6 +130,12 @@ def organize_cli() -> None:
     # config
     hopla.add_command(config)
 
+    # dashboard
+    hopla.add_command(dashboard)
+
+    # execute
+    hopla.add_command(execute)
+
     # feed
     hopla.add_command(feed)
 
@@ -120,6 +151,7 @@ def organize_cli() -> None:
     get_user.add_command(stats)
     get_user.add_command(info)
     get_user.add_command(auth)
+    get_user.add_command(diff)
 
     # hatch
     hopla.add_command(hatch)
@@ -138,9 +170,17 @@ def organize_cli() -> None:
     # version
     hopla.add_command(version)
 
+    # webhook
+    hopla.add_command(webhook)
+
     # set
     hopla.add_command(set)
 
+    # zoo
+    hopla.add_command(zoo)
+    zoo.add_command(query)
+    zoo.add_command(report)
+
 
 def init_hopla_config_files() -> None:
     """Setup the config file."""
@@ -157,4 +197,5 @@ def kickstart_hopla() -> None:
     """Setup the config files, organize the CLI, and call the base command group."""
     init_hopla_config_files()
     organize_cli()
-    hopla()
+    # click fills in the parameters of the hopla group by parsing sys.argv
+    hopla()  # pylint: disable=no-value-for-parameter
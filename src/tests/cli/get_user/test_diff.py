@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import click
+import pytest
+from click.testing import CliRunner, Result
+
+from hopla.cli.get_user.diff import DurationParamType, diff
+from hopla.hoplalib.user.userhistory import UserHistoryStore
+from hopla.hoplalib.user.usermodels import HabiticaUser
+
+
+class TestDurationParamType:
+    @pytest.mark.parametrize("duration,expected", [
+        ("30m", timedelta(minutes=30)),
+        ("12h", timedelta(hours=12)),
+        ("1d", timedelta(days=1)),
+        ("2w", timedelta(weeks=2))
+    ])
+    def test_convert_ok(self, duration: str, expected: timedelta):
+        assert DurationParamType().convert(duration, None, None) == expected
+
+    @pytest.mark.parametrize("duration", ["", "1", "d", "1y", "-1d"])
+    def test_convert_fails(self, duration: str):
+        with pytest.raises(click.BadParameter):
+            DurationParamType().convert(duration, None, None)
+
+
+class TestDiffCliCommand:
+    USER_ID = "c0ffee69-dada-feed-abb1-5ca1ab1ed004"
+
+    @patch("hopla.cli.get_user.diff.AuthorizationHandler")
+    def test_diff_without_history_fails(self, mock_auth, tmp_path: Path):
+        mock_auth.return_value.user_id = self.USER_ID
+
+        with patch.dict("os.environ", {"HOPLA_HISTORY_FILE": str(tmp_path / "h.sqlite3")}):
+            result: Result = CliRunner().invoke(diff)
+
+        assert result.exit_code == 1
+        assert "hopla config cmd_all.record_history true" in result.stdout
+
+    @patch("hopla.cli.get_user.diff.AuthorizationHandler")
+    def test_diff_ok(self, mock_auth, tmp_path: Path):
+        mock_auth.return_value.user_id = self.USER_ID
+        history_file = tmp_path / "h.sqlite3"
+        store = UserHistoryStore(db_file=history_file)
+        now = datetime.now(timezone.utc)
+        store.record(HabiticaUser({"stats": {"gp": 50},
+                                   "items": {"pets": {}, "food": {"Fish": 2}}}),
+                     user_id=self.USER_ID, taken_at=now - timedelta(days=3))
+        store.record(HabiticaUser({"stats": {"gp": 20},
+                                   "items": {"pets": {"Wolf-Base": 5}, "food": {"Fish": 1}}}),
+                     user_id=self.USER_ID, taken_at=now - timedelta(hours=1))
+
+        with patch.dict("os.environ", {"HOPLA_HISTORY_FILE": str(history_file)}):
+            result: Result = CliRunner().invoke(diff, ["--since", "2d"])
+
+        assert result.exit_code == 0
+        output = json.loads(result.stdout)
+        assert output["pets_gained"] == ["Wolf-Base"]
+        assert output["food_consumed"] == {"Fish": 1}
+        assert output["gold_spent"] == 30
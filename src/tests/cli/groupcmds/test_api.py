@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner, Result
+
+from hopla.cli.groupcmds.api import content
+from hopla.hoplalib.contenttables import ContentTablesCache
+
+
+class TestApiContentCliCommand:
+
+    @patch("hopla.cli.groupcmds.api.ContentTablesCache")
+    @patch("hopla.cli.groupcmds.api.requests.get")
+    def test_content_refreshes_the_content_tables(self, mock_get: MagicMock,
+                                                  mock_cache_cls: MagicMock,
+                                                  tmp_path: Path):
+        cache = ContentTablesCache(cache_file=tmp_path / "content-tables.json")
+        mock_cache_cls.return_value = cache
+        mock_get.return_value.json.return_value = {
+            "success": True, "appVersion": "5.1.0",
+            "data": {"dropEggs": {"Wolf": {}, "Yeti": {}}}
+        }
+
+        result: Result = CliRunner().invoke(content)
+
+        assert result.exit_code == 0
+        mock_get.return_value.json.assert_called_once_with()
+        assert cache.cached_app_version() == "5.1.0"
+        assert cache.load().tables["eggs"]["drop"] == ["Wolf", "Yeti"]
+
+    @patch("hopla.cli.groupcmds.api.ContentTablesCache")
+    @patch("hopla.cli.groupcmds.api.requests.get")
+    def test_failed_content_request_keeps_the_cache(self, mock_get: MagicMock,
+                                                    mock_cache_cls: MagicMock):
+        mock_get.return_value.json.return_value = {"success": False, "message": "down"}
+
+        result: Result = CliRunner().invoke(content)
+
+        assert result.exit_code == 1
+        mock_cache_cls.return_value.refresh.assert_not_called()
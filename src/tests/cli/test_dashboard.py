@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+import json
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner, Result
+
+from hopla.cli.dashboard import dashboard
+from hopla.hoplalib.dashboard import Dashboard
+from hopla.hoplalib.user.usermodels import HabiticaUser
+
+
+class TestDashboardCliCommand:
+    DASHBOARD = Dashboard(
+        user=HabiticaUser({
+            "stats": {"class": "healer", "lvl": 7, "hp": 50, "mp": 20, "exp": 10, "gp": 3},
+            "items": {"pets": {}, "mounts": {}, "eggs": {}, "hatchingPotions": {}}
+        }),
+        party=None, api_status={"status": "up"}, todos=[]
+    )
+
+    @patch("hopla.cli.dashboard.Dashboard.fetch")
+    def test_dashboard_text(self, mock_fetch: MagicMock):
+        mock_fetch.return_value = self.DASHBOARD
+
+        result: Result = CliRunner().invoke(dashboard)
+
+        assert result.exit_code == 0
+        assert "Level 7 healer" in result.stdout
+        assert "Party: -" in result.stdout
+
+    @patch("hopla.cli.dashboard.Dashboard.fetch")
+    def test_dashboard_json(self, mock_fetch: MagicMock):
+        mock_fetch.return_value = self.DASHBOARD
+
+        result: Result = CliRunner().invoke(dashboard, ["--json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)["feedable_pets"] == 0
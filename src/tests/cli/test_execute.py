@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner, Result
+
+from hopla.cli.execute import execute
+from hopla.cli.feed_all import feed_all
+from hopla.cli.hatch_all import hatch_all
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from tests.testutils.user_test_utils import UserTestUtil
+
+
+class MockOkResponse:
+    def __init__(self, msg: str):
+        self.msg = msg
+
+    def json(self):
+        return {"success": True, "message": self.msg}
+
+
+ITEMS = {"pets": {"Wolf-Base": 35}, "food": {"Meat": 3}, "eggs": {"Fox": 1},
+         "hatch_potions": {"Red": 1}}
+USER: HabiticaUser = UserTestUtil.user_with_items(**ITEMS)
+
+
+class TestExecuteCliCommand:
+    @pytest.fixture
+    def feed_plan_file(self, tmp_path: Path) -> Path:
+        path = tmp_path / "plan.json"
+        with patch("hopla.cli.feed_all.HabiticaUserRequest.request_user_data_or_exit",
+                   return_value=USER):
+            result: Result = CliRunner().invoke(feed_all, ["--plan-out", str(path)])
+        assert result.stdout == f"Wrote the feed plan of 1 items to {path}.\n"
+        return path
+
+    @pytest.fixture
+    def hatch_plan_file(self, tmp_path: Path) -> Path:
+        path = tmp_path / "plan.json"
+        with patch("hopla.cli.hatch_all.HabiticaUserRequest.request_user_data_or_exit",
+                   return_value=USER):
+            result: Result = CliRunner().invoke(hatch_all, ["--plan-out", str(path)])
+        assert result.stdout == f"Wrote the hatch plan of 1 items to {path}.\n"
+        return path
+
+    @patch("hopla.cli.feed_all.RateLimitingAwareThrottler.perform")
+    @patch("hopla.cli.execute.HabiticaUserRequest.request_user_data_or_exit")
+    def test_execute_feed_plan_ok(self, mock_user_request: MagicMock, mock_perform: MagicMock,
+                                  feed_plan_file: Path):
+        mock_user_request.return_value = USER
+        mock_perform.return_value = MockOkResponse("You have tamed Base Wolf!")
+
+        result: Result = CliRunner().invoke(execute, [str(feed_plan_file)], input="yes")
+
+        assert result.stdout == ("Pet Wolf-Base will get 3 Meat.\n"
+                                 "Do you want to proceed? [y/N]: yes\n"
+                                 "You have tamed Base Wolf!\n")
+        assert result.exit_code == 0
+
+    @patch("hopla.cli.feed_all.RateLimitingAwareThrottler.perform")
+    @patch("hopla.cli.execute.HabiticaUserRequest.request_user_data_or_exit")
+    def test_execute_drifted_plan_refused(self, mock_user_request: MagicMock,
+                                          mock_perform: MagicMock, feed_plan_file: Path):
+        mock_user_request.return_value = UserTestUtil.user_with_items(
+            **{**ITEMS, "food": {"Meat": 5}}
+        )
+
+        result: Result = CliRunner().invoke(execute, [str(feed_plan_file), "--yes"])
+
+        assert result.exit_code == 1
+        assert "The food changed since the plan was made" in result.output
+        mock_perform.assert_not_called()
+
+    @patch("hopla.cli.feed_all.RateLimitingAwareThrottler.perform")
+    @patch("hopla.cli.execute.HabiticaUserRequest.request_user_data_or_exit")
+    def test_execute_drifted_plan_rebased(self, mock_user_request: MagicMock,
+                                          mock_perform: MagicMock, feed_plan_file: Path):
+        mock_user_request.return_value = UserTestUtil.user_with_items(
+            **{**ITEMS, "food": {"Meat": 1}}
+        )
+
+        result: Result = CliRunner().invoke(execute, [str(feed_plan_file), "--on-drift",
+                                                      "rebase", "--yes"])
+
+        assert result.stdout == ("The food changed since the plan was made. "
+                                 "Made the plan again.\n"
+                                 "The plan is empty. There is nothing to execute.\n")
+        assert result.exit_code == 0
+        mock_perform.assert_not_called()
+
+    @patch("hopla.cli.hatch_all.RateLimitingAwareThrottler.perform_and_yield_response")
+    @patch("hopla.cli.execute.HabiticaUserRequest.request_user_data_or_exit")
+    def test_execute_hatch_plan_ok(self, mock_user_request: MagicMock,
+                                   mock_throttler: MagicMock, hatch_plan_file: Path):
+        mock_user_request.return_value = USER
+        mock_throttler.return_value = iter([MockOkResponse("")])
+
+        result: Result = CliRunner().invoke(execute, [str(hatch_plan_file), "--yes"])
+
+        assert result.stdout == "Successfully hatched a Fox-Red.\n"
+        assert result.exit_code == 0
+
+    def test_execute_invalid_plan_file_fails(self, tmp_path: Path):
+        path = tmp_path / "plan.json"
+        path.write_text("[]")
+
+        result: Result = CliRunner().invoke(execute, [str(path)])
+
+        assert result.exit_code == 1
+        assert f"Can't read {path}: The plan file is not a JSON object." in result.output
@@ -1,8 +1,10 @@
+from typing import List
 from unittest.mock import MagicMock, patch
 
 import pytest
 from _pytest.capture import CaptureResult
 from click.testing import CliRunner, Result
+from requests.structures import CaseInsensitiveDict
 from requests.status_codes import codes
 
 from hopla.cli.feed import feed, get_appropriate_food_or_exit, get_feed_times_until_mount, \
@@ -17,6 +19,7 @@ class MockFeedResponse:
     def __init__(self, *, json, status_code: int = 200):
         self.__json = json
         self.status_code = status_code
+        self.headers = CaseInsensitiveDict()
 
     def json(self):
         return self.__json
@@ -94,7 +97,7 @@ class TestFeedCliCommand:
         assert f'"feed_status": {feed_status_expected},' in result.output
         assert f'"message": "{message_expected}"' in result.output
 
-    @patch("hopla.cli.feed.HabiticaUserRequest.request_user_data_or_exit")
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user_data_or_exit")
     @patch("hopla.cli.feed.FeedPostRequester.post_feed_request")
     def test_feed_pet_with_abundant_food(self, mock_feed_request: MagicMock,
                                          mock_user_request: MagicMock):
@@ -152,7 +155,7 @@ class TestFeedCliCommand:
         assert result.exit_code == 2
 
     @patch("hopla.cli.feed.FeedPostRequester")
-    @patch("hopla.cli.feed.HabiticaUserRequest.request_user_data_or_exit")
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user_data_or_exit")
     def test_feed_until_mount(self,
                               mock_user_request: MagicMock,
                               mock_feed_requester: MagicMock):
@@ -193,6 +196,120 @@ class TestFeedCliCommand:
         assert response_msg in result.stdout
         assert f'"feed_status": {response_data}' in result.stdout
 
+    @patch("hopla.cli.feed.FeedPostRequester")
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user")
+    def test_feed_magic_pet_until_mount_requests_user_once(self,
+                                                           mock_user_request: MagicMock,
+                                                           mock_feed_requester: MagicMock):
+        pet_name = "Wolf-Glow"
+        mock_user_request.return_value = MockFeedResponse(json={
+            "success": True,
+            "data": {"items": {"pets": {pet_name: 35}, "mounts": {},
+                               "food": {"Honey": 3, "Fish": 9}}}
+        })
+        mock_feed_requester.return_value.post_feed_request.return_value = MockFeedResponse(
+            json={"success": True, "data": -1, "message": "mounted"}
+        )
+
+        result: Result = CliRunner().invoke(feed, [pet_name, "--until-mount"])
+
+        assert result.exit_code == 0
+        mock_user_request.assert_called_once_with()
+        mock_feed_requester.assert_called_with(pet_name=pet_name, food_name="Fish",
+                                               food_amount=3)
+
+
+class TestFeedBatchCliCommand:
+    user = HabiticaUser({"items": {
+        "pets": {"Wolf-Base": 35, "Fox-Red": 40, "Cactus-Golden": 45},
+        "mounts": {"Cactus-Golden": True},
+        "food": {"Meat": 3, "Strawberry": 2}
+    }})
+
+    @patch("hopla.cli.feed.RateLimitingAwareThrottler.perform_and_yield_response")
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user_data_or_exit")
+    def test_feed_pets_until_mount_ok(self, mock_user_request: MagicMock,
+                                      mock_throttler: MagicMock):
+        mock_user_request.return_value = self.user
+        mock_throttler.return_value = iter([
+            MockFeedResponse(json={"success": True, "message": "Tamed Wolf-Base!"}),
+            MockFeedResponse(json={"success": True, "message": "Tamed Fox-Red!"}),
+        ])
+
+        result: Result = CliRunner().invoke(feed, ["--until-mount", "Wolf-Base", "Fox-Red"])
+
+        assert result.stdout == "Tamed Wolf-Base!\nTamed Fox-Red!\n"
+        assert result.exit_code == 0
+        mock_user_request.assert_called_once_with()
+
+    @patch("hopla.cli.feed.RateLimitingAwareThrottler.perform_and_yield_response")
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user_data_or_exit")
+    def test_feed_pets_from_stdin_with_failure(self, mock_user_request: MagicMock,
+                                               mock_throttler: MagicMock):
+        mock_user_request.return_value = self.user
+        mock_throttler.return_value = iter([
+            MockFeedResponse(json={"success": False, "error": "NotAuthorized",
+                                   "message": "Not enough food."}),
+        ])
+
+        result: Result = CliRunner().invoke(feed, ["--from-file", "-", "--times", "1"],
+                                            input="# pets\nFox-Red\n")
+
+        assert result.stdout == "Failed to feed Fox-Red\nNotAuthorized: Not enough food.\n"
+        assert result.exit_code == 1
+
+    @patch("hopla.hoplalib.zoo.petcontroller.FeedPostRequester.post_feed_request")
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user_data_or_exit")
+    def test_feed_pets_with_a_response_without_json(self, mock_user_request: MagicMock,
+                                                    mock_post_feed_request: MagicMock):
+        mock_user_request.return_value = self.user
+        # the HTML page of a gateway error has no JSON, and no rate limiting headers
+        html = MagicMock(status_code=502, headers=CaseInsensitiveDict({"Content-Type": "text/html"}))
+        html.json.side_effect = ValueError("Expecting value: line 1 column 1 (char 0)")
+        mock_post_feed_request.side_effect = [
+            html, MockFeedResponse(json={"success": True, "message": "Tamed Fox-Red!"}),
+        ]
+
+        result: Result = CliRunner().invoke(feed, ["--until-mount", "Wolf-Base", "Fox-Red"])
+
+        assert result.stdout == ("Failed to feed Wolf-Base\n"
+                                 "HTTP 502: Habitica did not answer with JSON.\n"
+                                 "Tamed Fox-Red!\n")
+        assert result.exit_code == 1
+
+    @patch("hopla.cli.feed.RateLimitingAwareThrottler.perform_and_yield_response")
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user_data_or_exit")
+    def test_feed_pets_refuses_the_whole_batch(self, mock_user_request: MagicMock,
+                                               mock_throttler: MagicMock):
+        mock_user_request.return_value = self.user
+
+        result: Result = CliRunner().invoke(feed, ["--until-mount", "Wolf-Base",
+                                                   "Cactus-Golden", "Rat-Red"])
+
+        assert result.exit_code == 1
+        assert result.output == ("Can't feed pet Cactus-Golden. You have the mount.\n"
+                                 "Can't feed pet Rat-Red. You don't have this pet.\n")
+        mock_throttler.assert_not_called()
+
+    @pytest.mark.parametrize("args,expected_msg", [
+        (["Meat", "Wolf-Base"], "Specify at most one FOOD_NAME, after the PET_NAMEs."),
+        (["Wolf-Base", "Meat", "Fish"], "Specify at most one FOOD_NAME, after the PET_NAMEs."),
+        (["Meat"], "Missing argument 'PET_NAME...'."),
+        (["Wolf-Base", "Fox-Red", "--list-favorite-food"],
+         "--list-favorite-food takes a single PET_NAME."),
+    ])
+    def test_feed_pets_usage_errors(self, args: List[str], expected_msg: str):
+        result: Result = CliRunner().invoke(feed, args)
+
+        assert result.exit_code == 2
+        assert expected_msg in result.output
+
+    def test_feed_pets_from_file_with_unknown_pet(self):
+        result: Result = CliRunner().invoke(feed, ["--from-file", "-"], input="Wolf-Nope\n")
+
+        assert result.exit_code == 2
+        assert "These are not feedable pets: Wolf-Nope" in result.output
+
 
 class TestPrintFavoriteFood:
     @pytest.mark.parametrize(
@@ -215,7 +332,7 @@ class TestPrintFavoriteFood:
 
 
 class TestGetFeedTimesUntilMount:
-    @patch("hopla.cli.feed.HabiticaUserRequest.request_user_data_or_exit")
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user_data_or_exit")
     def test_get_feed_times_until_mount_ok(self, mock_user_request: MagicMock):
         pet_name = "Rat-Red"
         food_name = "Strawberry"
@@ -237,7 +354,7 @@ class TestGetFeedTimesUntilMount:
         HabiticaUser({"items": {"pets": {PET_NAME: -1}, "mounts": {}}}),
         HabiticaUser({"items": {"pets": {PET_NAME: -1}, "mounts": {PET_NAME: None}}}),
     ])
-    @patch("hopla.cli.feed.HabiticaUserRequest.request_user_data_or_exit")
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user_data_or_exit")
     def test_get_feed_times_until_mount_no_pet_fail(self,
                                                     mock_user_request: MagicMock,
                                                     no_pet_user: HabiticaUser):
@@ -252,7 +369,7 @@ class TestGetFeedTimesUntilMount:
         )
         assert str(execinfo.value) == expected_msg
 
-    @patch("hopla.cli.feed.HabiticaUserRequest.request_user_data_or_exit")
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user_data_or_exit")
     def test_get_feed_times_until_mount_have_mount_fail(self,
                                                         mock_user_request: MagicMock):
         name = "Rat-Red"
@@ -269,7 +386,7 @@ class TestGetFeedTimesUntilMount:
         err_msg = str(execinfo.value)
         assert err_msg == f"Can't feed pet {name}. You have the mount."
 
-    @patch("hopla.cli.feed.HabiticaUserRequest.request_user_data_or_exit")
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user_data_or_exit")
     def test_get_feed_times_until_mount_pet_unfeedable_data(self,
                                                             mock_user_request: MagicMock):
         pet_name = "Phoenix-Base"  # unfeedable
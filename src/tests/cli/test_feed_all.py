@@ -5,7 +5,7 @@ from click.testing import CliRunner, Result
 from unittest.mock import patch, MagicMock
 from requests.status_codes import codes
 
-from hopla.cli.feed_all import feed_all
+from hopla.cli.feed_all import configured_strategy, feed_all
 from hopla.cli.groupcmds.get_user import HabiticaUser
 from hopla.hoplalib.hopla_option import NO_INTERACTION_OPTION_NAMES
 
@@ -19,6 +19,15 @@ class MockBadGatewayResponse:
         return self.__json
 
 
+class MockBadRequestResponse:
+    def __init__(self, msg):
+        self.status_code = codes.bad_request
+        self.__json = {"success": False, "error": "BadRequest", "message": msg}
+
+    def json(self):
+        return self.__json
+
+
 class MockOkResponse:
     def __init__(self, msg: str):
         self.status_code = codes.ok
@@ -81,13 +90,13 @@ class TestFeedAllCliCommand:
         assert result.stdout.startswith("The feed plan is empty.")
 
     @pytest.mark.parametrize("yes_response", yes_responses)
-    @patch("hopla.cli.feed_all.RateLimitingAwareThrottler.perform_and_yield_response")
-    @patch("hopla.cli.feed_all.FeedPostRequester.post_feed_request")
+    @patch("hopla.cli.feed_all.RateLimitingAwareThrottler.perform")
+    @patch("hopla.hoplalib.zoo.feedexecutor.FeedPostRequester.post_feed_request")
     @patch("hopla.cli.feed_all.HabiticaUserRequest.request_user_data_or_exit")
     def test_feed_all_ok(self,
                          mock_user_request: MagicMock,
                          mock_feed_request: MagicMock,
-                         mock_throttle_iter: MagicMock,
+                         mock_perform: MagicMock,
                          user_with_feedable_pet: HabiticaUser,
                          yes_response: str):
         # This user has a pet that can be grown into a mount by feeding 8 Fish
@@ -96,7 +105,7 @@ class TestFeedAllCliCommand:
         feed_msg = "You have tamed Skeleton Velociraptor, let's go for a ride!"
         mocked_response = MockOkResponse(msg=feed_msg)
         mock_feed_request.return_value = mocked_response
-        mock_throttle_iter.return_value = iter([mocked_response])
+        mock_perform.return_value = mocked_response
 
         runner = CliRunner()
         result: Result = runner.invoke(feed_all, input=yes_response)
@@ -108,13 +117,13 @@ class TestFeedAllCliCommand:
         assert result.exit_code == 0
 
     @pytest.mark.parametrize("force_option", NO_INTERACTION_OPTION_NAMES)
-    @patch("hopla.cli.feed_all.RateLimitingAwareThrottler.perform_and_yield_response")
-    @patch("hopla.cli.feed_all.FeedPostRequester.post_feed_request")
+    @patch("hopla.cli.feed_all.RateLimitingAwareThrottler.perform")
+    @patch("hopla.hoplalib.zoo.feedexecutor.FeedPostRequester.post_feed_request")
     @patch("hopla.cli.feed_all.HabiticaUserRequest.request_user_data_or_exit")
     def test_feed_all_force_ok(self,
                                mock_user_request: MagicMock,
                                mock_feed_request: MagicMock,
-                               mock_throttle_iter: MagicMock,
+                               mock_perform: MagicMock,
                                user_with_feedable_pet: HabiticaUser,
                                force_option: str):
         # This user has a pet that can be grown into a mount by feeding 8 Fish
@@ -123,7 +132,7 @@ class TestFeedAllCliCommand:
         feed_msg = "You have tamed Skeleton Velociraptor, let's go for a ride!"
         mocked_response = MockOkResponse(msg=feed_msg)
         mock_feed_request.return_value = mocked_response
-        mock_throttle_iter.return_value = iter([mocked_response])
+        mock_perform.return_value = mocked_response
 
         runner = CliRunner()
         result: Result = runner.invoke(feed_all, [force_option])
@@ -131,9 +140,96 @@ class TestFeedAllCliCommand:
         assert result.stdout == f"{feed_msg}\n"
         assert result.exit_code == 0
 
+    @patch("hopla.cli.feed_all.RateLimitingAwareThrottler.perform")
+    @patch("hopla.hoplalib.zoo.feedexecutor.FeedPostRequester.post_feed_request")
+    @patch("hopla.cli.feed_all.HabiticaUserRequest.request_user_data_or_exit")
+    def test_feed_all_optimal_strategy_ok(self,
+                                          mock_user_request: MagicMock,
+                                          mock_feed_request: MagicMock,
+                                          mock_perform: MagicMock):
+        # greedy feeds all the Meat to the Wolf, optimal feeds it to the 2 Bears
+        mock_user_request.return_value = HabiticaUser({"items": {
+            "pets": {"Wolf-Base": 5, "BearCub-Amber": 45, "BearCub-Aurora": 45},
+            "mounts": {},
+            "food": {"Meat": 9}
+        }})
+        feed_msg = "You have tamed a bear!"
+        mock_feed_request.return_value = MockOkResponse(msg=feed_msg)
+        mock_perform.return_value = MockOkResponse(msg=feed_msg)
+
+        runner = CliRunner()
+        result: Result = runner.invoke(feed_all, ["--strategy", "optimal", "--yes"])
+
+        assert result.stdout == f"{feed_msg}\n{feed_msg}\n"
+        assert result.exit_code == 0
+
+    @patch("hopla.cli.feed_all.RateLimitingAwareThrottler.perform")
+    @patch("hopla.cli.feed_all.HabiticaUserRequest.request_user_data_or_exit")
+    def test_feed_all_replans_after_a_failure(self, mock_user_request: MagicMock,
+                                              mock_perform: MagicMock):
+        # Habitica rejected the request for Wolf-Base as such: its Meat goes to Fox-Base
+        mock_user_request.return_value = HabiticaUser({"items": {
+            "pets": {"Wolf-Base": 45, "Fox-Base": 35},
+            "mounts": {},
+            "food": {"Meat": 3}
+        }})
+        rejected = MockBadRequestResponse(msg="Invalid pet name.")
+        tamed = MockOkResponse(msg="You have tamed Base Fox, let's go for a ride!")
+        mock_perform.side_effect = [rejected, tamed]
+
+        runner = CliRunner()
+        result: Result = runner.invoke(feed_all, ["--yes"])
+
+        assert result.stdout == ("Failed to feed Wolf-Base\n"
+                                 "BadRequest: Invalid pet name.\n"
+                                 "Replanned the rest: 1 feed items left.\n"
+                                 "You have tamed Base Fox, let's go for a ride!\n")
+        assert result.exit_code == 0
+
+    @patch("hopla.cli.feed_all.HabiticaUserRequest.request_user_data_or_exit")
+    def test_feed_all_partial_shows_the_partial_feeding(self, mock_user_request: MagicMock,
+                                                        user_with_feedable_pet: HabiticaUser):
+        mock_user_request.return_value = user_with_feedable_pet
+        user_with_feedable_pet.user_dict["items"]["food"]["Fish"] = 5
+
+        runner = CliRunner()
+        without_partial: Result = runner.invoke(feed_all, input="no")
+        with_partial: Result = runner.invoke(feed_all, ["--partial"], input="no")
+
+        assert without_partial.stdout.startswith("The feed plan is empty.")
+        assert with_partial.stdout.startswith("Pet Velociraptor-Skeleton will get 5 Fish.\n")
+        assert with_partial.exit_code == 1
+
+    @patch("hopla.cli.feed_all.RateLimitingAwareThrottler.perform")
+    @patch("hopla.cli.feed_all.ConfigurationFileParser")
+    @patch("hopla.cli.feed_all.HabiticaUserRequest.request_user_data_or_exit")
+    def test_feed_all_uses_the_configured_strategy(self, mock_user_request: MagicMock,
+                                                   mock_parser: MagicMock,
+                                                   mock_perform: MagicMock):
+        mock_user_request.return_value = HabiticaUser({"items": {
+            "pets": {"Wolf-Base": 5, "BearCub-Amber": 45, "BearCub-Aurora": 45},
+            "mounts": {},
+            "food": {"Meat": 9}
+        }})
+        mock_parser.return_value.get_full_config_name.return_value = "optimal"
+        mock_perform.return_value = MockOkResponse(msg="Yum!")
+
+        runner = CliRunner()
+        result: Result = runner.invoke(feed_all, input="no")
+
+        assert result.stdout.startswith("Pet BearCub-Amber will get 1 Meat.\n"
+                                        "Pet BearCub-Aurora will get 1 Meat.\n")
+
+    def test_feed_all_unknown_strategy_fails(self):
+        runner = CliRunner()
+        result: Result = runner.invoke(feed_all, ["--strategy", "random"])
+
+        assert result.exit_code == 2
+        assert "Invalid value for '--strategy'" in result.output
+
     @pytest.mark.parametrize("yes_response", yes_responses)
     @pytest.mark.parametrize("released_zoo_user", released_zoo_users)
-    @patch("hopla.cli.feed.HabiticaUserRequest.request_user_data_or_exit")
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user_data_or_exit")
     def test_feed_released_pets(self, mock_user_request: MagicMock,
                                 released_zoo_user: HabiticaUser,
                                 yes_response: str):
@@ -164,3 +260,19 @@ class TestFeedAllCliCommand:
             "mounts": {},
             "food": {"Fish": 20}
         }})
+
+
+class TestConfiguredStrategy:
+
+    @pytest.mark.parametrize("config_value,expected", [
+        ("optimal", "optimal"),
+        ("fewest-requests", "fewest-requests"),
+        ("greedy", "greedy"),
+        ("not-a-strategy", "greedy"),
+    ])
+    @patch("hopla.cli.feed_all.ConfigurationFileParser")
+    def test_configured_strategy(self, mock_parser: MagicMock,
+                                 config_value: str, expected: str):
+        mock_parser.return_value.get_full_config_name.return_value = config_value
+
+        assert configured_strategy() == expected
@@ -244,3 +244,30 @@ class TestRateLimitingAwareThrottler:
 
         with pytest.raises(StopIteration):
             next(generator)
+
+    @patch("hopla.hoplalib.throttling.Response")
+    def test_perform_single_request_ok(self, mock_response: MagicMock):
+        mock_response.headers = CaseInsensitiveDict(data={
+            ResponseHeaders.XRATE_LIMIT_REMAINING_HEADER_NAME: "29",
+            ResponseHeaders.XRATE_LIMIT_RESET_HEADER_NAME:
+                "Mon Oct 16 2022 13:49:39 GMT+0000 (Coordinated Universal Time)"
+        })
+        throttler = RateLimitingAwareThrottler()
+
+        response = throttler.perform(lambda: mock_response, requests_remaining=5)
+
+        assert response is mock_response
+        assert throttler._api_requests_remaining == 4
+        assert throttler._xrate_limit_remaining == 29
+        assert throttler._throttling_required() is False
+
+    def test_perform_response_without_rate_limiting_headers_keeps_the_rate_info(self):
+        # e.g. the HTML page of a gateway error
+        html = MagicMock(status_code=502, headers=CaseInsensitiveDict({"Content-Type": "text/html"}))
+        throttler = RateLimitingAwareThrottler()
+
+        response = throttler.perform(lambda: html, requests_remaining=5)
+
+        assert response is html
+        assert throttler._api_requests_remaining == 4
+        assert throttler._is_rate_initialized is False
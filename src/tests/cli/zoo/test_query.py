@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+import json
+
+from click.testing import CliRunner, Result
+
+from hopla.cli.zoo.query import query
+from tests.testutils.user_test_utils import UserTestUtil
+
+
+class TestQueryCliCommand:
+    USER = UserTestUtil.user_with_zoo(
+        pets={"Wolf-Base": 35, "Wolf-Spooky": 20, "Gryphon-Red": 45, "Gryphon-Base": 25},
+        mounts={"Gryphon-Base": True}
+    )
+
+    def test_query_names(self):
+        result: Result = CliRunner().invoke(
+            query, ["--feedable", "--category", "quest", "--min-feed-status", "31"],
+            obj=self.USER
+        )
+
+        assert result.exit_code == 0
+        assert result.stdout == "Gryphon-Red\n"
+
+    def test_query_ndjson(self):
+        result: Result = CliRunner().invoke(query, ["--egg", "Wolf", "--format", "ndjson"],
+                                            obj=self.USER)
+
+        assert result.exit_code == 0
+        rows = [json.loads(line) for line in result.stdout.splitlines()]
+        assert rows == [
+            {"name": "Wolf-Base", "category": "generation1", "egg": "Wolf", "potion": "Base",
+             "feed_status": 35, "pet": True, "mount": False},
+            {"name": "Wolf-Spooky", "category": "magic_potion", "egg": "Wolf",
+             "potion": "Spooky", "feed_status": 20, "pet": True, "mount": False},
+        ]
+
+    def test_query_json(self):
+        result: Result = CliRunner().invoke(query, ["--mount", "--format", "json"], obj=self.USER)
+
+        assert result.exit_code == 0
+        assert [row["name"] for row in json.loads(result.stdout)] == ["Gryphon-Base"]
+
+    def test_query_unknown_egg_fails(self):
+        result: Result = CliRunner().invoke(query, ["--egg", "wolf"], obj=self.USER)
+
+        assert result.exit_code == 2
+        assert "Did you mean 'Wolf'" in result.stdout
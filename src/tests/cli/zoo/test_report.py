@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+import json
+
+from click.testing import CliRunner, Result
+
+from hopla.cli.groupcmds.get_user import HabiticaUser
+from hopla.cli.zoo.report import report
+
+
+class TestReportCliCommand:
+    USER = HabiticaUser({"items": {"pets": {"Wolf-Base": 45}, "mounts": {"Fox-Base": True},
+                                   "food": {"Meat": 3}}})
+
+    def test_report_text(self):
+        result: Result = CliRunner().invoke(report, obj=self.USER)
+
+        assert result.exit_code == 0
+        assert result.stdout.splitlines()[0].split() == ["category", "pets", "mounts",
+                                                         "feedable"]
+        assert result.stdout.splitlines()[1].startswith("generation1")
+
+    def test_report_json(self):
+        result: Result = CliRunner().invoke(report, ["--json"], obj=self.USER)
+
+        assert result.exit_code == 0
+        generation1 = json.loads(result.stdout)["generation1"]
+        assert (generation1["pets"], generation1["mounts"]) == (1, 1)
+        assert generation1["feedable_to_mount"] == 1
+        assert "Fox-Base" in generation1["missing_pets"]
+        assert "Fox-Base" not in generation1["missing_mounts"]
@@ -230,3 +230,15 @@ class TestEggCollection:
             egg2_name: egg2_quantity, egg3_name: egg3_quantity, egg4_name: egg4_quantity
         })
         assert result == expected
+
+    def test_snapshot(self):
+        collection = EggCollection({"Wolf": 2, "Fox": 1})
+
+        before = collection.snapshot()
+        collection.remove_egg(Egg("Wolf"))
+        after = collection.snapshot()
+
+        assert before.as_dict() == {"Fox": 1, "Wolf": 2}
+        assert after.as_dict() == {"Fox": 1, "Wolf": 1}
+        assert before.fingerprint != after.fingerprint
+        assert before == EggCollection({"Fox": 1, "Wolf": 2}).snapshot()
@@ -197,3 +197,14 @@ class TestHatchPotionCollection:
 
         expected_msg = f"{not_found_potion_name} was not in the collection "
         assert str(exec_info.value).startswith(expected_msg)
+
+    def test_snapshot(self):
+        collection = HatchPotionCollection({"Base": 2, "Shimmer": 1})
+
+        before = collection.snapshot()
+        collection.remove_hatch_potion(HatchPotion("Base"))
+
+        assert before.as_dict() == {"Base": 2, "Shimmer": 1}
+        assert collection.snapshot().as_dict() == {"Base": 1, "Shimmer": 1}
+        assert before.fingerprint != collection.snapshot().fingerprint
+        assert hash(before) == hash(HatchPotionCollection({"Shimmer": 1, "Base": 2}).snapshot())
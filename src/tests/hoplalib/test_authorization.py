@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hopla.hoplalib.authorization import ActiveProfile, AuthorizationHandler, HoplaAuthFile
+
+
+class TestHoplaAuthFile:
+    def test_file_path_reads_environment_at_init(self, tmp_path: Path):
+        auth_file = tmp_path / "other-auth.conf"
+
+        with patch.dict("os.environ", {"HOPLA_AUTH_FILE": str(auth_file)}):
+            result = HoplaAuthFile().file_path
+
+        assert result == auth_file.resolve()
+
+
+class TestAuthorizationHandler:
+    user_id = uuid.UUID("c0ffee69-dada-feed-abb1-5ca1ab1ed004")
+    api_token = uuid.UUID("c0ffee69-dada-feed-abb1-5ca1ab1ed005")
+
+    def test_set_credentials_keeps_other_profiles(self, auth_file: HoplaAuthFile):
+        AuthorizationHandler(auth_file=auth_file).set_hopla_credentials(
+            user_id=self.user_id, api_token=self.api_token
+        )
+        AuthorizationHandler(auth_file=auth_file, profile="alice").set_hopla_credentials(
+            user_id=self.api_token, api_token=self.user_id
+        )
+
+        default_handler = AuthorizationHandler(auth_file=auth_file)
+        alice_handler = AuthorizationHandler(auth_file=auth_file, profile="alice")
+        assert default_handler.user_id == str(self.user_id)
+        assert default_handler.api_token == str(self.api_token)
+        assert alice_handler.user_id == str(self.api_token)
+        assert alice_handler.api_token == str(self.user_id)
+        assert default_handler.profile_names() == ["default", "alice"]
+
+    def test_active_profile_selects_credentials(self, auth_file: HoplaAuthFile):
+        AuthorizationHandler(auth_file=auth_file, profile="bob").set_hopla_credentials(
+            user_id=self.user_id, api_token=self.api_token
+        )
+
+        ActiveProfile.set("bob")
+        try:
+            handler = AuthorizationHandler(auth_file=auth_file)
+        finally:
+            ActiveProfile.set(None)
+
+        assert handler.credentials_section == "credentials.bob"
+        assert handler.user_id == str(self.user_id)
+
+    def test_missing_profile_exits(self, auth_file: HoplaAuthFile, capsys):
+        AuthorizationHandler(auth_file=auth_file).set_hopla_credentials(
+            user_id=self.user_id, api_token=self.api_token
+        )
+
+        with pytest.raises(SystemExit):
+            _ = AuthorizationHandler(auth_file=auth_file, profile="nobody").user_id
+
+        assert "hopla authenticate --profile nobody" in capsys.readouterr().out
+
+    @pytest.fixture
+    def auth_file(self, tmp_path: Path) -> HoplaAuthFile:
+        with patch.dict("os.environ", {"HOPLA_AUTH_FILE": str(tmp_path / "auth.conf")}):
+            return HoplaAuthFile()
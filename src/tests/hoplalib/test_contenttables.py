@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hopla.hoplalib.contenttables import (ContentTables, ContentTablesCache,
+                                          extract_content_tables)
+
+
+def _content() -> dict:
+    return {
+        "petInfo": {
+            "Wolf-Base": {"key": "Wolf-Base", "type": "drop"},
+            "Wolf-Aurora": {"key": "Wolf-Aurora", "type": "premium"},
+            "Yeti-Base": {"key": "Yeti-Base", "type": "quest"},
+            "Wolf-Veggie": {"key": "Wolf-Veggie", "type": "wacky"},
+            "Orca-Base": {"key": "Orca-Base", "type": "special"},
+            "Kraken-Base": {"key": "Kraken-Base", "type": "special"},
+        },
+        "dropEggs": {"Wolf": {}},
+        "questEggs": {"Yeti": {}},
+        "dropHatchingPotions": {"Base": {}},
+        "premiumHatchingPotions": {"Aurora": {}},
+        "wackyHatchingPotions": {"Veggie": {}},
+        "food": {
+            "Meat": {"target": "Base", "canDrop": True},
+            "Saddle": {"canDrop": False},
+        },
+        "spells": {
+            "warrior": {"smash": {"mana": 10, "target": "task"},
+                        "defensiveStance": {"mana": 20, "target": "self"}},
+            "wizard": {"earth": {"mana": 35, "target": "party"}},
+            "special": {"snowball": {"mana": 0, "target": "user"}},
+        },
+    }
+
+
+class TestExtractContentTables:
+
+    def test_extract_content_tables(self):
+        tables: dict = extract_content_tables(_content())
+
+        assert tables == {
+            "pets": {"drop": ["Wolf-Base"], "premium": ["Wolf-Aurora"], "quest": ["Yeti-Base"],
+                     "wacky": ["Wolf-Veggie"], "special": ["Kraken-Base", "Orca-Base"]},
+            "eggs": {"drop": ["Wolf"], "quest": ["Yeti"]},
+            "hatchingPotions": {"drop": ["Base"], "premium": ["Aurora"], "wacky": ["Veggie"]},
+            "food": {"Meat": "Base"},
+            "spells": {"warrior": {"defensiveStance": 20}, "wizard": {"earth": 35},
+                       "healer": {}, "rogue": {}},
+        }
+
+    def test_extract_empty_content(self):
+        tables: dict = extract_content_tables({})
+
+        assert tables["eggs"] == {"drop": [], "quest": []}
+        assert tables["spells"]["healer"] == {}
+
+
+class TestContentTables:
+
+    def test_empty_tables_keep_the_hardcoded_data(self):
+        tables = ContentTables()
+
+        assert tables.extend(["Wolf"], "eggs", "drop") == ["Wolf"]
+        assert tables.extend_spell_book({"heal": 15}, "healer") == {"heal": 15}
+        assert tables.extend_favorite_food({"Base": "Meat"}) == {"Base": "Meat"}
+
+    def test_extend_appends_new_names_only(self):
+        tables = ContentTables(extract_content_tables(_content()))
+
+        result = tables.extend(["Orca-Base", "Phoenix-Base"], "pets", "special")
+
+        assert result == ["Orca-Base", "Phoenix-Base", "Kraken-Base"]
+
+    def test_extend_skips_known_names(self):
+        tables = ContentTables(extract_content_tables(_content()))
+
+        result = tables.extend([], "pets", "special", known=["Orca-Base"])
+
+        assert result == ["Kraken-Base"]
+
+    def test_extend_spell_book_uses_the_mana_of_the_content(self):
+        tables = ContentTables(extract_content_tables(_content()))
+
+        result = tables.extend_spell_book({"defensiveStance": 25, "intimidate": 15}, "warrior")
+
+        assert result == {"defensiveStance": 20, "intimidate": 15}
+
+    def test_extend_favorite_food_keeps_the_mapped_potions(self):
+        tables = ContentTables({"food": {"Cake_Base": "Base", "Cheese": "Gold"}})
+
+        result = tables.extend_favorite_food({"Base": "Meat"})
+
+        assert result == {"Base": "Meat", "Gold": "Cheese"}
+
+
+class TestContentTablesCache:
+
+    @pytest.fixture
+    def cache(self, tmp_path: Path) -> ContentTablesCache:
+        return ContentTablesCache(cache_file=tmp_path / "content-tables.json")
+
+    def test_load_without_cache_returns_empty_tables(self, cache: ContentTablesCache):
+        tables: ContentTables = cache.load()
+
+        assert tables.tables == {}
+        assert tables.app_version is None
+        assert cache.cached_app_version() is None
+
+    def test_refresh_then_load(self, cache: ContentTablesCache):
+        refreshed: bool = cache.refresh(_content(), app_version="5.1.0")
+
+        assert refreshed is True
+        tables: ContentTables = cache.load()
+        assert tables.app_version == "5.1.0"
+        assert tables.tables == extract_content_tables(_content())
+
+    def test_refresh_is_keyed_by_app_version(self, cache: ContentTablesCache):
+        cache.refresh(_content(), app_version="5.1.0")
+
+        assert cache.refresh({}, app_version="5.1.0") is False
+        assert cache.load().tables["eggs"]["drop"] == ["Wolf"]
+
+        assert cache.refresh({}, app_version="5.2.0") is True
+        assert cache.load().tables["eggs"]["drop"] == []
+
+    def test_broken_cache_is_ignored(self, cache: ContentTablesCache):
+        cache.cache_file.write_text("{not json", encoding="utf-8")
+
+        assert cache.load().tables == {}
+
+    def test_cache_of_another_format_is_ignored(self, cache: ContentTablesCache):
+        cache.refresh(_content(), app_version="5.1.0")
+
+        with patch.object(ContentTablesCache, "TABLES_FORMAT", ContentTablesCache.TABLES_FORMAT + 1):
+            assert cache.load().tables == {}
+            assert cache.refresh(_content(), app_version="5.1.0") is True
+
+    def test_refresh_failure_is_not_fatal(self, tmp_path: Path):
+        not_a_dir: Path = tmp_path / "file"
+        not_a_dir.write_text("", encoding="utf-8")
+        cache = ContentTablesCache(cache_file=not_a_dir / "content-tables.json")
+
+        assert cache.refresh(_content(), app_version="5.1.0") is False
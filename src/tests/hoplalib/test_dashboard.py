@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hopla.hoplalib.authorization import ActiveProfile
+from hopla.hoplalib.dashboard import Dashboard, fetch_concurrently, format_summary
+from hopla.hoplalib.user.usermodels import HabiticaUser
+
+
+class TestFetchConcurrently:
+    def test_fetchers_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetcher(value: int):
+            return lambda: (barrier.wait(), value)[1]
+
+        result = fetch_concurrently({"a": fetcher(1), "b": fetcher(2), "c": fetcher(3)})
+
+        assert result == {"a": 1, "b": 2, "c": 3}
+
+    def test_fetchers_use_profile_of_caller(self):
+        ActiveProfile.set("alice")
+        try:
+            result = fetch_concurrently({"profile": ActiveProfile.get})
+        finally:
+            ActiveProfile.set(None)
+
+        assert result == {"profile": "alice"}
+
+    def test_exit_in_fetcher_propagates(self):
+        def failing_fetcher():
+            time.sleep(0.01)
+            raise SystemExit("The habitica API call failed")
+
+        with pytest.raises(SystemExit):
+            fetch_concurrently({"ok": lambda: 1, "failing": failing_fetcher})
+
+
+class TestDashboard:
+    NOW = datetime(2021, 6, 10, 12, 0, tzinfo=timezone.utc)
+
+    @pytest.fixture
+    def dashboard(self) -> Dashboard:
+        user = HabiticaUser({
+            "stats": {"class": "wizard", "lvl": 42, "hp": 40.5, "mp": 70, "exp": 300, "gp": 12.5},
+            "party": {"quest": {"progress": {"up": 12.25}}},
+            "items": {
+                "pets": {"Wolf-Base": 5, "Fox-Base": 10, "Cactus-Base": -1},
+                "mounts": {"Fox-Base": True, "Cactus-Base": True},
+                "eggs": {"Wolf": 1, "BearCub": 1},
+                "hatchingPotions": {"Base": 1, "Red": 1}
+            }
+        })
+        party = {"name": "The Party", "quest": {"key": "rat", "active": True,
+                                                "progress": {"hp": 800}}}
+        todos = [{"text": "overdue", "date": "2021-06-01T22:00:00.000Z"},
+                 {"text": "later", "date": "2021-07-01T22:00:00.000Z"},
+                 {"text": "no date"}]
+        return Dashboard(user=user, party=party, api_status={"status": "up"}, todos=todos)
+
+    def test_to_dict(self, dashboard: Dashboard):
+        result = dashboard.to_dict(now=self.NOW)
+
+        assert result == {
+            "api_status": "up",
+            "stats": {"class": "wizard", "lvl": 42, "hp": 40.5, "mp": 70, "exp": 300, "gp": 12.5},
+            "party": "The Party",
+            "quest": {"key": "rat", "active": True, "progress": {"hp": 800},
+                      "pending_damage": 12.25},
+            "feedable_pets": 1,
+            "hatchable_pets": 2,
+            "due_todos": ["overdue"]
+        }
+
+    def test_to_dict_without_party(self, dashboard: Dashboard):
+        no_party = Dashboard(user=dashboard.user, party=None,
+                             api_status={"status": "up"}, todos=[])
+
+        result = no_party.to_dict(now=self.NOW)
+
+        assert result["party"] is None
+        assert result["quest"] is None
+
+    def test_format_summary(self, dashboard: Dashboard):
+        result: str = format_summary(dashboard.to_dict(now=self.NOW))
+
+        assert "Level 42 wizard: hp=40 mp=70 exp=300 gp=12.50" in result
+        assert "Quest: rat (active), progress={'hp': 800}, pending damage=12.2" in result
+        assert result.endswith("Due To-Dos: 1\n  - overdue")
+
+    @patch("hopla.hoplalib.dashboard.request_api_status_or_exit")
+    @patch("hopla.hoplalib.dashboard.request_party_or_none")
+    @patch("hopla.hoplalib.dashboard.UserTasksRequest.get_tasks_data_or_exit")
+    @patch("hopla.hoplalib.dashboard.HabiticaUserRequest.request_user_data_or_exit")
+    def test_fetch(self, mock_user: MagicMock, mock_tasks: MagicMock,
+                   mock_party: MagicMock, mock_status: MagicMock):
+        mock_user.return_value = HabiticaUser({})
+        mock_tasks.return_value = []
+        mock_party.return_value = None
+        mock_status.return_value = {"status": "up"}
+
+        result = Dashboard.fetch()
+
+        assert result == Dashboard(user=HabiticaUser({}), party=None,
+                                   api_status={"status": "up"}, todos=[])
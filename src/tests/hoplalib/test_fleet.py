@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+import sys
+import time
+from io import BytesIO, StringIO
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import click
+import pytest
+from click.testing import CliRunner, Result
+
+from hopla.hoplalib.authorization import ActiveProfile
+from hopla.hoplalib.fleet import FleetGroup, FleetRunner, ProfileRunResult, \
+    ProfileTaggedStream, all_profiles_option, parse_profiles, profiles_option
+
+
+class TestProfileTaggedStream:
+    def test_write_tags_lines_with_active_profile(self):
+        buffer = StringIO()
+        stream = ProfileTaggedStream(buffer)
+
+        ActiveProfile.set("alice")
+        try:
+            stream.write("hello\nworld\n")
+        finally:
+            ActiveProfile.set(None)
+
+        assert buffer.getvalue() == "[alice] hello\n[alice] world\n"
+
+    def test_write_holds_incomplete_line_until_flush(self):
+        buffer = StringIO()
+        stream = ProfileTaggedStream(buffer)
+
+        ActiveProfile.set("bob")
+        try:
+            stream.write("Do you want to proceed? ")
+            assert buffer.getvalue() == ""
+            stream.flush()
+            stream.write("yes\n")
+        finally:
+            ActiveProfile.set(None)
+
+        assert buffer.getvalue() == "[bob] Do you want to proceed? yes\n"
+
+    def test_write_without_profile_is_untagged(self):
+        buffer = StringIO()
+
+        ProfileTaggedStream(buffer).write("plain\n")
+
+        assert buffer.getvalue() == "plain\n"
+
+    def test_write_bytes_fails(self):
+        with pytest.raises(TypeError):
+            ProfileTaggedStream(StringIO()).write(b"")
+
+
+class TestFleetRunner:
+    def test_run_tags_output_per_profile(self, capsys):
+        def echo_profile():
+            click.echo(f"I am {ActiveProfile.get()}")
+            return ActiveProfile.get()
+
+        results: List[ProfileRunResult] = FleetRunner(["alice", "bob"]).run(echo_profile)
+
+        captured = capsys.readouterr()
+        assert "[alice] I am alice\n" in captured.out
+        assert "[bob] I am bob\n" in captured.out
+        assert results == [ProfileRunResult("alice", 0, "alice"),
+                           ProfileRunResult("bob", 0, "bob")]
+        assert ActiveProfile.get() is None
+
+    def test_run_is_concurrent(self):
+        sleep_seconds = 0.2
+        profiles = ["a", "b", "c", "d"]
+
+        start = time.monotonic()
+        FleetRunner(profiles).run(lambda: time.sleep(sleep_seconds))
+        elapsed = time.monotonic() - start
+
+        assert elapsed < sleep_seconds * len(profiles) / 2
+
+    def test_run_restores_streams(self):
+        stdout, stderr = sys.stdout, sys.stderr
+
+        FleetRunner(["alice"]).run(lambda: None)
+
+        assert sys.stdout is stdout
+        assert sys.stderr is stderr
+
+    @pytest.mark.parametrize("exception,expected_exit_code", [
+        (SystemExit(), 0),
+        (SystemExit(3), 3),
+        (SystemExit("The habitica API call failed"), 1),
+        (click.Abort(), 1),
+        (click.UsageError("wrong"), 2),
+        (click.exceptions.Exit(4), 4),
+    ])
+    def test_run_captures_exits(self, exception: BaseException, expected_exit_code: int):
+        def fail():
+            raise exception
+
+        results: List[ProfileRunResult] = FleetRunner(["alice"]).run(fail)
+
+        assert results == [ProfileRunResult("alice", expected_exit_code)]
+
+
+class TestParseProfiles:
+    @pytest.mark.parametrize("value,expected", [
+        (None, []),
+        ("alice", ["alice"]),
+        ("alice,bob", ["alice", "bob"]),
+        (" alice , bob ,", ["alice", "bob"]),
+    ])
+    def test_parse_profiles(self, value, expected: List[str]):
+        assert parse_profiles(None, None, value) == expected
+
+
+@click.group(cls=FleetGroup)
+@profiles_option()
+@all_profiles_option()
+def fleet_group(profiles: List[str], all_profiles: bool):
+    """A group to test the FleetGroup with."""
+
+
+@fleet_group.command()
+@click.argument("word")
+def shout(word: str):
+    """Echo the word and the active profile."""
+    if ActiveProfile.get() == "broken":
+        sys.exit("this profile is broken")
+    click.echo(f"{word.upper()} from {ActiveProfile.get()}")
+
+
+class SlowStdin(BytesIO):
+    """A stdin that takes a while to read from, like a user who reads the plan first."""
+
+    def read(self, size=-1):
+        time.sleep(0.05)
+        return super().read(size)
+
+    def read1(self, size=-1):
+        time.sleep(0.05)
+        return super().read1(size)
+
+
+@fleet_group.command()
+def feed_everything():
+    """Ask for confirmation like feed-all, and echo what the profile does."""
+    profile = ActiveProfile.get()
+    time.sleep(0.05)  # let the other profiles reach their prompt too
+    if click.confirm(f"Feed all the pets of {profile}?"):
+        click.echo(f"fed the pets of {profile}")
+    else:
+        click.echo(f"left the pets of {profile} alone")
+
+
+class TestFleetGroup:
+    def test_invoke_with_profiles_prompts_one_profile_at_a_time(self):
+        result: Result = CliRunner().invoke(
+            fleet_group, ["--profiles", "alice,bob", "feed-everything"],
+            input=SlowStdin(b"y\nn\n")
+        )
+
+        assert result.exit_code == 0
+        lines: List[str] = result.output.splitlines()
+        assert len(lines) == 4
+        first, second = ("alice", "bob") if lines[0].startswith("[alice]") else ("bob", "alice")
+        # every profile acts on the answer that was typed right after its own prompt
+        assert f"[{first}] Feed all the pets of {first}? [y/N]: y" in lines
+        assert f"[{first}] fed the pets of {first}" in lines
+        assert f"[{second}] Feed all the pets of {second}? [y/N]: n" in lines
+        assert f"[{second}] left the pets of {second} alone" in lines
+        assert click.confirm is click.termui.confirm  # the prompts are restored
+
+    def test_invoke_without_profiles(self):
+        result: Result = CliRunner().invoke(fleet_group, ["shout", "hi"])
+
+        assert result.exit_code == 0
+        assert result.output == "HI from None\n"
+
+    def test_invoke_with_profiles(self):
+        result: Result = CliRunner().invoke(fleet_group, ["--profiles", "alice,bob", "shout", "hi"])
+
+        assert result.exit_code == 0
+        assert sorted(result.output.splitlines()) == ["[alice] HI from alice",
+                                                      "[bob] HI from bob"]
+
+    def test_invoke_with_failing_profile(self):
+        result: Result = CliRunner(mix_stderr=True).invoke(
+            fleet_group, ["--profiles", "alice,broken", "shout", "hi"]
+        )
+
+        assert result.exit_code == 1
+        assert "[alice] HI from alice\n" in result.output
+        assert "[broken] this profile is broken\n" in result.output
+
+    def test_invoke_with_all_profiles(self, tmp_path: Path):
+        auth_file = tmp_path / "auth.conf"
+        auth_file.write_text("[credentials]\nuser_id = 1\napi_token = 2\n"
+                             "[credentials.alice]\nuser_id = 3\napi_token = 4\n")
+
+        with patch.dict("os.environ", {"HOPLA_AUTH_FILE": str(auth_file)}):
+            result: Result = CliRunner().invoke(fleet_group, ["--all-profiles", "shout", "hi"])
+
+        assert result.exit_code == 0
+        assert sorted(result.output.splitlines()) == ["[alice] HI from alice",
+                                                      "[default] HI from default"]
+
+    def test_invoke_with_all_profiles_without_profiles_fails(self, tmp_path: Path):
+        with patch.dict("os.environ", {"HOPLA_AUTH_FILE": str(tmp_path / "missing.conf")}):
+            result: Result = CliRunner().invoke(fleet_group, ["--all-profiles", "shout", "hi"])
+
+        assert result.exit_code == 2
+        assert "the auth file has no credential profiles" in result.output
@@ -1,10 +1,69 @@
 #!/usr/bin/env python3
 from typing import Callable
+from unittest.mock import MagicMock
 
-from hopla.hoplalib.hopla_option import no_interactive_option
+import click
+import pytest
+
+from hopla.hoplalib.hopla_option import LazyChoice, no_interactive_option
 
 
 class TestNoInteractiveOption:
     def test_no_interactive_option(self):
         f = no_interactive_option()
         assert isinstance(f, Callable)
+
+
+class TestLazyChoice:
+    def test_choices_are_computed_once_on_first_use(self):
+        get_choices = MagicMock(return_value=["Wolf-Base", "Fox-Base"])
+        choice = LazyChoice(get_choices)
+        get_choices.assert_not_called()
+
+        assert choice.convert("Wolf-Base", None, None) == "Wolf-Base"
+        assert choice.convert("Fox-Base", None, None) == "Fox-Base"
+        get_choices.assert_called_once()
+
+    def test_invalid_choice_fails(self):
+        choice = LazyChoice(lambda: ["Wolf-Base"])
+
+        with pytest.raises(click.BadParameter):
+            choice.convert("Wolf-Nope", None, None)
+
+    def test_invalid_choice_suggests_close_choices(self):
+        choice = LazyChoice(lambda: ["Wolf-Base", "Fox-Base", "Owl-Red"])
+
+        with pytest.raises(click.BadParameter) as exec_info:
+            choice.convert("Wolf-Bsae", None, None)
+
+        assert "Did you mean 'Wolf-Base'" in str(exec_info.value)
+
+    def test_invalid_choice_lists_few_choices_only(self):
+        few = LazyChoice(lambda: ["Wolf-Base", "Fox-Base"])
+        many = LazyChoice(lambda: [f"Pet{i}" for i in range(100)])
+
+        with pytest.raises(click.BadParameter) as few_info:
+            few.convert("Zzzzz", None, None)
+        with pytest.raises(click.BadParameter) as many_info:
+            many.convert("Zzzzz", None, None)
+
+        assert "'Wolf-Base', 'Fox-Base'" in str(few_info.value)
+        assert "Press TAB" in str(many_info.value)
+
+    def test_case_insensitive_choice(self):
+        choice = LazyChoice(lambda: ["Wolf-Base"], case_sensitive=False)
+
+        assert choice.convert("wolf-BASE", None, None) == "Wolf-Base"
+
+    @pytest.mark.parametrize("incomplete,expected", [
+        ("", ["Fox-Base", "Wolf-Base", "Wolf-Red"]),
+        ("Wolf-", ["Wolf-Base", "Wolf-Red"]),
+        ("wolf-r", ["Wolf-Red"]),
+        ("Yeti", []),
+    ])
+    def test_shell_complete(self, incomplete: str, expected: list):
+        choice = LazyChoice(lambda: ["Wolf-Base", "Wolf-Red", "Fox-Base"])
+
+        items = choice.shell_complete(None, None, incomplete)
+
+        assert [item.value for item in items] == expected
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+import pytest
+
+from hopla.hoplalib.nameindex import NameIndex
+from hopla.hoplalib.zoo.petdata import PetData
+
+
+class TestNameIndex:
+    index = NameIndex(PetData.pet_names)
+
+    def test_contains_every_name_once(self):
+        assert len(self.index) == len(set(PetData.pet_names))
+        assert list(self.index) == sorted(set(PetData.pet_names))
+        assert "Wolf-Base" in self.index
+        assert "wolf-base" not in self.index
+
+    @pytest.mark.parametrize("prefix", ["", "W", "Wolf", "Wolf-", "Wolf-Base", "Gryphon-R", "Z"])
+    def test_with_prefix_agrees_with_a_scan(self, prefix: str):
+        expected = sorted(name for name in set(PetData.pet_names) if name.startswith(prefix))
+
+        assert self.index.with_prefix(prefix) == expected
+
+    @pytest.mark.parametrize("prefix", ["wOLF-", "gryphon-r", "BEARCUB"])
+    def test_with_prefix_case_insensitive(self, prefix: str):
+        expected = sorted(name for name in set(PetData.pet_names)
+                          if name.lower().startswith(prefix.lower()))
+
+        assert sorted(self.index.with_prefix(prefix, case_sensitive=False)) == expected
+
+    @pytest.mark.parametrize("name,expected_first", [
+        ("wolf-base", "Wolf-Base"),
+        ("Wolf-Bsae", "Wolf-Base"),
+        ("Gryphon-redd", "Gryphon-Red"),
+    ])
+    def test_suggestions(self, name: str, expected_first: str):
+        suggestions = self.index.suggestions(name)
+
+        assert suggestions[0] == expected_first
+        assert len(suggestions) <= 3
+
+    def test_no_suggestions(self):
+        assert not self.index.suggestions("0123456789")
+
+    def test_empty_index(self):
+        index = NameIndex([])
+
+        assert index.with_prefix("") == []
+        assert index.suggestions("Wolf-Base") == []
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from hopla.hoplalib.hatchery.hatchalgorithms import HatchPlan
+from hopla.hoplalib.hatchery.eggmodels import Egg
+from hopla.hoplalib.hatchery.hatchpotionmodels import HatchPotion
+from hopla.hoplalib.planfile import (FEED_PLAN, HATCH_PLAN, InvalidPlanFile, PlanFile,
+                                     feed_state, hatch_state)
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.zoo.zoofeed_algorithms import FeedPlan, FeedPlanItem
+from tests.testutils.user_test_utils import UserTestUtil
+
+ITEMS = {"pets": {"Wolf-Base": 35}, "food": {"Meat": 2}, "eggs": {"Fox": 1},
+         "hatch_potions": {"Red": 1}}
+USER: HabiticaUser = UserTestUtil.user_with_items(**ITEMS)
+
+
+class TestStates:
+    def test_feed_state(self):
+        assert feed_state(USER) == feed_state(UserTestUtil.user_with_items(**{**ITEMS, "eggs": {}}))
+        assert feed_state(USER) != feed_state(UserTestUtil.user_with_items(**{**ITEMS, "food": {"Meat": 1}}))
+        assert feed_state(USER) != feed_state(
+            UserTestUtil.user_with_items(**{**ITEMS, "pets": {"Wolf-Base": 40}})
+        )
+
+    def test_hatch_state(self):
+        assert hatch_state(USER) == hatch_state(UserTestUtil.user_with_items(**{**ITEMS, "food": {}}))
+        assert hatch_state(USER) != hatch_state(UserTestUtil.user_with_items(**{**ITEMS, "eggs": {"Fox": 2}}))
+        assert hatch_state(USER) != hatch_state(UserTestUtil.user_with_items(**{**ITEMS, "hatch_potions": {}}))
+
+
+class TestPlanFile:
+    def test_feed_plan_round_trip(self, tmp_path: Path):
+        plan = FeedPlan()
+        plan.add_to_feed_plan(pet_name="Wolf-Base", food_name="Meat", times=2)
+        path = tmp_path / "plan.json"
+
+        PlanFile.of_feed_plan(plan, user=USER, strategy="optimal", partial=True).write(path)
+        plan_file = PlanFile.read(path)
+
+        assert plan_file.kind == FEED_PLAN
+        assert plan_file.options == {"strategy": "optimal", "partial": True}
+        assert plan_file.feed_plan().feed_plan == [
+            FeedPlanItem(pet_name="Wolf-Base", food_name="Meat", times=2)
+        ]
+        assert plan_file.drift(USER) == []
+
+    def test_hatch_plan_round_trip(self, tmp_path: Path):
+        plan = HatchPlan().add(egg=Egg("Fox"), potion=HatchPotion("Red"))
+        path = tmp_path / "plan.json"
+
+        PlanFile.of_hatch_plan(plan, user=USER).write(path)
+        plan_file = PlanFile.read(path)
+
+        assert plan_file.kind == HATCH_PLAN
+        assert plan_file.hatch_plan() == plan
+        assert plan_file.drift(USER) == []
+
+    @pytest.mark.parametrize("user,expected_drift", [
+        (UserTestUtil.user_with_items(**{**ITEMS, "food": {"Meat": 1}}), ["food"]),
+        (UserTestUtil.user_with_items(**{**ITEMS, "pets": {}, "food": {}}), ["zoo", "food"]),
+        (UserTestUtil.user_with_items(**{**ITEMS, "eggs": {}}), []),
+    ])
+    def test_feed_plan_drift(self, user: HabiticaUser, expected_drift: List[str]):
+        plan_file = PlanFile.of_feed_plan(FeedPlan(), user=USER)
+
+        assert plan_file.drift(user) == expected_drift
+
+    @pytest.mark.parametrize("text,expected_msg", [
+        ("{", "The plan file is not valid JSON"),
+        ("[]", "The plan file is not a JSON object."),
+        ('{"version": 2, "kind": "feed"}', "Unsupported plan file version: 2"),
+        ('{"version": 1, "kind": "buy"}', "Unknown kind of plan: 'buy'"),
+        ('{"version": 1, "kind": "feed", "items": [{"pet_name": "Wolf-Base"}]}',
+         "The plan file has an invalid item"),
+        ('{"version": 1, "kind": "hatch", "items": [{"egg": "Wolf", "potion": "Nope"}]}',
+         "The plan file has an invalid item"),
+    ])
+    def test_from_json_invalid(self, text: str, expected_msg: str):
+        with pytest.raises(InvalidPlanFile) as exec_info:
+            PlanFile.from_json(text)
+
+        assert str(exec_info.value).startswith(expected_msg)
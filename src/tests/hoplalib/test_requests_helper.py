@@ -4,7 +4,7 @@ import pytest
 
 import requests
 
-from hopla.hoplalib.requests_helper import get_data_or_exit
+from hopla.hoplalib.requests_helper import get_data_or_exit, json_or_failure
 
 
 class TestRequestHelperModule:
@@ -39,3 +39,25 @@ class TestRequestHelperModule:
         response.json.assert_called_once()
         expected_exit_msg = f"The habitica API call failed: status_code={response.status_code}"
         assert ex.value.code == expected_exit_msg
+
+
+class TestJsonOrFailure:
+    def test_json_or_failure_ok(self):
+        response = requests.Response()
+        response._content = b'{"success": true, "data": 5}'
+
+        assert json_or_failure(response) == {"success": True, "data": 5}
+
+    @pytest.mark.parametrize("status_code,content", [
+        (502, b"<html><body>Bad Gateway</body></html>"),
+        (429, b""),
+    ])
+    def test_json_or_failure_without_json(self, status_code: int, content: bytes):
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = content
+
+        assert json_or_failure(response) == {
+            "success": False, "error": f"HTTP {status_code}",
+            "message": "Habitica did not answer with JSON."
+        }
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+import pickle
+
+import pytest
+
+from hopla.hoplalib.snapshots import QuantitiesSnapshot, fingerprint
+
+
+class TestFingerprint:
+    def test_fingerprint_is_stable(self):
+        # A stored fingerprint must stay valid: this value must never change.
+        assert fingerprint("food", [["Meat", 3]]) == "a16f79552d0a03ad5763f34e4b11c1dd"
+
+    def test_fingerprint_depends_on_the_kind(self):
+        assert fingerprint("food", [["Base", 1]]) != fingerprint("eggs", [["Base", 1]])
+
+
+class TestQuantitiesSnapshot:
+    def test_order_does_not_matter(self):
+        first = QuantitiesSnapshot.of("food", {"Meat": 3, "Milk": 1})
+        second = QuantitiesSnapshot.of("food", {"Milk": 1, "Meat": 3})
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert first.fingerprint == second.fingerprint
+
+    @pytest.mark.parametrize("other", [
+        QuantitiesSnapshot.of("food", {"Meat": 2, "Milk": 1}),
+        QuantitiesSnapshot.of("food", {"Meat": 3}),
+        QuantitiesSnapshot.of("eggs", {"Meat": 3, "Milk": 1}),
+    ])
+    def test_different_content(self, other: QuantitiesSnapshot):
+        snapshot = QuantitiesSnapshot.of("food", {"Meat": 3, "Milk": 1})
+
+        assert snapshot != other
+        assert snapshot.fingerprint != other.fingerprint
+
+    def test_usable_as_key(self):
+        cache = {QuantitiesSnapshot.of("food", {"Meat": 3}): "plan"}
+
+        assert cache[QuantitiesSnapshot.of("food", {"Meat": 3})] == "plan"
+
+    def test_is_frozen(self):
+        snapshot = QuantitiesSnapshot.of("food", {"Meat": 3})
+
+        with pytest.raises(AttributeError):
+            snapshot.items = ()  # type: ignore
+
+        snapshot.as_dict()["Meat"] = 99
+        assert snapshot.as_dict() == {"Meat": 3}
+
+    def test_pickle(self):
+        snapshot = QuantitiesSnapshot.of("food", {"Meat": 3})
+        expected: str = snapshot.fingerprint
+
+        copy = pickle.loads(pickle.dumps(snapshot))
+
+        assert copy == snapshot
+        assert copy.fingerprint == expected
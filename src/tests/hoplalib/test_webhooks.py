@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+import http.client
+import json
+import threading
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+import requests
+
+from hopla.hoplalib.user.usercache import UserSnapshotCache
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.webhooks import (InvalidWebhookEvent, WebhookAuthorization, WebhookEvent,
+                                     WebhookEventHandler, WebhookServer, sample_event)
+
+USER_ID = "c0ffee69-dada-feed-abb1-5ca1ab1ed004"
+SECRET = "s3cr3t"
+
+
+def _event(event_type: str, **kwargs) -> WebhookEvent:
+    return WebhookEvent.from_json(json.dumps(sample_event(event_type, user_id=USER_ID,
+                                                          **kwargs)).encode())
+
+
+def _post_with_content_length(port: int, content_length: str) -> int:
+    """Post to the webhook server with a Content-Length header that requests won't send."""
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    try:
+        connection.putrequest("POST", f"/{SECRET}")
+        connection.putheader("Content-Length", content_length)
+        connection.endheaders()
+        return connection.getresponse().status
+    finally:
+        connection.close()
+
+
+class TestWebhookEvent:
+    @pytest.mark.parametrize("event_type", ["petHatched", "mountRaised", "leveledUp",
+                                            "scored", "created", "questStarted"])
+    def test_from_json_sample_events_ok(self, event_type: str):
+        result = _event(event_type)
+
+        assert result.event_type == event_type
+        assert result.user_id == USER_ID
+
+    @pytest.mark.parametrize("body,expected_msg", [
+        (b"{not json", "The body is not valid JSON"),
+        (b"[]", "The body is not a JSON object."),
+        (b'{"webhookType": "somethingNew"}', "Unknown webhookType: 'somethingNew'"),
+        (b'{"webhookType": "userActivity", "type": "petEaten"}',
+         "Unknown type for userActivity: 'petEaten'"),
+        (b'{"webhookType": "userActivity", "type": "leveledUp", "user": {}}',
+         "The event has no user._id."),
+        (b'{"webhookType": "userActivity", "type": "petHatched", "user": {"_id": "u"}}',
+         "A petHatched event must specify the pet."),
+    ])
+    def test_from_json_invalid(self, body: bytes, expected_msg: str):
+        with pytest.raises(InvalidWebhookEvent) as exec_info:
+            WebhookEvent.from_json(body)
+
+        assert expected_msg in str(exec_info.value)
+
+
+class TestWebhookEventHandler:
+    @pytest.fixture
+    def cache(self, tmp_path: Path) -> UserSnapshotCache:
+        cache = UserSnapshotCache(cache_dir=tmp_path)
+        cache.put(USER_ID, HabiticaUser({
+            "stats": {"gp": 10, "lvl": 1},
+            "items": {"pets": {}, "eggs": {"Wolf": 2}, "hatchingPotions": {"Base": 1}}
+        }))
+        return cache
+
+    def test_pet_hatched_applied(self, cache: UserSnapshotCache):
+        result = WebhookEventHandler(cache).handle(_event("petHatched", pet="Wolf-Base"))
+
+        assert result == WebhookEventHandler.APPLIED
+        items = cache.get_regardless_of_age(USER_ID).get_inventory()
+        assert items == {"pets": {"Wolf-Base": 5}, "eggs": {"Wolf": 1},
+                         "hatchingPotions": {"Base": 0}}
+
+    def test_pet_hatched_unknown_items_invalidates(self, cache: UserSnapshotCache):
+        result = WebhookEventHandler(cache).handle(_event("petHatched", pet="Fox-Red"))
+
+        assert result == WebhookEventHandler.INVALIDATED
+        assert cache.get_regardless_of_age(USER_ID) is None
+
+    def test_scored_applied(self, cache: UserSnapshotCache):
+        result = WebhookEventHandler(cache).handle(_event("scored"))
+
+        assert result == WebhookEventHandler.APPLIED
+        assert cache.get_regardless_of_age(USER_ID).get_gp() == 25.5
+
+    @pytest.mark.parametrize("event_type", ["mountRaised", "leveledUp", "questFinished"])
+    def test_other_events_invalidate(self, cache: UserSnapshotCache, event_type: str):
+        result = WebhookEventHandler(cache).handle(_event(event_type))
+
+        assert result == WebhookEventHandler.INVALIDATED
+        assert cache.get_regardless_of_age(USER_ID) is None
+
+    def test_group_chat_ignored(self, cache: UserSnapshotCache):
+        event = WebhookEvent.from_json(json.dumps({
+            "webhookType": "groupChatReceived", "user": {"_id": USER_ID}
+        }).encode())
+
+        assert WebhookEventHandler(cache).handle(event) == WebhookEventHandler.IGNORED
+        assert cache.get_regardless_of_age(USER_ID) is not None
+
+
+class TestWebhookAuthorization:
+    authorization = WebhookAuthorization(SECRET, user_ids=frozenset([USER_ID]))
+
+    @pytest.mark.parametrize("path,headers", [
+        ("/s3cr3t", {}),
+        ("/s3cr3t/?source=habitica", {}),
+        ("/", {WebhookAuthorization.SECRET_HEADER_NAME: SECRET}),
+    ])
+    def test_authorizes_request_ok(self, path: str, headers: dict):
+        assert self.authorization.authorizes_request(path, headers=headers) is True
+
+    @pytest.mark.parametrize("path,headers", [
+        ("/", {}),
+        ("/s3cr3", {}),
+        ("/s3cr3t/extra", {}),
+        ("/", {WebhookAuthorization.SECRET_HEADER_NAME: "guess"}),
+    ])
+    def test_authorizes_request_wrong_secret(self, path: str, headers: dict):
+        assert self.authorization.authorizes_request(path, headers=headers) is False
+
+    def test_authorizes_event(self):
+        other_user_event = WebhookEvent.from_json(json.dumps(
+            sample_event("leveledUp", user_id="someone-else")).encode())
+
+        assert self.authorization.authorizes_event(_event("leveledUp")) is True
+        assert self.authorization.authorizes_event(other_user_event) is False
+
+    def test_empty_secret_fails(self):
+        with pytest.raises(ValueError):
+            WebhookAuthorization("", user_ids=frozenset([USER_ID]))
+
+
+class TestWebhookServer:
+    def test_serve_events(self, tmp_path: Path):
+        received: List[Tuple[str, str]] = []
+        server = WebhookServer(("127.0.0.1", 0),
+                               authorization=WebhookAuthorization(
+                                   SECRET, user_ids=frozenset([USER_ID])),
+                               event_handler=WebhookEventHandler(UserSnapshotCache(
+                                   cache_dir=tmp_path)),
+                               on_event=lambda event, outcome: received.append(
+                                   (event.event_type, outcome)))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        try:
+            ok_response = requests.post(f"{url}{SECRET}",
+                                        json=sample_event("leveledUp", user_id=USER_ID),
+                                        timeout=5)
+            header_response = requests.post(
+                url, json=sample_event("questStarted", user_id=USER_ID),
+                headers={WebhookAuthorization.SECRET_HEADER_NAME: SECRET}, timeout=5)
+            bad_response = requests.post(f"{url}{SECRET}", data=b"{not json", timeout=5)
+            no_secret_response = requests.post(
+                url, json=sample_event("leveledUp", user_id=USER_ID), timeout=5)
+            other_user_response = requests.post(
+                f"{url}{SECRET}", json=sample_event("leveledUp", user_id="someone-else"),
+                timeout=5)
+            malformed_length_responses = [_post_with_content_length(server.server_address[1],
+                                                                    content_length)
+                                          for content_length in ("many", "-1")]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert ok_response.status_code == 200
+        assert ok_response.json() == {"success": True, "outcome": "invalidated"}
+        assert header_response.status_code == 200
+        assert bad_response.status_code == 400
+        assert no_secret_response.status_code == 403
+        assert other_user_response.status_code == 403
+        assert malformed_length_responses == [400, 400]
+        assert received == [("leveledUp", "invalidated"), ("questStarted", "invalidated")]
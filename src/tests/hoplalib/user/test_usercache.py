@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hopla.hoplalib.user.usercache import UserSnapshotCache
+from hopla.hoplalib.user.usermodels import HabiticaUser
+
+
+class TestUserSnapshotCache:
+    USER_ID = "c0ffee69-dada-feed-abb1-5ca1ab1ed004"
+
+    @pytest.fixture
+    def cache(self, tmp_path: Path) -> UserSnapshotCache:
+        return UserSnapshotCache(cache_dir=tmp_path / "users")
+
+    def test_put_get(self, cache: UserSnapshotCache):
+        user = HabiticaUser({"stats": {"gp": 3}})
+
+        cache.put(self.USER_ID, user)
+
+        assert cache.get(self.USER_ID, max_age=60) == user
+        assert cache.get("other-user", max_age=60) is None
+
+    def test_get_too_old_returns_none(self, cache: UserSnapshotCache):
+        user = HabiticaUser({"stats": {"gp": 3}})
+        cache.put(self.USER_ID, user, cached_at=time.time() - 120)
+
+        assert cache.get(self.USER_ID, max_age=60) is None
+        assert cache.get_regardless_of_age(self.USER_ID) == user
+
+    def test_update_keeps_age(self, cache: UserSnapshotCache):
+        cache.put(self.USER_ID, HabiticaUser({"stats": {"gp": 3}}), cached_at=time.time() - 120)
+
+        result: bool = cache.update(self.USER_ID, HabiticaUser({"stats": {"gp": 4}}))
+
+        assert result is True
+        assert cache.get(self.USER_ID, max_age=60) is None
+        assert cache.get_regardless_of_age(self.USER_ID) == HabiticaUser({"stats": {"gp": 4}})
+
+    def test_update_nothing_cached(self, cache: UserSnapshotCache):
+        assert cache.update(self.USER_ID, HabiticaUser({})) is False
+
+    def test_invalidate(self, cache: UserSnapshotCache):
+        cache.put(self.USER_ID, HabiticaUser({}))
+
+        cache.invalidate(self.USER_ID)
+        cache.invalidate(self.USER_ID)  # invalidating twice is fine
+
+        assert cache.get_regardless_of_age(self.USER_ID) is None
+
+    def test_unreadable_cache_is_ignored(self, cache: UserSnapshotCache):
+        cache.put(self.USER_ID, HabiticaUser({}))
+        (cache.cache_dir / f"{self.USER_ID}.json").write_text("{not json")
+
+        assert cache.get_regardless_of_age(self.USER_ID) is None
+
+    @pytest.mark.parametrize("config_value,expected", [("0", 0), ("3600", 3600),
+                                                       ("-5", 0), ("soon", 0)])
+    @patch("hopla.hoplalib.user.usercache.ConfigurationFileParser")
+    def test_max_age(self, mock_parser: MagicMock, config_value: str, expected: int):
+        mock_parser.return_value.get_full_config_name.return_value = config_value
+
+        assert UserSnapshotCache.max_age() == expected
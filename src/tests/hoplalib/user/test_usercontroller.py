@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+from unittest.mock import MagicMock, patch
+
+from hopla.hoplalib.user.usercontroller import HabiticaUserRequest, UserRequestContext
+from hopla.hoplalib.user.usermodels import HabiticaUser
+
+
+class TestHabiticaUserRequest:
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaRequest.default_headers", {})
+    @patch("hopla.hoplalib.user.usercontroller.requests.get")
+    def test_request_user_full_user(self, mock_get: MagicMock):
+        HabiticaUserRequest().request_user()
+
+        assert mock_get.call_args.kwargs["params"] is None
+
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaRequest.default_headers", {})
+    @patch("hopla.hoplalib.user.usercontroller.requests.get")
+    def test_request_user_projected(self, mock_get: MagicMock):
+        HabiticaUserRequest(user_fields=["items.pets", "stats.gp"]).request_user()
+
+        assert mock_get.call_args.kwargs["params"] == {"userFields": "items.pets,stats.gp"}
+
+
+class TestHabiticaUserRequestCache:
+    USER_ID = "c0ffee69-dada-feed-abb1-5ca1ab1ed004"
+
+    @patch("hopla.hoplalib.user.usercontroller.UserSnapshotCache")
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user")
+    def test_allow_cached_returns_cached_user(self, mock_request: MagicMock,
+                                              mock_cache: MagicMock):
+        cached_user = HabiticaUser({"stats": {"gp": 1}})
+        mock_cache.max_age.return_value = 60
+        mock_cache.return_value.get.return_value = cached_user
+
+        with patch.object(HabiticaUserRequest, "_authenticated_user_id", self.USER_ID):
+            result = HabiticaUserRequest(allow_cached=True).request_user_data_or_exit()
+
+        assert result == cached_user
+        mock_request.assert_not_called()
+
+    @patch("hopla.hoplalib.user.usercontroller.record_user_if_enabled")
+    @patch("hopla.hoplalib.user.usercontroller.UserSnapshotCache")
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user")
+    def test_fetched_user_is_cached(self, mock_request: MagicMock, mock_cache: MagicMock,
+                                    _mock_record: MagicMock):
+        user_data = {"id": self.USER_ID, "stats": {"gp": 2}}
+        mock_request.return_value.json.return_value = {"success": True, "data": user_data}
+        mock_cache.max_age.return_value = 60
+
+        result = HabiticaUserRequest().request_user_data_or_exit()
+
+        assert result == HabiticaUser(user_data)
+        mock_cache.return_value.get.assert_not_called()
+        mock_cache.return_value.put.assert_called_once_with(self.USER_ID, result)
+
+
+class TestUserRequestContext:
+    @patch("hopla.hoplalib.user.usercontroller.HabiticaUserRequest.request_user_data_or_exit")
+    def test_user_requested_once(self, mock_request: MagicMock):
+        user = HabiticaUser({"items": {}})
+        mock_request.return_value = user
+        context = UserRequestContext(user_fields=["items"])
+
+        results = [context.user(), context.user()]
+
+        assert results == [user, user]
+        mock_request.assert_called_once_with()
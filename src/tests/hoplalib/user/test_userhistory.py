@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hopla.hoplalib.user.userhistory import (UserHistoryStore, UserSnapshotDiff,
+                                             record_user_if_enabled)
+from tests.testutils.user_test_utils import UserTestUtil
+
+USER_FIELDS = {"gold": 100.0, "eggs": {"Wolf": 2, "Fox": 1}, "fields": {
+    "id": "c0ffee69-dada-feed-abb1-5ca1ab1ed004",
+    "tags": [{"id": 1, "name": "work"}, {"id": 2, "name": None}]
+}}
+
+
+class TestUserHistoryStore:
+    USER_ID = "c0ffee69-dada-feed-abb1-5ca1ab1ed004"
+    NOW = datetime(2021, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> UserHistoryStore:
+        return UserHistoryStore(db_file=tmp_path / "history.sqlite3")
+
+    def test_record_load_roundtrip(self, store: UserHistoryStore):
+        user = UserTestUtil.user_with_items(**USER_FIELDS, pets={"Wolf-Base": 5}, food={"Meat": 3})
+
+        snapshot = store.record(user, user_id=self.USER_ID, taken_at=self.NOW)
+
+        assert store.load_user(snapshot) == user
+        assert snapshot.taken_at == self.NOW
+
+    def test_record_unchanged_user_adds_no_nodes(self, store: UserHistoryStore):
+        store.record(UserTestUtil.user_with_items(**USER_FIELDS), user_id=self.USER_ID, taken_at=self.NOW)
+        node_count = store.node_count()
+
+        store.record(UserTestUtil.user_with_items(**USER_FIELDS),
+                     user_id=self.USER_ID, taken_at=self.NOW + timedelta(hours=1))
+
+        assert store.node_count() == node_count
+        assert len(store.snapshots(self.USER_ID)) == 2
+
+    def test_record_changed_food_only_adds_changed_path(self, store: UserHistoryStore):
+        store.record(UserTestUtil.user_with_items(**USER_FIELDS, food={"Meat": 3}),
+                     user_id=self.USER_ID, taken_at=self.NOW)
+        node_count = store.node_count()
+
+        store.record(UserTestUtil.user_with_items(**USER_FIELDS, food={"Meat": 2}),
+                     user_id=self.USER_ID, taken_at=self.NOW + timedelta(hours=1))
+
+        # root, items, and food changed; stats, pets, eggs, tags are shared
+        assert store.node_count() == node_count + 3
+
+    def test_baseline_returns_last_snapshot_before_since(self, store: UserHistoryStore):
+        old = store.record(UserTestUtil.user_with_items(**{**USER_FIELDS, "gold": 1}),
+                           user_id=self.USER_ID, taken_at=self.NOW - timedelta(days=2))
+        middle = store.record(UserTestUtil.user_with_items(**{**USER_FIELDS, "gold": 2}),
+                              user_id=self.USER_ID, taken_at=self.NOW - timedelta(hours=30))
+        store.record(UserTestUtil.user_with_items(**{**USER_FIELDS, "gold": 3}),
+                     user_id=self.USER_ID, taken_at=self.NOW)
+
+        assert store.baseline(self.USER_ID, since=self.NOW - timedelta(days=1)) == middle
+        assert store.baseline(self.USER_ID, since=self.NOW - timedelta(days=7)) == old
+
+    def test_snapshots_are_per_user(self, store: UserHistoryStore):
+        store.record(UserTestUtil.user_with_items(**USER_FIELDS), user_id=self.USER_ID, taken_at=self.NOW)
+
+        assert store.latest("other-user") is None
+        assert store.latest(self.USER_ID).user_id == self.USER_ID
+
+
+class TestUserSnapshotDiff:
+    def test_to_dict(self):
+        old = UserTestUtil.user_with_items(gold=100.5, pets={"Wolf-Base": 5, "Fox-Red": -1},
+                                           mounts={"Wolf-Base": None},
+                                           food={"Meat": 3, "Milk": 1})
+        new = UserTestUtil.user_with_items(gold=60.25,
+                                           pets={"Wolf-Base": 10, "Fox-Red": 5, "Cactus-Base": 5},
+                                           mounts={"Wolf-Base": True, "Fox-Red": True},
+                                           food={"Meat": 1, "Milk": 4})
+
+        result = UserSnapshotDiff(old=old, new=new).to_dict()
+
+        assert result == {
+            "pets_gained": ["Cactus-Base", "Fox-Red"],
+            "mounts_gained": ["Fox-Red", "Wolf-Base"],
+            "food_consumed": {"Meat": 2},
+            "gold_spent": 40.25
+        }
+
+    def test_gold_spent_is_zero_when_gold_increased(self):
+        assert UserSnapshotDiff(old=UserTestUtil.user_with_gp(gold=5),
+                                new=UserTestUtil.user_with_gp(gold=10)).gold_spent() == 0
+
+
+class TestRecordUserIfEnabled:
+    @patch("hopla.hoplalib.user.userhistory.UserHistoryStore.recording_enabled")
+    def test_disabled_records_nothing(self, mock_enabled, tmp_path: Path):
+        mock_enabled.return_value = False
+        history_file = tmp_path / "history.sqlite3"
+
+        with patch.dict("os.environ", {"HOPLA_HISTORY_FILE": str(history_file)}):
+            result = record_user_if_enabled(UserTestUtil.user_with_items(**USER_FIELDS), user_id="x")
+
+        assert result is None
+        assert history_file.exists() is False
+
+    @patch("hopla.hoplalib.user.userhistory.UserHistoryStore.recording_enabled")
+    def test_enabled_records_snapshot(self, mock_enabled, tmp_path: Path):
+        mock_enabled.return_value = True
+        history_file = tmp_path / "history.sqlite3"
+
+        with patch.dict("os.environ", {"HOPLA_HISTORY_FILE": str(history_file)}):
+            result = record_user_if_enabled(UserTestUtil.user_with_items(**USER_FIELDS), user_id="x")
+
+        assert UserHistoryStore(db_file=history_file).latest("x") == result
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+import mmap
+from pathlib import Path
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from hopla.hoplalib.zoo.catalogueindex import (CatalogueIndex, CataloguePet, compile_index,
+                                               load_catalogue_index)
+
+
+def _pets() -> List[CataloguePet]:
+    return [
+        CataloguePet("Wolf-Base", "Wolf", "Base", 0, True, "Meat", False),
+        CataloguePet("Wolf-Aurora", "Wolf", "Aurora", 1, True, None, False),
+        CataloguePet("Fox-Veggie", "Fox", "Veggie", 2, False, None, False),
+        CataloguePet("Orca-Base", None, None, 3, False, None, True),
+    ]
+
+
+class TestCatalogueIndex:
+
+    @pytest.fixture
+    def index(self) -> CatalogueIndex:
+        return CatalogueIndex(compile_index(_pets(), n_categories=4))
+
+    def test_pets_round_trip(self, index: CatalogueIndex):
+        assert len(index) == 4
+        for pet_id, pet in enumerate(_pets()):
+            assert index.pet_id(pet.name) == pet_id
+            assert index.pet_name(pet_id) == pet.name
+            assert index.pet(pet_id) == pet
+
+    def test_unknown_pet(self, index: CatalogueIndex):
+        assert index.pet_id("Wolf-Nonexistent") is None
+        assert index.pet_id("") is None
+
+    def test_category_bitsets(self, index: CatalogueIndex):
+        assert [index.category_bitset(category) for category in range(4)] == [1, 2, 4, 8]
+
+    def test_many_pets(self):
+        pets = [CataloguePet(f"Egg{i}-Potion{i % 7}", f"Egg{i}", f"Potion{i % 7}",
+                             i % 3, True, None, False) for i in range(2000)]
+
+        index = CatalogueIndex(compile_index(pets, n_categories=3))
+
+        assert all(index.pet_id(pet.name) == pet_id for pet_id, pet in enumerate(pets))
+        assert bin(index.category_bitset(0)).count("1") == 667
+
+    def test_empty_index(self):
+        index = CatalogueIndex(compile_index([], n_categories=2))
+
+        assert len(index) == 0
+        assert index.pet_id("Wolf-Base") is None
+        assert index.category_bitset(1) == 0
+
+    def test_invalid_index_raises(self):
+        with pytest.raises(ValueError):
+            CatalogueIndex(b"NOPE" + bytes(64))
+
+
+class TestLoadCatalogueIndex:
+
+    def test_load_compiles_then_memory_maps(self, tmp_path: Path):
+        source_file = tmp_path / "petdata.py"
+        source_file.write_text("pets", encoding="utf-8")
+        compile_pets = MagicMock(return_value=_pets())
+
+        first = load_catalogue_index(compile_pets, n_categories=4,
+                                     source_files=[source_file], cache_dir=tmp_path / "cache")
+        second = load_catalogue_index(compile_pets, n_categories=4,
+                                      source_files=[source_file], cache_dir=tmp_path / "cache")
+
+        compile_pets.assert_called_once()
+        assert second.pet(3) == first.pet(3) == _pets()[3]
+        assert isinstance(second._CatalogueIndex__buffer, mmap.mmap)
+
+    def test_changed_source_recompiles(self, tmp_path: Path):
+        source_file = tmp_path / "petdata.py"
+        source_file.write_text("pets", encoding="utf-8")
+        compile_pets = MagicMock(return_value=_pets())
+        load_catalogue_index(compile_pets, n_categories=4,
+                             source_files=[source_file], cache_dir=tmp_path / "cache")
+
+        source_file.write_text("more pets", encoding="utf-8")
+        load_catalogue_index(compile_pets, n_categories=4,
+                             source_files=[source_file], cache_dir=tmp_path / "cache")
+
+        assert compile_pets.call_count == 2
+        assert len(list((tmp_path / "cache").glob("catalogue-*.idx"))) == 1
+
+    def test_recompile_keeps_the_indexes_of_other_installs(self, tmp_path: Path):
+        source_file = tmp_path / "petdata.py"
+        source_file.write_text("pets", encoding="utf-8")
+        other_install_file = tmp_path / "venv" / "petdata.py"
+        other_install_file.parent.mkdir()
+        other_install_file.write_text("pets", encoding="utf-8")
+        load_catalogue_index(_pets, n_categories=4,
+                             source_files=[other_install_file], cache_dir=tmp_path / "cache")
+        load_catalogue_index(_pets, n_categories=4,
+                             source_files=[source_file], cache_dir=tmp_path / "cache")
+
+        source_file.write_text("more pets", encoding="utf-8")
+        load_catalogue_index(_pets, n_categories=4,
+                             source_files=[source_file], cache_dir=tmp_path / "cache")
+
+        assert len(list((tmp_path / "cache").glob("catalogue-*.idx"))) == 2
+
+    def test_unwritable_cache_still_works(self, tmp_path: Path):
+        not_a_dir = tmp_path / "file"
+        not_a_dir.write_text("", encoding="utf-8")
+
+        index = load_catalogue_index(lambda: _pets(), n_categories=4,
+                                     source_files=[], cache_dir=not_a_dir / "cache")
+
+        assert index.pet_id("Orca-Base") == 3
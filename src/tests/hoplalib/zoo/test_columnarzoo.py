@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+import pytest
+
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
+from hopla.hoplalib.zoo.petdata import PetData
+from hopla.hoplalib.zoo.petmodels import PetMountPair
+from hopla.hoplalib.zoo.petregistry import PetCategory
+from hopla.hoplalib.zoo.zoomodels import Zoo, ZooBuilder, ZooHelper
+from tests.testutils.user_test_utils import UserTestUtil
+
+
+def as_reprs(zoo) -> dict:
+    return {name: repr(pair) for name, pair in zoo.items()}
+
+
+class TestColumnarZoo:
+    pets = {
+        "BearCub-Desert": 5,  # we have the mount
+        "Owl-Golden": -1,  # grew up to a mount
+        "Ferret-Red": 27,  # can be fed
+        "Phoenix-Base": 5,  # unfeedable pet
+        "Parrot-Base": 0,  # released
+        "Wolf-Spooky": 20,  # magic potion pet
+    }
+    mounts = {"BearCub-Desert": True, "Owl-Golden": True, "Fox-Base": None,
+              "Unknown-Mount": True}
+
+    @pytest.fixture
+    def user(self) -> HabiticaUser:
+        return UserTestUtil.user_with_zoo(pets=self.pets, mounts=self.mounts)
+
+    def test_is_a_read_only_view_of_the_zoo(self, user: HabiticaUser):
+        zoo: Zoo = ZooBuilder(user).build()
+
+        columnar = ColumnarZoo.from_zoo(zoo)
+
+        assert list(columnar) == list(zoo)
+        assert len(columnar) == len(zoo)
+        assert as_reprs(columnar) == as_reprs(zoo)
+        assert "Fox-Base" in columnar and "Wolf-Base" not in columnar
+        with pytest.raises(KeyError):
+            _ = columnar["Wolf-Base"]
+
+    def test_from_pets_and_mounts_is_same_as_from_zoo(self, user: HabiticaUser):
+        zoo: Zoo = ZooBuilder(user).build()
+
+        columnar = ColumnarZoo.from_pets_and_mounts(pets=self.pets, mounts=self.mounts)
+
+        assert as_reprs(columnar) == as_reprs(ColumnarZoo.from_zoo(zoo))
+
+    def test_from_pets_and_mounts_skips_unknown_pets(self):
+        columnar = ColumnarZoo.from_pets_and_mounts(pets={"Wolf-Base": 5, "Wolf-Nope": 5},
+                                                    mounts={})
+
+        assert list(columnar) == ["Wolf-Base"]
+
+    def test_get_feedable_zoo(self, user: HabiticaUser):
+        zoo: Zoo = ZooBuilder(user).build()
+
+        feedable = ColumnarZoo.from_zoo(zoo).get_feedable_zoo()
+
+        assert list(feedable) == ["Ferret-Red", "Wolf-Spooky"]
+        assert list(feedable) == list(ZooHelper(zoo).get_feedable_zoo())
+
+    def test_filters_combine_without_copying(self, user: HabiticaUser):
+        columnar = ColumnarZoo.from_zoo(ZooBuilder(user).build())
+
+        magic = columnar.get_feedable_zoo().filter_on_categories(PetCategory.MAGIC_POTION)
+        named = columnar.filter_on_pet_name(lambda name: name.endswith("-Base"))
+        pairs = columnar.filter_on_pet_mount_pairs(PetMountPair.mount_available)
+
+        assert list(magic) == ["Wolf-Spooky"]
+        assert list(named) == ["Phoenix-Base", "Parrot-Base", "Fox-Base"]
+        assert list(pairs) == ["BearCub-Desert", "Owl-Golden", "Unknown-Mount"]
+        assert list(named.filter_on_mask(pairs.mask)) == []
+        assert len(columnar) == len(self.mounts) + len(self.pets) - 2
+
+    def test_feed_rows(self, user: HabiticaUser):
+        columnar = ColumnarZoo.from_zoo(ZooBuilder(user).build())
+
+        rows = list(columnar.get_feedable_zoo().feed_rows())
+
+        assert rows == [("Ferret-Red", PetData.pet_names.index("Ferret-Red"), 27),
+                        ("Wolf-Spooky", PetData.pet_names.index("Wolf-Spooky"), 20)]
+
+    def test_feedable_mask_agrees_with_can_feed_pet(self):
+        pets = {pet_name: 5 for pet_name in PetData.pet_names[::3]}
+        mounts = {pet_name: True for pet_name in PetData.pet_names[::2]}
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets=pets, mounts=mounts)).build()
+
+        feedable_zoo: Zoo = ZooHelper(zoo).filter_on_pet_mount_pairs(
+            lambda pair: pair.can_feed_pet()
+        )
+
+        assert list(ColumnarZoo.from_zoo(zoo).get_feedable_zoo()) == list(feedable_zoo)
+
+    def test_agrees_with_zoo_helper_on_a_full_zoo(self):
+        pets = {name: [5, 20, -1, 0][i % 4] for i, name in enumerate(PetData.pet_names)}
+        mounts = dict.fromkeys(PetData.pet_names[::3], True)
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets=pets, mounts=mounts)).build()
+        helper = ZooHelper(zoo)
+
+        columnar = ColumnarZoo.from_zoo(zoo)
+
+        assert list(columnar.get_feedable_zoo()) == list(helper.get_feedable_zoo())
+        for category in PetCategory.ALL:
+            assert (list(columnar.filter_on_categories(category))
+                    == list(helper.filter_on_categories(category)))
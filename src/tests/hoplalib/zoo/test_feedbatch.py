@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+from typing import List
+
+import pytest
+
+from hopla.hoplalib.zoo.feedbatch import FeedBatchPlanner, InvalidFeedBatch, read_pet_names
+from hopla.hoplalib.zoo.zoofeed_algorithms import FeedPlanItem
+from tests.testutils.user_test_utils import UserTestUtil
+
+ZOO = {"pets": {"Wolf-Base": 35, "Fox-Rainbow": 40, "BearCub-Spooky": 45, "Rat-Red": 5},
+       "mounts": {"Rat-Red": True}}
+
+
+class TestReadPetNames:
+    def test_read_pet_names(self):
+        assert read_pet_names(["  Wolf-Base  \n", "#Fox-Red\n", "", "Rat-Red#x"]) == [
+            "Wolf-Base", "Rat-Red"
+        ]
+
+
+class TestFeedBatchPlanner:
+    def test_until_mount_with_appropriate_food(self):
+        planner = FeedBatchPlanner(UserTestUtil.user_with_items(**ZOO, food={"Meat": 3, "Milk": 2, "Fish": 1}))
+
+        plan = planner.make_plan(["Wolf-Base", "Fox-Rainbow", "Wolf-Base"])
+
+        assert plan.feed_plan == [
+            FeedPlanItem(pet_name="Wolf-Base", food_name="Meat", times=3),
+            # Meat is gone, so Milk is the most abundant food for the magic pet
+            FeedPlanItem(pet_name="Fox-Rainbow", food_name="Milk", times=2),
+        ]
+
+    def test_times_with_specified_food(self):
+        planner = FeedBatchPlanner(UserTestUtil.user_with_items(**ZOO, food={"Fish": 2}),
+                                   food_name="Fish", times=1)
+
+        plan = planner.make_plan(["Wolf-Base", "BearCub-Spooky"])
+
+        assert [item.times for item in plan] == [1, 1]
+
+    @pytest.mark.parametrize("pet_names,expected_errors", [
+        (["Wolf-Base", "Rat-Red"], ["Can't feed pet Rat-Red. You have the mount."]),
+        (["Wolf-Base", "Wolf-Red"], ["Can't feed pet Wolf-Red. You don't have this pet."]),
+        (["Wolf-Base", "Wolf-Base", "BearCub-Spooky"],
+         ["Can't feed pet BearCub-Spooky. It needs 1 Meat, but only 0 are left."]),
+    ])
+    def test_invalid_batch(self, pet_names: List[str], expected_errors: List[str]):
+        planner = FeedBatchPlanner(UserTestUtil.user_with_items(**ZOO, food={"Meat": 3}))
+
+        with pytest.raises(InvalidFeedBatch) as exec_info:
+            planner.make_plan(pet_names)
+
+        assert str(exec_info.value) == "\n".join(expected_errors)
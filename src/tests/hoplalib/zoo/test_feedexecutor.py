@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from hopla.hoplalib.throttling import RateLimitingAwareThrottler
+from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
+from hopla.hoplalib.zoo.feedexecutor import AdaptiveFeedExecutor, FeedOutcome
+from hopla.hoplalib.zoo.foodmodels import FeedStatus, FoodStockpile, FoodStockpileBuilder
+from hopla.hoplalib.zoo.zoofeed_algorithms import (FeedPlan, FeedPlanItem,
+                                                   OptimalFeedAlgorithm)
+
+
+def optimal_planner(zoo: ColumnarZoo, stockpile: FoodStockpile) -> FeedPlan:
+    return OptimalFeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan()
+
+
+STATUS_CODES = {"BadRequest": 400, "NotAuthorized": 401, "NotFound": 404, "TooManyRequests": 429,
+                "BadGateway": 502, "ServiceUnavailable": 503}
+
+
+def response_of(response_json: Dict[str, Any]) -> MagicMock:
+    response = MagicMock()
+    response.status_code = STATUS_CODES.get(response_json.get("error"), 200)
+    response.json.return_value = response_json
+    return response
+
+
+def ok(feed_status: int) -> Dict[str, Any]:
+    return {"success": True, "data": feed_status, "message": "Yum!"}
+
+
+def failure(error: str, message: str) -> Dict[str, Any]:
+    return {"success": False, "error": error, "message": message}
+
+
+class FakeThrottler:
+    """Performs the requests right away, and remembers the requests remaining of every call."""
+
+    def __init__(self):
+        self.requests_remaining: List[int] = []
+
+    def perform(self, api_request, *, requests_remaining: int):
+        self.requests_remaining.append(requests_remaining)
+        return api_request()
+
+
+class FakeHabitica:
+    """Answers the feed requests with the responses of a script, then with success."""
+
+    def __init__(self, script: Dict[str, Any]):
+        self.script = script
+        """The response (or its JSON) of the first request to feed a pet, by the name of the pet."""
+        self.fed: List[FeedPlanItem] = []
+
+    def feed(self, item: FeedPlanItem) -> MagicMock:
+        self.fed.append(item)
+        scripted = self.script.pop(item.pet_name, ok(FeedStatus.PET_GREW_UP_TO_MOUNT))
+        return scripted if isinstance(scripted, MagicMock) else response_of(scripted)
+
+
+def executor_of(pets: Dict[str, int], food: Dict[str, int],
+                habitica: FakeHabitica) -> AdaptiveFeedExecutor:
+    stockpile: FoodStockpile = FoodStockpileBuilder.empty_stockpile().add_food_dict(food)
+    plan: FeedPlan = optimal_planner(ColumnarZoo.from_pets_and_mounts(pets=pets, mounts={}),
+                                     stockpile)
+    return AdaptiveFeedExecutor(plan, pets=pets, mounts={}, stockpile=stockpile,
+                                planner=optimal_planner, feed=habitica.feed)
+
+
+class TestAdaptiveFeedExecutor:
+
+    def test_execute_without_failures_executes_the_plan(self):
+        habitica = FakeHabitica({})
+        executor = executor_of({"Wolf-Base": 45, "Fox-Base": 40}, {"Meat": 10}, habitica)
+        throttler = FakeThrottler()
+
+        outcomes: List[FeedOutcome] = list(executor.execute(throttler))
+
+        assert habitica.fed == [FeedPlanItem("Wolf-Base", "Meat", 1),
+                                FeedPlanItem("Fox-Base", "Meat", 2)]
+        assert [outcome.success for outcome in outcomes] == [True, True]
+        assert not any(outcome.replanned for outcome in outcomes)
+        assert throttler.requests_remaining == [2, 1]
+        assert executor.stockpile.as_dict()["Meat"] == 7
+        assert executor.remaining_items == []
+
+    def test_execute_gives_the_food_of_a_pet_that_only_failed_itself_to_other_pets(self):
+        # Habitica rejected the Wolf-Base request as such: its Meat goes to Fox-Base
+        habitica = FakeHabitica({"Wolf-Base": failure("BadRequest", "Invalid pet name.")})
+        executor = executor_of({"Wolf-Base": 45, "Fox-Base": 35}, {"Meat": 3}, habitica)
+        assert executor.remaining_items == [FeedPlanItem("Wolf-Base", "Meat", 1)]
+
+        outcomes: List[FeedOutcome] = list(executor.execute(FakeThrottler()))
+
+        assert habitica.fed == [FeedPlanItem("Wolf-Base", "Meat", 1),
+                                FeedPlanItem("Fox-Base", "Meat", 3)]
+        assert [(outcome.success, outcome.replanned) for outcome in outcomes] == [
+            (False, True), (True, False)
+        ]
+
+    @pytest.mark.parametrize("error,message", [
+        ("NotAuthorized", "You already have that mount. Try feeding another pet."),
+        ("NotAuthorized", "Du hast nicht genug Futter."),  # not enough food, in German
+        ("NotFound", "Pet not found."),
+    ])
+    def test_execute_drops_the_pet_and_its_food_when_the_cause_is_unclear(self, error: str,
+                                                                          message: str):
+        habitica = FakeHabitica({"Wolf-Base": failure(error, message)})
+        executor = executor_of({"Wolf-Base": 45, "Fox-Base": 35, "Wolf-Red": 45},
+                               {"Meat": 4, "Strawberry": 1}, habitica)
+
+        outcomes: List[FeedOutcome] = list(executor.execute(FakeThrottler()))
+
+        assert habitica.fed == [FeedPlanItem("Wolf-Base", "Meat", 1),
+                                FeedPlanItem("Wolf-Red", "Strawberry", 1)]
+        assert outcomes[0].replanned is True
+        assert executor.stockpile.as_dict()["Meat"] == 0
+
+    @pytest.mark.parametrize("error", ["TooManyRequests", "BadGateway", "ServiceUnavailable"])
+    def test_execute_drops_only_the_item_when_habitica_is_unavailable(self, error: str):
+        habitica = FakeHabitica({"Wolf-Base": failure(error, "")})
+        executor = executor_of({"Wolf-Base": 45, "Fox-Base": 35, "Wolf-Red": 45},
+                               {"Meat": 4, "Strawberry": 1}, habitica)
+
+        outcomes: List[FeedOutcome] = list(executor.execute(FakeThrottler()))
+
+        assert habitica.fed == [FeedPlanItem("Wolf-Base", "Meat", 1),
+                                FeedPlanItem("Fox-Base", "Meat", 3),
+                                FeedPlanItem("Wolf-Red", "Strawberry", 1)]
+        assert outcomes[0].replanned is True
+        assert executor.stockpile.as_dict()["Meat"] == 1
+
+    def test_execute_survives_a_response_without_json(self):
+        html = MagicMock(status_code=503)
+        html.json.side_effect = ValueError("Expecting value: line 1 column 1 (char 0)")
+        habitica = FakeHabitica({"Wolf-Base": html})
+        executor = executor_of({"Wolf-Base": 45, "Wolf-Red": 45},
+                               {"Meat": 1, "Strawberry": 1}, habitica)
+
+        outcomes: List[FeedOutcome] = list(executor.execute(FakeThrottler()))
+
+        assert [(outcome.success, outcome.replanned) for outcome in outcomes] == [
+            (False, True), (True, False)
+        ]
+        assert outcomes[0].response_json["error"] == "HTTP 503"
+
+    def test_execute_survives_a_response_without_headers_through_a_real_throttler(self):
+        html = MagicMock(status_code=502, headers=CaseInsensitiveDict({"Content-Type": "text/html"}))
+        html.json.side_effect = ValueError("Expecting value: line 1 column 1 (char 0)")
+        habitica = FakeHabitica({"Wolf-Base": html})
+        executor = executor_of({"Wolf-Base": 45, "Wolf-Red": 45},
+                               {"Meat": 1, "Strawberry": 1}, habitica)
+
+        outcomes: List[FeedOutcome] = list(executor.execute(RateLimitingAwareThrottler()))
+
+        assert [(outcome.success, outcome.replanned) for outcome in outcomes] == [
+            (False, True), (True, False)
+        ]
+        assert outcomes[0].response_json["error"] == "HTTP 502"
+
+    def test_execute_skips_the_pets_of_food_that_ran_out(self):
+        # the Meat was spent on another device: only the Strawberry pet is fed
+        habitica = FakeHabitica({"Wolf-Base": failure("NotFound", "You don't have enough food")})
+        executor = executor_of({"Wolf-Base": 45, "Fox-Base": 45, "Wolf-Red": 45},
+                               {"Meat": 2, "Strawberry": 1}, habitica)
+
+        list(executor.execute(FakeThrottler()))
+
+        assert habitica.fed == [FeedPlanItem("Wolf-Base", "Meat", 1),
+                                FeedPlanItem("Wolf-Red", "Strawberry", 1)]
+        assert executor.stockpile.as_dict()["Meat"] == 0
+
+    def test_execute_replans_a_partly_fed_pet_from_its_feed_status(self):
+        # BearCub-Amber gets 3 Meat and 3 Milk, but the Milk is gone after the Meat
+        habitica = FakeHabitica({"BearCub-Amber": ok(35)})
+        executor = executor_of({"BearCub-Amber": 20, "Wolf-Base": 45},
+                               {"Meat": 4, "Milk": 3}, habitica)
+        habitica.script["Wolf-Base"] = ok(FeedStatus.PET_GREW_UP_TO_MOUNT)
+        assert executor.remaining_items == [FeedPlanItem("Wolf-Base", "Meat", 1),
+                                            FeedPlanItem("BearCub-Amber", "Meat", 3),
+                                            FeedPlanItem("BearCub-Amber", "Milk", 3)]
+        outcomes = executor.execute(FakeThrottler())
+        next(outcomes)
+        next(outcomes)
+        habitica.script["BearCub-Amber"] = failure("NotFound", "Milk not found in user.items.food")
+
+        assert next(outcomes).replanned is True
+        assert executor.remaining_items == []
+        with pytest.raises(StopIteration):
+            next(outcomes)
+
+    def test_execute_estimates_the_feed_status_without_data(self):
+        # the replan must know that Fox-Base became a mount, or it feeds Fox-Base again
+        habitica = FakeHabitica({
+            "Fox-Base": {"success": True, "message": "Yum!"},
+            "Wolf-Base": failure("BadRequest", "Invalid pet name."),
+        })
+        executor = executor_of({"Wolf-Base": 40, "Fox-Base": 45}, {"Meat": 3}, habitica)
+
+        list(executor.execute(FakeThrottler()))
+
+        assert habitica.fed == [FeedPlanItem("Wolf-Base", "Meat", 2),
+                                FeedPlanItem("Fox-Base", "Meat", 1)]
+        assert executor.remaining_items == []
@@ -1,3 +1,5 @@
+import copy
+import pickle
 from typing import Dict
 
 import pytest
@@ -122,7 +124,29 @@ class TestFeedStatusHash:
         assert hash(feed_status) == hash(equal_feed_status)
 
 
+class TestFeedStatusFlyweight:
+    @pytest.mark.parametrize("valid_status", TestFeedStatus.valid_feed_range)
+    def test_one_instance_per_value(self, valid_status: int):
+        assert FeedStatus(valid_status) is FeedStatus(valid_status)
+
+    def test_copies_are_the_same_instance(self):
+        feed_status = FeedStatus(27)
+
+        assert copy.deepcopy(feed_status) is feed_status
+        assert pickle.loads(pickle.dumps(feed_status)) is feed_status
+
+    def test_is_slotted(self):
+        assert not hasattr(FeedStatus(), "__dict__")
+
+
 class TestFood:
+    def test_is_slotted_and_copyable(self):
+        food = Food("Meat")
+
+        assert not hasattr(food, "__dict__")
+        assert copy.deepcopy(food) == food
+        with pytest.raises(AttributeError):
+            food.name = "Fish"  # type: ignore
 
     @pytest.mark.parametrize("food_name", [
         "RottenMeat", "CottonCandyBlue", "Chocolate", "Fish",
@@ -212,6 +236,37 @@ class TestFoodStockpile:
         assert stockpile.as_dict() == expected_food
         assert str(stockpile) == f"FoodStockpile({expected_food})"
 
+    def test_fork_is_independent(self):
+        original: FoodStockpile = FoodStockpileBuilder.empty_stockpile().add_food("Meat", n=5)
+
+        fork: FoodStockpile = original.fork()
+        assert fork == original
+
+        fork.add_food("Meat", n=-2)
+        original.add_food("Fish", n=1)
+
+        assert fork.as_dict()["Meat"] == 3
+        assert fork.as_dict()["Fish"] == 0
+        assert original.as_dict()["Meat"] == 5
+        assert original.as_dict()["Fish"] == 1
+
+    def test_copies_are_forks(self):
+        original: FoodStockpile = FoodStockpileBuilder.empty_stockpile()
+
+        for duplicate in [copy.copy(original), copy.deepcopy(original)]:
+            duplicate.add_food("Honey", n=1)
+            assert original.as_dict()["Honey"] == 0
+
+    def test_add_food_does_not_change_the_given_dict(self,
+                                                     empty_stockpile_dict: Dict[str, int]):
+        stockpile = FoodStockpile(empty_stockpile_dict)
+
+        stockpile.add_food("Meat", n=1)
+        stockpile.as_dict()["Meat"] = 99
+
+        assert empty_stockpile_dict["Meat"] == 0
+        assert stockpile.as_dict()["Meat"] == 1
+
     def test_add_food_supply_too_small_fail(self):
         stockpile: FoodStockpile = FoodStockpileBuilder.empty_stockpile()
 
@@ -298,3 +353,66 @@ class TestFoodStockpile:
         assert stockpile.has_sufficient_abundant_food(n=abundant_food_quantity - 1)
         assert stockpile.has_sufficient_abundant_food(n=abundant_food_quantity)
         assert stockpile.has_sufficient_abundant_food(n=abundant_food_quantity + 1) is False
+
+    def test_get_most_abundant_food_ties_like_max(self):
+        stockpile = FoodStockpile({"Meat": 3, "Milk": 5, "Fish": 5})
+
+        assert stockpile.get_most_abundant_food() == "Milk"
+        stockpile.add_food("Milk", n=-1)
+        assert stockpile.get_most_abundant_food() == "Fish"
+        stockpile.add_food("Milk", n=1)
+        assert stockpile.get_most_abundant_food() == "Milk"
+
+    def test_get_most_abundant_food_empty_stockpile_fails(self):
+        with pytest.raises(ValueError):
+            FoodStockpile({}).get_most_abundant_food()
+
+    def test_get_most_abundant_food_same_as_max(self):
+        food_names = list(FoodStockpileBuilder.empty_stockpile().as_dict())
+        stockpile: FoodStockpile = FoodStockpileBuilder.empty_stockpile()
+        expected: Dict[str, int] = stockpile.as_dict()
+
+        for i in range(300):
+            food_name = food_names[i * 7 % len(food_names)]
+            n = (i * 13) % 11 - 3
+            if expected[food_name] + n < 0:
+                n = -expected[food_name]
+            stockpile.add_food(food_name, n=n)
+            expected[food_name] += n
+
+            assert stockpile.as_dict() == expected
+            assert stockpile.get_most_abundant_food() == max(expected, key=expected.get)
+
+    def test_fork_keeps_its_own_most_abundant_food(self):
+        original = FoodStockpile({"Meat": 3, "Milk": 2})
+
+        fork: FoodStockpile = original.fork().add_food("Milk", n=2)
+
+        assert fork.get_most_abundant_food() == "Milk"
+        assert original.get_most_abundant_food() == "Meat"
+
+    def test_unhashable_but_the_snapshot_is_hashable(self):
+        stockpile = FoodStockpile({"Meat": 3, "Milk": 1})
+        same = FoodStockpile({"Milk": 1, "Meat": 3})
+
+        assert stockpile == same
+        with pytest.raises(TypeError):
+            hash(stockpile)
+        assert hash(stockpile.snapshot()) == hash(same.snapshot())
+        assert len({stockpile.snapshot(), same.snapshot()}) == 1
+        assert stockpile.snapshot().fingerprint == same.snapshot().fingerprint
+
+    def test_snapshot_does_not_follow_changes(self):
+        stockpile = FoodStockpile({"Meat": 3})
+        snapshot = stockpile.snapshot()
+
+        stockpile.add_food("Meat", n=-1)
+
+        assert snapshot.as_dict() == {"Meat": 3}
+        assert stockpile.snapshot() != snapshot
+
+    def test_add_unknown_drop_food_fails(self):
+        stockpile = FoodStockpile({"Meat": 3})
+
+        with pytest.raises(KeyError):
+            stockpile.add_food("Milk", n=1)
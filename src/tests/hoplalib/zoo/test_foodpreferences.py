@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+import pytest
+
+from hopla.hoplalib.zoo.fooddata import FoodData
+from hopla.hoplalib.zoo.foodmodels import FeedStatus
+from hopla.hoplalib.zoo.foodpreferences import NOT_FEEDABLE, FoodPreferenceMatrix
+from hopla.hoplalib.zoo.petdata import PetData
+from hopla.hoplalib.zoo.petregistry import get_pet_registry
+
+
+class TestFoodPreferenceMatrix:
+    matrix = FoodPreferenceMatrix.cached()
+
+    def test_columns_are_the_drop_food(self):
+        assert self.matrix.food_names == tuple(FoodData.drop_food_names)
+        assert FoodPreferenceMatrix.cached() is self.matrix
+
+    @pytest.mark.parametrize("pet_name,food_name,expected_increment", [
+        ("Fox-Red", "Strawberry", FeedStatus.FAVORITE_INCREMENT),
+        ("Fox-Red", "Milk", FeedStatus.NON_FAVORITE_INCREMENT),
+        ("Fox-Red", "Cake_Base", FeedStatus.NON_FAVORITE_INCREMENT),
+        ("Gryphon-Golden", "Honey", FeedStatus.FAVORITE_INCREMENT),
+        ("Wolf-Spooky", "Milk", FeedStatus.FAVORITE_INCREMENT),
+        ("Wolf-Spooky", "Cake_Base", FeedStatus.FAVORITE_INCREMENT),
+        ("Phoenix-Base", "Meat", NOT_FEEDABLE),
+        ("BearCub-Veggie", "Meat", NOT_FEEDABLE),
+    ])
+    def test_increment(self, pet_name: str, food_name: str, expected_increment: int):
+        pet_id: int = get_pet_registry().pet_id(pet_name)
+
+        assert self.matrix.increment(pet_id, food_name) == expected_increment
+
+    @pytest.mark.parametrize("feed_status", [-1, 0, 5, 6, 27, 48, 49])
+    def test_required_food_items_agree_with_feed_status(self, feed_status: int):
+        feed_statuses = {get_pet_registry().pet_id(name): feed_status
+                         for name in PetData.feedable_pet_names}
+
+        required = self.matrix.required_food_items_matrix(feed_statuses)
+
+        for pet_id, row in required.items():
+            for food_name, required_food_items in zip(self.matrix.food_names, row):
+                is_favorite = (self.matrix.increment(pet_id, food_name)
+                               == FeedStatus.FAVORITE_INCREMENT)
+                assert required_food_items == FeedStatus(
+                    feed_status
+                ).required_food_items_to_become_mount(is_favorite)
+
+    def test_unfeedable_pets_require_no_food(self):
+        phoenix: int = get_pet_registry().pet_id("Phoenix-Base")
+
+        assert self.matrix.required_food_items(phoenix, "Meat", feed_status=5) == NOT_FEEDABLE
+        assert set(self.matrix.required_food_items_row(phoenix, feed_status=5)) == {NOT_FEEDABLE}
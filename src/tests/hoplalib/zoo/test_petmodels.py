@@ -338,6 +338,18 @@ class TestPet:
             assert times_result == expected_times
 
 
+class TestSlots:
+    @pytest.mark.parametrize("model", [
+        Pet("Wolf-Base"),
+        Mount("Wolf-Base", availability_status=True),
+        PetMountPair(pet=Pet("Wolf-Base"), mount=None),
+    ])
+    def test_models_are_slotted(self, model):
+        assert not hasattr(model, "__dict__")
+        with pytest.raises(AttributeError):
+            model.undeclared_attribute = True
+
+
 class TestMount:
 
     @pytest.mark.parametrize(
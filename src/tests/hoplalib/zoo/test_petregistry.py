@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+from unittest.mock import patch
+
+import pytest
+
+from hopla.hoplalib.hatchery.egg_data import EggData
+from hopla.hoplalib.hatchery.hatchpotion_data import HatchPotionData
+from hopla.hoplalib.zoo.fooddata import FoodData
+from hopla.hoplalib.zoo.petdata import PetData
+from hopla.hoplalib.zoo.petregistry import (PetCategory, PetRecord, PetRegistry,
+                                            get_pet_registry)
+
+
+class TestPetRegistry:
+
+    def test_registry_has_every_pet_exactly_once(self):
+        assert len(get_pet_registry()) == len(PetData.pet_names) == len(set(PetData.pet_names))
+        assert set(get_pet_registry()) == set(PetData.pet_names)
+
+    def test_unknown_pet(self):
+        assert "Wolf-Nonexistent" not in get_pet_registry()
+        assert get_pet_registry().get("Wolf-Nonexistent") is None
+        with pytest.raises(KeyError):
+            _ = get_pet_registry()["Wolf-Nonexistent"]
+
+    def test_records_are_immutable_and_slotted(self):
+        record: PetRecord = get_pet_registry()["Wolf-Base"]
+        with pytest.raises(AttributeError):
+            record.feedable = False  # type: ignore
+        assert not hasattr(record, "__dict__")
+
+    @pytest.mark.parametrize("pet_names,category", [
+        (PetData.generation1_pet_names, PetCategory.GENERATION1),
+        (PetData.magic_potion_pet_names, PetCategory.MAGIC_POTION),
+        (PetData.quest_pet_names, PetCategory.QUEST),
+        (PetData.wacky_pet_names, PetCategory.WACKY),
+        (PetData.rare_pet_names, PetCategory.RARE),
+    ])
+    def test_records_agree_with_pet_data(self, pet_names, category: str):
+        for pet_name in pet_names:
+            record: PetRecord = get_pet_registry()[pet_name]
+            assert record.category == category
+            assert record.feedable is (pet_name in PetData.feedable_pet_names)
+            assert record.rare is (pet_name in PetData.rare_pet_names)
+            assert record.likes_all_food is (pet_name in PetData.magic_potion_pet_names)
+            has_one_favorite = pet_name in PetData.only_1favorite_food_pet_names
+            assert (record.favorite_food is not None) is has_one_favorite
+
+    def test_quest_pet_record(self):
+        record: PetRecord = get_pet_registry()["Gryphon-CottonCandyBlue"]
+
+        assert record == PetRecord(
+            name="Gryphon-CottonCandyBlue", egg="Gryphon", potion="CottonCandyBlue",
+            category=PetCategory.QUEST, feedable=True, favorite_food="CottonCandyBlue",
+            rare=False, pet_id=PetData.pet_names.index("Gryphon-CottonCandyBlue")
+        )
+
+    def test_rare_pet_record(self):
+        record: PetRecord = get_pet_registry()["Phoenix-Base"]
+
+        assert record == PetRecord(
+            name="Phoenix-Base", egg=None, potion=None, category=PetCategory.RARE,
+            feedable=False, favorite_food=None, rare=True,
+            pet_id=PetData.pet_names.index("Phoenix-Base")
+        )
+
+    def test_pet_ids_follow_the_order_of_pet_data(self):
+        assert list(get_pet_registry()) == PetData.pet_names
+
+    def test_pet_names_of_categories(self):
+        assert get_pet_registry().pet_names(PetCategory.QUEST) == PetData.quest_pet_names
+        assert get_pet_registry().pet_names(PetCategory.WACKY, PetCategory.RARE) == (
+            PetData.wacky_pet_names + PetData.rare_pet_names
+        )
+        assert sorted(get_pet_registry().feedable_pet_names()) == sorted(PetData.feedable_pet_names)
+
+    def test_load_compiles_the_index_once(self, tmp_path):
+        registry = PetRegistry.load(cache_dir=tmp_path)
+        index_files = list(tmp_path.glob("catalogue-*.idx"))
+
+        with patch("hopla.hoplalib.zoo.petregistry._catalogue_pets") as mock_pets:
+            reloaded = PetRegistry.load(cache_dir=tmp_path)
+
+        mock_pets.assert_not_called()
+        assert len(index_files) == 1
+        assert reloaded["Wolf-Base"] == registry["Wolf-Base"] == get_pet_registry()["Wolf-Base"]
+
+    def test_load_recompiles_an_outdated_index(self, tmp_path):
+        source_file = tmp_path / "petdata.py"
+        source_file.write_text("pets", encoding="utf-8")
+        with patch("hopla.hoplalib.zoo.petregistry._CATALOGUE_SOURCE_FILES", [source_file]):
+            PetRegistry.load(cache_dir=tmp_path)
+            (outdated_file,) = tmp_path.glob("catalogue-*.idx")
+            source_file.write_text("more pets", encoding="utf-8")
+            registry = PetRegistry.load(cache_dir=tmp_path)
+
+        assert not outdated_file.exists()
+        assert len(list(tmp_path.glob("catalogue-*.idx"))) == 1
+        assert len(registry) == len(PetData.pet_names)
+
+    def test_egg_kind(self):
+        assert {get_pet_registry().egg_kind(egg) for egg in EggData.drop_egg_names} == {"drop"}
+        assert {get_pet_registry().egg_kind(egg) for egg in EggData.quest_egg_names} == {"quest"}
+        assert get_pet_registry().egg_kind("NotAnEgg") is None
+
+    def test_hatch_potion_kind(self):
+        for potion_names, kind in [(HatchPotionData.drop_hatch_potion_names, "drop"),
+                                   (HatchPotionData.magic_hatch_potion_names, "magic"),
+                                   (HatchPotionData.wacky_hatch_potion_names, "wacky")]:
+            assert {get_pet_registry().hatch_potion_kind(potion) for potion in potion_names} == {kind}
+        assert get_pet_registry().hatch_potion_kind("NotAPotion") is None
+
+    def test_drop_food_names(self):
+        assert get_pet_registry().drop_food_names == frozenset(FoodData.drop_food_names)
+
+    def test_bitset_and_names_of(self):
+        bitset: int = get_pet_registry().bitset(PetCategory.WACKY, PetCategory.RARE)
+
+        assert get_pet_registry().names_of(bitset) == PetData.wacky_pet_names + PetData.rare_pet_names
+        assert get_pet_registry().names_of(0) == []
+        assert get_pet_registry().pet_id("Wolf-Nonexistent") is None
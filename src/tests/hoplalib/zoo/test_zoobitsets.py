@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+from hopla.hoplalib.user.usermodels import HabiticaUser
+from hopla.hoplalib.zoo.petregistry import PetCategory, get_pet_registry
+from hopla.hoplalib.zoo.zoobitsets import ZooBitsets, count
+from hopla.hoplalib.zoo.zoomodels import Zoo, ZooBuilder
+from tests.testutils.user_test_utils import UserTestUtil
+
+
+def bit(pet_name: str) -> int:
+    return 1 << get_pet_registry().pet_id(pet_name)
+
+
+class TestZooBitsets:
+    pets = {
+        "BearCub-Desert": 5,  # we have the mount, not hungry
+        "Owl-Golden": -1,  # grew up to a mount
+        "Ferret-Red": 27,  # can be fed
+        "Phoenix-Base": 5,  # unfeedable pet
+        "Parrot-Base": 0,  # released
+        "Wolf-Nonexistent": 5  # unknown to hopla
+    }
+    mounts = {"BearCub-Desert": True, "Owl-Golden": True, "Fox-Base": None}
+
+    def test_from_user(self):
+        user: HabiticaUser = UserTestUtil.user_with_zoo(pets=self.pets, mounts=self.mounts)
+
+        zoo = ZooBitsets.from_user(user)
+
+        assert zoo.pets == bit("BearCub-Desert") | bit("Ferret-Red") | bit("Phoenix-Base")
+        assert zoo.mounts == bit("BearCub-Desert") | bit("Owl-Golden")
+
+    def test_from_zoo_is_same_as_from_user(self):
+        user: HabiticaUser = UserTestUtil.user_with_zoo(pets=self.pets, mounts=self.mounts)
+        zoo: Zoo = ZooBuilder(user).build(skip_unsupported_pets=True)
+
+        assert ZooBitsets.from_zoo(zoo) == ZooBitsets.from_user(user)
+
+    def test_queries(self):
+        user: HabiticaUser = UserTestUtil.user_with_zoo(pets=self.pets, mounts=self.mounts)
+
+        zoo = ZooBitsets.from_user(user)
+
+        assert zoo.names(zoo.owned_without_mount()) == ["Ferret-Red", "Phoenix-Base"]
+        hatchable_not_owned: int = zoo.hatchable_not_owned()
+        assert count(hatchable_not_owned) == count(
+            get_pet_registry().bitset(*PetCategory.HATCHABLE)
+        ) - 2
+        assert hatchable_not_owned & bit("Owl-Golden")
+        assert not hatchable_not_owned & (bit("Ferret-Red") | bit("Phoenix-Base"))
+
+    def test_combine_accounts(self):
+        alice = ZooBitsets.from_pets_and_mounts(pets={"Wolf-Base": 5, "Fox-Base": 5},
+                                                mounts={})
+        bob = ZooBitsets.from_pets_and_mounts(pets={"Wolf-Base": 10}, mounts={"Fox-Base": True})
+
+        assert sorted(ZooBitsets.names((alice | bob).pets)) == ["Fox-Base", "Wolf-Base"]
+        assert ZooBitsets.names((alice & bob).pets) == ["Wolf-Base"]
+        assert (alice & bob).mounts == 0
@@ -6,7 +6,8 @@ from hopla.hoplalib.zoo.fooddata import FoodData
 from hopla.hoplalib.zoo.foodmodels import FoodStockpile, FoodStockpileBuilder
 from hopla.hoplalib.zoo.zoomodels import Zoo, ZooBuilder
 from hopla.hoplalib.zoo.zoofeed_algorithms import FeedPlanItem, \
-    FeedAlgorithm, FeedPlan
+    FeedAlgorithm, FeedPlan, OptimalFeedAlgorithm, FEED_STRATEGIES, add_partial_feeding, \
+    CategoryOrderedFeedAlgorithm, FewestRequestsFeedAlgorithm, FeedStrategy, feed_strategy
 from tests.testutils.user_test_utils import UserTestUtil
 
 
@@ -100,6 +101,20 @@ class TestFeedAlgorithm:
         after_expected = f"FeedAlgorithm(\n  __feed_plan={plan.format_plan()}\n)"
         assert repr_after == after_expected
 
+    def test_make_plan_leaves_the_zoo_and_stockpile_unchanged(self):
+        food = {"Chocolate": 10, "Meat": 10}
+        user: HabiticaUser = UserTestUtil.user_with_zoo(pets={"Wolf-Shade": 5, "Fox-Base": 5})
+        zoo: Zoo = ZooBuilder(user).build()
+        stockpile: FoodStockpile = FoodStockpileBuilder.empty_stockpile().add_food_dict(food)
+        stockpile_before: dict = stockpile.as_dict()
+
+        algorithm = FeedAlgorithm(zoo=zoo, stockpile=stockpile)
+        algorithm.make_plan()
+
+        assert stockpile.as_dict() == stockpile_before
+        assert algorithm.stockpile.as_dict()["Chocolate"] == 1
+        assert [int(pair.pet.feed_status) for pair in zoo.values()] == [5, 5]
+
     def test_make_plan_empty_stockpile_results_in_empty_plan_ok(self,
                                                                 empty_zoo,
                                                                 empty_stockpile):
@@ -234,3 +249,230 @@ class TestFeedAlgorithm:
             lots_of_food = 100
             stockpile.add_food(food_name, n=lots_of_food)
         return stockpile
+
+
+def food_spent(plan: FeedPlan) -> int:
+    return sum(item.times for item in plan)
+
+
+def mounts(plan: FeedPlan) -> int:
+    return len({item.pet_name for item in plan})
+
+
+class TestOptimalFeedAlgorithm:
+
+    def test__repr__(self):
+        algorithm = OptimalFeedAlgorithm(zoo={}, stockpile=FoodStockpileBuilder().build())
+
+        assert repr(algorithm) == "OptimalFeedAlgorithm(\n  __feed_plan=\n)"
+
+    def test_make_plan_empty_stockpile_results_in_empty_plan(self):
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets={"Wolf-Base": 5})).build()
+        algorithm = OptimalFeedAlgorithm(zoo=zoo, stockpile=FoodStockpileBuilder().build())
+
+        assert algorithm.make_plan().is_empty()
+
+    def test_make_plan_leaves_the_stockpile_unchanged(self):
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets={"Wolf-Base": 5})).build()
+        stockpile = FoodStockpileBuilder.empty_stockpile().add_food("Meat", n=10)
+
+        algorithm = OptimalFeedAlgorithm(zoo=zoo, stockpile=stockpile)
+        plan: FeedPlan = algorithm.make_plan()
+
+        assert plan.feed_plan == [FeedPlanItem("Wolf-Base", "Meat", 9)]
+        assert stockpile.as_dict()["Meat"] == 10
+        assert algorithm.stockpile.as_dict()["Meat"] == 1
+
+    def test_make_plan_prefers_the_pets_that_need_the_least_food(self):
+        # the greedy plan spends all the Meat on the Wolf, and has nothing left for the Bears
+        pets = {"Wolf-Base": 5, "BearCub-Amber": 45, "BearCub-Aurora": 45, "BearCub-Bronze": 40}
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets=pets)).build()
+        stockpile = FoodStockpileBuilder.empty_stockpile().add_food("Meat", n=9)
+
+        greedy: FeedPlan = FeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan()
+        optimal: FeedPlan = OptimalFeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan()
+
+        assert mounts(greedy) == 1
+        assert optimal.feed_plan == [FeedPlanItem("BearCub-Amber", "Meat", 1),
+                                     FeedPlanItem("BearCub-Aurora", "Meat", 1),
+                                     FeedPlanItem("BearCub-Bronze", "Meat", 2)]
+
+    def test_make_plan_feeds_more_kinds_of_food_to_pets_that_like_all_food(self):
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets={"BearCub-Amber": 5})).build()
+        stockpile = FoodStockpileBuilder.empty_stockpile().add_food_dict({"Meat": 5, "Milk": 4})
+
+        greedy: FeedPlan = FeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan()
+        algorithm = OptimalFeedAlgorithm(zoo=zoo, stockpile=stockpile)
+        optimal: FeedPlan = algorithm.make_plan()
+
+        assert greedy.is_empty()
+        assert optimal.feed_plan == [FeedPlanItem("BearCub-Amber", "Meat", 5),
+                                     FeedPlanItem("BearCub-Amber", "Milk", 4)]
+        assert sum(algorithm.stockpile.as_dict().values()) == 0
+
+    def test_make_plan_feeds_favorite_food_before_food_that_any_pet_likes(self):
+        # the Bear must not eat the Meat that the Wolf needs
+        pets = {"BearCub-Amber": 45, "Wolf-Base": 45}
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets=pets)).build()
+        stockpile = FoodStockpileBuilder.empty_stockpile().add_food_dict({"Meat": 1, "Milk": 1})
+
+        plan: FeedPlan = OptimalFeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan()
+
+        assert plan.feed_plan == [FeedPlanItem("Wolf-Base", "Meat", 1),
+                                  FeedPlanItem("BearCub-Amber", "Milk", 1)]
+
+    @pytest.mark.parametrize("strategy", list(FEED_STRATEGIES))
+    @pytest.mark.parametrize("food_per_kind", [0, 3, 20, 100, 1000])
+    def test_make_plan_never_worse_than_other_strategies(self, food_per_kind: int,
+                                                         strategy: str):
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets=MIXED_PETS)).build()
+        stockpile = FoodStockpile(dict.fromkeys(FoodData.drop_food_names, food_per_kind))
+
+        other: FeedPlan = FEED_STRATEGIES[strategy](zoo=zoo, stockpile=stockpile).make_plan()
+        optimal: FeedPlan = OptimalFeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan()
+
+        assert mounts(optimal) >= mounts(other)
+        if mounts(optimal) == mounts(other):
+            assert food_spent(optimal) <= food_spent(other)
+
+
+MIXED_PETS = dict(zip(
+    ["Wolf-Base", "Wolf-Shade", "Fox-Red", "Parrot-Shade", "Alligator-Golden",
+     "BearCub-Amber", "BearCub-Aurora", "Velociraptor-Skeleton", "TigerCub-Fluorite"],
+    [5, 40, 45, 20, 10, 5, 35, 10, 49]
+))
+"""Pets of every FEED_ORDER category, with favorite food and without."""
+
+
+class TestFeedStrategies:
+
+    def test_feed_strategies_registers_every_strategy(self):
+        assert FEED_STRATEGIES == {
+            "greedy": FeedAlgorithm,
+            "category-ordered": CategoryOrderedFeedAlgorithm,
+            "optimal": OptimalFeedAlgorithm,
+            "fewest-requests": FewestRequestsFeedAlgorithm,
+        }
+
+    @pytest.mark.parametrize("strategy", FEED_STRATEGIES.values())
+    def test_every_strategy_has_a_description(self, strategy):
+        assert issubclass(strategy, FeedStrategy)
+        assert strategy.description.endswith(".")
+
+    def test_feed_strategy_refuses_a_duplicate_name(self):
+        with pytest.raises(ValueError):
+            feed_strategy("greedy")(FeedAlgorithm)
+
+    @pytest.mark.parametrize("strategy", FEED_STRATEGIES.values())
+    def test_make_plan_leaves_the_stockpile_unchanged(self, strategy):
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets=MIXED_PETS)).build()
+        stockpile = FoodStockpile(dict.fromkeys(FoodData.drop_food_names, 20))
+
+        algorithm: FeedStrategy = strategy(zoo=zoo, stockpile=stockpile)
+        plan: FeedPlan = algorithm.make_plan()
+
+        assert set(stockpile.as_dict().values()) == {20}
+        assert sum(algorithm.stockpile.as_dict().values()) == 20 * len(FoodData.drop_food_names) \
+            - food_spent(plan)
+
+
+class TestCategoryOrderedFeedAlgorithm:
+
+    def test_make_plan_feeds_the_pets_of_a_category_that_need_the_least_food_first(self):
+        # greedy feeds Wolf-Base first, in the order of the zoo, and has no Meat for Fox-Base
+        pets = {"Wolf-Base": 20, "Fox-Base": 30, "BearCub-Amber": 45}
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets=pets)).build()
+        stockpile = FoodStockpileBuilder.empty_stockpile().add_food("Meat", n=6)
+
+        greedy: FeedPlan = FeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan()
+        plan: FeedPlan = CategoryOrderedFeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan()
+
+        assert greedy.feed_plan == [FeedPlanItem("Wolf-Base", "Meat", 6)]
+        assert plan.feed_plan == [FeedPlanItem("Fox-Base", "Meat", 4),
+                                  FeedPlanItem("BearCub-Amber", "Meat", 1)]
+
+    def test_make_plan_feeds_the_first_category_before_cheaper_pets_of_the_next(self):
+        pets = {"Wolf-Base": 20, "BearCub-Amber": 45, "BearCub-Aurora": 45}
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets=pets)).build()
+        stockpile = FoodStockpileBuilder.empty_stockpile().add_food("Meat", n=6)
+
+        plan: FeedPlan = CategoryOrderedFeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan()
+
+        assert plan.feed_plan == [FeedPlanItem("Wolf-Base", "Meat", 6)]
+
+
+class TestFewestRequestsFeedAlgorithm:
+
+    def test_make_plan_never_splits_the_food_of_a_pet(self):
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets={"BearCub-Amber": 5})).build()
+        stockpile = FoodStockpileBuilder.empty_stockpile().add_food_dict({"Meat": 5, "Milk": 4})
+
+        plan: FeedPlan = FewestRequestsFeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan()
+
+        assert plan.is_empty()
+
+    def test_make_plan_gives_the_hungriest_pet_the_tightest_food(self):
+        # BearCub-Aurora needs the most food and only the Meat fits it, BearCub-Amber gets the Milk
+        pets = {"BearCub-Amber": 35, "BearCub-Aurora": 30}
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets=pets)).build()
+        stockpile = FoodStockpileBuilder.empty_stockpile().add_food_dict({"Meat": 4, "Milk": 3})
+
+        plan: FeedPlan = FewestRequestsFeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan()
+
+        assert plan.feed_plan == [FeedPlanItem("BearCub-Aurora", "Meat", 4),
+                                  FeedPlanItem("BearCub-Amber", "Milk", 3)]
+
+    @pytest.mark.parametrize("food_per_kind", [3, 20, 100])
+    def test_make_plan_has_a_request_per_mount(self, food_per_kind: int):
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets=MIXED_PETS)).build()
+        stockpile = FoodStockpile(dict.fromkeys(FoodData.drop_food_names, food_per_kind))
+
+        plan: FeedPlan = FewestRequestsFeedAlgorithm(zoo=zoo, stockpile=stockpile).make_plan()
+
+        assert len(plan) == mounts(plan) > 0
+
+
+class TestAddPartialFeeding:
+
+    def test_add_partial_feeding_feeds_the_pet_closest_to_a_mount(self):
+        pets = {"Wolf-Base": 5, "Wolf-Shade": 20, "Fox-Base": 30}
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets=pets)).build()
+        stockpile = FoodStockpileBuilder.empty_stockpile().add_food("Meat", n=5)
+
+        plan: FeedPlan = add_partial_feeding(FeedPlan(), zoo=zoo, stockpile=stockpile)
+
+        # Fox-Base needs 4 Meat and becomes a mount, Wolf-Base needs 9 and gets the last Meat
+        assert plan.feed_plan == [FeedPlanItem("Fox-Base", "Meat", 4),
+                                  FeedPlanItem("Wolf-Base", "Meat", 1)]
+        assert stockpile.as_dict()["Meat"] == 0
+
+    def test_add_partial_feeding_keeps_the_plan_and_skips_its_pets(self):
+        pets = {"Wolf-Base": 5, "Fox-Base": 10, "BearCub-Amber": 5}
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets=pets)).build()
+        stockpile = FoodStockpileBuilder.empty_stockpile().add_food_dict({"Meat": 14, "Milk": 3})
+        algorithm = FeedAlgorithm(zoo=zoo, stockpile=stockpile)
+        plan: FeedPlan = algorithm.make_plan()
+
+        add_partial_feeding(plan, zoo=zoo, stockpile=algorithm.stockpile)
+
+        assert plan.feed_plan == [FeedPlanItem("Wolf-Base", "Meat", 9),
+                                  FeedPlanItem("Fox-Base", "Meat", 5),
+                                  FeedPlanItem("BearCub-Amber", "Milk", 3)]
+        assert sum(algorithm.stockpile.as_dict().values()) == 0
+
+    def test_add_partial_feeding_spreads_any_food_over_a_pet_that_likes_all_food(self):
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets={"BearCub-Amber": 5})).build()
+        stockpile = FoodStockpileBuilder.empty_stockpile().add_food_dict({"Meat": 3, "Milk": 2})
+
+        plan: FeedPlan = add_partial_feeding(FeedPlan(), zoo=zoo, stockpile=stockpile)
+
+        assert plan.feed_plan == [FeedPlanItem("BearCub-Amber", "Meat", 3),
+                                  FeedPlanItem("BearCub-Amber", "Milk", 2)]
+
+    def test_add_partial_feeding_without_food_leaves_the_plan_unchanged(self):
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets={"Wolf-Base": 5})).build()
+
+        plan: FeedPlan = add_partial_feeding(FeedPlan(), zoo=zoo,
+                                             stockpile=FoodStockpileBuilder().build())
+
+        assert plan.is_empty()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+import pytest
+
+from hopla.hoplalib.zoo.columnarzoo import ColumnarZoo
+from hopla.hoplalib.zoo.petregistry import PetCategory
+from hopla.hoplalib.zoo.zooindex import ZooIndex, ZooQuery, egg_and_potion
+from hopla.hoplalib.zoo.zoomodels import Zoo, ZooBuilder, ZooHelper
+from tests.testutils.user_test_utils import UserTestUtil
+
+
+class TestEggAndPotion:
+    @pytest.mark.parametrize("pet_name,expected", [
+        ("Wolf-Base", ("Wolf", "Base")),
+        ("Dragon-Hydra", ("Dragon", "Hydra")),
+        ("Wolf-NOTSUPPORTED", ("Wolf", "NOTSUPPORTED")),
+    ])
+    def test_egg_and_potion(self, pet_name: str, expected):
+        assert egg_and_potion(pet_name) == expected
+
+
+class TestZooIndex:
+    PETS = {
+        "Wolf-Base": 35, "Wolf-Spooky": 20, "Wolf-Veteran": 5,
+        "Gryphon-Red": 45, "Gryphon-Base": 31, "Gryphon-Golden": -1,
+        "Fox-Shimmer": 30, "Fox-Base": 29,
+    }
+    MOUNTS = {"Gryphon-Base": True, "Gryphon-Golden": True, "Aether-Invisible": True}
+
+    @pytest.fixture
+    def zoo(self) -> Zoo:
+        user = UserTestUtil.user_with_zoo(pets=dict(self.PETS), mounts=dict(self.MOUNTS))
+        return ZooBuilder(user).build()
+
+    def test_empty_query_selects_everything(self, zoo: Zoo):
+        assert ZooIndex(zoo).names(ZooQuery()) == list(zoo)
+
+    def test_eggs(self, zoo: Zoo):
+        result = ZooIndex(zoo).names(ZooQuery(eggs=("Wolf", "Fox")))
+
+        assert result == ["Wolf-Base", "Wolf-Spooky", "Wolf-Veteran", "Fox-Shimmer", "Fox-Base"]
+
+    def test_feedable_quest_pets_above_30(self, zoo: Zoo):
+        query = ZooQuery(feedable=True, categories=(PetCategory.QUEST,), min_feed_status=31)
+
+        assert ZooIndex(zoo).names(query) == ["Gryphon-Red"]
+
+    def test_magic_pets_without_mount(self, zoo: Zoo):
+        query = ZooQuery(categories=(PetCategory.MAGIC_POTION,), has_pet=True, has_mount=False)
+
+        assert ZooIndex(zoo).names(query) == ["Wolf-Spooky", "Fox-Shimmer"]
+
+    @pytest.mark.parametrize("low,high", [
+        (None, None), (None, 30), (30, None), (29, 31), (31, 34), (5, 5), (-1, 0), (-1, 49)
+    ])
+    def test_feed_status_range_same_as_scan(self, zoo: Zoo, low, high):
+        def in_range(pair) -> bool:
+            if pair.pet is None:
+                return False
+            status = int(pair.pet.feed_status)
+            return (low is None or low <= status) and (high is None or status <= high)
+
+        expected = list(ZooHelper(zoo).filter_on_pet_mount_pairs(in_range))
+        if low is None and high is None:
+            expected = list(zoo)
+
+        result = ZooIndex(zoo).names(ZooQuery(min_feed_status=low, max_feed_status=high))
+
+        assert result == expected
+
+    def test_feedable_same_as_zoo_helper(self, zoo: Zoo):
+        expected = list(ZooHelper(zoo).get_feedable_zoo())
+
+        assert ZooIndex(zoo).names(ZooQuery(feedable=True)) == expected
+
+    def test_feedable_of_a_columnar_zoo_view(self, zoo: Zoo):
+        view = ColumnarZoo.from_zoo(zoo).filter_on_pet_name(lambda name: name != "Wolf-Base")
+
+        assert ZooIndex(view).names(ZooQuery(feedable=True)) == list(view.get_feedable_zoo())
+
+    def test_has_mount(self, zoo: Zoo):
+        index = ZooIndex(zoo)
+
+        assert index.names(ZooQuery(has_mount=True)) == ["Gryphon-Base", "Gryphon-Golden",
+                                                         "Aether-Invisible"]
+        assert "Aether-Invisible" not in index.names(ZooQuery(has_mount=False))
+
+    def test_pairs(self, zoo: Zoo):
+        pairs = dict(ZooIndex(zoo).pairs(ZooQuery(potions=("Veteran",))))
+
+        assert list(pairs) == ["Wolf-Veteran"]
+        assert pairs["Wolf-Veteran"] is zoo["Wolf-Veteran"]
+
+    def test_unknown_key_selects_nothing(self, zoo: Zoo):
+        assert ZooIndex(zoo).names(ZooQuery(eggs=("Unicorn",))) == []
+
+    def test_empty_zoo(self):
+        assert ZooIndex({}).names(ZooQuery(feedable=True)) == []
@@ -4,7 +4,8 @@ import pytest
 from hopla.cli.groupcmds.get_user import HabiticaUser
 from hopla.hoplalib.zoo.foodmodels import FeedStatus
 from hopla.hoplalib.zoo.petmodels import Pet, PetMountPair, InvalidPet
-from hopla.hoplalib.zoo.zoomodels import Zoo, ZooBuilder, ZooHelper
+from hopla.hoplalib.zoo.petregistry import PetCategory
+from hopla.hoplalib.zoo.zoomodels import Zoo, ZooBuilder, ZooHelper, ZooSnapshot
 from tests.testutils.user_test_utils import UserTestUtil
 
 
@@ -109,6 +110,65 @@ class TestZooBuilder:
         assert result_pair.pet.feed_status == FeedStatus(feed_status)
         assert result_pair.mount_available() is False
 
+    @pytest.mark.parametrize("pets,mounts", [
+        ({"Wolf-Base": 5, "Fox-Red": 20}, {"Fox-Red": True}),
+        ({"Wolf-Base": -1, "Fox-Red": 20}, {"Wolf-Base": True}),
+        ({}, {"Wolf-Base": True}),
+        ({}, {})
+    ])
+    def test_build_pair_same_as_build(self, pets: dict, mounts: dict):
+        pet_name = "Wolf-Base"
+        user: HabiticaUser = UserTestUtil.user_with_zoo(pets=dict(pets), mounts=dict(mounts))
+
+        result: PetMountPair = ZooBuilder(user).build_pair(pet_name)
+
+        assert user.get_mounts() == mounts  # build_pair doesn't change the user
+        expected: PetMountPair = ZooBuilder(user).build().get(pet_name)
+        assert repr(result) == repr(expected)
+
+    def test_build_does_not_change_the_user(self):
+        pets = {"Wolf-Base": 5, "Fox-Red": 20, "Dragon-NOTSUPPORTED": 5}
+        mounts = {"Wolf-Base": True, "Aether-Invisible": True}
+        user: HabiticaUser = UserTestUtil.user_with_zoo(pets=dict(pets), mounts=dict(mounts))
+        builder = ZooBuilder(user)
+
+        first: Zoo = builder.build(skip_unsupported_pets=True)
+        second: Zoo = builder.build(skip_unsupported_pets=True)
+
+        assert user.get_pets() == pets
+        assert user.get_mounts() == mounts
+        assert list(first) == list(second) == ["Wolf-Base", "Fox-Red", "Aether-Invisible"]
+        assert first["Wolf-Base"].mount_available()
+
+    def test_iter_pairs_is_lazy(self):
+        user = UserTestUtil.user_with_zoo(pets={"Wolf-Base": 5, "Dragon-NOTSUPPORTED": 5})
+
+        pairs = ZooBuilder(user).iter_pairs()
+
+        assert next(pairs)[0] == "Wolf-Base"
+        with pytest.raises(InvalidPet):
+            next(pairs)
+
+    def test_build_categories(self):
+        pets = {"Wolf-Base": 5, "Wolf-Veteran": 5, "Wolf-Spooky": 5}
+        mounts = {"Wolf-Base": True, "Aether-Invisible": True}
+        user = UserTestUtil.user_with_zoo(pets=pets, mounts=mounts)
+
+        zoo: Zoo = ZooBuilder(user).build(categories=[PetCategory.GENERATION1,
+                                                      PetCategory.RARE])
+
+        assert list(zoo) == ["Wolf-Base", "Wolf-Veteran", "Aether-Invisible"]
+        assert zoo["Wolf-Base"].mount_available()
+
+    def test_build_subset(self):
+        user = UserTestUtil.user_with_zoo(pets={"Wolf-Base": 5, "Fox-Red": 20},
+                                          mounts={"Aether-Invisible": True})
+
+        zoo: Zoo = ZooBuilder(user).build_subset(["Aether-Invisible", "Fox-Red", "Fox-Base"])
+
+        assert list(zoo) == ["Aether-Invisible", "Fox-Red"]
+        assert repr(zoo["Fox-Red"]) == repr(ZooBuilder(user).build()["Fox-Red"])
+
 
 class TestZooHelper:
     def test_filter_on_pet_mount_pair(self):
@@ -177,3 +237,42 @@ class TestZooHelper:
 
         expected_pets = ["Owl-Golden", "Phoenix-Base"]
         assert all(expected_pet in filtered_zoo.keys() for expected_pet in expected_pets)
+
+    def test_filter_on_categories(self):
+        pets = {"Wolf-Base": 5, "Gryphon-Red": 10, "Wolf-Spooky": 5, "Phoenix-Base": 5}
+        user: HabiticaUser = UserTestUtil.user_with_zoo(pets=pets)
+        zoo: Zoo = ZooBuilder(user).build()
+
+        helper = ZooHelper(zoo)
+
+        assert list(helper.filter_on_categories(PetCategory.GENERATION1)) == ["Wolf-Base"]
+        assert list(helper.filter_on_categories(PetCategory.QUEST,
+                                                PetCategory.RARE)) == ["Gryphon-Red",
+                                                                       "Phoenix-Base"]
+        assert helper.filter_on_categories() == {}
+
+
+class TestZooSnapshot:
+    def test_from_zoo(self):
+        user = UserTestUtil.user_with_zoo(pets={"Wolf-Base": 5, "Fox-Base": -1},
+                                          mounts={"Fox-Base": True, "Aether-Invisible": True})
+
+        snapshot = ZooSnapshot.from_zoo(ZooBuilder(user).build())
+
+        assert snapshot.pairs == (("Aether-Invisible", None, True), ("Fox-Base", -1, True),
+                                  ("Wolf-Base", 5, None))
+
+    def test_equal_zoos(self):
+        pets = {"Wolf-Base": 5, "Fox-Base": 20}
+        zoo: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets=pets)).build()
+        reversed_zoo: Zoo = dict(reversed(list(zoo.items())))
+
+        assert ZooSnapshot.from_zoo(zoo) == ZooSnapshot.from_zoo(reversed_zoo)
+        assert ZooSnapshot.from_zoo(zoo).fingerprint == ZooSnapshot.from_zoo(reversed_zoo).fingerprint
+        assert len({ZooSnapshot.from_zoo(zoo), ZooSnapshot.from_zoo(reversed_zoo)}) == 1
+
+    def test_changed_zoo(self):
+        before: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets={"Wolf-Base": 5})).build()
+        after: Zoo = ZooBuilder(UserTestUtil.user_with_zoo(pets={"Wolf-Base": 10})).build()
+
+        assert ZooSnapshot.from_zoo(before).fingerprint != ZooSnapshot.from_zoo(after).fingerprint
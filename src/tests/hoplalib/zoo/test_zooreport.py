@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+from typing import Any, Dict
+
+from hopla.hoplalib.zoo.petregistry import PetCategory, get_pet_registry
+from hopla.hoplalib.zoo.zooreport import CollectionReport, format_report
+from tests.testutils.user_test_utils import UserTestUtil
+
+
+class TestCollectionReport:
+    def test_empty_user(self):
+        report: Dict[str, Any] = CollectionReport.from_user(
+            UserTestUtil.user_with_items()
+        ).to_dict()
+
+        assert list(report) == list(PetCategory.ALL)
+        for category, row in report.items():
+            assert row["total"] == len(get_pet_registry().pet_names(category))
+            assert row["pets"] == row["mounts"] == row["feedable_to_mount"] == 0
+            assert row["missing_pets"] == get_pet_registry().pet_names(category)
+
+    def test_counts(self):
+        user = UserTestUtil.user_with_items(
+            pets={"Wolf-Base": 45, "Fox-Base": 45, "Gryphon-Red": 5, "Wolf-Veteran": 5,
+                  "Dragon-Base": -1},
+            mounts={"Dragon-Base": True, "Aether-Invisible": True},
+            food={"Meat": 2}
+        )
+
+        report: Dict[str, Any] = CollectionReport.from_user(user).to_dict()
+
+        generation1 = report[PetCategory.GENERATION1]
+        assert (generation1["pets"], generation1["mounts"]) == (2, 1)
+        assert generation1["feedable_to_mount"] == 2  # 1 Meat each
+        assert "Dragon-Base" in generation1["missing_pets"]
+        assert "Dragon-Base" not in generation1["missing_mounts"]
+        assert report[PetCategory.QUEST]["pets"] == 1
+        assert report[PetCategory.QUEST]["feedable_to_mount"] == 0
+        assert (report[PetCategory.RARE]["pets"], report[PetCategory.RARE]["mounts"]) == (1, 1)
+
+    def test_feedable_to_mount_shares_the_stockpile(self):
+        user = UserTestUtil.user_with_items(pets={"Wolf-Base": 45, "Wolf-Red": 45},
+                                            food={"Meat": 1})
+
+        report: Dict[str, Any] = CollectionReport.from_user(user).to_dict()
+
+        assert report[PetCategory.GENERATION1]["feedable_to_mount"] == 1
+
+    def test_does_not_change_the_user(self):
+        pets = {"Wolf-Base": 45}
+        user = UserTestUtil.user_with_items(pets=dict(pets), food={"Meat": 1})
+
+        CollectionReport.from_user(user)
+
+        assert user.get_pets() == pets
+        assert user.get_food() == {"Meat": 1}
+
+
+class TestFormatReport:
+    def test_format_report(self):
+        report = CollectionReport.from_user(UserTestUtil.user_with_items(
+            pets={"Wolf-Base": 45}, food={"Meat": 1}
+        )).to_dict()
+
+        lines = format_report(report).splitlines()
+
+        assert len(lines) == 1 + len(PetCategory.ALL)
+        total: int = report[PetCategory.GENERATION1]["total"]
+        assert lines[1].split() == ["generation1", f"1/{total}", f"0/{total}", "1"]
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """TestUtils to get HabiticaUser objects for users."""
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from hopla.cli.groupcmds.get_user import HabiticaUser
 
@@ -20,6 +20,32 @@ class UserTestUtil:
 
         return HabiticaUser({"items": {"pets": pets, "mounts": mounts}})
 
+    ITEM_KEYS = {"pets": "pets", "mounts": "mounts", "food": "food", "eggs": "eggs",
+                 "hatch_potions": "hatchingPotions"}
+    """The keyword of every kind of item, and its key in the items of a user."""
+
+    @classmethod
+    def user_with_items(cls, *,
+                        gold: Optional[float] = None,
+                        fields: Optional[Dict[str, Any]] = None,
+                        **items: Dict[str, Any]) -> HabiticaUser:
+        """Create a user with the specified items, e.g. food={"Meat": 3}.
+
+        :param gold: the gp in the stats of the user, no stats when None
+        :param fields: other fields of the user, such as "id" or "tags"
+        :param items: the pets, mounts, food, eggs, and hatch_potions. Empty when not specified.
+        """
+        unknown_items = set(items) - set(cls.ITEM_KEYS)
+        if unknown_items:
+            raise TypeError(f"unknown items: {sorted(unknown_items)}")
+        user_dict: Dict[str, Any] = {
+            "items": {key: items.get(name) or {} for name, key in cls.ITEM_KEYS.items()},
+            **(fields or {})
+        }
+        if gold is not None:
+            user_dict["stats"] = {"gp": gold}
+        return HabiticaUser(user_dict)
+
     @classmethod
     def user_with_gp(cls, *,
                      gold: float):